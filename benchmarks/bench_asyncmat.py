@@ -0,0 +1,69 @@
+"""
+benchmark of the responsiveness of an event loop during a 300 x 300 Matrix
+product: the synchronous @ called from a coroutine, compared with amatmul
+in the default thread pool and in a process pool;
+the latency is the longest gap between the ticks of a 1 ms periodic task
+
+run with: python -m numeric.benchmarks.bench_asyncmat
+"""
+
+import asyncio
+import os
+import random
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from numeric.src.asyncmat import amatmul
+from numeric.src.matrix import Matrix
+
+
+SIZE = 300
+CHUNK_ROWS = 16
+
+
+async def ticker(ticks: list) -> None:
+    while True:
+        ticks.append(time.perf_counter())
+        await asyncio.sleep(0.001)
+
+
+async def measure(product) -> tuple:
+    ticks = []
+    task = asyncio.ensure_future(ticker(ticks))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await product()
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)
+    task.cancel()
+    latency = max(later - earlier for earlier, later in zip(ticks, ticks[1:]))
+    return elapsed, latency
+
+
+async def main() -> None:
+    random.seed(42)
+    a = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+    b = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+
+    async def blocking():
+        return a @ b
+
+    async def threaded():
+        return await amatmul(a, b, chunk_rows=CHUNK_ROWS)
+
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        async def processes():
+            return await amatmul(a, b, chunk_rows=CHUNK_ROWS, executor=executor, concurrency=workers)
+
+        print(f'{SIZE}x{SIZE} @ {SIZE}x{SIZE}, blocks of {CHUNK_ROWS} rows, seconds')
+        print(f'{"":>22}{"product":>10}{"latency":>10}')
+        for name, product in (('@ in a coroutine', blocking), ('amatmul, threads', threaded),
+                              (f'amatmul, {workers} processes', processes)):
+            elapsed, latency = await measure(product)
+            print(f'{name:>22}{elapsed:>10.4f}{latency:>10.4f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
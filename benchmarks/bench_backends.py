@@ -0,0 +1,42 @@
+"""
+benchmark of the Matrix backends: a 300 x 300 float product and sum on the
+python backend and on the numpy backend, with the conversions of the
+operands to arrays, and of the results back to python lists, included
+
+run with: python -m numeric.benchmarks.bench_backends
+"""
+
+import random
+import time
+
+from numeric.src.backends import numpy
+from numeric.src.matrix import Matrix
+
+
+SIZE = 300
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def operations(a: Matrix, b: Matrix) -> list:
+    return [timed(Matrix.__matmul__, a, b), timed(Matrix.__add__, a, b)]
+
+
+if __name__ == '__main__':
+
+    if numpy is None:
+        raise SystemExit('the numpy backend requires numpy, which is not installed')
+    random.seed(42)
+    rows_a = [[random.random() for _ in range(SIZE)] for _ in range(SIZE)]
+    rows_b = [[random.random() for _ in range(SIZE)] for _ in range(SIZE)]
+
+    pure = operations(Matrix(rows_a), Matrix(rows_b))
+    backed = operations(Matrix(rows_a, backend='numpy'), Matrix(rows_b, backend='numpy'))
+    print(f'{SIZE}x{SIZE} float matrices, seconds')
+    print(f'{"":>8}{"python":>12}{"numpy":>12}{"speedup":>10}')
+    for name, before, after in zip(('@', '+'), pure, backed):
+        print(f'{name:>8}{before:>12.4f}{after:>12.4f}{before / after:>9.1f}x')
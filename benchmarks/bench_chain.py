@@ -0,0 +1,50 @@
+"""
+benchmark of Matrix.chain_multiply against functools.reduce(operator.matmul, ...)
+on chains of 5 to 20 matrices of random shapes, with the estimated flops of
+both orders, and the time of planning a chain once, then from the cache
+
+run with: python -m numeric.benchmarks.bench_chain
+"""
+
+import operator
+import random
+import time
+
+from functools import reduce
+
+from numeric.src import chain
+from numeric.src.matrix import Matrix
+
+
+LENGTHS = (5, 10, 20)
+DIMS = (2, 120)
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def random_chain(length: int) -> list:
+    dims = [random.randint(*DIMS) for _ in range(length + 1)]
+    return [Matrix([[random.random() for _ in range(cols)] for _ in range(rows)])
+            for rows, cols in zip(dims, dims[1:])]
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    print(f'{"length":>8}{"naive Mflop":>14}{"planned Mflop":>16}{"reduce s":>10}{"chain s":>10}{"speedup":>10}')
+    for length in LENGTHS:
+        matrices = random_chain(length)
+        plan = Matrix.chain_plan(*matrices)
+        naive = timed(reduce, operator.matmul, matrices)
+        planned = timed(Matrix.chain_multiply, *matrices)
+        print(f'{length:>8}{plan.naive_flops / 1e6:>14.2f}{plan.flops / 1e6:>16.2f}'
+              f'{naive:>10.4f}{planned:>10.4f}{naive / planned:>9.1f}x')
+
+    dims = tuple(random.randint(*DIMS) for _ in range(21))
+    chain.plan.cache_clear()
+    first, cached = timed(chain.plan, dims), timed(chain.plan, dims)
+    print(f'planning a chain of 20: {first * 1e3:.3f} ms, from the cache: {cached * 1e6:.1f} us')
@@ -0,0 +1,86 @@
+"""
+benchmark of the construction of the results of the Matrix operators: each
+operator as it was, building its result as rows passed to Matrix(...), that
+validates and gathers them again, against the trusted constructor of the
+results; the time per operation, and the peak of the memory allocated during
+the operation, traced by tracemalloc
+
+run with: python -m numeric.benchmarks.bench_construct
+"""
+
+import random
+import time
+import tracemalloc
+
+from numeric.src.matmul import matmul
+from numeric.src.matrix import Matrix
+
+
+SIZE = 300
+PRODUCT = 100
+REPEAT = 5
+
+
+def checked(data: list) -> Matrix:
+    """the construction of the results before the trusted constructor: three
+    validation passes, then a python loop gathering the rows into the storage
+    """
+    assert len(data) > 0, 'Matrix data cannot be empty'
+    assert len(data[0]) > 0, 'Matrix rows cannot be empty'
+    assert all([len(seq) == len(data[0]) for seq in data]), 'all inners must have the same length'
+    return Matrix._from_owned([elt for row in data for elt in row], len(data), len(data[0]))
+
+
+def add_before(a: Matrix, b: Matrix) -> Matrix:
+    return checked([[x + y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a._row_lists(), b._row_lists())])
+
+
+def scale_before(a: Matrix, scalar: float) -> Matrix:
+    return checked([[elt * scalar for elt in row] for row in a._row_lists()])
+
+
+def matmul_before(a: Matrix, b: Matrix) -> Matrix:
+    return checked(matmul(a._row_lists(), b._row_lists(), 'auto'))
+
+
+def clone_before(a: Matrix) -> Matrix:
+    return checked(a._row_lists())
+
+
+def measured(func, *args) -> tuple:
+    """
+    :return: the best time of REPEAT calls of func, and the peak KiB allocated by a call
+    """
+    best = min(_timed(func, *args) for _ in range(REPEAT))
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1024
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    a = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+    b = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+    p = Matrix([[random.random() for _ in range(PRODUCT)] for _ in range(PRODUCT)])
+
+    cases = [
+        (f'a + b {SIZE}', (add_before, a, b), (Matrix.__add__, a, b)),
+        (f'a * 2.0 {SIZE}', (scale_before, a, 2.0), (Matrix.__mul__, a, 2.0)),
+        (f'a @ b {PRODUCT}', (matmul_before, p, p), (Matrix.__matmul__, p, p)),
+        (f'clone {SIZE}', (clone_before, a), (Matrix.clone, a)),
+    ]
+    print(f'{"":>14}{"before ms":>11}{"after ms":>10}{"speedup":>9}{"before KiB":>12}{"after KiB":>11}')
+    for name, before, after in cases:
+        before_time, before_peak = measured(*before)
+        after_time, after_peak = measured(*after)
+        print(f'{name:>14}{before_time * 1e3:>11.2f}{after_time * 1e3:>10.2f}{before_time / after_time:>8.1f}x'
+              f'{before_peak:>12.0f}{after_peak:>11.0f}')
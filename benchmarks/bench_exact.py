@@ -0,0 +1,60 @@
+"""
+benchmark of exact arithmetic on 50 x 50 rational systems:
+Gaussian elimination on Fraction elements (LUDecomposition) compared
+with the fraction-free Bareiss elimination of src.bareiss
+
+run with: python -m numeric.benchmarks.bench_exact
+"""
+
+import random
+import time
+
+from fractions import Fraction
+
+from numeric.src import bareiss
+from numeric.src.lu import LUDecomposition
+
+
+SIZE = 50
+
+
+def random_rational_rows(num_rows: int, num_cols: int) -> list:
+    return [[Fraction(random.randint(-50, 50), random.randint(1, 20)) for _ in range(num_cols)]
+            for _ in range(num_rows)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    rows = random_rational_rows(SIZE, SIZE)
+    rhs = random_rational_rows(1, SIZE)[0]
+
+    print(f'{SIZE} x {SIZE} rational system')
+    print(f'{"operation":<12}{"Fraction LU":>14}{"Bareiss":>14}{"speedup":>10}')
+
+    fraction_det, fraction_seconds = timed(lambda: LUDecomposition(rows).det())
+    exact_det, exact_seconds = timed(bareiss.det, rows)
+    assert fraction_det == exact_det
+    print(f'{"det":<12}{fraction_seconds:>13.3f}s{exact_seconds:>13.3f}s'
+          f'{fraction_seconds / exact_seconds:>9.1f}x')
+
+    fraction_x, fraction_seconds = timed(lambda: LUDecomposition(rows).solve(rhs))
+    exact_x, exact_seconds = timed(bareiss.solve, rows, rhs)
+    assert fraction_x == exact_x
+    print(f'{"solve":<12}{fraction_seconds:>13.3f}s{exact_seconds:>13.3f}s'
+          f'{fraction_seconds / exact_seconds:>9.1f}x')
+
+    fraction_inv, fraction_seconds = timed(lambda: LUDecomposition(rows).inverse())
+    exact_inv, exact_seconds = timed(bareiss.inverse, rows)
+    assert fraction_inv == exact_inv
+    print(f'{"inverse":<12}{fraction_seconds:>13.3f}s{exact_seconds:>13.3f}s'
+          f'{fraction_seconds / exact_seconds:>9.1f}x')
+
+    _, exact_seconds = timed(bareiss.rank, rows)
+    print(f'{"rank":<12}{"-":>14}{exact_seconds:>13.3f}s')
@@ -0,0 +1,69 @@
+"""
+benchmark of conversions between the leaves of a deep CoordinateSystem tree:
+the chain of local transforms recomputed at each conversion, compared with
+the cached transforms to and from the root
+
+run with: python -m numeric.benchmarks.bench_frames
+"""
+
+import math
+import random
+import time
+
+from array import array
+
+from numeric.src.frames import CoordinateSystem, convert
+from numeric.src.hommat import Hmat33
+from numeric.src.vector import Point2D, Vector2D
+
+
+DEPTH = 50
+CONVERSIONS = 2_000
+POINTS = 10
+
+
+def branch(root: CoordinateSystem, depth: int) -> CoordinateSystem:
+    frame = root
+    for _ in range(depth):
+        angle = random.uniform(-math.pi, math.pi)
+        frame = CoordinateSystem(Vector2D(math.cos(angle), math.sin(angle)),
+                                 Vector2D(-math.sin(angle), math.cos(angle)),
+                                 Point2D(random.random(), random.random()), parent=frame)
+    return frame
+
+
+def chain_to_root(frame: CoordinateSystem) -> Hmat33:
+    transform = Hmat33.identity()
+    while frame is not None:
+        transform = frame.local @ transform
+        frame = frame.parent
+    return transform
+
+
+def uncached(source: CoordinateSystem, target: CoordinateSystem, coords: array) -> None:
+    for _ in range(CONVERSIONS):
+        transform = chain_to_root(target).inverse() @ chain_to_root(source)
+        transform.apply_many(coords)
+
+
+def cached(source: CoordinateSystem, target: CoordinateSystem, coords: array) -> None:
+    for _ in range(CONVERSIONS):
+        convert(coords, source, target)
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    root = CoordinateSystem(name='root')
+    source, target = branch(root, DEPTH), branch(root, DEPTH)
+    coords = array('d', (random.random() for _ in range(2 * POINTS)))
+
+    timings = []
+    for func in (uncached, cached):
+        start = time.perf_counter()
+        func(source, target, coords)
+        timings.append(time.perf_counter() - start)
+    before, after = timings
+    print(f'{CONVERSIONS} conversions of {POINTS} points between leaves at depth {DEPTH}, seconds')
+    print(f'{"recomputed":>12}{"cached":>12}{"speedup":>10}')
+    print(f'{before:>12.4f}{after:>12.4f}{before / after:>9.1f}x')
@@ -0,0 +1,49 @@
+"""
+benchmark of the generation of a 2000 x 2000 affine lattice: the nodes
+computed one by one as origin + col * e1 + row * e2 with Point2D and
+Vector2D, compared with AffineGrid built by increments, in a flat buffer
+and streamed row by row
+
+run with: python -m numeric.benchmarks.bench_grid
+"""
+
+import time
+
+from numeric.src.grid import AffineGrid
+from numeric.src.vector import Point2D, Vector2D
+
+
+SIZE = 2_000
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def per_node(grid: AffineGrid) -> list:
+    return [grid.origin + grid.e1 * col + grid.e2 * row for row in grid.rows for col in grid.cols]
+
+
+def streamed(grid: AffineGrid) -> int:
+    return sum(len(row) for row in grid.iter_rows())
+
+
+def lines(grid: AffineGrid) -> int:
+    return sum(1 for _ in grid.lines())
+
+
+if __name__ == '__main__':
+
+    half = SIZE // 2
+    grid = AffineGrid(Vector2D(20, 5), Vector2D(3, 15), origin=Point2D(250, 250),
+                      rows=range(-half, half), cols=range(-half, half))
+
+    before = timed(per_node, grid)
+    flat = timed(grid.lattice)
+    rows = timed(streamed, grid)
+    segments = timed(lines, grid)
+    print(f'{SIZE} x {SIZE} lattice, seconds')
+    print(f'{"per node":>12}{"lattice":>12}{"streamed":>12}{"lines":>12}{"speedup":>10}')
+    print(f'{before:>12.4f}{flat:>12.4f}{rows:>12.4f}{segments:>12.4f}{before / flat:>9.1f}x')
@@ -0,0 +1,47 @@
+"""
+benchmark of the batched transforms of Hmat33 and Hmat44 on a polyline
+of 100k vertices, compared with one __mul__ call per vertex
+
+run with: python -m numeric.benchmarks.bench_hommat
+"""
+
+import random
+import time
+
+from array import array
+
+from numeric.src.hommat import Hmat33, Hmat44
+
+
+COUNT = 100_000
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def per_vertex(hmat, coords, dim: int) -> list:
+    result = []
+    for idx in range(0, len(coords), dim):
+        result.extend(hmat * (*coords[idx: idx + dim], 1))
+    return result
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    transforms = {
+        2: Hmat33([[0.8, -0.6, 10], [0.6, 0.8, -5], [0, 0, 1]]),
+        3: Hmat44([[0.8, -0.6, 0, 10], [0.6, 0.8, 0, -5], [0, 0, 1, 2], [0, 0, 0, 1]]),
+    }
+    print(f'{COUNT} vertices, seconds')
+    print(f'{"matrix":<8}{"per vertex":>12}{"apply_many":>12}{"in place":>12}{"speedup":>10}')
+    for dim, hmat in transforms.items():
+        coords = array('d', (random.random() for _ in range(dim * COUNT)))
+        out = array('d', bytes(8 * len(coords)))
+        before = timed(per_vertex, hmat, coords, dim)
+        after = timed(hmat.apply_many, coords, out=out)
+        in_place = timed(hmat.apply_in_place, coords)
+        print(f'{type(hmat).__name__:<8}{before:>12.4f}{after:>12.4f}{in_place:>12.4f}{before / after:>9.1f}x')
@@ -0,0 +1,102 @@
+"""
+benchmark of the in-place Matrix operators and the out= parameters: each
+in-place operator as it was, gathering all the elements of the result in a
+new list before assigning them, against the kernels writing the storage run
+by run; and the operators allocating their result against out= writing
+into a preallocated Matrix, in a loop; the time per operation, and the peak
+of the memory allocated during the operation, traced by tracemalloc
+
+the elementwise in-place operators mostly save memory: their time is within
+the noise of the previous one (about 1.0x to 1.4x), while their peak drops
+by 40 to 50%, what is left being the new python floats of the results;
+the product into out= takes the time of @, and transpose into out= is the
+only clear time gain (about 2x to 3x)
+
+run with: python -m numeric.benchmarks.bench_inplace
+"""
+
+import operator
+import random
+import time
+import tracemalloc
+
+from numeric.src.matrix import Matrix
+
+
+SIZE = 500
+PRODUCT = 100
+REPEAT = 5
+
+
+def iadd_before(a: Matrix, b: Matrix) -> None:
+    a._assign(list(map(operator.add, a._flat(), b._flat())))
+
+
+def iadd_after(a: Matrix, b: Matrix) -> None:
+    a += b
+
+
+def imul_before(a: Matrix, scalar: float) -> None:
+    a._assign([elt * scalar for elt in a._flat()])
+
+
+def imul_after(a: Matrix, scalar: float) -> None:
+    a *= scalar
+
+
+def matmul_new(a: Matrix, b: Matrix, _: Matrix) -> None:
+    a @ b
+
+
+def matmul_out(a: Matrix, b: Matrix, out: Matrix) -> None:
+    a.matmul(b, out=out)
+
+
+def transpose_new(a: Matrix, _: Matrix) -> None:
+    a.transpose().copy()
+
+
+def transpose_out(a: Matrix, out: Matrix) -> None:
+    a.transpose(out=out)
+
+
+def measured(func, *args) -> tuple:
+    """
+    :return: the best time of REPEAT calls of func, and the peak KiB allocated by a call
+    """
+    best = min(_timed(func, *args) for _ in range(REPEAT))
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1024
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    a = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+    b = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+    p = Matrix([[random.random() for _ in range(PRODUCT)] for _ in range(PRODUCT)])
+    column = Matrix([[random.random()] for _ in range(SIZE * SIZE)])
+    out, out_t, out_p = Matrix.zeros(a.shape), Matrix.zeros(a.shape), Matrix.zeros(p.shape)
+
+    cases = [
+        (f'a += b {SIZE}', (iadd_before, a, b), (iadd_after, a, b)),
+        (f'a *= 1.0 {SIZE}', (imul_before, a, 1.0), (imul_after, a, 1.0)),
+        (f'v += v {SIZE * SIZE}', (iadd_before, column, column), (iadd_after, column, column)),
+        (f'a @ b {PRODUCT}', (matmul_new, p, p, out_p), (matmul_out, p, p, out_p)),
+        (f'a.T {SIZE}', (transpose_new, a, out_t), (transpose_out, a, out_t)),
+    ]
+    print(f'{"":>14}{"before ms":>11}{"after ms":>10}{"speedup":>9}{"before KiB":>12}{"after KiB":>11}')
+    for name, before, after in cases:
+        before_time, before_peak = measured(*before)
+        after_time, after_peak = measured(*after)
+        print(f'{name:>14}{before_time * 1e3:>11.2f}{after_time * 1e3:>10.2f}{before_time / after_time:>8.1f}x'
+              f'{before_peak:>12.0f}{after_peak:>11.0f}')
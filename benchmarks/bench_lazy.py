@@ -0,0 +1,58 @@
+"""
+benchmark of the lazy Matrix expressions against the eager operators:
+an elementwise formula of 500 x 500 float matrices, fused into one pass,
+and a chain A @ B @ v of 300 x 300 matrices and a vector, reordered
+
+run with: python -m numeric.benchmarks.bench_lazy
+"""
+
+import random
+import time
+
+from numeric.src.lazy import lazy
+from numeric.src.matrix import Matrix
+
+
+SIZE = 500
+CHAIN = 300
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def random_matrix(rows: int, cols: int) -> Matrix:
+    return Matrix([[random.random() for _ in range(cols)] for _ in range(rows)])
+
+
+def formula_eager(a, b, c, d):
+    return a + b * 2 - c / 3 + d
+
+
+def formula_lazy(a, b, c, d):
+    return (lazy(a) + b * 2 - c / 3 + d).eval()
+
+
+def chain_eager(a, b, v):
+    return a @ b @ v
+
+
+def chain_lazy(a, b, v):
+    return (lazy(a) @ b @ v).eval()
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    operands = [random_matrix(SIZE, SIZE) for _ in range(4)]
+    chain = [random_matrix(CHAIN, CHAIN), random_matrix(CHAIN, CHAIN), random_matrix(CHAIN, 1)]
+
+    results = [
+        (f'a + b * 2 - c / 3 + d, {SIZE}x{SIZE}', timed(formula_eager, *operands), timed(formula_lazy, *operands)),
+        (f'a @ b @ v, {CHAIN}x{CHAIN}', timed(chain_eager, *chain), timed(chain_lazy, *chain)),
+    ]
+    print(f'{"":>32}{"eager s":>10}{"lazy s":>10}{"speedup":>10}')
+    for name, eager, fused in results:
+        print(f'{name:>32}{eager:>10.4f}{fused:>10.4f}{eager / fused:>9.1f}x')
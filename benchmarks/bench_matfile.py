@@ -0,0 +1,56 @@
+"""
+benchmark of the persistence of a 2000 x 2000 float Matrix: the text of
+str(matrix), parsed back, against the binary format of Matrix.save, read
+in full or memory-mapped by Matrix.load; for the mapped file, the time of
+the first access to a row, that pages it in
+
+run with: python -m numeric.benchmarks.bench_matfile
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from numeric.src.matrix import Matrix
+
+
+SIZE = 2000
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def save_text(matrix: Matrix, path: str) -> None:
+    with open(path, 'w') as file:
+        file.write(str(matrix))
+
+
+def load_text(path: str) -> Matrix:
+    with open(path) as file:
+        return Matrix([[float(elt) for elt in line.split(', ')] for line in file])
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    matrix = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+    with tempfile.TemporaryDirectory() as directory:
+        text, binary = os.path.join(directory, 'matrix.txt'), os.path.join(directory, 'matrix.bin')
+        results = [
+            ('text save', timed(save_text, matrix, text), os.path.getsize(text)),
+            ('text load', timed(load_text, text), os.path.getsize(text)),
+            ('binary save', timed(matrix.save, binary), os.path.getsize(binary)),
+            ('binary load', timed(Matrix.load, binary), os.path.getsize(binary)),
+            ('mmap load', timed(Matrix.load, binary, True), os.path.getsize(binary)),
+        ]
+        mapped = Matrix.load(binary, mmap=True)
+        results.append(('mmap row', timed(mapped.get_row(SIZE // 2).copy), SIZE * 8))
+
+    print(f'{SIZE}x{SIZE} float Matrix')
+    print(f'{"":>12}{"seconds":>12}{"MB":>10}')
+    for name, seconds, size in results:
+        print(f'{name:>12}{seconds:>12.5f}{size / 1e6:>10.2f}')
@@ -0,0 +1,47 @@
+"""
+benchmark of the matmul strategies of src.matmul on square matrices of
+random floats, sizes 4 to 512
+
+the naive kernel is skipped above NAIVE_MAX_SIZE, where it takes minutes
+
+run with: python -m numeric.benchmarks.bench_matmul
+"""
+
+import random
+import time
+
+from numeric.src.matmul import STRATEGIES, choose_strategy
+from numeric.src.matrix import Matrix
+
+
+SIZES = (4, 8, 16, 32, 64, 128, 256, 512)
+NAIVE_MAX_SIZE = 128
+MIN_DURATION = 0.2   # seconds spent on each measurement
+
+
+def random_matrix(size: int) -> Matrix:
+    return Matrix([[random.random() for col in range(size)] for row in range(size)])
+
+
+def seconds_per_product(a: Matrix, b: Matrix, strategy: str) -> float:
+    repeats, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while elapsed < MIN_DURATION:
+        a.matmul(b, strategy)
+        repeats += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / repeats
+
+
+if __name__ == '__main__':
+
+    print(f'{"size":>6}' + ''.join(f'{name:>14}' for name in STRATEGIES) + f'{"auto picks":>14}')
+    for size in SIZES:
+        a, b = random_matrix(size), random_matrix(size)
+        timings = []
+        for name in STRATEGIES:
+            if name == 'naive' and size > NAIVE_MAX_SIZE:
+                timings.append(f'{"-":>14}')
+                continue
+            timings.append(f'{seconds_per_product(a, b, name) * 1e3:>12.3f}ms')
+        print(f'{size:>6}' + ''.join(timings) + f'{choose_strategy(size, size, size):>14}')
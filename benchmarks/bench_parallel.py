@@ -0,0 +1,58 @@
+"""
+scaling benchmark of ParallelBackend: a 400 x 400 float product, and the
+sum and scaling of two 1500 x 1500 matrices, serial and with 1 to N worker
+processes (N = os.cpu_count(), or the first command line argument), through
+the Matrix operators of matrices selecting the backend; the time includes
+the copy of the operands to the arrays of the backend
+
+run with: python -m numeric.benchmarks.bench_parallel [max_workers]
+"""
+
+import os
+import random
+import sys
+import time
+
+from numeric.src.matrix import Matrix
+from numeric.src.parallel import ParallelBackend
+
+
+MATMUL_SIZE = 400
+ELEMENTWISE_SIZE = 1_500
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def random_matrix(size: int) -> Matrix:
+    return Matrix([[random.random() for _ in range(size)] for _ in range(size)])
+
+
+def on_backend(matrix: Matrix, backend: ParallelBackend) -> Matrix:
+    copy = matrix.clone()
+    copy.backend = backend
+    return copy
+
+
+if __name__ == '__main__':
+
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    random.seed(42)
+    a, b = random_matrix(MATMUL_SIZE), random_matrix(MATMUL_SIZE)
+    c, d = random_matrix(ELEMENTWISE_SIZE), random_matrix(ELEMENTWISE_SIZE)
+
+    print(f'matmul {MATMUL_SIZE}x{MATMUL_SIZE}, add and mul {ELEMENTWISE_SIZE}x{ELEMENTWISE_SIZE}, seconds')
+    print(f'{"workers":>8}{"matmul":>10}{"speedup":>9}{"add":>10}{"speedup":>9}{"mul":>10}{"speedup":>9}')
+    serial = [timed(Matrix.__matmul__, a, b), timed(Matrix.__add__, c, d), timed(Matrix.__mul__, c, 2.0)]
+    print(f'{"serial":>8}' + ''.join(f'{elapsed:>10.4f}{1:>8.1f}x' for elapsed in serial))
+    for workers in range(1, max_workers + 1):
+        with ParallelBackend(workers=workers, matmul_threshold=0, elementwise_threshold=0) as backend:
+            pa, pb, pc, pd = (on_backend(matrix, backend) for matrix in (a, b, c, d))
+            on_backend(Matrix([[1.0]]), backend) * 2.0   # starts the worker processes
+            parallel = [timed(Matrix.__matmul__, pa, pb), timed(Matrix.__add__, pc, pd),
+                        timed(Matrix.__mul__, on_backend(c, backend), 2.0)]
+        print(f'{workers:>8}' + ''.join(f'{elapsed:>10.4f}{before / elapsed:>8.1f}x'
+                                        for before, elapsed in zip(serial, parallel)))
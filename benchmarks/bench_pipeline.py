@@ -0,0 +1,59 @@
+"""
+benchmark of a model -> world -> canvas TransformPipeline on 100k points:
+each stage applied per point, each stage applied to the whole batch,
+and the fused matrix applied once
+
+run with: python -m numeric.benchmarks.bench_pipeline
+"""
+
+import math
+import random
+import time
+
+from array import array
+
+from numeric.src.hommat import Hmat33
+from numeric.src.pipeline import TransformPipeline
+
+
+COUNT = 100_000
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def per_point(pipeline: TransformPipeline, coords: array) -> list:
+    stages = [pipeline[idx] for idx in range(len(pipeline))]
+    result = []
+    for idx in range(0, len(coords), 2):
+        point = (coords[idx], coords[idx + 1], 1)
+        for stage in stages:
+            point = stage * point
+        result.extend(point[:2])
+    return result
+
+
+def per_stage(pipeline: TransformPipeline, coords: array) -> array:
+    for idx in range(len(pipeline)):
+        coords = pipeline[idx].apply_many(coords)
+    return coords
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    coords = array('d', (random.random() for _ in range(2 * COUNT)))
+    pipeline = TransformPipeline()
+    pipeline.append(Hmat33.rotation(math.pi / 6) @ Hmat33.scaling(2), name='model')
+    pipeline.append(Hmat33.from_basis((20, 5), (3, 15)), name='world')
+    pipeline.append(Hmat33.translation(250, 250) @ Hmat33.scaling(1, -1), name='canvas')
+
+    before = timed(per_point, pipeline, coords)
+    staged = timed(per_stage, pipeline, coords)
+    fused = timed(pipeline.apply_many, coords)
+    print(f'{COUNT} points through {len(pipeline)} stages, seconds')
+    print(f'{"per point":>12}{"per stage":>12}{"fused":>12}')
+    print(f'{before:>12.4f}{staged:>12.4f}{fused:>12.4f}')
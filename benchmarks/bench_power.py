@@ -0,0 +1,67 @@
+"""
+benchmark of Matrix.__pow__ and Hmat33.__pow__, exponentiation by squaring,
+against multiplying in a loop, for exponents n up to 10**6: the exact
+Fibonacci matrix [[1, 1], [1, 0]] of ints, a rotation Hmat33, a 3x3 float
+Matrix, and a 30x30 stochastic Matrix on the generic kernels; the loop is
+only run up to LOOP_LIMIT
+
+run with: python -m numeric.benchmarks.bench_power
+"""
+
+import math
+import random
+import time
+
+from numeric.src.hommat import Hmat33
+from numeric.src.matrix import Matrix
+
+
+EXPONENTS = (10, 10 ** 3, 10 ** 4, 10 ** 6)
+LOOP_LIMIT = 10 ** 4
+GENERIC = 30
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def loop(matrix, exponent: int):
+    result = matrix
+    for _ in range(exponent - 1):
+        result = result @ matrix
+    return result
+
+
+def squaring(matrix, exponent: int):
+    return matrix ** exponent
+
+
+def stochastic(size: int) -> Matrix:
+    """a random Matrix whose rows sum to 1, its powers stay bounded"""
+    rows = [[random.random() for _ in range(size)] for _ in range(size)]
+    return Matrix([[elt / sum(row) for elt in row] for row in rows])
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    cases = [
+        ('fibonacci 2x2 int', Matrix([[1, 1], [1, 0]])),
+        ('Hmat33 rotation', Hmat33.rotation(0.1)),
+        ('3x3 float', Matrix([[math.cos(0.1), -math.sin(0.1), 0], [math.sin(0.1), math.cos(0.1), 0], [0, 0, 1]])),
+        (f'{GENERIC}x{GENERIC} stochastic', stochastic(GENERIC)),
+    ]
+    print(f'{"":>20}{"n":>9}{"loop s":>10}{"squaring s":>12}{"speedup":>10}')
+    for name, matrix in cases:
+        for exponent in EXPONENTS:
+            fast = timed(squaring, matrix, exponent)
+            if exponent <= LOOP_LIMIT:
+                slow = timed(loop, matrix, exponent)
+                print(f'{name:>20}{exponent:>9}{slow:>10.4f}{fast:>12.6f}{slow / fast:>9.0f}x')
+            else:
+                print(f'{name:>20}{exponent:>9}{"-":>10}{fast:>12.6f}{"-":>10}')
+
+    bits = (Matrix([[1, 1], [1, 0]]) ** 10 ** 6)[0, 1].bit_length()
+    print(f'fibonacci(10**6) has {bits} bits')
@@ -0,0 +1,71 @@
+"""
+benchmark of SparseMatrix on 10k x 10k matrices with ~50k non-zeros
+
+a dense Matrix of that size would hold 10^8 elements, and is out of reach;
+the dense comparison is made on a 400 x 400 matrix of the same density
+
+run with: python -m numeric.benchmarks.bench_sparse
+"""
+
+import operator
+import random
+import sys
+import time
+
+from numeric.src.sparse import COOMatrix, SparseMatrix
+from numeric.src.vector import Vector
+
+
+SIZE = 10_000
+NNZ = 50_000
+DENSE_SIZE = 400
+
+
+def random_coo(size: int, nnz: int) -> COOMatrix:
+    builder = COOMatrix((size, size))
+    for _ in range(nnz):
+        builder.add(random.randrange(size), random.randrange(size), random.random())
+    return builder
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def storage_bytes(sparse: SparseMatrix) -> int:
+    """the arrays, the list of values, and the float objects it refers to"""
+    return (sys.getsizeof(sparse._indptr) + sys.getsizeof(sparse._indices)
+            + sys.getsizeof(sparse._values) + sum(sys.getsizeof(value) for value in sparse._values))
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    builder = random_coo(SIZE, NNZ)
+    a, build = timed(builder.to_csr)
+    b = random_coo(SIZE, NNZ).to_csr()
+    vector = Vector(*(random.random() for _ in range(SIZE)))
+
+    print(f'{SIZE} x {SIZE}, {a.nnz} non-zeros')
+    print(f'storage: {storage_bytes(a) / 2 ** 20:.1f} MB '
+          f'(dense storage: {SIZE * SIZE * 8 / 2 ** 20:.0f} MB of references alone)')
+    print(f'{"operation":<16}{"seconds":>10}')
+    print(f'{"to_csr":<16}{build:>10.4f}')
+    for name, func, args in (('A @ vector', a.__matmul__, (vector,)),
+                             ('A.T()', a.transpose, ()),
+                             ('A + B', a.__add__, (b,)),
+                             ('A @ B', a.__matmul__, (b,))):
+        _, elapsed = timed(func, *args)
+        print(f'{name:<16}{elapsed:>10.4f}')
+
+    density = NNZ / SIZE ** 2
+    small = random_coo(DENSE_SIZE, int(density * DENSE_SIZE ** 2)).to_csr()
+    dense = small.to_matrix()
+    print(f'\n{DENSE_SIZE} x {DENSE_SIZE}, {small.nnz} non-zeros, sparse vs dense')
+    print(f'{"operation":<16}{"dense":>10}{"sparse":>10}{"speedup":>10}')
+    for name, op in (('A @ A', operator.matmul), ('A + A', operator.add)):
+        _, dense_time = timed(op, dense, dense)
+        _, sparse_time = timed(op, small, small)
+        print(f'{name:<16}{dense_time:>10.4f}{sparse_time:>10.4f}{dense_time / sparse_time:>9.0f}x')
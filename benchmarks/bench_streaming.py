@@ -0,0 +1,69 @@
+"""
+benchmark of a stream of 1M pointer events turned into smoothed canvas
+directions: one Point2D per event with a deque, as in
+direction_vector_GUI.direction, compared with the chunked streaming stages
+
+run with: python -m numeric.benchmarks.bench_streaming
+"""
+
+import random
+import time
+
+from collections import deque
+from functools import partial
+
+from numeric.src.hommat import Hmat33
+from numeric.src.streaming import chunked, decimate, differences, normalize, pipe, transform
+from numeric.src.vector import Point2D
+
+
+COUNT = 1_000_000
+LAG = 3
+STEP = 4
+
+
+def events(count: int):
+    random.seed(42)
+    x, y = 0.0, 0.0
+    for _ in range(count):
+        x += random.random()
+        y += random.random()
+        yield x, y
+
+
+def per_event(to_canvas: Hmat33) -> int:
+    window = deque(maxlen=LAG + 1)
+    kept = 0
+    for idx, (x, y) in enumerate(events(COUNT)):
+        px, py, _ = to_canvas * (x, y, 1)
+        window.append(Point2D(px, py))
+        if len(window) > LAG:
+            direction = (window[-1] - window[0]).unit_vector()
+            if (idx - LAG) % STEP == 0 and direction:
+                kept += 1
+    return kept
+
+
+def streamed(to_canvas: Hmat33, size: int) -> int:
+    stream = pipe(chunked(events(COUNT), size=size), partial(transform, hmat=to_canvas),
+                  partial(differences, lag=LAG), normalize, partial(decimate, step=STEP))
+    return sum(len(chunk) for chunk in stream) // 2
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+
+    to_canvas = Hmat33.translation(250, 250) @ Hmat33.scaling(1, -1)
+    source = timed(lambda: sum(1 for _ in events(COUNT)))
+    print(f'{COUNT} events, seconds, the generation of the events ({source:.4f}s) included')
+    print(f'{"chunk":>8}{"seconds":>12}{"events/s":>14}')
+    before = timed(per_event, to_canvas)
+    print(f'{"per evt":>8}{before:>12.4f}{COUNT / before:>14,.0f}')
+    for size in (64, 1024, 4096, 16384):
+        after = timed(streamed, to_canvas, size)
+        print(f'{size:>8}{after:>12.4f}{COUNT / after:>14,.0f}')
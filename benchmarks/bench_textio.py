@@ -0,0 +1,66 @@
+"""
+benchmark of the delimited text readers and writers: a CSV point cloud of
+500 000 points x, y, z read into Point3D objects with csv.reader, or into
+a PointArray by chunks; and a 1000 x 1000 float Matrix written with a loop
+per element, or with Matrix.to_csv, and read back with Matrix.from_csv
+
+run with: python -m numeric.benchmarks.bench_textio
+"""
+
+import csv
+import os
+import random
+import tempfile
+import time
+
+from numeric.src.matrix import Matrix
+from numeric.src.pointarray import PointArray
+from numeric.src.textio import ReadStats
+from numeric.src.vector import Point3D
+
+
+POINTS = 500_000
+SIZE = 1000
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def read_points_loop(path: str) -> list:
+    with open(path, newline='') as file:
+        return [Point3D(float(x), float(y), float(z)) for x, y, z in csv.reader(file)]
+
+
+def write_matrix_loop(matrix: Matrix, path: str) -> None:
+    with open(path, 'w') as file:
+        for row in range(matrix.rows):
+            line = ''
+            for col in range(matrix.cols):
+                line += ('' if col == 0 else ',') + str(matrix[row, col])
+            file.write(line + '\n')
+
+
+if __name__ == '__main__':
+
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as directory:
+        cloud, dump = os.path.join(directory, 'cloud.csv'), os.path.join(directory, 'matrix.csv')
+        PointArray([random.uniform(-100, 100) for _ in range(3 * POINTS)], dim=3).to_csv(cloud)
+        matrix = Matrix([[random.random() for _ in range(SIZE)] for _ in range(SIZE)])
+
+        stats = ReadStats()
+        results = [
+            ('points', timed(read_points_loop, cloud), timed(PointArray.from_csv, cloud, 3, ',', None, 0, stats)),
+            ('write', timed(write_matrix_loop, matrix, dump), timed(matrix.to_csv, dump)),
+        ]
+        matrix_stats = ReadStats()
+        matrix_seconds = timed(Matrix.from_csv, dump, ',', None, None, 0, matrix_stats)
+
+    print(f'{"":>8}{"loop s":>10}{"chunked s":>12}{"speedup":>10}')
+    for name, loop, chunked in results:
+        print(f'{name:>8}{loop:>10.3f}{chunked:>12.3f}{loop / chunked:>9.1f}x')
+    print(f'point cloud read: {stats}')
+    print(f'{SIZE}x{SIZE} matrix read in {matrix_seconds:.3f} s: {matrix_stats}')
@@ -0,0 +1,62 @@
+"""
+micro-benchmark: operations per second of the fixed dimension
+Vector2D / Point2D / Vector3D / Point3D, compared with the generic,
+list backed, Vector and Point of the same dimension (the former
+implementation of Vector2D and Point2D)
+
+run with: python -m numeric.benchmarks.bench_vector
+"""
+
+import timeit
+
+from numeric.src.vector import Point, Point2D, Point3D, Vector, Vector2D, Vector3D
+
+
+NUMBER = 200_000
+
+OPERATIONS = {
+    'construct': 'V(1.5, 2.5)',
+    'p - p': 'p0 - p1',
+    'p + v': 'p0 + v0',
+    'v + v': 'v0 + v1',
+    'v * s': 'v0 * 3.0',
+    'v += v': 'v0.__iadd__(v1)',
+    'v.dot(v)': 'v0.dot(v1)',
+    'v.mag()': 'v0.mag()',
+    'v.unit_vector()': 'v0.unit_vector()',
+    'v == v': 'v0 == v1',
+}
+
+
+def ops_per_second(statement: str, namespace: dict) -> float:
+    elapsed = min(timeit.repeat(statement, globals=namespace, number=NUMBER, repeat=3))
+    return NUMBER / elapsed
+
+
+def namespace_for(point_type, vector_type, dim: int) -> dict:
+    coords_0, coords_1 = (1.5, 2.5, 3.5)[:dim], (-4.0, 0.5, 2.0)[:dim]
+    return {
+        'V': vector_type,
+        'p0': point_type(*coords_0), 'p1': point_type(*coords_1),
+        'v0': vector_type(*coords_0), 'v1': vector_type(*coords_1),
+    }
+
+
+def run(dim: int, point_type, vector_type) -> None:
+    generic = namespace_for(Point, Vector, dim)
+    fixed = namespace_for(point_type, vector_type, dim)
+    construct = OPERATIONS['construct'] if dim == 2 else 'V(1.5, 2.5, 3.5)'
+    print(f'\n{dim}D: generic Point/Vector vs {point_type.__name__}/{vector_type.__name__}')
+    print(f'{"operation":<18}{"before ops/s":>16}{"after ops/s":>16}{"speedup":>10}')
+    for name, statement in OPERATIONS.items():
+        if name == 'construct':
+            statement = construct
+        before = ops_per_second(statement, generic)
+        after = ops_per_second(statement, fixed)
+        print(f'{name:<18}{before:>16,.0f}{after:>16,.0f}{after / before:>9.1f}x')
+
+
+if __name__ == '__main__':
+
+    run(2, Point2D, Vector2D)
+    run(3, Point3D, Vector3D)
@@ -1,5 +1,6 @@
 
-from numeric.src.vector import Point, Point2D, Vector, Vector2D
+from numeric.src.pointarray import PointArray, VectorArray
+from numeric.src.vector import Point, Point2D, Point3D, Vector, Vector2D, Vector3D
 
 
 __all__ = [
@@ -7,4 +8,8 @@ __all__ = [
     'Vector',
     'Point2D',
     'Vector2D',
-]
\ No newline at end of file
+    'Point3D',
+    'Vector3D',
+    'PointArray',
+    'VectorArray',
+]
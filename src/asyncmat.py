@@ -0,0 +1,178 @@
+"""
+asyncio front end for the long Matrix operations
+
+amatmul splits a product into blocks of rows of the left operand, and
+asolve_many splits the right hand sides into blocks of columns; each block
+is computed in an executor (the default thread pool of the event loop, or
+any concurrent.futures executor, a ProcessPoolExecutor included), so that
+the event loop keeps running while the blocks are computed, and the
+coroutine can be cancelled between blocks.
+Each block goes through the same kernel as the synchronous operation, with
+the strategy or the arithmetic mode resolved once for the whole operation:
+the results are identical to those of @, solve and solve_many.
+On a backend other than python, amatmul computes the product with the
+backend, in a single block.
+A is eliminated once by asolve_many, whatever the number of blocks: the LU
+factors are cached on A, and the exact mode solves each block from the
+exact inverse of A, as integers over a common divisor (see src.bareiss).
+
+"""
+
+import asyncio
+
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, List, Union
+
+from numeric.src import bareiss
+from numeric.src.matmul import choose_strategy, matmul
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix, Number
+
+
+CHUNK_ROWS = 64     # rows of the left operand per block of amatmul
+CHUNK_COLS = 64     # right hand sides per block of asolve_many
+
+
+async def _run_blocks(func: Callable, blocks: List[tuple], executor: Union[Executor, None],
+                      concurrency: int) -> list:
+    """runs func(*block) for each block in executor, with at most concurrency blocks in flight
+
+    on cancellation, the blocks not started yet are cancelled, and the
+    cancellation is propagated; a block already running runs to completion
+    in its worker
+
+    :return: the list of the results of the blocks, in order
+    """
+    if concurrency < 1:
+        raise ValueError('at least one block must be in flight')
+    loop = asyncio.get_running_loop()
+    results, pending = [], deque()
+    try:
+        for block in blocks:
+            pending.append(loop.run_in_executor(executor, func, *block))
+            if len(pending) >= concurrency:
+                results.append(await pending.popleft())
+        while pending:
+            results.append(await pending.popleft())
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    return results
+
+
+async def amatmul(a: Matrix, b: Matrix, chunk_rows: int = CHUNK_ROWS, executor: Union[Executor, None] = None,
+                  concurrency: int = 1, strategy: str = 'auto') -> Matrix:
+    """multiplies a with b, without blocking the event loop
+
+    :param chunk_rows: int, the number of rows of a per block
+    :param executor: the executor computing the blocks, None for the default executor of the loop
+    :param concurrency: int, the maximum number of blocks in flight, more than one for a process pool
+    :param strategy: str, see Matrix.matmul; with 'auto', a backend other than python
+                     computes the whole product, as a single block
+    :return: a new Matrix, equal to a.matmul(b, strategy)
+    """
+    if not isinstance(a, Matrix) or not isinstance(b, Matrix):
+        raise TypeError('Matrix multiplication must multiply two Matrices')
+    if a.cols != b.rows:
+        raise IncompatibleMatrixShapes('Matrix A number of columns must equal Matrix B number of rows')
+    if chunk_rows < 1:
+        raise ValueError('a block holds at least one row')
+    if strategy == 'auto':
+        backend, _ = a._backend_operands(b)
+        if backend is not None:
+            return await asyncio.get_running_loop().run_in_executor(executor, a.matmul, b)
+    if strategy == 'auto' and a.shape == b.shape and a._small_size():
+        return a.matmul(b)
+    if strategy == 'auto':
+        strategy = choose_strategy(a.rows, a.cols, b.cols)
+    a_rows, b_rows = a._row_lists(), b._row_lists()
+    blocks = [(a_rows[start: start + chunk_rows], b_rows, strategy) for start in range(0, a.rows, chunk_rows)]
+    products = await _run_blocks(matmul, blocks, executor, concurrency)
+    return Matrix._from_rows([row for product in products for row in product])
+
+
+async def asolve(a: Matrix, rhs: Union[Matrix, List[Number]], exact: Union[bool, None] = None,
+                 executor: Union[Executor, None] = None) -> Union[Matrix, List[Number]]:
+    """solves a @ x = rhs in executor, without blocking the event loop
+
+    a single system is not split: its elimination is one block
+
+    :return: x, equal to a.solve(rhs, exact)
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, a.solve, rhs, exact)
+
+
+def _solve_block(a: Matrix, rhss: Matrix) -> List[list]:
+    """
+    :return: the rows of the solutions of a @ X = rhss, with the LU factors of a
+    """
+    return a.solve_many(rhss, exact=False)._row_lists()
+
+
+def _solve_exact_block(numerators: List[List[int]], divisor: int, rhss: Matrix) -> List[list]:
+    """
+    :return: the rows of the exact solutions of a @ X = rhss, from the inverse of a
+    """
+    return list(map(list, zip(*bareiss.solve_inverted(numerators, divisor, rhss.transpose()._row_lists()))))
+
+
+async def asolve_many(a: Matrix, rhss: Matrix, exact: Union[bool, None] = None, chunk_cols: int = CHUNK_COLS,
+                      executor: Union[Executor, None] = None, concurrency: int = 1) -> Matrix:
+    """solves a @ X = rhss by blocks of columns of rhss, without blocking the event loop
+
+    a is eliminated once, in a first block: the LU factors are cached on a,
+    and the exact mode computes the exact inverse of a; the other blocks only
+    substitute, or multiply by the inverse. The exact inverse costs more than
+    an elimination of a with all of rhss unless rhss has at least a.rows
+    columns, split in several blocks: otherwise the exact mode solves all of
+    rhss in a single block
+
+    :param exact: True, False or None, see Matrix._use_exact; resolved once for all the blocks
+    :param chunk_cols: int, the number of right hand sides per block
+    :return: X, equal to a.solve_many(rhss, exact)
+    """
+    a._check_square()
+    if not isinstance(rhss, Matrix):
+        raise TypeError('the right hand sides must be given as the columns of a Matrix')
+    if rhss.rows != a.rows:
+        raise IncompatibleMatrixShapes('the right hand sides must have self.rows rows')
+    if chunk_cols < 1:
+        raise ValueError('a block holds at least one right hand side')
+    exact = a._use_exact(exact, rhss.transpose()._row_lists())
+    loop = asyncio.get_running_loop()
+    chunks = [rhss[:, start: start + chunk_cols].copy() for start in range(0, rhss.cols, chunk_cols)]
+    if exact and (len(chunks) == 1 or rhss.cols < a.rows):
+        return await loop.run_in_executor(executor, a.solve_many, rhss, True)
+    if exact:
+        numerators, divisor = await loop.run_in_executor(executor, bareiss.inverse_numerators, a._row_lists())
+        blocks = [(numerators, divisor, chunk) for chunk in chunks]
+        solutions = await _run_blocks(_solve_exact_block, blocks, executor, concurrency)
+    else:
+        await loop.run_in_executor(executor, a.lu)
+        solutions = await _run_blocks(_solve_block, [(a, chunk) for chunk in chunks], executor, concurrency)
+    return Matrix._from_rows([[elt for solution in solutions for elt in solution[row]] for row in range(a.rows)])
+
+
+if __name__ == '__main__':
+
+    import random
+
+    async def ticker(ticks: list) -> None:
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.01)
+
+    async def main() -> None:
+        size = 200
+        a = Matrix([[random.random() for _ in range(size)] for _ in range(size)])
+        b = Matrix([[random.random() for _ in range(size)] for _ in range(size)])
+        ticks = []
+        task = asyncio.ensure_future(ticker(ticks))
+        product = await amatmul(a, b, chunk_rows=16)
+        task.cancel()
+        print(f'{size}x{size} product, {len(ticks)} ticks of the event loop meanwhile')
+        print(product._row_lists() == (a @ b)._row_lists())
+        print(await asolve(Matrix([[2, 1], [1, 3]]), [3, 5]))
+
+    asyncio.run(main())
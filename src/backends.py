@@ -0,0 +1,256 @@
+"""
+pluggable compute backends for src.matrix.Matrix
+
+A Matrix stores its elements in python lists; a backend computes its
+heavy operations (@, +, -, multiplication by a scalar, ==) on another
+representation of the same values, an "array", that the Matrix caches
+until it is mutated, as it caches its LU decomposition.
+The results keep their array, and their python list is only materialized
+from it (to_flat) when it is first needed: on element access, by a view,
+or by an operation of the pure python path. Chained operations stay on the
+backend without converting their intermediate results.
+
+A backend declines the matrices it cannot represent without loss (to_array
+returns None): these stay on the pure python path, which keeps the exact
+arithmetic of int and Fraction elements.
+
+backends:
+    python:  the pure python kernels, the default
+    numpy:   float64 and complex128 numpy arrays, when numpy is importable
+
+The backend is selected per Matrix (Matrix(data, backend='numpy'), or
+matrix.backend = 'numpy'), or globally with set_default_backend('numpy').
+Other backends are plugged in with register(backend), an instance of a
+subclass of Backend that implements all its abstract methods.
+
+"""
+
+import math
+import operator
+
+from abc import ABC, abstractmethod
+from itertools import chain
+from typing import Any, Dict, List, Union
+
+from numeric.src.matmul import matmul
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+EXACT_FLOAT_INT = 2 ** 53    # the ints of larger magnitude do not convert exactly to float64
+
+
+class Backend(ABC):
+    """
+    the interface of a backend; the arrays are opaque to Matrix
+    """
+    name = ''
+
+    @abstractmethod
+    def available(self) -> bool:
+        """
+        :return: True if the packages the backend depends on are installed
+        """
+
+    @abstractmethod
+    def to_array(self, flat: list, rows: int, cols: int) -> Any:
+        """
+        :param flat: the elements of a matrix, in row-major order
+        :return: the array of the matrix, or None if the backend cannot represent it without loss
+        """
+
+    @abstractmethod
+    def to_rows(self, array: Any) -> List[list]:
+        """
+        :return: the rows of array, as new lists of python numbers
+        """
+
+    def to_flat(self, array: Any) -> list:
+        """
+        :return: a new list of the python numbers of array, in row-major order
+        """
+        return list(chain.from_iterable(self.to_rows(array)))
+
+    def accepts_scalar(self, scalar: Any) -> bool:
+        return False
+
+    @abstractmethod
+    def matmul(self, a: Any, b: Any) -> Any:
+        """
+        :return: the array of a @ b
+        """
+
+    @abstractmethod
+    def add(self, a: Any, b: Any) -> Any:
+        """
+        :return: the array of a + b
+        """
+
+    @abstractmethod
+    def sub(self, a: Any, b: Any) -> Any:
+        """
+        :return: the array of a - b
+        """
+
+    @abstractmethod
+    def scale(self, a: Any, scalar: Any) -> Any:
+        """
+        :return: the array of a * scalar, for a scalar that accepts_scalar
+        """
+
+    @abstractmethod
+    def isclose(self, a: Any, b: Any) -> bool:
+        """
+        :return: True if all the elements of a and b are close, as Matrix.__eq__ with math.isclose
+        """
+
+
+class PythonBackend(Backend):
+    """
+    the pure python kernels; its arrays are lists of rows
+
+    Matrix does not go through it: its own kernels compute on its storage
+    directly, the arrays would only add a conversion
+    """
+    name = 'python'
+
+    def available(self) -> bool:
+        return True
+
+    def to_array(self, flat: list, rows: int, cols: int) -> List[list]:
+        return [flat[row * cols: (row + 1) * cols] for row in range(rows)]
+
+    def to_rows(self, array: List[list]) -> List[list]:
+        return [row[:] for row in array]
+
+    def accepts_scalar(self, scalar: Any) -> bool:
+        return True
+
+    def matmul(self, a: List[list], b: List[list]) -> List[list]:
+        return matmul(a, b)
+
+    def add(self, a: List[list], b: List[list]) -> List[list]:
+        return [list(map(operator.add, row_a, row_b)) for row_a, row_b in zip(a, b)]
+
+    def sub(self, a: List[list], b: List[list]) -> List[list]:
+        return [list(map(operator.sub, row_a, row_b)) for row_a, row_b in zip(a, b)]
+
+    def scale(self, a: List[list], scalar: Any) -> List[list]:
+        return [[elt * scalar for elt in row] for row in a]
+
+    def isclose(self, a: List[list], b: List[list]) -> bool:
+        return all(map(math.isclose, chain.from_iterable(a), chain.from_iterable(b)))
+
+
+class NumpyBackend(Backend):
+    """
+    numpy float64 arrays for real matrices, complex128 arrays for complex matrices
+
+    matrices holding only ints (exact, unbounded), or Fractions, or any other
+    type, are declined; ints mixed with floats are accepted below 2**53
+    """
+    name = 'numpy'
+
+    def available(self) -> bool:
+        return numpy is not None
+
+    def to_array(self, flat: list, rows: int, cols: int) -> Any:
+        kinds = set(map(type, flat))
+        if not kinds <= {float, int, complex} or kinds == {int}:
+            return None
+        if int in kinds and any(abs(elt) >= EXACT_FLOAT_INT for elt in flat if type(elt) is int):
+            return None
+        dtype = numpy.complex128 if complex in kinds else numpy.float64
+        return numpy.array(flat, dtype=dtype).reshape(rows, cols)
+
+    def to_rows(self, array: Any) -> List[list]:
+        return array.tolist()
+
+    def to_flat(self, array: Any) -> list:
+        return array.ravel().tolist()
+
+    def export(self, flat: list, rows: int, cols: int) -> Any:
+        """
+        :return: a new numpy array of the elements: float64 or complex128 as for to_array,
+                 int64 for ints that fit, dtype object otherwise, Fractions included
+        """
+        array = self.to_array(flat, rows, cols)
+        if array is not None:
+            return array
+        int64 = set(map(type, flat)) == {int} and all(-2 ** 63 <= elt < 2 ** 63 for elt in flat)
+        return numpy.array(flat, dtype=numpy.int64 if int64 else object).reshape(rows, cols)
+
+    def accepts_scalar(self, scalar: Any) -> bool:
+        return type(scalar) in (float, int, complex) and abs(scalar) < EXACT_FLOAT_INT
+
+    def matmul(self, a: Any, b: Any) -> Any:
+        return a @ b
+
+    def add(self, a: Any, b: Any) -> Any:
+        return a + b
+
+    def sub(self, a: Any, b: Any) -> Any:
+        return a - b
+
+    def scale(self, a: Any, scalar: Any) -> Any:
+        return a * scalar
+
+    def isclose(self, a: Any, b: Any) -> bool:
+        rel_tol = 1e-09     # the default of math.isclose
+        finite = numpy.isfinite(a) & numpy.isfinite(b)
+        close = (a == b) | (finite & (abs(a - b) <= rel_tol * numpy.maximum(abs(a), abs(b))))
+        return bool(close.all())
+
+
+_BACKENDS: Dict[str, Backend] = {}
+_default: List[Backend] = []
+
+
+def register(backend: Backend) -> None:
+    """makes backend selectable by its name
+    """
+    if not backend.name:
+        raise ValueError('a backend must have a name')
+    _BACKENDS[backend.name] = backend
+
+
+def get_backend(name: Union[str, Backend]) -> Backend:
+    """
+    :param name: str, the name of a registered backend, or a Backend
+    :return: the Backend
+    :raises ValueError: for an unknown name
+    :raises ImportError: when the backend depends on a package that is not installed
+    """
+    if isinstance(name, Backend):
+        return name
+    try:
+        backend = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f'unknown Matrix backend: {name}')
+    if not backend.available():
+        raise ImportError(f'the {name} backend requires {name}, which is not installed')
+    return backend
+
+
+def default_backend() -> Backend:
+    return _default[0]
+
+
+def set_default_backend(name: Union[str, Backend]) -> str:
+    """selects the backend of the Matrices that do not select one
+
+    :return: str, the name of the previous default backend
+    """
+    backend = get_backend(name)
+    previous = _default[0].name
+    _default[0] = backend
+    return previous
+
+
+PYTHON = PythonBackend()
+register(PYTHON)
+register(NumpyBackend())
+_default.append(PYTHON)
@@ -0,0 +1,192 @@
+"""
+exact arithmetic for matrices of int and Fraction, by fraction-free
+Bareiss elimination
+
+Each row is first scaled to integers by the lcm of its denominators; the
+elimination then only ever handles integers, every division being exact.
+Fractions are built once, at the end, instead of normalizing a gcd at every
+step of a Gaussian elimination on Fraction entries.
+
+"""
+
+import math
+import operator
+
+from fractions import Fraction
+from typing import List, Sequence, Tuple, Union
+
+from numeric.src.lu import SingularMatrixError
+
+
+Rational = Union[int, Fraction]
+
+
+def is_exact(rows: Sequence[Sequence]) -> bool:
+    """
+    :return: True if every element of rows is an int or a Fraction
+    """
+    return all(isinstance(elt, (int, Fraction)) for row in rows for elt in row)
+
+
+def _integer_row(row: Sequence[Rational]) -> Tuple[List[int], int]:
+    """scales a row of rationals to integers
+
+    floats are accepted, and converted exactly to Fraction
+
+    :return: the scaled row, and the scale, the lcm of the denominators
+    """
+    row = [Fraction(elt) for elt in row]
+    scale = math.lcm(*(elt.denominator for elt in row))
+    return [elt.numerator * (scale // elt.denominator) for elt in row], scale
+
+
+def _eliminate(matrix: List[List[int]], num_cols: int) -> Tuple[int, List[int]]:
+    """fraction-free forward elimination, in place, over the first num_cols columns
+
+    columns without a pivot are skipped, leaving matrix in row echelon form
+
+    :return: the sign of the row permutation, and the list of the pivot columns
+    """
+    num_rows = len(matrix)
+    sign, previous, pivot_row, pivot_cols = 1, 1, 0, []
+    for col in range(num_cols):
+        if pivot_row == num_rows:
+            break
+        found = next((row for row in range(pivot_row, num_rows) if matrix[row][col]), None)
+        if found is None:
+            continue
+        if found != pivot_row:
+            matrix[pivot_row], matrix[found] = matrix[found], matrix[pivot_row]
+            sign = -sign
+        pivot_tail = matrix[pivot_row][col:]
+        pivot = pivot_tail[0]
+        for row in matrix[pivot_row + 1:]:
+            factor = row[col]
+            row[col:] = [(pivot * elt - factor * pivot_elt) // previous
+                         for elt, pivot_elt in zip(row[col:], pivot_tail)]
+        previous = pivot
+        pivot_cols.append(col)
+        pivot_row += 1
+    return sign, pivot_cols
+
+
+def det(rows: Sequence[Sequence[Rational]]) -> Rational:
+    """
+    :param rows: the rows of a square matrix of int or Fraction
+    :return: the exact determinant, an int when every element is an int
+    """
+    size = len(rows)
+    matrix, scale = [], 1
+    for row in rows:
+        int_row, row_scale = _integer_row(row)
+        matrix.append(int_row)
+        scale *= row_scale
+    sign, pivot_cols = _eliminate(matrix, size)
+    if len(pivot_cols) < size:
+        return 0
+    result = Fraction(sign * matrix[-1][-1], scale)
+    return result.numerator if result.denominator == 1 else result
+
+
+def rank(rows: Sequence[Sequence[Rational]]) -> int:
+    """
+    :param rows: the rows of a matrix of int or Fraction
+    :return: int, the exact rank of the matrix
+    """
+    matrix = [_integer_row(row)[0] for row in rows]
+    return len(_eliminate(matrix, len(matrix[0]))[1])
+
+
+def solve_many(rows: Sequence[Sequence[Rational]],
+               rhss: Sequence[Sequence[Rational]]) -> List[List[Fraction]]:
+    """solves A @ x = rhs exactly, for each rhs in rhss
+
+    :param rows: the rows of A, a square matrix of int or Fraction
+    :param rhss: sequence of right hand sides, each a sequence of len(rows) numbers
+    :return: list of the solutions, in the order of rhss, as Fractions
+    """
+    scaled, divisor = _solve_scaled(rows, rhss)
+    return [[Fraction(elt, divisor) for elt in solution] for solution in scaled]
+
+
+def _solve_scaled(rows: Sequence[Sequence[Rational]],
+                  rhss: Sequence[Sequence[Rational]]) -> Tuple[List[List[int]], int]:
+    """
+    :return: the solutions of A @ x = rhs, each scaled to integers by the divisor, and the divisor
+    """
+    size, num_rhs = len(rows), len(rhss)
+    if any(len(rhs) != size for rhs in rhss):
+        raise ValueError('the right hand side must have as many values as the matrix has rows')
+    matrix = [_integer_row(list(row) + [rhs[idx] for rhs in rhss])[0]
+              for idx, row in enumerate(rows)]
+    _, pivot_cols = _eliminate(matrix, size)
+    if len(pivot_cols) < size:
+        raise SingularMatrixError('cannot solve a system with a singular matrix')
+
+    # the last pivot d is the determinant of the (scaled, permuted) system, so
+    # y = d * x is an integer vector, and the back substitution is exact
+    divisor = matrix[-1][size - 1]
+    solutions = []
+    for rhs_col in range(size, size + num_rhs):
+        scaled = [0] * size
+        for idx in reversed(range(size)):
+            row = matrix[idx]
+            total = divisor * row[rhs_col] - sum(row[col] * scaled[col] for col in range(idx + 1, size))
+            scaled[idx] = total // row[idx]
+        solutions.append(scaled)
+    return solutions, divisor
+
+
+def inverse_numerators(rows: Sequence[Sequence[Rational]]) -> Tuple[List[List[int]], int]:
+    """the exact inverse of A, as integers over a common divisor, by a single elimination
+
+    the right hand sides can then be solved by solve_inverted, with integer
+    products only, without eliminating A again
+
+    :param rows: the rows of a square matrix of int or Fraction
+    :return: the rows of the integer matrix N, and the int divisor d: A^-1 = N / d
+    """
+    size = len(rows)
+    columns, divisor = _solve_scaled(rows, [[1 if row == col else 0 for row in range(size)]
+                                            for col in range(size)])
+    return list(map(list, zip(*columns))), divisor
+
+
+def solve_inverted(numerators: Sequence[Sequence[int]], divisor: int,
+                   rhss: Sequence[Sequence[Rational]]) -> List[List[Fraction]]:
+    """solves A @ x = rhs exactly, for each rhs in rhss, from the inverse of A
+
+    :param numerators, divisor: the inverse of A, see inverse_numerators
+    :param rhss: sequence of right hand sides, each a sequence of len(numerators) numbers
+    :return: list of the solutions, in the order of rhss, as Fractions, equal to solve_many
+    """
+    size = len(numerators)
+    solutions = []
+    for rhs in rhss:
+        if len(rhs) != size:
+            raise ValueError('the right hand side must have as many values as the matrix has rows')
+        column, scale = _integer_row(rhs)
+        denominator = divisor * scale
+        solutions.append([Fraction(sum(map(operator.mul, row, column)), denominator) for row in numerators])
+    return solutions
+
+
+def solve(rows: Sequence[Sequence[Rational]], rhs: Sequence[Rational]) -> List[Fraction]:
+    """solves A @ x = rhs exactly
+
+    :param rows: the rows of A, a square matrix of int or Fraction
+    :param rhs: sequence of len(rows) numbers
+    :return: list of Fractions, the solution x
+    """
+    return solve_many(rows, [rhs])[0]
+
+
+def inverse(rows: Sequence[Sequence[Rational]]) -> List[List[Fraction]]:
+    """
+    :param rows: the rows of a square matrix of int or Fraction
+    :return: the rows of the exact inverse, as Fractions
+    """
+    size = len(rows)
+    columns = solve_many(rows, [[1 if row == col else 0 for row in range(size)]
+                                for col in range(size)])
+    return list(map(list, zip(*columns)))
@@ -0,0 +1,56 @@
+"""
+reading objects that support the buffer protocol
+
+array.array, bytes, bytearray, memoryview, mmap, numpy arrays... expose
+their memory as a typed, possibly multidimensional, buffer. These helpers
+read such a buffer as a flat sequence of numbers, with C-level copies
+(array.frombytes, memoryview.tolist) instead of a python loop per element.
+
+"""
+
+from array import array
+from typing import Any, List, Tuple
+
+
+NATIVE_FORMATS = 'bBhHiIlLqQnNfd'   # the formats memoryview.cast and array support
+
+
+def flat_view(obj: Any) -> Tuple[memoryview, Tuple[int, ...]]:
+    """
+    :param obj: an object supporting the buffer protocol
+    :return: a 1 dimensional memoryview of the elements of obj, in C order, and the shape of obj;
+             the view shares the memory of obj when obj is C-contiguous
+    :raises ValueError: for the buffers of another format than a native number
+    """
+    view = memoryview(obj)
+    fmt = view.format.lstrip('@')
+    if fmt not in NATIVE_FORMATS or len(fmt) != 1:
+        raise ValueError(f'unsupported buffer format: {view.format}')
+    shape = view.shape
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes(order='C'))
+    return view.cast('B').cast(fmt), shape
+
+
+def to_list(obj: Any) -> Tuple[List, Tuple[int, ...]]:
+    """
+    :return: a new list of the elements of obj, python ints or floats, and the shape of obj
+    """
+    view, shape = flat_view(obj)
+    with view:
+        return view.tolist(), shape
+
+
+def to_array(obj: Any) -> Tuple[array, Tuple[int, ...]]:
+    """
+    :return: a new array('d') of the elements of obj, and the shape of obj;
+             a buffer of doubles is copied as raw bytes
+    """
+    view, shape = flat_view(obj)
+    with view:
+        if view.format == 'd':
+            coords = array('d')
+            coords.frombytes(view.cast('B'))
+        else:
+            coords = array('d', view.tolist())
+    return coords, shape
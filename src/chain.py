@@ -0,0 +1,152 @@
+"""
+optimal order of the products of a chain of matrices
+
+the product of a chain A0 @ A1 @ ... @ An-1 has the same value in any
+order of evaluation, but not the same cost: with A0 10x1000, A1 1000x1000
+and A2 1000x1, (A0 @ A1) @ A2 takes 10 010 000 multiplications, and
+A0 @ (A1 @ A2) 1 010 000. parenthesize finds the cheapest order with the
+classic dynamic programming on the shapes, in O(n**3) of the length of
+the chain; multiply evaluates the chain in that order.
+
+the shapes of a chain are given as its dims: Ai has shape (dims[i], dims[i + 1])
+
+plan caches the order of a chain by its dims, so that the repeated chains
+of the same shapes are not planned again, and compares its cost with the
+evaluation from left to right of functools.reduce(operator.matmul, chain).
+
+"""
+
+import operator
+
+from functools import lru_cache
+from typing import Any, Callable, List, NamedTuple, Sequence, Tuple
+
+
+def parenthesize(dims: Sequence[int]) -> Tuple[int, List[List[int]]]:
+    """
+    :param dims: the dims of a chain of n matrices, n + 1 ints
+    :return: the minimal number of scalar multiplications of the product of the chain,
+             and the split table: the product of the matrices i to j is split as
+             (i .. split[i][j]) @ (split[i][j] + 1 .. j) in the cheapest order
+    """
+    count = len(dims) - 1
+    if count < 1:
+        raise ValueError('a chain holds at least one matrix')
+    cost = [[0] * count for _ in range(count)]
+    split = [[0] * count for _ in range(count)]
+    for length in range(1, count):
+        for first in range(count - length):
+            last = first + length
+            best, best_split = None, first
+            for mid in range(first, last):
+                candidate = cost[first][mid] + cost[mid + 1][last] + dims[first] * dims[mid + 1] * dims[last + 1]
+                if best is None or candidate < best:
+                    best, best_split = candidate, mid
+            cost[first][last], split[first][last] = best, best_split
+    return cost[0][count - 1], split
+
+
+def naive_cost(dims: Sequence[int]) -> int:
+    """
+    :return: the number of scalar multiplications of the product of the chain from left to right
+    """
+    return sum(dims[0] * dims[index] * dims[index + 1] for index in range(1, len(dims) - 1))
+
+
+class Plan(NamedTuple):
+    """
+    the cheapest order of the products of a chain of matrices of dims
+
+    the costs are counted in scalar multiplications; a product of matrices
+    of shapes (m, n) and (n, p) takes m * n * p, and 2 * m * n * p flops
+    counting the additions
+    """
+    dims: Tuple[int, ...]
+    split: Tuple[Tuple[int, ...], ...]
+    cost: int
+    naive_cost: int
+
+    @property
+    def flops(self) -> int:
+        return 2 * self.cost
+
+    @property
+    def naive_flops(self) -> int:
+        return 2 * self.naive_cost
+
+    @property
+    def speedup(self) -> float:
+        """
+        :return: the estimated speedup over the product from left to right
+        """
+        return self.naive_cost / self.cost if self.cost else 1.0
+
+    def order(self) -> str:
+        """
+        :return: str, the parenthesization of the chain, its matrices named A0, A1...
+        """
+        return multiply([f'A{index}' for index in range(len(self.dims) - 1)], self.split,
+                        lambda left, right: f'({left} {right})')
+
+    def __str__(self):
+        return (f'{self.order()}: {self.flops:,} flops, {self.naive_flops:,} from left to right '
+                f'({self.speedup:.1f}x)')
+
+
+@lru_cache(maxsize=1024)
+def plan(dims: Tuple[int, ...]) -> Plan:
+    """
+    :param dims: the dims of a chain, a tuple
+    :return: the Plan of the chain, computed once per dims
+    """
+    cost, split = parenthesize(dims)
+    return Plan(dims, tuple(map(tuple, split)), cost, naive_cost(dims))
+
+
+def dims_of(matrices: Sequence[Any]) -> Tuple[int, ...]:
+    """
+    :param matrices: a chain of objects with a shape (rows, cols): Matrix, SparseMatrix, numpy arrays...
+    :return: the dims of the chain
+    :raises ValueError: if the shapes of consecutive matrices do not match
+    """
+    if not matrices:
+        raise ValueError('a chain holds at least one matrix')
+    shapes = [tuple(matrix.shape) for matrix in matrices]
+    for index, (left, right) in enumerate(zip(shapes, shapes[1:])):
+        if left[1] != right[0]:
+            raise ValueError(f'matrix {index} of shape {left} cannot multiply matrix {index + 1} of shape {right}')
+    return tuple(rows for rows, _ in shapes) + (shapes[-1][1],)
+
+
+def multi_dot(matrices: Sequence[Any], product: Callable[[Any, Any], Any] = operator.matmul) -> Any:
+    """multiplies a chain of matrices in its cheapest order
+
+    :param matrices: a chain of objects with a shape (rows, cols), see dims_of
+    :param product: the product of two matrices, @ by default
+    :return: the product of the chain
+    """
+    return multiply(matrices, plan(dims_of(matrices)).split, product)
+
+
+def multiply(matrices: Sequence[Any], split: Sequence[Sequence[int]],
+             product: Callable[[Any, Any], Any] = operator.matmul) -> Any:
+    """
+    :param matrices: the chain of matrices
+    :param split: the split table of parenthesize for the dims of the chain
+    :param product: the product of two matrices, @ by default
+    :return: the product of the chain, evaluated in the order of split
+    """
+
+    def subchain(first: int, last: int) -> Any:
+        if first == last:
+            return matrices[first]
+        mid = split[first][last]
+        return product(subchain(first, mid), subchain(mid + 1, last))
+
+    return subchain(0, len(matrices) - 1)
+
+
+if __name__ == '__main__':
+
+    print(plan((10, 1000, 1000, 1)))
+    print(plan((30, 35, 15, 5, 10, 20, 25)))
@@ -0,0 +1,201 @@
+"""
+a tree of 2D coordinate systems (frames), and conversions between them
+
+Each CoordinateSystem places its basis e1, e2 and its origin in the
+coordinates of its parent; the root has no parent. The local transform
+(to the parent) is an Hmat33, and each frame caches its transform to the
+root, and the inverse, from the root.
+A frame computing its transform to the root also caches those of all its
+ancestors; moving a frame clears the caches of its subtree only, so a
+frame whose cache is empty has a subtree without caches, and invalidation
+stops there. Walks along the tree are iterative, deep hierarchies do not
+hit the recursion limit.
+
+"""
+
+import numbers
+
+from array import array
+from typing import Iterable, List, Sequence, Union
+
+from numeric.src.hommat import Buffer, Hmat33
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point, Point2D, Vector2D
+
+
+class CoordinateSystem:
+    """
+    a frame of a tree of coordinate systems
+    """
+
+    def __init__(self, e1: Vector2D = Vector2D(1, 0), e2: Vector2D = Vector2D(0, 1),
+                 origin: Point2D = Point2D(0, 0), parent: 'CoordinateSystem' = None,
+                 name: str = '') -> None:
+        """
+        :param e1: the first basis vector of this frame, in the parent coordinates
+        :param e2: the second basis vector of this frame, in the parent coordinates
+        :param origin: the origin of this frame, in the parent coordinates
+        :param parent: the parent frame, None for a root
+        :param name: the name of this frame
+        """
+        self.name = name
+        self._parent = None
+        self._children: List['CoordinateSystem'] = []
+        self._to_root: Union[Hmat33, None] = None
+        self._from_root: Union[Hmat33, None] = None
+        self.move(e1, e2, origin)
+        self.parent = parent
+
+    @property
+    def e1(self) -> Vector2D:
+        return self._e1
+
+    @property
+    def e2(self) -> Vector2D:
+        return self._e2
+
+    @property
+    def origin(self) -> Point2D:
+        return self._origin
+
+    @property
+    def local(self) -> Hmat33:
+        """
+        :return: the Hmat33 transforming coordinates in self to coordinates in the parent
+        """
+        return self._local
+
+    @property
+    def parent(self) -> Union['CoordinateSystem', None]:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Union['CoordinateSystem', None]) -> None:
+        """attaches self, with its subtree, to parent, or makes it a root with None
+        """
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor is self:
+                raise ValueError('a frame cannot be its own ancestor')
+            ancestor = ancestor._parent
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+        self._invalidate()
+
+    @property
+    def children(self) -> List['CoordinateSystem']:
+        return self._children[:]
+
+    @property
+    def root(self) -> 'CoordinateSystem':
+        frame = self
+        while frame._parent is not None:
+            frame = frame._parent
+        return frame
+
+    def move(self, e1: Vector2D = None, e2: Vector2D = None, origin: Point2D = None) -> None:
+        """replaces the basis vectors and/or the origin given, in the parent coordinates
+
+        the cached transforms of self and its descendants are invalidated
+        """
+        if e1 is not None:
+            self._e1 = Vector2D(*e1)
+        if e2 is not None:
+            self._e2 = Vector2D(*e2)
+        if origin is not None:
+            self._origin = Point2D(*origin)
+        self._local = Hmat33.from_basis(self._e1, self._e2, self._origin)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """clears the cached transforms of self and its subtree
+        """
+        stack = [self]
+        while stack:
+            frame = stack.pop()
+            if frame._to_root is None:
+                continue
+            frame._to_root = frame._from_root = None
+            stack.extend(frame._children)
+
+    @property
+    def to_root(self) -> Hmat33:
+        """
+        :return: the Hmat33 transforming coordinates in self to coordinates in the root
+        """
+        if self._to_root is None:
+            uncached = []
+            frame = self
+            while frame is not None and frame._to_root is None:
+                uncached.append(frame)
+                frame = frame._parent
+            for frame in reversed(uncached):
+                parent = frame._parent
+                frame._to_root = frame._local if parent is None else parent._to_root @ frame._local
+        return self._to_root
+
+    @property
+    def from_root(self) -> Hmat33:
+        """
+        :return: the Hmat33 transforming coordinates in the root to coordinates in self
+        """
+        if self._from_root is None:
+            self._from_root = self.to_root.inverse()
+        return self._from_root
+
+    def transform_to(self, other: 'CoordinateSystem') -> Hmat33:
+        """
+        :return: the Hmat33 transforming coordinates in self to coordinates in other
+        """
+        if self.root is not other.root:
+            raise ValueError('the frames must belong to the same tree')
+        if other is self:
+            return Hmat33.identity()
+        return other.from_root @ self.to_root
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(name={self.name!r})'
+
+
+def convert(points: Union[Sequence[float], PointArray, Iterable[Point]], from_frame: CoordinateSystem,
+            to_frame: CoordinateSystem, out: Union[Buffer, None] = None,
+            vectors: bool = False) -> Union[Buffer, PointArray]:
+    """converts a batch of points, or vectors, from from_frame coordinates to to_frame coordinates
+
+    :param points: a flat buffer of coordinates x0, y0, x1, y1, ..., a PointArray,
+                   or a sequence of Point2D
+    :param out: for a flat buffer, the buffer to write the result to, see Hmat33.apply_many
+    :param vectors: bool, True to convert vectors, ignoring the translations
+    :return: a buffer for a flat buffer, a new PointArray otherwise
+    """
+    transform = from_frame.transform_to(to_frame)
+    if _is_flat(points):
+        return transform.apply_many(points, out=out, vectors=vectors)
+    if not isinstance(points, PointArray):
+        points = PointArray.from_elements(points)
+    return PointArray._from_buffer(transform.apply_many(points.coords, vectors=vectors), 2)
+
+
+def _is_flat(points) -> bool:
+    """
+    :return: True if points is a flat buffer of numbers, rather than a batch or a sequence of Point
+    """
+    if isinstance(points, (array, memoryview)):
+        return True
+    return isinstance(points, list) and len(points) > 0 and isinstance(points[0], numbers.Number)
+
+
+if __name__ == '__main__':
+
+    world = CoordinateSystem(name='world')
+    canvas = CoordinateSystem(Vector2D(1, 0), Vector2D(0, -1), Point2D(250, 250), parent=world, name='canvas')
+    model = CoordinateSystem(Vector2D(20, 5), Vector2D(3, 15), parent=world, name='model')
+    part = CoordinateSystem(Vector2D(0, 1), Vector2D(-1, 0), Point2D(2, 2), parent=model, name='part')
+
+    print(convert([Point2D(0, 0), Point2D(1, 0)], part, canvas).to_list())
+    model.move(origin=Point2D(10, 10))
+    print(convert([Point2D(0, 0), Point2D(1, 0)], part, canvas).to_list())
+    print(convert([250, 250], canvas, part))
@@ -0,0 +1,138 @@
+"""
+lattice points and grid lines of an affine basis
+
+AffineGrid replaces the point by point construction of NumberPlane.make_grid
+and AffineGrid.make_grid_lines (z_discarded), which computed
+row * e2 + col * e1 with two temporary Points per node.
+Here the lattice is built by increments only: the first row by accumulating
+the step along e1, and each following row by adding the step along e2 to
+the previous row, with map(operator.add, ...) over flat array('d') rows.
+Rows and lines are generated lazily, so a grid can be streamed in memory
+bounded by a single row.
+
+"""
+
+import operator
+
+from array import array
+from itertools import accumulate, repeat
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point2D, Vector2D
+
+
+Segment = Tuple[float, float, float, float]
+
+
+class AffineGrid:
+    """
+    the lattice origin + col * e1 + row * e2, for row in rows, col in cols
+    """
+
+    def __init__(self, e1: Iterable[float], e2: Iterable[float], origin: Iterable[float] = (0, 0),
+                 rows: range = range(-10, 11), cols: range = range(-10, 11)) -> None:
+        """
+        :param e1: Vector2D, or pair of floats, the basis vector along a row
+        :param e2: Vector2D, or pair of floats, the basis vector along a column
+        :param origin: Point2D, or pair of floats, the position of the node (0, 0)
+        :param rows: range of the multiples of e2, one row of nodes each
+        :param cols: range of the multiples of e1, one column of nodes each
+
+        e1 and e2 are not necessarily orthogonal
+        """
+        if not rows or not cols:
+            raise ValueError('a grid needs at least one row and one column')
+        self.e1 = Vector2D(*e1)
+        self.e2 = Vector2D(*e2)
+        self.origin = Point2D(*origin)
+        self.rows = rows
+        self.cols = cols
+
+    def __len__(self) -> int:
+        """
+        :return: int, the number of nodes of the lattice
+        """
+        return len(self.rows) * len(self.cols)
+
+    def position(self, row: float, col: float) -> Tuple[float, float]:
+        """
+        :return: the coordinates of origin + col * e1 + row * e2
+        """
+        return (self.origin.x + col * self.e1.x + row * self.e2.x,
+                self.origin.y + col * self.e1.y + row * self.e2.y)
+
+    def _steps(self) -> Tuple[float, float, float, float]:
+        """
+        :return: the step from a node to the next along a row, then along a column
+        """
+        col_step, row_step = self.cols.step, self.rows.step
+        return (col_step * self.e1.x, col_step * self.e1.y,
+                row_step * self.e2.x, row_step * self.e2.y)
+
+    def iter_rows(self) -> Iterator[array]:
+        """yields the nodes row by row, each row a new flat array('d') x0, y0, x1, y1, ...
+
+        the rows are computed one at a time, from the previous one
+        """
+        count = len(self.cols)
+        col_dx, col_dy, row_dx, row_dy = self._steps()
+        x, y = self.position(self.rows[0], self.cols[0])
+        row = array('d', bytes(16 * count))
+        row[0::2] = array('d', accumulate(repeat(col_dx, count - 1), initial=x))
+        row[1::2] = array('d', accumulate(repeat(col_dy, count - 1), initial=y))
+        yield row
+        delta = array('d', [row_dx, row_dy]) * count
+        add = operator.add
+        for _ in range(len(self.rows) - 1):
+            row = array('d', map(add, row, delta))
+            yield row
+
+    def lattice(self, out: Union[array, List[float], memoryview, None] = None) -> Union[array, List[float], memoryview]:
+        """all the nodes, row by row, in a flat buffer
+
+        :param out: a preallocated buffer of 2 * len(self) coordinates, or None for a new array('d')
+        :return: out, holding x0, y0, x1, y1, ...
+        """
+        size = 2 * len(self)
+        if out is None:
+            out = array('d', bytes(8 * size))
+        elif len(out) != size:
+            raise ValueError('the output buffer must hold two coordinates per node')
+        width = 2 * len(self.cols)
+        for idx, row in enumerate(self.iter_rows()):
+            out[idx * width: (idx + 1) * width] = row
+        return out
+
+    def points(self) -> PointArray:
+        """
+        :return: a new PointArray of all the nodes, row by row
+        """
+        return PointArray._from_buffer(self.lattice(), 2)
+
+    def lines(self) -> Iterator[Segment]:
+        """yields the grid lines lazily, as (x_start, y_start, x_end, y_end):
+        first one line along e1 per row, then one line along e2 per column
+        """
+        col_dx, col_dy, row_dx, row_dy = self._steps()
+        first_row, last_row = self.rows[0], self.rows[-1]
+        first_col, last_col = self.cols[0], self.cols[-1]
+
+        (x0, y0), (x1, y1) = self.position(first_row, first_col), self.position(first_row, last_col)
+        for _ in self.rows:
+            yield x0, y0, x1, y1
+            x0, y0, x1, y1 = x0 + row_dx, y0 + row_dy, x1 + row_dx, y1 + row_dy
+
+        (x0, y0), (x1, y1) = self.position(first_row, first_col), self.position(last_row, first_col)
+        for _ in self.cols:
+            yield x0, y0, x1, y1
+            x0, y0, x1, y1 = x0 + col_dx, y0 + col_dy, x1 + col_dx, y1 + col_dy
+
+
+if __name__ == '__main__':
+
+    grid = AffineGrid(Vector2D(20, 5), Vector2D(3, 15), origin=Point2D(250, 250),
+                      rows=range(-2, 3), cols=range(-2, 3))
+    print(len(grid), grid.points().to_list()[:3])
+    for segment in grid.lines():
+        print(segment)
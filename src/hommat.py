@@ -5,16 +5,168 @@ hommat.py
 
 
 Homogeneous Matrix
+
+Hmat33 transforms 2D points, Hmat44 3D points, in homogeneous coordinates.
+apply_many transforms a whole flat buffer of coordinates x0, y0, x1, y1, ...
+(x0, y0, z0, ... in 3D) in one call: the coefficients are unpacked once, and
+all the output coordinates are computed by a single list comprehension over
+the points of the buffer, interleaved as they are written back.
 """
 
-from typing import List
+import math
+
+from abc import ABC, abstractmethod
+from array import array
+from typing import Iterable, List, MutableSequence, Sequence, Union
+
+from numeric.src import smallmat
+from numeric.src.lu import SingularMatrixError
+from numeric.src.matmul import power
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point
+
+
+Buffer = Union[array, List[float], memoryview]
 
 
-class Hmat33:
+def _write(out: MutableSequence[float], start: int, step: int, values: List[float]) -> None:
+    """writes values to out[start::step], out being a list, or an array or memoryview of doubles
+    """
+    if isinstance(out, list):
+        out[start::step] = values
+    else:
+        out[start::step] = array('d', values)
+
+
+class AbstractHmat(ABC):
+    """Abstract Base Class for Hmat33 and Hmat44
+    """
+    DIM = 0    # the dimension of the points transformed
 
     def __init__(self, rows: List[List[float]]) -> None:
         self._mat = [row[:] for row in rows]
 
+    def _output(self, coords: Sequence[float], out: Union[Buffer, None]) -> Buffer:
+        """
+        :return: out, checked against coords, or a new array('d') of len(coords)
+        """
+        if len(coords) % self.DIM:
+            raise ValueError(f'the number of coordinates must be a multiple of {self.DIM}')
+        if out is None:
+            return array('d', bytes(8 * len(coords)))
+        if len(out) != len(coords):
+            raise ValueError('the output buffer must have as many coordinates as the input')
+        return out
+
+    @abstractmethod
+    def apply_many(self, coords: Sequence[float], out: Union[Buffer, None] = None,
+                   vectors: bool = False) -> Buffer:
+        """transforms a flat buffer of points of dimension DIM, x0, y0, x1, y1, ... in 2D,
+        x0, y0, z0, x1, ... in 3D, in one pass
+
+        points are taken with w = 1, and divided by the resulting w unless the
+        matrix is affine; vectors are taken with w = 0, ignoring the translation
+
+        :param coords: flat sequence of DIM * n coordinates, array('d'), list or memoryview
+        :param out: preallocated buffer of len(coords), coords itself for an in place
+                    transform, or None to return a new array('d')
+        :param vectors: bool, True to transform vectors instead of points
+        :return: out, holding the transformed coordinates
+        """
+
+    def apply_in_place(self, coords: Buffer, vectors: bool = False) -> Buffer:
+        """transforms the flat buffer coords, overwriting it
+
+        :return: coords
+        """
+        return self.apply_many(coords, out=coords, vectors=vectors)
+
+    def transform_points(self, points: Union[PointArray, Iterable[Point]]) -> PointArray:
+        """
+        :param points: a PointArray, or a sequence of Point, of dimension DIM
+        :return: a new PointArray of the transformed points
+        """
+        if not isinstance(points, PointArray):
+            points = PointArray.from_elements(points)
+        if points.dim != self.DIM:
+            raise ValueError(f'the points must be of dimension {self.DIM}')
+        return PointArray._from_buffer(self.apply_many(points.coords), self.DIM)
+
+    def inverse(self) -> 'AbstractHmat':
+        """the inverse, from the unrolled adjugate of src.smallmat
+
+        :raises SingularMatrixError: when self is not invertible
+        """
+        det, adjugate = smallmat.ADJUGATE[self.DIM + 1](self._mat)
+        if det == 0:
+            raise SingularMatrixError('a singular matrix has no inverse')
+        return type(self)([[elt / det for elt in row] for row in adjugate])
+
+    def __pow__(self, exponent: int) -> 'AbstractHmat':
+        """the transform applied exponent times, by squaring with the unrolled kernels of src.smallmat
+
+        :param exponent: int; 0 gives the identity, a negative exponent a power of the inverse
+        :raises SingularMatrixError: for a negative exponent, when self is not invertible
+        """
+        if not isinstance(exponent, int) or isinstance(exponent, bool):
+            return NotImplemented
+        size = self.DIM + 1
+        if exponent == 0:
+            return type(self)([[int(row == col) for col in range(size)] for row in range(size)])
+        base = self.inverse() if exponent < 0 else self
+        return type(self)(power(base._mat, abs(exponent), smallmat.MATMUL[size], smallmat.SQUARE[size]))
+
+    def __eq__(self, other: 'AbstractHmat') -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        size = self.DIM + 1
+        for row in range(size):
+            for col in range(size):
+                if self._mat[row][col] != other._mat[row][col]:
+                    return False
+        return True
+
+    def __str__(self):
+        return '\n'.join([' '.join([str(elt) for elt in row]) for row in self._mat]) + '\n'
+
+
+class Hmat33(AbstractHmat):
+    DIM = 2
+
+    @classmethod
+    def identity(cls) -> 'Hmat33':
+        return cls([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+    @classmethod
+    def translation(cls, dx: float, dy: float) -> 'Hmat33':
+        return cls([[1, 0, dx], [0, 1, dy], [0, 0, 1]])
+
+    @classmethod
+    def scaling(cls, sx: float, sy: Union[float, None] = None) -> 'Hmat33':
+        """
+        :param sy: the scale along y, the same as sx when None
+        """
+        sy = sx if sy is None else sy
+        return cls([[sx, 0, 0], [0, sy, 0], [0, 0, 1]])
+
+    @classmethod
+    def rotation(cls, angle: float) -> 'Hmat33':
+        """
+        :param angle: float, counterclockwise, in radians
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        return cls([[cos, -sin, 0], [sin, cos, 0], [0, 0, 1]])
+
+    @classmethod
+    def from_basis(cls, e1: Iterable[float], e2: Iterable[float],
+                   origin: Iterable[float] = (0, 0)) -> 'Hmat33':
+        """the transform sending (1, 0) to origin + e1, and (0, 1) to origin + e2
+
+        :param e1, e2, origin: Vector2D, Point2D, or pairs of floats, in the target coordinates
+        """
+        (a, b), (c, d), (x, y) = e1, e2, origin
+        return cls([[a, c, x], [b, d, y], [0, 0, 1]])
+
     def __matmul__(self, other: 'Hmat33') -> 'Hmat33':
         a, b, c = self._mat[0]
         d, e, f = self._mat[1]
@@ -37,15 +189,87 @@ class Hmat33:
         x, y, z = vec
         return (a*x+b*y+c*z, d*x+e*y+f*z, g*x+h*y+i*z)
 
-    def __eq__(self, other: 'Hmat33') -> bool:
-        for row in range(3):
-            for col in range(3):
-                if self._mat[row][col] != other._mat[row][col]:
-                    return False
-        return True
+    def apply_many(self, coords: Sequence[float], out: Union[Buffer, None] = None,
+                   vectors: bool = False) -> Buffer:
+        out = self._output(coords, out)
+        (a, b, c), (d, e, f), (g, h, i) = self._mat
+        points = iter(coords)
+        if vectors:
+            c = f = 0
+        if vectors or (g == h == 0 and i == 1):
+            values = [v for x, y in zip(points, points) for v in (a*x+b*y+c, d*x+e*y+f)]
+        else:
+            values = [v for x, y in zip(points, points) for w in (g*x+h*y+i,)
+                      for v in ((a*x+b*y+c) / w, (d*x+e*y+f) / w)]
+        _write(out, 0, 1, values)
+        return out
+
+
+class Hmat44(AbstractHmat):
+    DIM = 3
+
+    @classmethod
+    def identity(cls) -> 'Hmat44':
+        return cls([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+
+    @classmethod
+    def translation(cls, dx: float, dy: float, dz: float) -> 'Hmat44':
+        return cls([[1, 0, 0, dx], [0, 1, 0, dy], [0, 0, 1, dz], [0, 0, 0, 1]])
+
+    @classmethod
+    def scaling(cls, sx: float, sy: Union[float, None] = None, sz: Union[float, None] = None) -> 'Hmat44':
+        """
+        :param sy, sz: the scales along y and z, the same as sx when None
+        """
+        sy = sx if sy is None else sy
+        sz = sx if sz is None else sz
+        return cls([[sx, 0, 0, 0], [0, sy, 0, 0], [0, 0, sz, 0], [0, 0, 0, 1]])
 
-    def __str__(self):
-        return '\n'.join([' '.join([str(elt) for elt in row]) for row in self._mat]) + '\n'
+    @classmethod
+    def rotation(cls, angle: float, axis: Iterable[float] = (0, 0, 1)) -> 'Hmat44':
+        """the rotation about an axis through the origin, by Rodrigues' formula
+
+        :param angle: float, counterclockwise when the axis points towards the viewer, in radians
+        :param axis: Vector3D or triple of floats, the direction of the axis, z by default
+        """
+        x, y, z = axis
+        norm = math.sqrt(x*x + y*y + z*z)
+        if norm == 0:
+            raise ValueError('the axis of a rotation must be a non zero vector')
+        x, y, z = x / norm, y / norm, z / norm
+        cos, sin = math.cos(angle), math.sin(angle)
+        t = 1 - cos
+        return cls([[t*x*x + cos, t*x*y - sin*z, t*x*z + sin*y, 0],
+                    [t*x*y + sin*z, t*y*y + cos, t*y*z - sin*x, 0],
+                    [t*x*z - sin*y, t*y*z + sin*x, t*z*z + cos, 0],
+                    [0, 0, 0, 1]])
+
+    def __matmul__(self, other: 'Hmat44') -> 'Hmat44':
+        return Hmat44(smallmat.MATMUL[4](self._mat, other._mat))
+
+    def __mul__(self, vec):
+        """multiplies 4x4 matrix with 4x1 point or vector
+        returns a point or vector
+        """
+        (a, b, c, d), (e, f, g, h), (i, j, k, l), (m, n, o, p) = self._mat
+        x, y, z, w = vec
+        return (a*x+b*y+c*z+d*w, e*x+f*y+g*z+h*w, i*x+j*y+k*z+l*w, m*x+n*y+o*z+p*w)
+
+    def apply_many(self, coords: Sequence[float], out: Union[Buffer, None] = None,
+                   vectors: bool = False) -> Buffer:
+        out = self._output(coords, out)
+        (a, b, c, d), (e, f, g, h), (i, j, k, l), (m, n, o, p) = self._mat
+        points = iter(coords)
+        if vectors:
+            d = h = l = 0
+        if vectors or (m == n == o == 0 and p == 1):
+            values = [v for x, y, z in zip(points, points, points)
+                      for v in (a*x+b*y+c*z+d, e*x+f*y+g*z+h, i*x+j*y+k*z+l)]
+        else:
+            values = [v for x, y, z in zip(points, points, points) for w in (m*x+n*y+o*z+p,)
+                      for v in ((a*x+b*y+c*z+d) / w, (e*x+f*y+g*z+h) / w, (i*x+j*y+k*z+l) / w)]
+        _write(out, 0, 1, values)
+        return out
 
 
 if __name__ == '__main__':
@@ -87,20 +311,6 @@ if __name__ == '__main__':
     for vec in vecs:
         print(vec, B * vec)
 
+    print()
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    print(list(B.apply_many([x for vec in vecs for x in vec[:2]])))
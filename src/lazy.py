@@ -0,0 +1,399 @@
+"""
+lazy evaluation of Matrix expressions
+
+lazy(A) wraps a Matrix in an expression: the operators @, +, -, * and / by
+a scalar, and unary - on an expression build a tree of Expr nodes instead
+of computing a Matrix per operator,
+
+    result = (lazy(A) @ B + C * 2 - D).eval()
+
+and the tree is evaluated once, by eval() or at the first access to an
+element (expr[row, col]):
+    - a product of several matrices (A @ B @ C ...) is computed in the
+      cheapest order of the chain (see src.chain), each product by @
+    - the elementwise part of the tree (+, -, *, / by a scalar, negation)
+      is fused into a single list comprehension over the elements of its
+      operands, compiled once per form of expression: one pass and one new
+      list, instead of one Matrix per operator
+
+The operators compute the same values as those of Matrix, element by
+element, except that the reordering of a chain of float products rounds
+differently; ints and Fractions stay exact. On a backend other than
+python (see src.backends), the elementwise operators are evaluated one at
+a time by the backend.
+Negation does not mutate its operand, unlike -matrix.
+
+"""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import chain as chained
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from numeric.src import backends, chain
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix, Number, Shape
+
+
+class Expr(ABC):
+    """
+    a node of a lazy Matrix expression, of a known shape, evaluated on demand
+    """
+
+    def __init__(self, shape: Shape) -> None:
+        self.shape = shape
+        self._value: Union[Matrix, None] = None
+        self._stamp: Tuple[int, ...] = ()
+        self._value_version = 0
+        self._leaves: Union[Tuple[Matrix, ...], None] = None
+
+    @property
+    def rows(self) -> int:
+        return self.shape.rows
+
+    @property
+    def cols(self) -> int:
+        return self.shape.cols
+
+    def leaves(self) -> List[Matrix]:
+        """
+        :return: the matrices of the expression, in order, without repetition
+        """
+        return list(self._leaf_matrices())
+
+    def _leaf_matrices(self) -> Tuple[Matrix, ...]:
+        """
+        :return: the matrices of the expression, collected once: the tree is immutable
+        """
+        if self._leaves is None:
+            found: Dict[int, Matrix] = {}
+            self._collect(found)
+            self._leaves = tuple(found.values())
+        return self._leaves
+
+    @abstractmethod
+    def _collect(self, found: Dict[int, Matrix]) -> None:
+        """adds the matrices of the expression to found, by id, in order
+        """
+
+    def eval(self) -> Matrix:
+        """evaluates the expression, once: the result is cached until one of its matrices is mutated
+
+        :return: a new Matrix, the value of the expression, a copy of the cached result
+        """
+        return self._cached().copy()
+
+    def _cached(self) -> Matrix:
+        """
+        :return: the cached value of the expression, evaluated again when one of its
+                 matrices, or the cached value itself through a view, was mutated
+        """
+        stamp = tuple(leaf._version[0] for leaf in self._leaf_matrices())
+        if self._value is None or stamp != self._stamp or self._value._version[0] != self._value_version:
+            self._value = self._evaluate()
+            self._stamp = stamp
+            self._value_version = self._value._version[0]
+        return self._value
+
+    @abstractmethod
+    def _evaluate(self) -> Matrix:
+        """
+        :return: the value of the expression, computed from the values of its operands
+        """
+
+    def _emit(self, kernel: '_Kernel') -> str:
+        """
+        :return: the code of the elementwise evaluation of self; an expression
+                 that is not elementwise is evaluated once, and its value an operand
+        """
+        return kernel.operand(self._cached())
+
+    def __getitem__(self, row_col: tuple) -> Union[Number, Matrix]:
+        return self._cached()[row_col]
+
+    def __str__(self):
+        return str(self._cached())
+
+    def __matmul__(self, other: Union['Expr', Matrix]) -> 'Expr':
+        other = _as_expr(other)
+        if other is None:
+            return NotImplemented
+        return MatMul(self, other)
+
+    def __rmatmul__(self, other: Matrix) -> 'Expr':
+        other = _as_expr(other)
+        if other is None:
+            return NotImplemented
+        return MatMul(other, self)
+
+    def __add__(self, other: Union['Expr', Matrix]) -> 'Expr':
+        other = _as_expr(other)
+        if other is None:
+            return NotImplemented
+        return Add(self, other)
+
+    def __radd__(self, other: Matrix) -> 'Expr':
+        other = _as_expr(other)
+        if other is None:
+            return NotImplemented
+        return Add(other, self)
+
+    def __sub__(self, other: Union['Expr', Matrix]) -> 'Expr':
+        other = _as_expr(other)
+        if other is None:
+            return NotImplemented
+        return Sub(self, other)
+
+    def __rsub__(self, other: Matrix) -> 'Expr':
+        other = _as_expr(other)
+        if other is None:
+            return NotImplemented
+        return Sub(other, self)
+
+    def __mul__(self, scalar: Number) -> 'Expr':
+        if isinstance(scalar, (Expr, Matrix)):
+            return NotImplemented
+        return Scale(self, scalar)
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: Number) -> 'Expr':
+        if isinstance(scalar, (Expr, Matrix)):
+            return NotImplemented
+        if scalar == 0:
+            raise ZeroDivisionError('the divisor must be non zero')
+        return Divide(self, scalar)
+
+    def __neg__(self) -> 'Expr':
+        return Negate(self)
+
+
+def lazy(matrix: Matrix) -> 'Leaf':
+    """
+    :return: the lazy expression of matrix, the operand of lazy operators
+    """
+    return Leaf(matrix)
+
+
+def _as_expr(operand: Any) -> Union[Expr, None]:
+    """
+    :return: operand as an Expr, or None if it is neither an Expr nor a Matrix
+    """
+    if isinstance(operand, Expr):
+        return operand
+    if isinstance(operand, Matrix):
+        return Leaf(operand)
+    return None
+
+
+class Leaf(Expr):
+    """a Matrix in an expression; it is read when the expression is evaluated
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        super().__init__(matrix.shape)
+        self.matrix = matrix
+
+    def _collect(self, found: Dict[int, Matrix]) -> None:
+        found.setdefault(id(self.matrix), self.matrix)
+
+    def eval(self) -> Matrix:
+        """
+        :return: a copy of the matrix
+        """
+        return self.matrix.copy()
+
+    def _evaluate(self) -> Matrix:
+        return self.matrix
+
+    def _cached(self) -> Matrix:
+        return self.matrix
+
+    def __getitem__(self, row_col: tuple) -> Union[Number, Matrix]:
+        return self.matrix[row_col]
+
+    def _emit(self, kernel: '_Kernel') -> str:
+        return kernel.operand(self.matrix)
+
+
+class MatMul(Expr):
+    """the product of two expressions; nested products form a chain, evaluated in its cheapest order
+    """
+
+    def __init__(self, left: Expr, right: Expr) -> None:
+        if left.cols != right.rows:
+            raise IncompatibleMatrixShapes('Matrix A number of columns must equal Matrix B number of rows')
+        super().__init__(Shape(left.rows, right.cols))
+        self.left = left
+        self.right = right
+
+    def _collect(self, found: Dict[int, Matrix]) -> None:
+        self.left._collect(found)
+        self.right._collect(found)
+
+    def factors(self) -> List[Expr]:
+        """
+        :return: the chain of the operands of the nested products of self, in order
+        """
+        return [factor for operand in (self.left, self.right)
+                for factor in (operand.factors() if isinstance(operand, MatMul) else [operand])]
+
+    def _evaluate(self) -> Matrix:
+        matrices = [factor._cached() for factor in self.factors()]
+        if len(matrices) == 2:
+            return matrices[0] @ matrices[1]
+        return chain.multi_dot(matrices)
+
+
+class Elementwise(Expr):
+    """an elementwise operation; the elementwise subtree it roots is evaluated in a single pass
+    """
+    operands: Tuple[Expr, ...] = ()
+
+    def _collect(self, found: Dict[int, Matrix]) -> None:
+        for operand in self.operands:
+            operand._collect(found)
+
+    def _evaluate(self) -> Matrix:
+        if any(leaf._backend not in (None, backends.PYTHON) for leaf in self._leaf_matrices()) \
+                or backends.default_backend() is not backends.PYTHON:
+            return self._eager(*(operand._cached() for operand in self.operands))
+        kernel = _Kernel()
+        code = self._emit(kernel)
+        return kernel.run(code, self.shape)
+
+    @abstractmethod
+    def _eager(self, *matrices: Matrix) -> Matrix:
+        """
+        :return: the value of self, computed from the values of its operands by the operators of Matrix
+        """
+
+
+def _binary(left: Expr, right: Expr, action: str) -> Shape:
+    if left.shape != right.shape:
+        raise IncompatibleMatrixShapes(f'Matrices must have identical shapes to be {action}')
+    return left.shape
+
+
+class Add(Elementwise):
+
+    def __init__(self, left: Expr, right: Expr) -> None:
+        super().__init__(_binary(left, right, 'added'))
+        self.operands = (left, right)
+
+    def _emit(self, kernel: '_Kernel') -> str:
+        left, right = self.operands
+        return f'({left._emit(kernel)} + {right._emit(kernel)})'
+
+    def _eager(self, left: Matrix, right: Matrix) -> Matrix:
+        return left + right
+
+
+class Sub(Elementwise):
+
+    def __init__(self, left: Expr, right: Expr) -> None:
+        super().__init__(_binary(left, right, 'subtracted'))
+        self.operands = (left, right)
+
+    def _emit(self, kernel: '_Kernel') -> str:
+        left, right = self.operands
+        return f'({left._emit(kernel)} - {right._emit(kernel)})'
+
+    def _eager(self, left: Matrix, right: Matrix) -> Matrix:
+        return left - right
+
+
+class Scale(Elementwise):
+
+    def __init__(self, operand: Expr, scalar: Number) -> None:
+        super().__init__(operand.shape)
+        self.operands = (operand,)
+        self.scalar = scalar
+
+    def _emit(self, kernel: '_Kernel') -> str:
+        return f'({self.operands[0]._emit(kernel)} * {kernel.scalar(self.scalar)})'
+
+    def _eager(self, operand: Matrix) -> Matrix:
+        return operand * self.scalar
+
+
+class Divide(Elementwise):
+
+    def __init__(self, operand: Expr, scalar: Number) -> None:
+        super().__init__(operand.shape)
+        self.operands = (operand,)
+        self.scalar = scalar
+
+    def _emit(self, kernel: '_Kernel') -> str:
+        return f'({self.operands[0]._emit(kernel)} / {kernel.scalar(self.scalar)})'
+
+    def _eager(self, operand: Matrix) -> Matrix:
+        return operand / self.scalar
+
+
+class Negate(Elementwise):
+
+    def __init__(self, operand: Expr) -> None:
+        super().__init__(operand.shape)
+        self.operands = (operand,)
+
+    def _emit(self, kernel: '_Kernel') -> str:
+        return f'(-{self.operands[0]._emit(kernel)})'
+
+    def _eager(self, operand: Matrix) -> Matrix:
+        return -operand.copy()
+
+
+class _Kernel:
+    """
+    the operands and scalars of a fused elementwise evaluation, named x0, x1...
+    and s0, s1... in the code emitted by the nodes
+    """
+
+    def __init__(self) -> None:
+        self.operands: List[Matrix] = []
+        self.names: Dict[int, str] = {}
+        self.scalars: List[Number] = []
+
+    def operand(self, matrix: Matrix) -> str:
+        """
+        :return: the name of the elements of matrix, the same for each use of a matrix
+        """
+        if id(matrix) not in self.names:
+            self.names[id(matrix)] = f'x{len(self.operands)}'
+            self.operands.append(matrix)
+        return self.names[id(matrix)]
+
+    def scalar(self, value: Number) -> str:
+        self.scalars.append(value)
+        return f's{len(self.scalars) - 1}'
+
+    def run(self, code: str, shape: Shape) -> Matrix:
+        """
+        :return: a new Matrix of shape, the value of code for each element of the operands
+        """
+        function = _compile(code, len(self.operands), len(self.scalars))
+        flat = function(*(operand._elements() for operand in self.operands), *self.scalars)
+        return Matrix._from_owned(flat, shape.rows, shape.cols)
+
+
+@lru_cache(maxsize=256)
+def _compile(code: str, arity: int, scalars: int) -> Callable[..., list]:
+    """
+    :return: a function of the arity lists of elements and the scalars, returning the
+             list of the values of code, a python expression of x0, x1... and s0, s1...
+    """
+    names = [f'x{index}' for index in range(arity)]
+    columns = [f'c{index}' for index in range(arity)]
+    parameters = ', '.join(chained(columns, (f's{index}' for index in range(scalars))))
+    source = columns[0] if arity == 1 else f'zip({", ".join(columns)})'
+    namespace: Dict[str, Any] = {}
+    exec(f'def fused({parameters}):\n'
+         f'    return [{code} for {", ".join(names)} in {source}]\n', namespace)
+    return namespace['fused']
+
+
+if __name__ == '__main__':
+
+    a = Matrix([[1, 2], [3, 4]])
+    b = Matrix([[0, 1], [1, 0]])
+    expression = lazy(a) @ b + a * 2 - b / 2
+    print(expression.eval())
@@ -0,0 +1,138 @@
+"""
+LU decomposition with partial pivoting
+
+P @ A = L @ U, where P is a permutation of the rows, L is lower triangular
+with a unit diagonal, and U is upper triangular.
+L and U are packed together in a single list of rows, the unit diagonal of L
+being implicit. Once factored, each new right hand side is solved in O(n^2).
+
+"""
+
+import math
+import operator
+
+from fractions import Fraction
+from typing import List, Sequence, Union
+
+
+Number = Union[float, int, complex, Fraction]
+
+
+class SingularMatrixError(Exception):
+    pass
+
+
+class LUDecomposition:
+    """
+    the LU factors of a square matrix, reusable to solve any number of systems
+    """
+
+    def __init__(self, rows: Sequence[Sequence[Number]]) -> None:
+        """factors the square matrix given by its rows
+
+        a singular matrix is factored without error; solving with it
+        raises SingularMatrixError, and its determinant is zero
+
+        :param rows: sequence of n sequences of n numbers, left untouched
+        """
+        size = len(rows)
+        lu = [list(row) for row in rows]
+        perm = list(range(size))
+        sign = 1
+        singular = False
+        for col in range(size):
+            pivot_row = max(range(col, size), key=lambda row: abs(lu[row][col]))
+            if lu[pivot_row][col] == 0:
+                singular = True
+                continue
+            if pivot_row != col:
+                lu[col], lu[pivot_row] = lu[pivot_row], lu[col]
+                perm[col], perm[pivot_row] = perm[pivot_row], perm[col]
+                sign = -sign
+            pivot = lu[col][col]
+            pivot_tail = lu[col][col + 1:]
+            for row in lu[col + 1:]:
+                factor = row[col] / pivot
+                row[col] = factor
+                if factor:
+                    row[col + 1:] = [elt - factor * pivot_elt
+                                     for elt, pivot_elt in zip(row[col + 1:], pivot_tail)]
+        self._lu = lu
+        self._perm = perm
+        self._sign = sign
+        self._size = size
+        self.singular = singular
+
+    @property
+    def size(self) -> int:
+        """
+        :return: int, the number of rows (and columns) of the factored matrix
+        """
+        return self._size
+
+    @property
+    def permutation(self) -> List[int]:
+        """
+        :return: list of int, the row of A found at each row of P @ A
+        """
+        return self._perm[:]
+
+    @property
+    def lower(self) -> List[List[Number]]:
+        """
+        :return: the rows of L, lower triangular with a unit diagonal
+        """
+        return [row[:idx] + [1] + [0] * (self._size - idx - 1)
+                for idx, row in enumerate(self._lu)]
+
+    @property
+    def upper(self) -> List[List[Number]]:
+        """
+        :return: the rows of U, upper triangular
+        """
+        return [[0] * idx + row[idx:] for idx, row in enumerate(self._lu)]
+
+    def det(self) -> Number:
+        """
+        :return: the determinant of the factored matrix
+        """
+        if self.singular:
+            return 0
+        return math.prod((row[idx] for idx, row in enumerate(self._lu)), start=self._sign)
+
+    def solve(self, rhs: Sequence[Number]) -> List[Number]:
+        """solves A @ x = rhs
+
+        :param rhs: sequence of n numbers
+        :return: list of n numbers, the solution x
+        """
+        if self.singular:
+            raise SingularMatrixError('cannot solve a system with a singular matrix')
+        if len(rhs) != self._size:
+            raise ValueError('the right hand side must have as many values as the matrix has rows')
+        mul = operator.mul
+        lu = self._lu
+        result = [rhs[row] for row in self._perm]
+        for idx in range(1, self._size):
+            result[idx] -= sum(map(mul, lu[idx][:idx], result[:idx]))
+        for idx in reversed(range(self._size)):
+            row = lu[idx]
+            result[idx] = (result[idx] - sum(map(mul, row[idx + 1:], result[idx + 1:]))) / row[idx]
+        return result
+
+    def solve_many(self, rhss: Sequence[Sequence[Number]]) -> List[List[Number]]:
+        """solves A @ x = rhs for each rhs in rhss
+
+        :param rhss: sequence of right hand sides, each a sequence of n numbers
+        :return: list of the solutions, in the order of rhss
+        """
+        return [self.solve(rhs) for rhs in rhss]
+
+    def inverse(self) -> List[List[Number]]:
+        """
+        :return: the rows of the inverse of the factored matrix
+        """
+        size = self._size
+        columns = self.solve_many([[1 if row == col else 0 for row in range(size)]
+                                   for col in range(size)])
+        return list(map(list, zip(*columns)))
@@ -0,0 +1,201 @@
+"""
+a compact binary file format for matrices, and its memory-mapped reading
+
+layout of a file:
+    header, 32 bytes, little-endian:
+        magic       6s  b'NUMMAT'
+        version     B   1
+        dtype       c   b'd' float64, or b'q' int64
+        layout      c   b'C' the rows one after the other, or b'F' the columns
+        padding     7x
+        rows        q
+        cols        q
+    payload: the rows * cols elements, raw little-endian, in the order of layout
+
+The payload starts on an 8 bytes boundary, so that a memory map of the
+file reads as an array of its elements in place: MappedStorage gives the
+elements of a mapped file the indexing of a list, and converts to python
+numbers only the elements read, so that only the pages of the file
+holding them are paged in.
+
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+from array import array
+from typing import List, NamedTuple, Tuple, Union
+
+from numeric.src.backends import EXACT_FLOAT_INT
+
+
+MAGIC = b'NUMMAT'
+VERSION = 1
+HEADER = struct.Struct('<6sBcc7xqq')
+DTYPES = {'d': 'float64', 'q': 'int64'}
+LAYOUTS = 'CF'
+MAPPABLE = sys.byteorder == 'little'    # the payload reads in place on little-endian hosts only
+
+PathLike = Union[str, os.PathLike]
+
+
+class Header(NamedTuple):
+    dtype: str
+    layout: str
+    rows: int
+    cols: int
+
+    @property
+    def size(self) -> int:
+        """
+        :return: int, the size in bytes of a file of this header
+        """
+        return HEADER.size + self.rows * self.cols * array(self.dtype).itemsize
+
+
+def dtype_of(flat: list) -> str:
+    """
+    :param flat: the elements of a matrix
+    :return: 'q' if all the elements are ints that fit int64, 'd' if they are floats,
+             or ints mixed with floats that convert to float64 exactly
+    :raises ValueError: for the other elements (Fraction, complex...), that would lose their value
+    """
+    kinds = set(map(type, flat))
+    if kinds == {int} and -2 ** 63 <= min(flat) and max(flat) < 2 ** 63:
+        return 'q'
+    if kinds <= {float, int}:
+        if int not in kinds or all(abs(elt) < EXACT_FLOAT_INT for elt in flat if type(elt) is int):
+            return 'd'
+    raise ValueError('only int64 and float64 elements can be saved without loss; '
+                     "give dtype='d' to save them converted to float64")
+
+
+def write(path: PathLike, flat: list, rows: int, cols: int,
+          dtype: Union[str, None] = None, layout: str = 'C') -> None:
+    """writes a matrix to the file at path
+
+    :param flat: the rows x cols elements of the matrix, in the order of layout
+    :param dtype: 'd' or 'q', None for dtype_of(flat)
+    :param layout: 'C' if flat holds the rows one after the other, 'F' for the columns
+    """
+    dtype = dtype_of(flat) if dtype is None else dtype
+    if dtype not in DTYPES:
+        raise ValueError(f'unsupported dtype: {dtype}, expected one of {", ".join(DTYPES)}')
+    if layout not in LAYOUTS:
+        raise ValueError(f'unsupported layout: {layout}, expected C or F')
+    payload = array(dtype, flat)
+    if not MAPPABLE:
+        payload.byteswap()
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, dtype.encode(), layout.encode(), rows, cols))
+        payload.tofile(file)
+
+
+def _parse_header(raw: bytes, file_size: int) -> Header:
+    """
+    :raises ValueError: if raw is not the header of a file of file_size bytes in this format
+    """
+    if len(raw) < HEADER.size:
+        raise ValueError('not a matrix file: too short')
+    magic, version, dtype, layout, rows, cols = HEADER.unpack(raw[:HEADER.size])
+    if magic != MAGIC:
+        raise ValueError('not a matrix file: bad magic number')
+    if version != VERSION:
+        raise ValueError(f'unsupported matrix file version: {version}')
+    header = Header(dtype.decode('latin-1'), layout.decode('latin-1'), rows, cols)
+    if header.dtype not in DTYPES or header.layout not in LAYOUTS or rows < 1 or cols < 1:
+        raise ValueError(f'corrupt matrix file header: {header}')
+    if header.size != file_size:
+        raise ValueError(f'truncated or corrupt matrix file: {file_size} bytes, expected {header.size}')
+    return header
+
+
+def read_header(path: PathLike) -> Header:
+    """
+    :return: the Header of the file at path, without reading its payload
+    """
+    with open(path, 'rb') as file:
+        return _parse_header(file.read(HEADER.size), os.fstat(file.fileno()).st_size)
+
+
+def read(path: PathLike) -> Tuple[Header, List]:
+    """
+    :return: the Header of the file at path, and a new list of its elements, in the order of its layout
+    """
+    with open(path, 'rb') as file:
+        header = _parse_header(file.read(HEADER.size), os.fstat(file.fileno()).st_size)
+        payload = array(header.dtype)
+        payload.fromfile(file, header.rows * header.cols)
+    if not MAPPABLE:
+        payload.byteswap()
+    return header, payload.tolist()
+
+
+class MappedStorage:
+    """
+    the elements of a matrix file, mapped in memory and indexed as a list:
+    an index reads an element, a slice reads a new list of elements, and
+    assignments write through to the map
+
+    mode:
+        'r':   read-only, assignments raise TypeError
+        'r+':  assignments write to the file
+        'c':   copy on write, assignments stay in memory and the file is unchanged
+
+    the map of an int64 file only stores ints: assigning any other value
+    raises TypeError, before anything is written by that assignment. The
+    in-place operators giving floats, m *= 2.5 or m /= 2, fail on such a
+    map; m.copy() gives a Matrix of python lists that accepts them.
+    """
+    _ACCESS = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+
+    def __init__(self, path: PathLike, mode: str = 'r') -> None:
+        if not MAPPABLE:
+            raise ValueError('matrix files are mapped on little-endian hosts only')
+        if mode not in self._ACCESS:
+            raise ValueError(f"unsupported mode: {mode}, expected 'r', 'r+' or 'c'")
+        with open(path, 'rb' if mode == 'r' else 'r+b') as file:
+            size = os.fstat(file.fileno()).st_size
+            header = _parse_header(file.read(HEADER.size), size)
+            self._map = mmap.mmap(file.fileno(), size, access=self._ACCESS[mode])
+        self.header = header
+        self._view = memoryview(self._map)[HEADER.size:].cast(header.dtype)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, int, list]:
+        if isinstance(index, slice):
+            return self._view[index].tolist()
+        return self._view[index]
+
+    def __setitem__(self, index: Union[int, slice], value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            self._check(value)
+            self._view[index] = array(self._view.format, value)
+        else:
+            self._check([value])
+            self._view[index] = value
+
+    def _check(self, values: list) -> None:
+        """
+        :raises TypeError: if the map is of int64 and values are not all ints
+        """
+        if self._view.format == 'q' and not all(isinstance(elt, int) for elt in values):
+            wrong = next(elt for elt in values if not isinstance(elt, int))
+            raise TypeError(f'an int64 matrix file only stores ints, not {type(wrong).__name__}: '
+                            'copy() the Matrix to store other values')
+
+    def flush(self) -> None:
+        """writes the assignments of mode 'r+' to the file
+        """
+        self._map.flush()
+
+    def close(self) -> None:
+        """unmaps the file; the storage can no longer be read
+        """
+        self._view.release()
+        self._map.close()
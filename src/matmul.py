@@ -0,0 +1,149 @@
+"""
+matrix multiplication kernels used by src.matrix.Matrix
+
+Each kernel takes the left and right operands as sequences of rows,
+and returns the product as a new list of rows.
+
+strategies:
+    naive:       the textbook triple loop, indexing the right operand column-wise
+    transposed:  pre-transposes the right operand, and computes each element as
+                 the inner product of two rows with sum(map(operator.mul, ...))
+    blocked:     the transposed kernel, tiled over blocks of rows and columns so
+                 that a block of columns of the right operand is reused by a
+                 whole block of rows before moving on
+    auto:        picks one of the above from the size of the operands
+"""
+
+import operator
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Union
+
+
+Rows = Sequence[Sequence]
+
+BLOCK_SIZE = 64          # rows and columns per tile of the blocked kernel
+BLOCKED_THRESHOLD = 64   # auto uses the blocked kernel from this size on
+
+
+def matmul_naive(a_rows: Rows, b_rows: Rows) -> List[list]:
+    """
+    :param a_rows: the rows of a (m x k) matrix
+    :param b_rows: the rows of a (k x n) matrix
+    :return: the rows of the (m x n) product
+    """
+    rows, cols, ndxs = len(a_rows), len(b_rows[0]), len(b_rows)
+    result = [[0 for col in range(cols)] for row in range(rows)]
+    for row in range(rows):
+        for col in range(cols):
+            for ndx in range(ndxs):
+                result[row][col] += a_rows[row][ndx] * b_rows[ndx][col]
+    return result
+
+
+def matmul_transposed(a_rows: Rows, b_rows: Rows) -> List[list]:
+    """
+    :param a_rows: the rows of a (m x k) matrix
+    :param b_rows: the rows of a (k x n) matrix
+    :return: the rows of the (m x n) product
+    """
+    mul = operator.mul
+    b_cols = list(zip(*b_rows))
+    return [[sum(map(mul, a_row, b_col)) for b_col in b_cols] for a_row in a_rows]
+
+
+def matmul_blocked(a_rows: Rows, b_rows: Rows, block_size: int = BLOCK_SIZE) -> List[list]:
+    """
+    :param a_rows: the rows of a (m x k) matrix
+    :param b_rows: the rows of a (k x n) matrix
+    :param block_size: int, the number of rows and columns in a tile
+    :return: the rows of the (m x n) product
+    """
+    mul = operator.mul
+    b_cols = list(zip(*b_rows))
+    rows, cols = len(a_rows), len(b_cols)
+    result = [[] for row in range(rows)]
+    for col_start in range(0, cols, block_size):
+        col_block = b_cols[col_start: col_start + block_size]
+        for row_start in range(0, rows, block_size):
+            for row in range(row_start, min(row_start + block_size, rows)):
+                a_row = a_rows[row]
+                result[row] += [sum(map(mul, a_row, b_col)) for b_col in col_block]
+    return result
+
+
+def matmul_rows(a_rows: Iterable[Sequence], b_rows: Rows) -> Iterator[list]:
+    """the transposed kernel, computing the rows of the product one at a time,
+    for writing them into the storage of a preallocated result
+
+    :param a_rows: the rows of a (m x k) matrix, possibly read lazily
+    :param b_rows: the rows of a (k x n) matrix
+    :return: an iterator of the rows of the (m x n) product
+    """
+    mul = operator.mul
+    b_cols = list(zip(*b_rows))
+    for a_row in a_rows:
+        yield [sum(map(mul, a_row, b_col)) for b_col in b_cols]
+
+
+def power(base: Any, exponent: int, multiply: Callable[[Any, Any], Any],
+          square: Union[Callable[[Any], Any], None] = None) -> Any:
+    """exponentiation by squaring: base ** exponent in at most 2 * log2(exponent) products
+
+    the bits of exponent are read from the lowest: base is squared at each bit,
+    and multiplied into the result at each set bit. The powers of base commute,
+    so the order of the products does not matter, but with floats the rounding
+    differs from multiplying base exponent times.
+
+    :param base: a square matrix, in any form multiply and square accept: rows, a Matrix...
+    :param exponent: int, at least 1
+    :param multiply: the product of two matrices
+    :param square: the square of a matrix, multiply(a, a) when None
+    :return: base ** exponent; base itself when exponent is 1
+    """
+    if exponent < 1:
+        raise ValueError('the exponent must be a positive int')
+    if square is None:
+        def square(matrix: Any) -> Any:
+            return multiply(matrix, matrix)
+    result = None
+    while True:
+        if exponent & 1:
+            result = base if result is None else multiply(result, base)
+        exponent >>= 1
+        if not exponent:
+            return result
+        base = square(base)
+
+
+STRATEGIES: Dict[str, Callable[[Rows, Rows], List[list]]] = {
+    'naive': matmul_naive,
+    'transposed': matmul_transposed,
+    'blocked': matmul_blocked,
+}
+
+
+def choose_strategy(rows: int, ndxs: int, cols: int) -> str:
+    """returns the name of the strategy 'auto' uses for a (rows x ndxs) @ (ndxs x cols) product
+    """
+    if max(rows, ndxs, cols) >= BLOCKED_THRESHOLD:
+        return 'blocked'
+    return 'transposed'
+
+
+def matmul(a_rows: Rows, b_rows: Rows, strategy: str = 'auto') -> List[list]:
+    """multiplies two matrices given as sequences of rows
+
+    the shapes are assumed compatible; validation is left to the caller
+
+    :param a_rows: the rows of a (m x k) matrix
+    :param b_rows: the rows of a (k x n) matrix
+    :param strategy: str, one of 'auto', 'naive', 'transposed', 'blocked'
+    :return: the rows of the (m x n) product
+    """
+    if strategy == 'auto':
+        strategy = choose_strategy(len(a_rows), len(b_rows), len(b_rows[0]))
+    try:
+        kernel = STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(f'unknown matmul strategy: {strategy}')
+    return kernel(a_rows, b_rows)
@@ -5,12 +5,23 @@ a matrix module that implements Matrix objects and associated operations
 """
 
 import math
+import operator
 
+from array import array
 from fractions import Fraction
-from typing import List, NamedTuple, Tuple, Union
+from itertools import chain as chained, repeat
+from typing import Any, Callable, Iterable, List, NamedTuple, Sequence, Tuple, Union
+
+from numeric.src import backends, bareiss, buffers, chain, matfile, smallmat, textio
+from numeric.src.backends import Backend
+from numeric.src.lu import LUDecomposition, SingularMatrixError
+from numeric.src.matmul import matmul, matmul_rows, power
 
 
 Number = Union[float, int, complex, Fraction]
+Index = Union[int, slice]
+
+RUN = 4096     # elements per run of the in-place kernels on contiguous storage
 
 
 class IncompatibleMatrixShapes(Exception):
@@ -34,43 +45,424 @@ class Shape(NamedTuple):
 class Matrix:
     """
     Represents a matrix
+
+    The elements are stored in a single flat list, _data; the element at
+    (row, col) is _data[_offset + row * _strides[0] + col * _strides[1]].
+    A Matrix built by __init__ owns its storage in row-major order;
+    transpose(), get_row(), get_col() and slice indexing (m[1:3, :], m[:, 2])
+    return views: Matrices that share the storage of their parent, with their
+    own shape, offset and strides. Writing to a view writes to its parent,
+    and vice versa; copy() detaches a view into a Matrix of its own.
+    The storage of a Matrix loaded with load(path, mmap=True) is a file
+    mapped in memory (src.matfile.MappedStorage), indexed as the list.
+
+    @, +, -, * by a scalar and == are computed by a backend (see src.backends),
+    selected per Matrix or globally; the pure python kernels by default.
     """
 
     @classmethod
-    def zeros(cls, shape: Union[Shape, tuple]) -> 'Matrix':
+    def zeros(cls, shape: Union[Shape, tuple], backend: Union[str, Backend, None] = None) -> 'Matrix':
         """makes and returns a new matrix of shape.rows x shape.cols
         containing only zeros
         :param shape: a Shape NamedTuple of the number of rows and columns of the matrix
+        :param backend: see __init__; the zeros are floats on a backend other than python
         :return:  new Matrix of shape.rows x shape.cols containing only zeros
         """
         rows, cols = shape
-        return cls([[0 for col in range(cols)] for row in range(rows)])
+        assert rows > 0 and cols > 0, 'Matrix data cannot be empty'
+        zero, _ = cls._units(backend)
+        return cls._from_owned([zero] * (rows * cols), rows, cols, backend)
 
     @classmethod
-    def identity(cls, shape: Shape) -> 'Matrix':
+    def identity(cls, shape: Shape, backend: Union[str, Backend, None] = None) -> 'Matrix':
         """makes and returns a new matrix of shape.rows x shape.cols
         containing only zeros
         :param shape: a Shape NamedTuple of the number of rows and columns of the matrix
+        :param backend: see __init__; the elements are floats on a backend other than python
         :return:  new Matrix of shape.rows x shape.cols containing only zeros
         """
         rows, cols = shape
         if rows != cols:
             raise IncompatibleMatrixShapes('Identity Matrix must be square')
-        return cls([[1 if col == row else 0 for col in range(cols)] for row in range(rows)])
+        assert rows > 0, 'Matrix data cannot be empty'
+        zero, one = cls._units(backend)
+        flat = [zero] * (rows * cols)
+        flat[::cols + 1] = [one] * rows
+        return cls._from_owned(flat, rows, cols, backend)
+
+    @staticmethod
+    def _units(backend: Union[str, Backend, None]) -> Tuple[Number, Number]:
+        """
+        :return: zero and one, exact ints on the python backend, floats otherwise
+        """
+        backend = backends.default_backend() if backend is None else backends.get_backend(backend)
+        return (0, 1) if backend is backends.PYTHON else (0.0, 1.0)
+
+    def __init__(self, data: Union[List[List[Number]], List[Number]], backend: Union[str, Backend, None] = None,
+                 shape: Union[Shape, tuple, None] = None, copy: bool = True, validate: bool = True) -> None:
+        """
+        :param data: sequence of sequences of numbers of identical length, the rows; or,
+                     with shape, a flat sequence of the numbers, in row-major order
+        :param backend: the name of the backend computing with self, or None
+                        for the default backend, see src.backends
+        :param shape: the Shape of a flat data, None for a sequence of rows
+        :param copy: False to adopt a flat data, a list, as the storage of self, without
+                     copying it: the caller hands it over, and must not use it afterwards.
+                     The rows of a sequence of rows are always gathered into the single
+                     flat list of the storage, which copies them once
+        :param validate: False to skip the checks of the lengths of data, for data known
+                         to be well formed
+
+        Attention: must make a deepcopy of the sequence passed, unless copy is False
+        """
+        if shape is not None:
+            rows, cols = shape
+            if validate and (rows < 1 or cols < 1 or rows * cols != len(data)):
+                raise IncompatibleMatrixShapes(f'{len(data)} elements do not fit a {rows}x{cols} Matrix')
+            self._own(data if not copy and type(data) is list else list(data), rows, cols, backend)
+            return
+        if validate:
+            assert len(data) > 0, 'Matrix data cannot be empty'
+            assert len(data[0]) > 0, 'Matrix rows cannot be empty'
+            assert all([len(seq) == len(data[0]) for seq in data]), \
+                'all inners must have the same length'
+        self._own(list(chained.from_iterable(data)), len(data), len(data[0]), backend)
+
+    @classmethod
+    def _from_owned(cls, flat: list, rows: int, cols: int, backend: Union[str, Backend, None] = None) -> 'Matrix':
+        """the trusted constructor of the results of the operators and factories
+
+        :param flat: a new list of the rows x cols elements in row-major order, that
+                     the caller no longer uses: it becomes the storage, not copied nor checked
+        :return: a new Matrix owning flat
+        """
+        matrix = object.__new__(cls)
+        matrix._own(flat, rows, cols, backend)
+        return matrix
+
+    @classmethod
+    def _from_rows(cls, rows: List[list], backend: Union[str, Backend, None] = None) -> 'Matrix':
+        """the trusted constructor of the results computed as rows, by the kernels of src.matmul...
+
+        :param rows: new rows of identical length, gathered into the storage in one C-level pass, not checked
+        :return: a new Matrix of the elements of rows
+        """
+        return cls._from_owned(list(chained.from_iterable(rows)), len(rows), len(rows[0]), backend)
+
+    def _own(self, flat: Union[list, None], rows: int, cols: int, backend: Union[str, Backend, None]) -> None:
+        """makes flat, the rows x cols elements of self in row-major order, the storage of self
+
+        a None flat leaves the storage to be materialized from the array of self, see __getattr__
+        """
+        self._rows = rows
+        self._cols = cols
+        if flat is not None:
+            self._data = flat
+        self._offset = 0
+        self._strides = (cols, 1)
+        self._version = [0]     # mutation count, shared by all the views of _data
+        self._lu = None
+        self._lu_version = 0
+        self._backend = None if backend is None else backends.get_backend(backend)
+        self._array = None      # the cached array of self on _array_backend
+        self._array_backend = None
+        self._array_version = 0
+
+    @classmethod
+    def frombuffer(cls, obj: Any, shape: Union[Shape, tuple, None] = None,
+                   backend: Union[str, Backend, None] = None) -> 'Matrix':
+        """makes a Matrix from an object supporting the buffer protocol:
+        array.array, bytes, memoryview, numpy array...
+
+        the elements are copied in one C-level pass (see src.buffers), as
+        python ints or floats
+
+        :param obj: a 2 dimensional buffer, or a buffer of rows x cols numbers with shape
+        :param shape: the Shape of the Matrix, None to take the shape of a 2 dimensional buffer
+        :param backend: see __init__
+        :return: a new Matrix, owning a copy of the elements of obj
+        """
+        flat, buffer_shape = buffers.to_list(obj)
+        if shape is None:
+            if len(buffer_shape) != 2:
+                raise IncompatibleMatrixShapes('the shape of a buffer that is not 2 dimensional must be given')
+            shape = buffer_shape
+        rows, cols = shape
+        if rows < 1 or cols < 1 or rows * cols != len(flat):
+            raise IncompatibleMatrixShapes(f'a buffer of {len(flat)} elements does not fit a {rows}x{cols} Matrix')
+        return cls._from_owned(flat, rows, cols, backend)
+
+    def as_buffer(self, typecode: str = 'd') -> memoryview:
+        """exports the elements of self, for the libraries and files that read buffers
+
+        the storage of a Matrix is a list of python objects, so the elements
+        are copied once, to an array of typecode
+
+        :param typecode: str, an array typecode, 'd' for float64, 'q' for int64...
+        :return: a memoryview of shape (self.rows, self.cols) and format typecode
+        """
+        return memoryview(array(typecode, self._flat())).cast('B').cast(typecode, (self._rows, self._cols))
+
+    def save(self, path: matfile.PathLike, dtype: Union[str, None] = None, layout: str = 'C') -> None:
+        """writes self to a binary file, see src.matfile for the format
+
+        :param path: str or path-like, the file to write
+        :param dtype: 'q' int64 or 'd' float64, None to select the one that holds the
+                      elements of self without loss; 'd' converts any element to float
+        :param layout: 'C' to write the rows one after the other, 'F' the columns
+        :raises ValueError: if dtype is None and the elements are neither int64 nor float64
+        """
+        flat = (self if layout != 'F' else self.transpose())._flat()
+        matfile.write(path, flat, self._rows, self._cols, dtype, layout)
+
+    @classmethod
+    def load(cls, path: matfile.PathLike, mmap: bool = False, mode: str = 'r',
+             backend: Union[str, Backend, None] = None) -> 'Matrix':
+        """reads a Matrix written by save
+
+        with mmap, the file is mapped in memory instead of read: loading takes
+        the same time whatever the size of the file, and the elements are read
+        from the map when they are accessed, paging in only the parts of the
+        file that hold them. The Matrix uses the map as its storage, and keeps
+        it open as long as the Matrix or any of its views is alive; copy()
+        detaches a Matrix of python lists.
+
+        :param path: str or path-like, the file to read
+        :param mmap: bool, True to map the file instead of reading it; on big-endian
+                     hosts, the file is read
+        :param mode: with mmap, 'r' read-only (assignments raise TypeError), 'r+' the
+                     assignments write to the file, 'c' the assignments stay in memory;
+                     the map of an int64 file only accepts ints (see matfile.MappedStorage)
+        :param backend: see __init__
+        :return: a new Matrix of the elements of the file, python ints or floats
+        :raises ValueError: if the file is not a matrix file
+        """
+        if mmap and matfile.MAPPABLE:
+            storage = matfile.MappedStorage(path, mode)
+            header, flat = storage.header, storage
+        else:
+            header, flat = matfile.read(path)
+        matrix = cls._from_owned(flat, header.rows, header.cols, backend)
+        if header.layout == 'F':
+            matrix._strides = (1, header.rows)
+        return matrix
+
+    @classmethod
+    def from_csv(cls, source: Any, delimiter: Union[str, None] = ',', dtype: textio.DType = None,
+                 columns: Union[List[int], None] = None, skip: int = 0,
+                 stats: Union[textio.ReadStats, None] = None,
+                 backend: Union[str, Backend, None] = None) -> 'Matrix':
+        """reads a Matrix from delimited text, one row per line, parsed by chunks (see src.textio)
+
+        :param source: a path, or a text file object
+        :param delimiter: str, the separator of the fields, None for runs of whitespace
+        :param dtype: int, float, Fraction, a str -> number callable, a sequence of
+                      them, one per column, or None to infer the type of each column
+        :param columns: the indices of the fields read in each line, None for all
+        :param skip: int, the number of lines skipped at the start, a header
+        :param stats: a textio.ReadStats updated with the throughput of the read, or None
+        :param backend: see __init__
+        :return: a new Matrix of the numbers read
+        :raises ValueError: for a field that is not a number, a row of another length,
+                            or a source without rows
+        """
+        flat, rows, cols = textio.read_flat(source, delimiter, dtype, columns, skip, stats)
+        return cls._from_owned(flat, rows, cols, backend)
+
+    def to_csv(self, target: Any, delimiter: str = ',', fmt: Union[str, None] = None,
+               header: Union[str, None] = None) -> None:
+        """writes self as delimited text, one row per line
+
+        :param target: a path, or a text file object
+        :param delimiter: str, the separator of the fields
+        :param fmt: str, a format spec for the elements, '.6g'..., None for str, that
+                    from_csv reads back to the same values, Fractions included
+        :param header: str, a first line, or None
+        """
+        textio.write_rows(target, map(self._row, range(self._rows)), delimiter, fmt, header)
+
+    def _view(self, rows: int, cols: int, strides: Tuple[int, int], offset: int) -> 'Matrix':
+        """
+        :return: a Matrix of shape (rows, cols) sharing the storage of self
+        """
+        view = object.__new__(type(self))
+        view._data = self._data
+        view._rows = rows
+        view._cols = cols
+        view._offset = offset
+        view._strides = strides
+        view._version = self._version
+        view._lu = None
+        view._lu_version = 0
+        view._backend = self._backend
+        view._array = None
+        view._array_backend = None
+        view._array_version = 0
+        return view
+
+    def _touch(self) -> None:
+        """records a mutation of the storage of self, and of all its views
+        """
+        self._version[0] += 1
 
-    def __init__(self, data: List[List[Number]]) -> None:
+    def _is_contiguous(self) -> bool:
         """
-        :param data: sequence of sequences of numbers of identical length
+        :return: True if the elements of self are a single run of _data, in row-major order
+        """
+        row_stride, col_stride = self._strides
+        return col_stride == 1 and (row_stride == self._cols or self._rows == 1)
+
+    def _flat_index(self, row: int, col: int) -> int:
+        """
+        :return: the index in _data of the element at (row, col), negative indices allowed
+        """
+        rows, cols = self._rows, self._cols
+        if not (-rows <= row < rows and -cols <= col < cols):
+            raise MatrixIndexError('Matrix indices row or col out of range')
+        if row < 0:
+            row += rows
+        if col < 0:
+            col += cols
+        row_stride, col_stride = self._strides
+        return self._offset + row * row_stride + col * col_stride
+
+    def _select(self, index: Index, size: int) -> Tuple[int, int, int]:
+        """
+        :param index: int or slice, selecting along an axis of size elements
+        :return: the first position, the number of positions, and the step of the selection
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            count = len(range(start, stop, step))
+            if not count:
+                raise MatrixIndexError('a Matrix selection cannot be empty')
+            return start, count, step
+        if not -size <= index < size:
+            raise MatrixIndexError('Matrix indices row or col out of range')
+        return index % size, 1, 1
+
+    def _sub_view(self, row: Index, col: Index) -> 'Matrix':
+        """
+        :return: a view on the rows and cols of self selected by row and col
+        """
+        row_start, rows, row_step = self._select(row, self._rows)
+        col_start, cols, col_step = self._select(col, self._cols)
+        row_stride, col_stride = self._strides
+        return self._view(rows, cols, (row_stride * row_step, col_stride * col_step),
+                          self._offset + row_start * row_stride + col_start * col_stride)
+
+    def _row_slice(self, row: int) -> slice:
+        """
+        :return: the slice of _data holding the row of self
+        """
+        row_stride, col_stride = self._strides
+        start = self._offset + row * row_stride
+        stop = start + self._cols * col_stride
+        return slice(start, stop if stop >= 0 else None, col_stride)
+
+    def _row(self, row: int) -> list:
+        """
+        :return: a new list of the elements of the row of self
+        """
+        return self._data[self._row_slice(row)]
+
+    def _row_lists(self) -> List[list]:
+        """
+        :return: a new list of the rows of self, each a new list
+        """
+        return [self._row(row) for row in range(self._rows)]
+
+    def _flat(self) -> list:
+        """
+        :return: a new list of the elements of self, in row-major order
+        """
+        if self._is_contiguous():
+            return self._data[self._offset: self._offset + self._rows * self._cols]
+        return [elt for row in range(self._rows) for elt in self._row(row)]
+
+    def _elements(self) -> list:
+        """
+        :return: the elements of self in row-major order, to be read only: the storage
+                 of self itself when it holds exactly them, a new list otherwise
+        """
+        if type(self._data) is list and self._offset == 0 and self._is_contiguous() \
+                and len(self._data) == self._rows * self._cols:
+            return self._data
+        return self._flat()
+
+    def _assign(self, values: list) -> None:
+        """writes values, the elements of self in row-major order, into the storage of self
+
+        the views sharing the storage see the new values
+        """
+        if self._is_contiguous():
+            self._data[self._offset: self._offset + len(values)] = values
+        else:
+            cols = self._cols
+            for row in range(self._rows):
+                self._data[self._row_slice(row)] = values[row * cols: (row + 1) * cols]
+        self._touch()
+
+    def _write_rows(self, rows: Iterable[Iterable[Number]]) -> None:
+        """writes rows, the rows of self, into the storage of self one at a time,
+        without gathering them first
+
+        the views sharing the storage see the new values
+        """
+        data = self._data
+        for row, values in enumerate(rows):
+            data[self._row_slice(row)] = values
+        self._touch()
+
+    def _runs(self, size: int = 0) -> List[slice]:
+        """
+        :param size: the number of elements per run of a contiguous self, 0 for its rows
+        :return: the slices of _data holding the elements of self in row-major order,
+                 runs of size elements, or rows
+        """
+        if not size:
+            return [self._row_slice(row) for row in range(self._rows)]
+        start, stop = self._offset, self._offset + self._rows * self._cols
+        return [slice(run, min(run + size, stop)) for run in range(start, stop, size)]
+
+    def _check_out(self, out: 'Matrix', rows: int, cols: int) -> None:
+        """
+        :raises TypeError: if out is not a Matrix
+        :raises IncompatibleMatrixShapes: if out is not of shape (rows, cols)
+        """
+        if not isinstance(out, Matrix):
+            raise TypeError('out must be a Matrix')
+        if out.shape != (rows, cols):
+            raise IncompatibleMatrixShapes(f'out must be of shape {(rows, cols)}, not {out.shape}')
 
-        Attention: must make a deepcopy of the sequence passed
+    def _unaliased(self, out: 'Matrix') -> 'Matrix':
         """
-        assert len(data) > 0, 'Matrix data cannot be empty'
-        assert len(data[0]) > 0, 'Matrix rows cannot be empty'
-        assert all([len(seq) == len(data[0]) for seq in data]), \
-            'all inners must have the same length'
-        self._data = [row[:] for row in data]
-        self._rows = len(self._data)
-        self._cols = len(self._data[0])
+        :return: self, or a copy of self if out shares the storage of self with
+                 another layout, and writing out would overwrite elements of self
+                 not read yet
+        """
+        if self._data is out._data and (self._offset, self._strides) != (out._offset, out._strides):
+            return self.copy()
+        return self
+
+    def _map_into(self, out: 'Matrix', kernel: Callable[..., list], *others: 'Matrix') -> 'Matrix':
+        """writes the results of kernel on the elements of self, and of others, into the
+        storage of out, run by run: no list of all the elements is built
+
+        :param out: a Matrix of the shape of self, possibly self
+        :param kernel: the function of a run of each operand, returning the list of the results
+        :param others: Matrices of the shape of self
+        :return: out
+        """
+        self._check_out(out, self._rows, self._cols)
+        matrices = [matrix._unaliased(out) for matrix in (self, *others)]
+        size = RUN if all(matrix._is_contiguous() for matrix in matrices + [out]) else 0
+        runs = [matrix._runs(size) for matrix in matrices]
+        data = out._data
+        for index, target in enumerate(out._runs(size)):
+            data[target] = kernel(*[matrix._data[matrix_runs[index]] for matrix, matrix_runs in zip(matrices, runs)])
+        out._touch()
+        return out
 
     @property
     def rows(self) -> int:
@@ -93,63 +485,168 @@ class Matrix:
         """
         return Shape(rows=self.rows, cols=self.cols)
 
-    def __setitem__(self, row_col: Tuple[int, int], value: Number) -> None:
+    @property
+    def backend(self) -> str:
+        """
+        :return: str, the name of the backend computing with self
+        """
+        return (self._backend or backends.default_backend()).name
+
+    @backend.setter
+    def backend(self, backend: Union[str, Backend, None]) -> None:
+        """selects the backend of self, None for the default backend
+        """
+        self._backend = None if backend is None else backends.get_backend(backend)
+
+    def _backend_array(self, backend: Backend) -> Any:
+        """the array of self on backend, cached until self, or a view sharing its storage, is mutated
+
+        :return: the array, or None if backend declines self
+        """
+        if self._array_backend is not backend or self._array_version != self._version[0]:
+            self._array = backend.to_array(self._flat(), self._rows, self._cols)
+            self._array_backend = backend
+            self._array_version = self._version[0]
+        return self._array
+
+    def _backend_operands(self, *others: 'Matrix') -> Tuple[Union[Backend, None], list]:
+        """selects the backend of an operation on self and others: the backend
+        of the first operand that selects one, or the default backend
+
+        :return: the backend and the arrays of self and others on it, or
+                 None and an empty list when the operation stays on the pure python path
+        """
+        backend = self._backend
+        for other in others:
+            backend = backend or other._backend
+        backend = backend or backends.default_backend()
+        if backend is backends.PYTHON:
+            return None, []
+        arrays = [matrix._backend_array(backend) for matrix in (self, *others)]
+        if any(array is None for array in arrays):
+            return None, []
+        return backend, arrays
+
+    def _from_backend(self, backend: Backend, array: Any, *others: 'Matrix') -> 'Matrix':
+        """
+        :return: a new Matrix of the values of array, of self.rows rows and the cols of the
+                 last operand, with the backend selected by self or others; array is its
+                 storage until its python list is needed, see __getattr__
+        """
+        result = object.__new__(Matrix)
+        result._own(None, self._rows, (others[-1] if others else self)._cols, self._backend)
+        for other in others:
+            result._backend = result._backend or other._backend
+        result._array, result._array_backend = array, backend
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        """materializes _data, the python list of the elements of a result of a backend,
+        from its array, when it is first needed
+
+        only called for the attributes that are not set: the Matrices that have
+        their list do not pay for it
+        """
+        if name != '_data' or '_array' not in vars(self):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self._data = self._array_backend.to_flat(self._array)
+        return self._data
+
+    def __setitem__(self, row_col: Tuple[Index, Index], value: Union[Number, 'Matrix']) -> None:
         """sets the matrix element at row, col to value
 
-        :param row_col: tuple[int, int], containing the row of and column of
+        with slices, sets the block selected to value, a Matrix of the shape
+        of the block, or a Number assigned to every element of the block
+
+        :param row_col: tuple[int | slice, int | slice], containing the row of and column of
                         the element in the Matrix
         :param value: Number, the value to set the element of the Matrix to
         :return: None
         """
         row, col = row_col
-        try:
-            self._data[row][col] = value
-        except IndexError:
-            raise MatrixIndexError('Matrix indices row or col out of range')
+        if isinstance(row, slice) or isinstance(col, slice):
+            block = self._sub_view(row, col)
+            if isinstance(value, Matrix):
+                if value.shape != block.shape:
+                    raise IncompatibleMatrixShapes('the Matrix assigned must have the shape of the selection')
+                block._assign(value._flat())
+            else:
+                block._assign([value] * (block.rows * block.cols))
+            return
+        self._data[self._flat_index(row, col)] = value
+        self._touch()
 
-    def __getitem__(self, row_col: Tuple[int, int]) -> Number:
+    def __getitem__(self, row_col: Tuple[Index, Index]) -> Union[Number, 'Matrix']:
         """returns the matrix element value at row, col
 
-        :param row_col: tuple[int, int], containing the row of and column of
+        with slices, returns a view on the block selected, sharing the storage of self:
+        m[1:3, :] is a (2, m.cols) view, m[:, 2] a (m.rows, 1) view
+
+        :param row_col: tuple[int | slice, int | slice], containing the row of and column of
                         the element in the Matrix
-        :return: Number, the element's value at location (row, col) in the Matrix
+        :return: Number, the element's value at location (row, col) in the Matrix,
+                 or a Matrix view when row or col is a slice
         """
         row, col = row_col
-        try:
-            return self._data[row][col]
-        except IndexError:
-            raise MatrixIndexError('Matrix indices row or col out of range')
+        if isinstance(row, slice) or isinstance(col, slice):
+            return self._sub_view(row, col)
+        return self._data[self._flat_index(row, col)]
 
     def __eq__(self, other: 'Matrix') -> bool:
         """test for equality, based on type, shape, and element to element equality
         :param other: a Matrix of identical Shape as self
-        :return: True if self == other, False otherwise
+        :return: True if self == other, False otherwise; NotImplemented for an other that is
+                 not a Matrix, so that python tries its reflected __eq__ (SparseMatrix...)
         """
         if not isinstance(other, type(self)):
-            raise TypeError('a Matrix must be compared to a Matrix')
+            return NotImplemented
         if self.shape != other.shape:
             raise IncompatibleMatrixShapes('Matrices must have identical shapes to be compared')
-        for selfrow, otherrow in zip(self._data, other._data):
-            for selfelt, otherelt in zip(selfrow, otherrow):
-                if not math.isclose(selfelt, otherelt):
-                    return False
+        backend, arrays = self._backend_operands(other)
+        if backend is not None:
+            return backend.isclose(*arrays)
+        for selfelt, otherelt in zip(self._flat(), other._flat()):
+            if not math.isclose(selfelt, otherelt):
+                return False
         return True
 
-    def transpose(self):
-        """
-        :return: a new Matrix, transpose of self
+    def transpose(self, out: Union['Matrix', None] = None) -> 'Matrix':
+        """the transpose is a view: the strides are swapped, no element is copied
+
+        :param out: a Matrix of shape (self.cols, self.rows) to write the transpose into, row by row;
+                    a square self transposes in place with out=self; the 2x2, 3x3 and 4x4
+                    matrices use the unrolled kernels of src.smallmat
+        :return: a Matrix, transpose of self, sharing the storage of self, or out
         """
-        return Matrix(list(map(list, zip(*self._data))))
+        row_stride, col_stride = self._strides
+        view = self._view(self._cols, self._rows, (col_stride, row_stride), self._offset)
+        if out is None:
+            return view
+        self._check_out(out, self._cols, self._rows)
+        if self._small_size():
+            out._write_rows(smallmat.TRANSPOSE[self._rows](self._row_lists()))
+            return out
+        view = view._unaliased(out)
+        out._write_rows(map(view._row, range(view._rows)))
+        return out
     T = transpose
 
+    def _small_size(self) -> int:
+        """
+        :return: the size of self if it is a square matrix with unrolled kernels
+                 in src.smallmat (2x2, 3x3, 4x4), 0 otherwise
+        """
+        if self._rows == self._cols and self._rows in smallmat.SIZES:
+            return self._rows
+        return 0
+
     def __neg__(self):
         """
         inverses the sign of each element in self
         mutates self
         :return: self, with each elements'sign inverted
         """
-        self._data = [[-elt for elt in row] for row in self._data]
-        return self
+        return self._map_into(self, lambda run: [-elt for elt in run])
 
     def __mul__(self, scalar: Number) -> 'Matrix':
         """
@@ -158,7 +655,10 @@ class Matrix:
         :return: a new Matrix of identical shape as self, whose elements
                  have been multiplied by the scalar
         """
-        return Matrix([[elt * scalar for elt in row] for row in self._data])
+        backend, arrays = self._backend_operands()
+        if backend is not None and backend.accepts_scalar(scalar):
+            return self._from_backend(backend, backend.scale(*arrays, scalar))
+        return Matrix._from_owned(list(map(operator.mul, self._elements(), repeat(scalar))), self._rows, self._cols)
 
     def __rmul__(self, scalar: Number) -> 'Matrix':
         """
@@ -175,8 +675,18 @@ class Matrix:
         :param scalar: a Number
         :return: self, whose elements have been multiplied by the scalar
         """
-        self._data = [[elt * scalar for elt in row] for row in self._data]
-        return self
+        return self.scale(scalar, out=self)
+
+    def scale(self, scalar: Number, out: Union['Matrix', None] = None) -> 'Matrix':
+        """
+        Matrix multiplication by a scalar
+        :param scalar: a Number
+        :param out: a Matrix of the shape of self to write the result into, possibly self
+        :return: a new Matrix, self * scalar, or out holding it
+        """
+        if out is None:
+            return self * scalar
+        return self._map_into(out, lambda run: [elt * scalar for elt in run])
 
     def __truediv__(self, scalar: Number) -> 'Matrix':
         """
@@ -187,7 +697,8 @@ class Matrix:
         """
         if scalar == 0:
             raise ZeroDivisionError('the divisor must be non zero')
-        return Matrix([[elt / scalar for elt in row] for row in self._data])
+        return Matrix._from_owned(list(map(operator.truediv, self._elements(), repeat(scalar))),
+                                  self._rows, self._cols)
     # division of a scalar by a matrix does not make sense.
 
     def __itruediv__(self, scalar: Number) -> 'Matrix':
@@ -199,8 +710,7 @@ class Matrix:
         """
         if scalar == 0:
             raise ZeroDivisionError('the divisor must be non zero')
-        self._data = [[elt / scalar for elt in row] for row in self._data]
-        return self
+        return self._map_into(self, lambda run: [elt / scalar for elt in run])
 
     def __add__(self, other: "Matrix") -> 'Matrix':
         """
@@ -208,10 +718,15 @@ class Matrix:
         :return: a new Matrix with the each element of self added
                  to each element of other
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented
         if self.shape != other.shape:
             raise IncompatibleMatrixShapes('Matrices must have identical shapes to be added')
-        return Matrix([[self_e + other_e for self_e, other_e in zip(self_row, other_row)]
-                       for self_row, other_row in zip(self._data, other._data)])
+        backend, arrays = self._backend_operands(other)
+        if backend is not None:
+            return self._from_backend(backend, backend.add(*arrays), other)
+        return Matrix._from_owned(list(map(operator.add, self._elements(), other._elements())),
+                                  self._rows, self._cols)
     __radd__ = __add__
 
     def __iadd__(self, other: "Matrix") -> 'Matrix':
@@ -219,11 +734,24 @@ class Matrix:
         :param other: a Matrix of Shape identical to self
         :return: self with each element of other added to each element of self
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other, out=self)
+
+    def add(self, other: 'Matrix', out: Union['Matrix', None] = None) -> 'Matrix':
+        """
+        :param other: a Matrix of Shape identical to self
+        :param out: a Matrix of the shape of self to write the sum into, possibly self or other;
+                    the backends are not used with out
+        :return: a new Matrix, self + other, or out holding it
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError('Matrix addition must add two Matrices')
         if self.shape != other.shape:
             raise IncompatibleMatrixShapes('Matrices must have identical shapes to be added')
-        self._data = [[self_e + other_e for self_e, other_e in zip(self_row, other_row)]
-                      for self_row, other_row in zip(self._data, other._data)]
-        return self
+        if out is None:
+            return self + other
+        return self._map_into(out, lambda run, other_run: list(map(operator.add, run, other_run)), other)
 
     def __sub__(self, other: "Matrix") -> 'Matrix':
         """
@@ -231,10 +759,15 @@ class Matrix:
         :return: a new Matrix with the each element of self added
                  to each element of other
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented
         if self.shape != other.shape:
             raise IncompatibleMatrixShapes('Matrices must have identical shapes to be subtracted')
-        return Matrix([[self_e - other_e for self_e, other_e in zip(self_row, other_row)]
-                       for self_row, other_row in zip(self._data, other._data)])
+        backend, arrays = self._backend_operands(other)
+        if backend is not None:
+            return self._from_backend(backend, backend.sub(*arrays), other)
+        return Matrix._from_owned(list(map(operator.sub, self._elements(), other._elements())),
+                                  self._rows, self._cols)
     __rsub__ = __sub__
 
     def __isub__(self, other: "Matrix") -> 'Matrix':
@@ -242,66 +775,349 @@ class Matrix:
         :param other: a Matrix of Shape identical to self
         :return: self with each element of other added to each element of self
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.sub(other, out=self)
+
+    def sub(self, other: 'Matrix', out: Union['Matrix', None] = None) -> 'Matrix':
+        """
+        :param other: a Matrix of Shape identical to self
+        :param out: a Matrix of the shape of self to write the difference into, possibly self or other;
+                    the backends are not used with out
+        :return: a new Matrix, self - other, or out holding it
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError('Matrix subtraction must subtract two Matrices')
         if self.shape != other.shape:
             raise IncompatibleMatrixShapes('Matrices must have identical shapes to be subtracted')
-        self._data = [[self_e - other_e for self_e, other_e in zip(self_row, other_row)]
-                      for self_row, other_row in zip(self._data, other._data)]
-        return self
+        if out is None:
+            return self - other
+        return self._map_into(out, lambda run, other_run: list(map(operator.sub, run, other_run)), other)
 
     def __matmul__(self, other: 'Matrix') -> 'Matrix':
         """
         :param other: a Matrix of compatible size
         :return: A Matrix of Shape(self.rows, other.cols), the result of the multiplication of self with other
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented   # lets other, e.g. a SparseMatrix, implement __rmatmul__
+        return self.matmul(other)
+
+    def matmul(self, other: 'Matrix', strategy: str = 'auto', out: Union['Matrix', None] = None) -> 'Matrix':
+        """multiplies self with other, using the kernel selected by strategy
+
+        :param other: a Matrix of compatible size
+        :param strategy: str, one of 'auto', 'naive', 'transposed', 'blocked'
+                         (see src.matmul); 'auto' uses the backend of the operands,
+                         and the unrolled kernels of src.smallmat when both matrices
+                         are 2x2, 3x3 or 4x4 on the python backend
+        :param out: a Matrix of Shape(self.rows, other.cols) to write the product into,
+                    possibly self or other
+        :return: A Matrix of Shape(self.rows, other.cols), the result of the multiplication of self with other,
+                 or out holding it
+        """
         if not isinstance(other, type(self)):
             raise TypeError('Matrix multiplication must multiply two Matrices')
         if self.cols != other.rows:
             raise IncompatibleMatrixShapes('Matrix A number of columns must equal Matrix B number of rows')
+        if out is not None:
+            return self._matmul_into(other, strategy, out)
+        if strategy == 'auto':
+            backend, arrays = self._backend_operands(other)
+            if backend is not None:
+                return self._from_backend(backend, backend.matmul(*arrays), other)
+        if strategy == 'auto' and self.shape == other.shape and self._small_size():
+            return Matrix._from_owned(smallmat.FLAT_MATMUL[self._rows](self._elements(), other._elements()),
+                                      self._rows, self._cols)
+        return Matrix._from_rows(matmul(self._row_lists(), other._row_lists(), strategy))
+
+    def _matmul_into(self, other: 'Matrix', strategy: str, out: 'Matrix') -> 'Matrix':
+        """writes the product of self with other into out
+
+        the product is computed row by row by the transposed kernel and written
+        as it goes, for the strategies 'auto' and 'transposed'; the backends,
+        the unrolled kernels and the other strategies compute the whole product
+        first. An operand sharing the storage of out is copied first, since its
+        elements are read after rows of out are written.
+        """
+        self._check_out(out, self._rows, other._cols)
+        a = self.copy() if self._data is out._data else self
+        b = other.copy() if other._data is out._data else other
+        if strategy == 'auto':
+            backend, arrays = a._backend_operands(b)
+            if backend is not None:
+                out._assign(backend.to_flat(backend.matmul(*arrays)))
+                return out
+            if a.shape == b.shape and a._small_size():
+                out._assign(smallmat.FLAT_MATMUL[a._rows](a._elements(), b._elements()))
+                return out
+        if strategy in ('auto', 'transposed'):
+            out._write_rows(matmul_rows(map(a._row, range(a._rows)), b._row_lists()))
+        else:
+            out._write_rows(matmul(a._row_lists(), b._row_lists(), strategy))
+        return out
+
+    def __pow__(self, exponent: int) -> 'Matrix':
+        """raises a square Matrix to an integer power, by squaring: O(log(exponent)) products
+
+        the int and Fraction elements stay exact: the products of ints are ints,
+        and a negative power of an exact Matrix is the power of its exact inverse.
+        On the python backend, the squaring runs on rows, with the unrolled
+        kernels of src.smallmat for the 2x2, 3x3 and 4x4 matrices; on the other
+        backends, each product is an @ of the backend.
+
+        :param exponent: int; self ** 0 is the identity, self ** -n the inverse of self ** n
+        :return: a new Matrix, self ** exponent
+        :raises SingularMatrixError: for a negative exponent, when self is not invertible
+        """
+        if not isinstance(exponent, int) or isinstance(exponent, bool):
+            return NotImplemented
+        self._check_square()
+        if exponent == 0:
+            return Matrix.identity(self.shape, self._backend)
+        base = self.inverse() if exponent < 0 else self
+        backend, _ = base._backend_operands()
+        if backend is not None:
+            result = power(base, abs(exponent), operator.matmul)
+            return result.copy() if result is self else result
+        size = base._small_size()
+        if size:
+            rows = power(base._row_lists(), abs(exponent), smallmat.MATMUL[size], smallmat.SQUARE[size])
+        else:
+            rows = power(base._row_lists(), abs(exponent), matmul)
+        return Matrix._from_rows(rows)
+
+    @staticmethod
+    def _chain_dims(matrices: Sequence['Matrix']) -> Tuple[int, ...]:
+        """
+        :return: the dims of the chain of matrices, see src.chain
+        """
+        if not matrices:
+            raise IncompatibleMatrixShapes('a chain holds at least one Matrix')
+        if not all(isinstance(matrix, Matrix) for matrix in matrices):
+            raise TypeError('Matrix multiplication must multiply Matrices')
+        try:
+            return chain.dims_of(matrices)
+        except ValueError as error:
+            raise IncompatibleMatrixShapes(str(error))
+
+    @classmethod
+    def chain_plan(cls, *matrices: 'Matrix') -> chain.Plan:
+        """plans the product of a chain of matrices, without computing it
+
+        :return: the chain.Plan of the product: its order, and its estimated flops
+                 compared with the product from left to right; str(plan) reports them
+        """
+        return chain.plan(cls._chain_dims(matrices))
+
+    @classmethod
+    def chain_multiply(cls, *matrices: 'Matrix') -> 'Matrix':
+        """multiplies a chain of matrices, A @ B @ C ..., in the order of the fewest multiplications
+
+        the order is found by dynamic programming on the shapes, and cached per
+        shapes: the repeated chains of the same shapes are not planned again.
+        Each product is computed by @, with the backend and the kernels it selects.
+
+        :param matrices: Matrices of compatible sizes
+        :return: a new Matrix, the product of the chain
+        """
+        product = chain.multiply(matrices, cls.chain_plan(*matrices).split)
+        return product.copy() if len(matrices) == 1 else product
+
+    def lu(self) -> LUDecomposition:
+        """returns the LU decomposition (with partial pivoting) of self
+
+        the factors are cached, and reused until self, or a view sharing
+        its storage, is mutated
+
+        :return: the LUDecomposition of self
+        """
+        self._check_square()
+        if self._lu is None or self._lu_version != self._version[0]:
+            self._lu = LUDecomposition(self._row_lists())
+            self._lu_version = self._version[0]
+        return self._lu
+
+    def _check_square(self) -> None:
+        if self.rows != self.cols:
+            raise IncompatibleMatrixShapes('Matrix must be square')
+
+    def _use_exact(self, exact: Union[bool, None], *others) -> bool:
+        """resolves the arithmetic mode of an elimination
+
+        :param exact: True for fraction-free Bareiss elimination, False for the LU
+                      decomposition, None to choose exact when self and others
+                      only contain int and Fraction elements
+        """
+        if exact is None:
+            return bareiss.is_exact(self._row_lists()) and all(bareiss.is_exact(other) for other in others)
+        return exact
+
+    def solve(self, rhs: Union['Matrix', List[Number]],
+              exact: Union[bool, None] = None) -> Union['Matrix', List[Number]]:
+        """solves self @ x = rhs, for a square Matrix self
+
+        :param rhs: a Matrix of shape (self.rows, 1), or a sequence of self.rows numbers
+        :param exact: True, False or None, see _use_exact
+        :return: x, a Matrix of shape (self.rows, 1), or a list of numbers, like rhs
+        """
+        self._check_square()
+        if isinstance(rhs, Matrix):
+            if rhs.shape != Shape(rows=self.rows, cols=1):
+                raise IncompatibleMatrixShapes('the right hand side must be a single column of self.rows values')
+            return Matrix._from_owned(self.solve(rhs._flat(), exact), self.rows, 1)
+        if len(rhs) != self.rows:
+            raise IncompatibleMatrixShapes('the right hand side must have self.rows values')
+        if self._use_exact(exact, [rhs]):
+            return bareiss.solve(self._row_lists(), rhs)
+        return self.lu().solve(rhs)
+
+    def solve_many(self, rhss: 'Matrix', exact: Union[bool, None] = None) -> 'Matrix':
+        """solves self @ X = rhss, each column of rhss being a right hand side
+
+        the elimination of self is done once, and shared by all the columns
+
+        :param rhss: a Matrix with self.rows rows
+        :param exact: True, False or None, see _use_exact
+        :return: X, a Matrix of the same shape as rhss
+        """
+        self._check_square()
+        if not isinstance(rhss, Matrix):
+            raise TypeError('the right hand sides must be given as the columns of a Matrix')
+        if rhss.rows != self.rows:
+            raise IncompatibleMatrixShapes('the right hand sides must have self.rows rows')
+        columns = rhss.transpose()._row_lists()
+        if self._use_exact(exact, columns):
+            columns = bareiss.solve_many(self._row_lists(), columns)
+        else:
+            columns = self.lu().solve_many(columns)
+        return Matrix._from_owned(list(chained.from_iterable(zip(*columns))), rhss.rows, rhss.cols)
 
-        rows, cols, ndxs = self.rows, other.cols, self.cols
-        _data = [[0 for col in range(cols)] for row in range(rows)]
-        for row in range(rows):
-            for col in range(cols):
-                for ndx in range(ndxs):
-                    _data[row][col] += self._data[row][ndx] * other._data[ndx][col]
-        return Matrix(_data)
+    def inverse(self, exact: Union[bool, None] = None) -> 'Matrix':
+        """
+        :param exact: True, False or None, see _use_exact
+                      with None, 2x2, 3x3 and 4x4 matrices use the unrolled
+                      adjugate of src.smallmat, divided exactly when possible
+        :return: a new Matrix, inverse of self
+        :raises SingularMatrixError: when self is not invertible
+        """
+        self._check_square()
+        if exact is None and self._small_size():
+            det, adjugate = smallmat.FLAT_ADJUGATE[self._rows](self._elements())
+            if det == 0:
+                raise SingularMatrixError('a singular Matrix has no inverse')
+            if self._use_exact(None):
+                det = Fraction(det)
+            return Matrix._from_owned([elt / det for elt in adjugate], self._rows, self._cols)
+        if self._use_exact(exact):
+            return Matrix._from_rows(bareiss.inverse(self._row_lists()))
+        lu = self.lu()
+        if lu.singular:
+            raise SingularMatrixError('a singular Matrix has no inverse')
+        return Matrix._from_rows(lu.inverse())
+
+    def det(self, exact: Union[bool, None] = None) -> Number:
+        """
+        :param exact: True, False or None, see _use_exact
+                      with None, 2x2, 3x3 and 4x4 matrices use the unrolled
+                      determinant of src.smallmat
+        :return: the determinant of self, a square Matrix
+        """
+        self._check_square()
+        if exact is None and self._small_size():
+            return smallmat.FLAT_DET[self._rows](self._elements())
+        if self._use_exact(exact):
+            return bareiss.det(self._row_lists())
+        return self.lu().det()
+
+    def rank(self) -> int:
+        """the rank of self, computed exactly
+
+        float elements are converted exactly to Fraction, no tolerance is applied
+
+        :return: int, the rank of self
+        """
+        return bareiss.rank(self._row_lists())
 
     def __str__(self):
         """
         :return: a string representing the Matrix self
         """
-        return '\n'.join(', '.join([str(elt) for elt in mrow]) for mrow in self._data)
+        return '\n'.join(', '.join(map(str, mrow)) for mrow in self._row_lists())
 
     def get_row(self, row: int) -> 'Matrix':
         """returns the row of the Matrix as a 1 x self.cols Matrix
 
         :param row: int, the row of the matrix to be returned
-        :return: a Matrix of shape (1, self.cols) containing the values in the row specified
+        :return: a view of shape (1, self.cols) on the values in the row specified
         """
-        try:
-            return Matrix([self._data[row]])
-        except IndexError:
+        if not -self._rows <= row < self._rows:
             raise MatrixIndexError('Matrix row out of range')
+        return self[row, :]
 
     def get_col(self, col: int) -> 'Matrix':
         """returns the col of the Matrix as a 1 x self.rows Matrix
 
         :param col: int, the col of the matrix to be returned
-        :return: a Matrix of shape (1, self.rows) containing the values in the col specified
+        :return: a view of shape (1, self.rows) on the values in the col specified
         """
-        try:
-            return Matrix([self.T()._data[col]])
-        except IndexError:
-            raise MatrixIndexError('Matrix row out of range')
+        if not -self._cols <= col < self._cols:
+            raise MatrixIndexError('Matrix col out of range')
+        row_stride, col_stride = self._strides
+        return self._view(1, self._rows, (col_stride, row_stride), self._flat_index(0, col))
 
     def clone(self) -> 'Matrix':
-        """clones self to a new Matrix
+        """clones self to a new Matrix, that owns its storage
+
+        the elements of self, or of the view self, are gathered in row-major order
+        into a new flat list, adopted as the storage of the clone without another
+        copy (see _from_owned); the numbers are immutable, and shared. A result of a
+        backend not yet materialized shares its array instead, never mutated
 
-        Attention relies on __init__ making a deepcopy of the sequence passed
+        :return: a Matrix, copy of self, on the backend selected by self
+        """
+        if '_data' not in vars(self):
+            return self._from_backend(self._array_backend, self._array)     # the arrays are never mutated
+        return Matrix._from_owned(self._flat(), self._rows, self._cols, self._backend)
+
+    def copy(self) -> 'Matrix':
+        """copies a view, or any Matrix, to a new Matrix that owns its storage
+
+        writing to the copy no longer affects the Matrix the view was taken from
 
         :return: a Matrix, deep-copy of self
         """
-        return Matrix(self._data)
+        return self.clone()
+
+    def to_numpy(self) -> Any:
+        """
+        :return: a new numpy array of the elements of self: float64 or complex128 as
+                 computed by the numpy backend, int64 for ints that fit, and dtype
+                 object for the others, Fractions included, so that no value is lost
+        :raises ImportError: when numpy is not installed
+        """
+        numpy_backend = backends.get_backend('numpy')
+        array = self._backend_array(numpy_backend)
+        if array is not None:
+            return array.copy()
+        return numpy_backend.export(self._flat(), self._rows, self._cols)
+
+    @classmethod
+    def from_numpy(cls, array: Any, backend: Union[str, Backend, None] = 'numpy') -> 'Matrix':
+        """
+        :param array: a 2 dimensional numpy array
+        :param backend: see __init__, numpy by default
+        :return: a new Matrix of the values of array, converted to python numbers
+        """
+        if array.ndim != 2:
+            raise ValueError('a Matrix is made from a 2 dimensional array')
+        return cls(array.tolist(), backend=backend)
+
+
+def multi_dot(matrices: Sequence[Matrix]) -> Matrix:
+    """multiplies a sequence of matrices in the order of the fewest multiplications, see Matrix.chain_multiply
+    """
+    return Matrix.chain_multiply(*matrices)
 
 
 if __name__ == '__main__':
@@ -156,20 +156,10 @@ class Matrix:
         return sum(sum(row) for row in self.matrix)
 
     def __str__(self):
-        width = max(len(str(elt)) for row in self.matrix for elt in row)
-        res = ['[']
-        for r, row in enumerate(self.matrix):
-            row_res = ['[']
-            for elt in row:
-                row_res.append(f"{' ' * (width - len(str(elt)))}{str(elt)}")
-                row_res.append(', ')
-            row_res.pop()
-            row_res.append(']')
-            if r < self.shape.num_rows - 1:
-                row_res.append(',\n ')
-            res.append(''.join(row_res))
-        res.append(']')
-        return ''.join(res)
+        texts = [[str(elt) for elt in row] for row in self.matrix]
+        width = max(len(text) for row in texts for text in row)
+        rows = (f"[{', '.join(text.rjust(width) for text in row)}]" for row in texts)
+        return '[' + ',\n '.join(rows) + ']'
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.matrix})"
@@ -0,0 +1,272 @@
+"""
+process-pool backend for the large float Matrix operations
+
+The pure python kernels hold the GIL, so a Matrix operation only uses one
+core. ParallelBackend is a backend of src.backends: selected by a Matrix,
+@, +, - and the multiplication by a scalar are computed by partitioning
+the rows of the result between the worker processes of a
+ProcessPoolExecutor. The operands are copied once into
+multiprocessing.shared_memory blocks of float64, and each worker is only
+sent the names of the blocks and the range of rows to compute, which it
+writes in the shared result block. Nothing else is pickled per call.
+
+Scope: only the matrices holding floats, and only these four operators;
+the matrices holding anything else (int, Fraction, complex: their exact
+values and types must be kept) are declined, and stay on the pure python
+kernels, and the other operations (solve, inverse, the in-place and out=
+operators...) are not parallel. Below a threshold of work, the backend
+computes serially, in the parent process.
+The parallel results are identical to the serial ones: each element is
+computed with the same expression as the kernels of src.matmul.
+The elementwise operations do one operation per element copied to and from
+the shared blocks; they only pay off for very large matrices on many cores,
+hence their high threshold.
+
+Importing this module registers a ParallelBackend of os.cpu_count() workers
+as 'parallel'; a backend of another configuration is selected as an object:
+
+    with ParallelBackend(workers=8) as backend:
+        a.backend = b.backend = backend
+        c = a @ b
+"""
+
+import math
+import operator
+import os
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain as chained, repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, NamedTuple, Tuple, Union
+
+from numeric.src.backends import Backend, register
+
+
+MATMUL_THRESHOLD = 2_000_000        # multiply-adds under which matmul stays serial
+ELEMENTWISE_THRESHOLD = 16_000_000  # elements under which add, sub and mul stay serial
+
+_OPERATORS = {'add': operator.add, 'sub': operator.sub, 'mul': operator.mul}
+
+
+def _share(*values: array) -> List[SharedMemory]:
+    """
+    :return: new SharedMemory blocks holding each of values as float64; when one cannot be
+             created (/dev/shm full...), the blocks already created are released
+    """
+    shared = []
+    try:
+        for each in values:
+            shared.append(SharedMemory(create=True, size=8 * max(len(each), 1)))
+            with shared[-1].buf.cast('d') as view:
+                view[:len(each)] = each
+    except BaseException:
+        _release(shared)
+        raise
+    return shared
+
+
+def _release(shared: List[SharedMemory]) -> None:
+    """closes and unlinks the blocks of shared, owned by the parent process
+    """
+    for shm in shared:
+        shm.close()
+        shm.unlink()
+
+
+def _matmul_rows(a_name: str, b_cols_name: str, inner: int, cols: int, out_name: str,
+                 start: int, stop: int) -> None:
+    """computes the rows start to stop of a @ b into the result block
+
+    the blocks are attached by name; the parent process owns and unlinks them.
+    b is shared as its columns, so that each element is sum(map(mul, a_row, b_col)),
+    as in matmul_transposed and matmul_blocked
+    """
+    mul = operator.mul
+    blocks = [SharedMemory(name=name) for name in (a_name, b_cols_name, out_name)]
+    try:
+        with blocks[0].buf.cast('d') as a, blocks[1].buf.cast('d') as b, blocks[2].buf.cast('d') as out:
+            b_cols = [b[col * inner: (col + 1) * inner].tolist() for col in range(cols)]
+            result = array('d')
+            for row in range(start, stop):
+                a_row = a[row * inner: (row + 1) * inner].tolist()
+                result.extend([sum(map(mul, a_row, b_col)) for b_col in b_cols])
+            out[start * cols: stop * cols] = result
+    finally:
+        for shm in blocks:
+            shm.close()
+
+
+def _elementwise(op: str, a_name: str, b_name: Union[str, None], scalar: float, out_name: str,
+                 start: int, stop: int) -> None:
+    """computes the elements start to stop of a op b, or of a op scalar, into the result block
+    """
+    func = _OPERATORS[op]
+    names = (a_name, out_name) if b_name is None else (a_name, out_name, b_name)
+    blocks = [SharedMemory(name=name) for name in names]
+    try:
+        with blocks[0].buf.cast('d') as a, blocks[1].buf.cast('d') as out:
+            if b_name is None:
+                out[start: stop] = array('d', [func(elt, scalar) for elt in a[start: stop].tolist()])
+            else:
+                with blocks[2].buf.cast('d') as b:
+                    out[start: stop] = array('d', map(func, a[start: stop].tolist(), b[start: stop].tolist()))
+    finally:
+        for shm in blocks:
+            shm.close()
+
+
+class FloatArray(NamedTuple):
+    """the array of a float Matrix on a ParallelBackend: its elements in row-major order
+    """
+    flat: array
+    rows: int
+    cols: int
+
+
+class ParallelBackend(Backend):
+    """
+    computes the large float Matrix operations in a pool of worker processes
+    """
+    name = 'parallel'
+
+    def __init__(self, workers: Union[int, None] = None, matmul_threshold: int = MATMUL_THRESHOLD,
+                 elementwise_threshold: int = ELEMENTWISE_THRESHOLD) -> None:
+        """
+        :param workers: int, the number of worker processes, None for os.cpu_count()
+        :param matmul_threshold: int, the number of multiply-adds under which matmul stays serial
+        :param elementwise_threshold: int, the number of elements under which add, sub and scale stay serial
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.matmul_threshold = matmul_threshold
+        self.elementwise_threshold = elementwise_threshold
+        self._executor = None
+
+    def __enter__(self) -> 'ParallelBackend':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """the pool, started on first use, and kept for the following calls
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self) -> None:
+        """shuts the worker processes down; they are started again by the next parallel operation
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def available(self) -> bool:
+        return True
+
+    def to_array(self, flat: list, rows: int, cols: int) -> Union[FloatArray, None]:
+        """
+        :return: the FloatArray of flat, or None unless every element is a float
+        """
+        if not all(type(elt) is float for elt in flat):
+            return None
+        return FloatArray(array('d', flat), rows, cols)
+
+    def to_rows(self, matrix: FloatArray) -> List[list]:
+        flat, cols = matrix.flat, matrix.cols
+        return [flat[row * cols: (row + 1) * cols].tolist() for row in range(matrix.rows)]
+
+    def to_flat(self, matrix: FloatArray) -> list:
+        return matrix.flat.tolist()
+
+    def accepts_scalar(self, scalar: Any) -> bool:
+        return type(scalar) in (int, float)
+
+    def _ranges(self, count: int) -> List[Tuple[int, int]]:
+        """
+        :return: the ranges (start, stop) partitioning range(count) between the workers
+        """
+        parts = min(self.workers, count)
+        bounds = [count * part // parts for part in range(parts + 1)]
+        return list(zip(bounds, bounds[1:]))
+
+    def _run(self, func, shared: List[SharedMemory], size: int, count: int, *args) -> array:
+        """runs func(*args, start, stop) over the ranges of count rows or elements,
+        and returns the size values of the result block
+
+        the blocks of shared and the result block are unlinked on return, or on failure
+        """
+        try:
+            out = SharedMemory(create=True, size=8 * max(size, 1))
+            shared.append(out)
+            futures = [self.executor.submit(func, *args, out.name, *bounds) for bounds in self._ranges(count)]
+            for future in futures:
+                future.result()
+            with out.buf.cast('d') as view:
+                return array('d', view[:size])
+        finally:
+            _release(shared)
+
+    def matmul(self, a: FloatArray, b: FloatArray) -> FloatArray:
+        """
+        :return: a @ b, computed in parallel above the matmul threshold
+        """
+        rows, inner, cols = a.rows, a.cols, b.cols
+        b_cols = [b.flat[col: len(b.flat): cols] for col in range(cols)]
+        if rows * inner * cols < self.matmul_threshold:
+            mul = operator.mul
+            flat = array('d', [sum(map(mul, a.flat[row * inner: (row + 1) * inner], b_col))
+                               for row in range(rows) for b_col in b_cols])
+            return FloatArray(flat, rows, cols)
+        shared = _share(a.flat, array('d', chained.from_iterable(b_cols)))
+        flat = self._run(_matmul_rows, shared, rows * cols, rows, shared[0].name, shared[1].name, inner, cols)
+        return FloatArray(flat, rows, cols)
+
+    def _elementwise(self, op: str, a: FloatArray, b: Union[FloatArray, None], scalar: float = 0.0) -> FloatArray:
+        """
+        :return: a op b, or a op scalar, computed in parallel above the elementwise threshold
+        """
+        size = len(a.flat)
+        if size < self.elementwise_threshold:
+            func = _OPERATORS[op]
+            flat = array('d', map(func, a.flat, repeat(scalar) if b is None else b.flat))
+            return FloatArray(flat, a.rows, a.cols)
+        shared = _share(a.flat) if b is None else _share(a.flat, b.flat)
+        b_name = None if b is None else shared[1].name
+        flat = self._run(_elementwise, shared, size, size, op, shared[0].name, b_name, scalar)
+        return FloatArray(flat, a.rows, a.cols)
+
+    def add(self, a: FloatArray, b: FloatArray) -> FloatArray:
+        return self._elementwise('add', a, b)
+
+    def sub(self, a: FloatArray, b: FloatArray) -> FloatArray:
+        return self._elementwise('sub', a, b)
+
+    def scale(self, a: FloatArray, scalar: Union[int, float]) -> FloatArray:
+        return self._elementwise('mul', a, None, scalar)
+
+    def isclose(self, a: FloatArray, b: FloatArray) -> bool:
+        return all(map(math.isclose, a.flat, b.flat))
+
+
+register(ParallelBackend())
+
+
+if __name__ == '__main__':
+
+    import random
+
+    from numeric.src.matrix import Matrix
+
+    size = 150
+    a = Matrix([[random.random() for _ in range(size)] for _ in range(size)])
+    b = Matrix([[random.random() for _ in range(size)] for _ in range(size)])
+    with ParallelBackend(workers=4, matmul_threshold=0, elementwise_threshold=0) as backend:
+        pa, pb = a.clone(), b.clone()
+        pa.backend, pb.backend = backend, backend
+        print((pa @ pb)._row_lists() == (a @ b)._row_lists())
+        print((pa + pb)._row_lists() == (a + b)._row_lists())
+        print((pa * 3)._row_lists() == (a * 3)._row_lists())
+
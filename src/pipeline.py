@@ -0,0 +1,128 @@
+"""
+a chain of Hmat33 transforms, fused into a single matrix before being applied
+
+A point goes through the stages in order: for stages model -> world -> canvas,
+the fused matrix is canvas @ world @ model, and transforming a batch of points
+costs one matrix application instead of one per stage.
+The fused matrix is computed on first use, and cached until a stage is
+appended, replaced or removed. Hmat33 are treated as values: to change a
+stage, set a new Hmat33 in its place.
+
+"""
+
+from typing import Iterable, List, Sequence, Union
+
+from numeric.src.hommat import Buffer, Hmat33
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point
+
+
+class TransformPipeline:
+    """
+    an ordered chain of named Hmat33 stages
+    """
+
+    def __init__(self, stages: Iterable[Hmat33] = ()) -> None:
+        """
+        :param stages: the Hmat33 of the first stages, in the order they apply to points
+        """
+        self._stages: List[Hmat33] = []
+        self._names: List[str] = []
+        self._fused: Union[Hmat33, None] = None
+        for stage in stages:
+            self.append(stage)
+
+    def _index(self, key: Union[int, str]) -> int:
+        """
+        :param key: int, the position of a stage, or str, its name
+        """
+        if isinstance(key, str):
+            try:
+                return self._names.index(key)
+            except ValueError:
+                raise KeyError(f'no stage named {key}')
+        return range(len(self._stages))[key]
+
+    def append(self, stage: Hmat33, name: str = '') -> 'TransformPipeline':
+        """adds a stage, applied after the current last stage
+
+        :param name: str, the name to get or set the stage by, optional
+        :return: self, for chaining
+        """
+        if not isinstance(stage, Hmat33):
+            raise TypeError('a stage must be a Hmat33')
+        if name and name in self._names:
+            raise ValueError(f'a stage is already named {name}')
+        self._stages.append(stage)
+        self._names.append(name)
+        self._fused = None
+        return self
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __getitem__(self, key: Union[int, str]) -> Hmat33:
+        return self._stages[self._index(key)]
+
+    def __setitem__(self, key: Union[int, str], stage: Hmat33) -> None:
+        """replaces a stage; the fused matrix is recomputed on next use
+        """
+        if not isinstance(stage, Hmat33):
+            raise TypeError('a stage must be a Hmat33')
+        self._stages[self._index(key)] = stage
+        self._fused = None
+
+    def __delitem__(self, key: Union[int, str]) -> None:
+        idx = self._index(key)
+        del self._stages[idx]
+        del self._names[idx]
+        self._fused = None
+
+    @property
+    def fused(self) -> Hmat33:
+        """
+        :return: the Hmat33 product of all the stages, the last one leftmost;
+                 the identity when the pipeline is empty
+        """
+        if self._fused is None:
+            fused = Hmat33.identity()
+            for stage in self._stages:
+                fused = stage @ fused
+            self._fused = fused
+        return self._fused
+
+    def apply_many(self, coords: Sequence[float], out: Union[Buffer, None] = None,
+                   vectors: bool = False) -> Buffer:
+        """transforms a flat buffer of 2D coordinates through all the stages in one pass
+
+        see Hmat33.apply_many
+        """
+        return self.fused.apply_many(coords, out=out, vectors=vectors)
+
+    def apply_in_place(self, coords: Buffer, vectors: bool = False) -> Buffer:
+        return self.fused.apply_in_place(coords, vectors=vectors)
+
+    def transform_points(self, points: Union[PointArray, Iterable[Point]]) -> PointArray:
+        return self.fused.transform_points(points)
+
+    def __str__(self) -> str:
+        return ' -> '.join(name or str(idx) for idx, name in enumerate(self._names))
+
+
+if __name__ == '__main__':
+
+    import math
+
+    from numeric.src.vector import Point2D, Vector2D
+
+    # model -> world -> canvas, as sketched in z_discarded/_geometry_affineplane.py
+    pipeline = TransformPipeline()
+    pipeline.append(Hmat33.rotation(math.pi / 2) @ Hmat33.scaling(2), name='model')
+    pipeline.append(Hmat33.from_basis(Vector2D(20, 5), Vector2D(3, 15)), name='world')
+    pipeline.append(Hmat33.translation(250, 250) @ Hmat33.scaling(1, -1), name='canvas')
+    print(pipeline)
+    print(pipeline.fused)
+    print(pipeline.transform_points([Point2D(0, 0), Point2D(1, 0), Point2D(0, 1)]).to_list())
+
+    pipeline['model'] = Hmat33.identity()
+    print(pipeline.transform_points([Point2D(0, 0), Point2D(1, 0), Point2D(0, 1)]).to_list())
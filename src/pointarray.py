@@ -0,0 +1,510 @@
+"""
+array-backed batch containers for Point and Vector
+
+A PointArray (or VectorArray) stores N points of dimension d in a single
+contiguous array('d') buffer, laid out as x0, y0, x1, y1, ...
+The Point / Vector operators are applied element-wise over the whole batch,
+so that one call replaces a python loop of N operator dispatches.
+
+"""
+
+
+import math
+import operator
+
+from array import array
+from itertools import repeat
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+from numeric.src import buffers, textio
+from numeric.src.vector import AbstractPointVector, Point, Point2D, Point3D, Scalar, Vector, Vector2D, Vector3D
+
+
+class ElementView:
+    """lightweight view on one element of a PointArray or VectorArray
+
+    reads and writes go directly to the buffer of the batch
+    """
+    __slots__ = ('_owner', '_start')
+
+    def __init__(self, owner: 'AbstractPointVectorArray', start: int) -> None:
+        self._owner = owner
+        self._start = start
+
+    def __len__(self) -> int:
+        return self._owner._dim
+
+    def __iter__(self) -> Iterator[float]:
+        start = self._start
+        return iter(self._owner._coords[start: start + self._owner._dim])
+
+    def __getitem__(self, idx: int) -> float:
+        if not -len(self) <= idx < len(self):
+            raise IndexError("coordinate index out of range")
+        return self._owner._coords[self._start + idx % len(self)]
+
+    def __setitem__(self, idx: int, value: Scalar) -> None:
+        if not -len(self) <= idx < len(self):
+            raise IndexError("coordinate index out of range")
+        self._owner._coords[self._start + idx % len(self)] = value
+
+    @property
+    def x(self) -> float:
+        return self[0]
+
+    @x.setter
+    def x(self, val: Scalar) -> None:
+        self[0] = val
+
+    @property
+    def y(self) -> float:
+        return self[1]
+
+    @y.setter
+    def y(self, val: Scalar) -> None:
+        self[1] = val
+
+    @property
+    def z(self) -> float:
+        return self[2]
+
+    @z.setter
+    def z(self, val: Scalar) -> None:
+        self[2] = val
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ElementView):
+            other = other.clone()
+        return self.clone() == other
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.clone())
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({", ".join(str(val) for val in self)})'
+
+
+class PointView(ElementView):
+
+    def clone(self) -> Point:
+        """
+        :return: a new Point2D, Point3D, or Point, with the values of the viewed element
+        """
+        tpe = {2: Point2D, 3: Point3D}.get(len(self), Point)
+        return tpe(*self)
+
+
+class VectorView(ElementView):
+
+    def clone(self) -> Vector:
+        """
+        :return: a new Vector2D, Vector3D, or Vector, with the values of the viewed element
+        """
+        tpe = {2: Vector2D, 3: Vector3D}.get(len(self), Vector)
+        return tpe(*self)
+
+
+class AbstractPointVectorArray:
+    """Abstract Base Class for PointArray and VectorArray
+    """
+    EPSILON = 1e-14
+
+    def __init__(self, coords: Iterable[Scalar] = (), dim: int = 2) -> None:
+        """
+        :param coords: flat sequence of coordinates x0, y0, x1, y1, ...
+        :param dim: int, the dimension of each element of the batch
+
+        Attention: must make a copy of the sequence passed
+        """
+        if dim < 1:
+            raise ValueError("dim must be a positive integer")
+        self._coords = array('d', coords)
+        self._dim = dim
+        if len(self._coords) % dim:
+            raise ValueError(f"the number of coordinates must be a multiple of {dim}")
+
+    @classmethod
+    def _from_buffer(cls, buffer: array, dim: int) -> 'AbstractPointVectorArray':
+        """wraps a freshly built array('d') without copying it
+        """
+        batch = cls.__new__(cls)
+        batch._coords = buffer
+        batch._dim = dim
+        return batch
+
+    @classmethod
+    def frombuffer(cls, obj: Any, dim: Union[int, None] = None) -> 'AbstractPointVectorArray':
+        """builds a batch from an object supporting the buffer protocol:
+        array.array, bytes, memoryview, numpy array...
+
+        a buffer of doubles is copied as raw bytes, other number formats in one C-level pass
+
+        :param obj: a flat buffer of coordinates, or a 2 dimensional buffer of shape (count, dim)
+        :param dim: int, the dimension of each element; None to take it from a
+                    2 dimensional buffer, or 2 for a flat one
+        :return: a new batch holding a copy of the coordinates
+        """
+        coords, shape = buffers.to_array(obj)
+        if dim is None:
+            dim = shape[1] if len(shape) == 2 else 2
+        elif len(shape) == 2 and shape[1] != dim:
+            raise ValueError(f"the buffer holds elements of dimension {shape[1]}, not {dim}")
+        if dim < 1:
+            raise ValueError("dim must be a positive integer")
+        if len(coords) % dim:
+            raise ValueError(f"the number of coordinates must be a multiple of {dim}")
+        return cls._from_buffer(coords, dim)
+
+    @classmethod
+    def from_csv(cls, source: Any, dim: Union[int, None] = None, delimiter: Union[str, None] = ',',
+                 columns: Union[Sequence[int], None] = None, skip: int = 0,
+                 stats: Union[textio.ReadStats, None] = None) -> 'AbstractPointVectorArray':
+        """reads a point cloud, one element per line, parsed by chunks (see src.textio)
+
+        for files larger than the memory, textio.iter_coords streams the
+        coordinates in chunks, as the streams of src.streaming
+
+        :param source: a path, or a text file object
+        :param dim: int, the dimension of each element; the first dim fields of each line are
+                    read if columns is None, all the fields if dim is None too
+        :param delimiter: str, the separator of the fields, None for runs of whitespace
+        :param columns: the indices of the coordinates in each line, None for the first dim fields
+        :param skip: int, the number of lines skipped at the start, a header
+        :param stats: a textio.ReadStats updated with the throughput of the read, or None
+        :return: a new batch of the elements read
+        """
+        columns = textio.coord_columns(dim, columns)
+        coords, width = array('d'), dim
+        for flat, _, width in textio.iter_chunks(source, delimiter, float, columns, skip, stats):
+            coords.extend(flat)
+        return cls._from_buffer(coords, width or 2)
+
+    def to_csv(self, target: Any, delimiter: str = ',', fmt: Union[str, None] = None,
+               header: Union[str, None] = None) -> None:
+        """writes the coordinates of the elements as delimited text, one element per line
+
+        :param fmt: str, a format spec for the coordinates, '.6g'..., None for an exact str
+        see Matrix.to_csv for the other parameters
+        """
+        coords, dim = self._coords, self._dim
+        rows = (coords[start: start + dim] for start in range(0, len(coords), dim))
+        textio.write_rows(target, rows, delimiter, fmt, header)
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[AbstractPointVector]) -> 'AbstractPointVectorArray':
+        """builds a batch from a sequence of Point or Vector of identical dimension
+
+        :param elements: an iterable of Point or Vector
+        :return: a new batch containing the coordinates of elements
+        """
+        coords = array('d')
+        dim = None
+        for element in elements:
+            if dim is None:
+                dim = len(element)
+            elif len(element) != dim:
+                raise ValueError("mismatched sizes of elements")
+            coords.extend(element)
+        return cls._from_buffer(coords, dim or 2)
+
+    @classmethod
+    def zeros(cls, count: int, dim: int = 2) -> 'AbstractPointVectorArray':
+        """makes and returns a new batch of count elements with all coordinates zero
+
+        :param count: int, the number of elements in the batch
+        :param dim: int, the dimension of each element
+        :return: a new batch of zeros
+        """
+        return cls._from_buffer(array('d', [0.0]) * (count * dim), dim)
+
+    @property
+    def dim(self) -> int:
+        """
+        :return: int, the dimension of each element of the batch
+        """
+        return self._dim
+
+    @property
+    def coords(self) -> array:
+        """
+        :return: the underlying array('d') buffer (not a copy)
+        """
+        return self._coords
+
+    def as_buffer(self) -> memoryview:
+        """exposes the coordinates without copying them
+
+        while the memoryview is alive, writes through the batch operators are seen
+        through it, and the array('d') of the batch cannot be resized
+
+        :return: a memoryview of format 'd' and shape (len(self), self.dim) on the buffer of self,
+                 flat for an empty batch, as memoryview has no shape with a zero
+        """
+        view = memoryview(self._coords)
+        if not self._coords:
+            return view
+        return view.cast('B').cast('d', (len(self), self._dim))
+
+    def __len__(self) -> int:
+        return len(self._coords) // self._dim
+
+    def __iter__(self) -> Iterator['ElementView']:
+        for start in range(0, len(self._coords), self._dim):
+            yield self._view_type(self, start)
+
+    def __getitem__(self, idx: int) -> 'ElementView':
+        """returns a lightweight view on the element at idx
+
+        :param idx: int, the index of the element in the batch
+        :return: an ElementView reading and writing into the batch buffer
+        """
+        count = len(self)
+        if idx < 0:
+            idx += count
+        if not 0 <= idx < count:
+            raise IndexError("batch index out of range")
+        return self._view_type(self, idx * self._dim)
+
+    def __eq__(self, other: 'AbstractPointVectorArray') -> bool:
+        """tests for equality between self and other, element-wise
+
+        :return: bool, True if self and other are equal, False otherwise
+        """
+        if not isinstance(other, type(self)) or self._dim != other._dim \
+                or len(self._coords) != len(other._coords):
+            return False
+        for self_c, other_c in zip(self._coords, other._coords):
+            if not math.isclose(self_c, other_c, abs_tol=self.EPSILON):
+                return False
+        return True
+
+    def __ne__(self, other: 'AbstractPointVectorArray') -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(dim={self._dim}, len={len(self)})'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._coords.tolist()}, dim={self._dim})'
+
+    def clone(self) -> 'AbstractPointVectorArray':
+        """clones self and returns it
+
+        :return: a new batch, copy of self
+        """
+        return self._from_buffer(array('d', self._coords), self._dim)
+
+    def to_list(self) -> list:
+        """
+        :return: a list of new Point or Vector objects, one per element of the batch
+        """
+        return [view.clone() for view in self]
+
+    def _check_operand(self, other: 'AbstractPointVectorArray') -> None:
+        if self._dim != other._dim or len(self._coords) != len(other._coords):
+            raise ValueError("mismatched sizes of operands")
+
+    def _broadcast(self, other: Union['AbstractPointVectorArray', AbstractPointVector]) -> array:
+        """returns a buffer aligned with self._coords
+
+        a single Point or Vector is repeated over the whole batch
+        """
+        if isinstance(other, AbstractPointVectorArray):
+            self._check_operand(other)
+            return other._coords
+        if len(other) != self._dim:
+            raise ValueError("mismatched sizes of operands")
+        return array('d', other) * len(self)
+
+    def __iadd__(self, other: Union['VectorArray', Vector]) -> 'AbstractPointVectorArray':
+        """adds VectorArray other to self element-wise and returns self, mutated
+
+        :param other: VectorArray, or a single Vector added to every element
+        :return: mutated self
+        """
+        if not isinstance(other, (VectorArray, Vector)):
+            raise TypeError("Can only mutate a PointArray or VectorArray via addition with a Vector")
+        self._coords[:] = array('d', map(operator.add, self._coords, self._broadcast(other)))
+        return self
+
+    def __isub__(self, other: Union['VectorArray', Vector]) -> 'AbstractPointVectorArray':
+        """subtracts VectorArray other from self element-wise and returns self, mutated
+
+        :param other: VectorArray, or a single Vector subtracted from every element
+        :return: mutated self
+        """
+        if not isinstance(other, (VectorArray, Vector)):
+            raise TypeError("Can only mutate a PointArray or VectorArray by subtracting a Vector")
+        self._coords[:] = array('d', map(operator.sub, self._coords, self._broadcast(other)))
+        return self
+
+
+class VectorArray(AbstractPointVectorArray):
+
+    _view_type = VectorView
+
+    def __add__(self, other):
+        """returns the element-wise sum of self and other
+
+        :param other: VectorArray, PointArray, or a single Vector or Point
+        :return: a new VectorArray, or a new PointArray if other is a PointArray or a Point
+        """
+        if isinstance(other, PointArray):
+            # Point + Vector = Point
+            return other + self
+        if isinstance(other, Point):
+            # Vector + Point = Point: other translated by each vector
+            return PointArray._from_buffer(array('d', map(operator.add, self._coords, self._broadcast(other))),
+                                           self._dim)
+        if not isinstance(other, (VectorArray, Vector)):
+            raise TypeError("can only add a Vector or a Point to a VectorArray")
+        return self._from_buffer(array('d', map(operator.add, self._coords, self._broadcast(other))),
+                                 self._dim)
+
+    def __sub__(self, other: Union['VectorArray', Vector]) -> 'VectorArray':
+        """returns the element-wise subtraction of other from self
+
+        :param other: VectorArray, or a single Vector
+        :return: a new VectorArray
+        """
+        if not isinstance(other, (VectorArray, Vector)):
+            raise TypeError("can only subtract a Vector from a VectorArray")
+        return self._from_buffer(array('d', map(operator.sub, self._coords, self._broadcast(other))),
+                                 self._dim)
+
+    def __neg__(self) -> 'VectorArray':
+        """
+        :return: a new VectorArray, negative of self
+        """
+        return self._from_buffer(array('d', map(operator.neg, self._coords)), self._dim)
+
+    def __mul__(self, scalar: Scalar) -> 'VectorArray':
+        """returns a new VectorArray with every element scaled by scalar
+
+        :param scalar: a Scalar
+        :return: new VectorArray
+        """
+        coords = self._coords
+        return self._from_buffer(array('d', map(operator.mul, coords, repeat(scalar, len(coords)))),
+                                 self._dim)
+
+    def __rmul__(self, scalar: Scalar) -> 'VectorArray':
+        return self * scalar
+
+    def __imul__(self, scalar: Scalar) -> 'VectorArray':
+        """scales every element of self by scalar
+
+        :param scalar: a Scalar
+        :return: mutated self
+        """
+        coords = self._coords
+        coords[:] = array('d', map(operator.mul, coords, repeat(scalar, len(coords))))
+        return self
+
+    def __truediv__(self, divisor: Scalar) -> 'VectorArray':
+        """returns a new VectorArray with every element divided by divisor
+
+        :param divisor: a Scalar
+        :return: new VectorArray
+        """
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        coords = self._coords
+        return self._from_buffer(array('d', map(operator.truediv, coords, repeat(divisor, len(coords)))),
+                                 self._dim)
+
+    def __itruediv__(self, divisor: Scalar) -> 'VectorArray':
+        """divides every element of self by divisor
+
+        :param divisor: a Scalar
+        :return: mutated self
+        """
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        coords = self._coords
+        coords[:] = array('d', map(operator.truediv, coords, repeat(divisor, len(coords))))
+        return self
+
+    def dot(self, other: Union['VectorArray', Vector]) -> array:
+        """calculates the dot product of each element of self with each element of other
+
+        :param other: VectorArray, or a single Vector
+        :return: array('d') of len(self) dot products
+        """
+        dim = self._dim
+        products = array('d', map(operator.mul, self._coords, self._broadcast(other)))
+        result = products[0::dim]
+        for offset in range(1, dim):
+            result = array('d', map(operator.add, result, products[offset::dim]))
+        return result
+
+    def __abs__(self) -> array:
+        """calculates the magnitude of each element of self
+
+        :return: array('d') of len(self) magnitudes
+        """
+        coords, dim = self._coords, self._dim
+        return array('d', map(math.hypot, *(coords[offset::dim] for offset in range(dim))))
+    mag = __abs__
+
+    def unit_vector(self) -> 'VectorArray':
+        """calculates the unit vector in the direction of each element of self
+
+        :return: new VectorArray
+        """
+        coords, dim = self._coords, self._dim
+        magnitudes = self.mag()
+        result = array('d', coords)
+        for offset in range(dim):
+            result[offset::dim] = array('d', map(operator.truediv, coords[offset::dim], magnitudes))
+        return self._from_buffer(result, dim)
+
+
+class PointArray(AbstractPointVectorArray):
+
+    _view_type = PointView
+
+    def __add__(self, other: Union[VectorArray, Vector]) -> 'PointArray':
+        """returns the element-wise translation of self by other
+
+        :param other: VectorArray, or a single Vector
+        :return: new PointArray
+        """
+        if isinstance(other, (PointArray, Point)):
+            raise TypeError("cannot add two Point")
+        if not isinstance(other, (VectorArray, Vector)):
+            raise TypeError(f'addition of PointArray with {type(other)} is not implemented')
+        return self._from_buffer(array('d', map(operator.add, self._coords, self._broadcast(other))),
+                                 self._dim)
+
+    def __sub__(self, other):
+        """returns the element-wise subtraction of other from self
+
+        :param other: a PointArray, VectorArray, or a single Point or Vector
+        :return: a new PointArray if other is a Vector or VectorArray
+                 a new VectorArray if other is a Point or PointArray
+        """
+        if isinstance(other, (VectorArray, Vector)):
+            tpe = PointArray
+        elif isinstance(other, (PointArray, Point)):
+            tpe = VectorArray
+        else:
+            raise TypeError("Can only subtract a Point or a Vector from a PointArray")
+        return tpe._from_buffer(array('d', map(operator.sub, self._coords, self._broadcast(other))),
+                                self._dim)
+
+
+if __name__ == '__main__':
+
+    points = PointArray.from_elements([Point2D(1, 2), Point2D(3, 4), Point2D(-5, 6)])
+    others = PointArray([0, 0, 1, 1, 2, 2])
+    directions = points - others
+    print(directions, repr(directions))
+    print(directions.mag().tolist())
+    print(repr(directions.unit_vector()))
+    print(points[1], repr(points[-1]), points.to_list())
+    print(repr(points + Vector2D(10, 10)))
@@ -0,0 +1,171 @@
+"""
+unrolled kernels for 2x2, 3x3 and 4x4 matrices
+
+The kernels are generated when the module is imported: the source of each
+function is written out with every element bound to a local name
+(a00, a01, ...), and every product and cofactor spelled out, then compiled.
+This is the same technique as the hand written inverse3x3 / inverse4x4
+and Hmat33.__matmul__, extended to every operation and size.
+
+Each kernel takes matrices as sequences of rows, and returns lists of rows:
+    MATMUL[n](a_rows, b_rows) -> rows of a @ b
+    SQUARE[n](rows)           -> rows of a @ a
+    TRANSPOSE[n](rows)        -> rows of the transpose
+    DET[n](rows)              -> determinant
+    ADJUGATE[n](rows)         -> (determinant, rows of the adjugate)
+
+Matrix stores its elements in a flat row-major list: the FLAT_ kernels take
+and return such lists, so that a Matrix passes its storage straight in and
+owns the result, without going through lists of rows:
+    FLAT_MATMUL[n](a_flat, b_flat) -> elements of a @ b
+    FLAT_DET[n](flat)              -> determinant
+    FLAT_ADJUGATE[n](flat)         -> (determinant, elements of the adjugate)
+
+The inverse is adjugate / determinant, left to the caller so that it can
+choose an exact or a floating point division.
+"""
+
+from typing import Callable, Dict, List, Sequence
+
+
+SIZES = (2, 3, 4)
+
+MATMUL: Dict[int, Callable] = {}
+SQUARE: Dict[int, Callable] = {}
+TRANSPOSE: Dict[int, Callable] = {}
+DET: Dict[int, Callable] = {}
+ADJUGATE: Dict[int, Callable] = {}
+FLAT_MATMUL: Dict[int, Callable] = {}
+FLAT_DET: Dict[int, Callable] = {}
+FLAT_ADJUGATE: Dict[int, Callable] = {}
+
+SOURCES: Dict[str, str] = {}   # generated source of each kernel, by function name
+
+
+def _names(prefix: str, size: int) -> List[List[str]]:
+    return [[f'{prefix}{row}{col}' for col in range(size)] for row in range(size)]
+
+
+def _unpack(names: List[List[str]], source: str) -> str:
+    targets = ', '.join(f"({', '.join(row)})" for row in names)
+    return f'    {targets} = {source}\n'
+
+
+def _unpack_flat(names: List[List[str]], source: str) -> str:
+    targets = ', '.join(name for row in names for name in row)
+    return f'    {targets} = {source}\n'
+
+
+def _rows_literal(names: List[List[str]]) -> str:
+    return '[' + ', '.join(f"[{', '.join(row)}]" for row in names) + ']'
+
+
+def _flat_literal(names: List[List[str]]) -> str:
+    return '[' + ', '.join(name for row in names for name in row) + ']'
+
+
+def _det_expression(names: List[List[str]], rows: Sequence[int], cols: Sequence[int]) -> str:
+    """Laplace expansion along the first of rows, as a python expression"""
+    if len(rows) == 1:
+        return names[rows[0]][cols[0]]
+    terms = []
+    for idx, col in enumerate(cols):
+        minor = _det_expression(names, rows[1:], cols[:idx] + cols[idx + 1:])
+        if ' ' in minor:
+            minor = f'({minor})'
+        sign = '-' if idx % 2 else '+'
+        terms.append(f'{sign} {names[rows[0]][col]} * {minor}')
+    return ' '.join(terms).lstrip('+ ')
+
+
+def _cofactor_expression(names: List[List[str]], row: int, col: int) -> str:
+    size = len(names)
+    rows = [idx for idx in range(size) if idx != row]
+    cols = [idx for idx in range(size) if idx != col]
+    minor = _det_expression(names, rows, cols)
+    return f'({minor})' if (row + col) % 2 == 0 else f'-({minor})'
+
+
+def _matmul_source(size: int, flat: bool = False) -> str:
+    a, b = _names('a', size), _names('b', size)
+    products = [[' + '.join(f'{a[row][idx]} * {b[idx][col]}' for idx in range(size))
+                 for col in range(size)] for row in range(size)]
+    if flat:
+        return (f'def matmul{size}_flat(a_flat, b_flat):\n'
+                + _unpack_flat(a, 'a_flat') + _unpack_flat(b, 'b_flat')
+                + f'    return {_flat_literal(products)}\n')
+    return (f'def matmul{size}(a_rows, b_rows):\n'
+            + _unpack(a, 'a_rows') + _unpack(b, 'b_rows')
+            + f'    return {_rows_literal(products)}\n')
+
+
+def _square_source(size: int) -> str:
+    """the elements are unpacked once; the 2x2 square shares its products,
+    5 multiplications instead of 8:
+    [[a00 a00 + a01 a10, a01 (a00 + a11)], [a10 (a00 + a11), a11 a11 + a01 a10]]
+    """
+    a = _names('a', size)
+    if size == 2:
+        return ('def square2(rows):\n'
+                + _unpack(a, 'rows')
+                + '    cross, trace = a01 * a10, a00 + a11\n'
+                + '    return [[a00 * a00 + cross, a01 * trace], [a10 * trace, a11 * a11 + cross]]\n')
+    products = [[' + '.join(f'{a[row][idx]} * {a[idx][col]}' for idx in range(size))
+                 for col in range(size)] for row in range(size)]
+    return (f'def square{size}(rows):\n'
+            + _unpack(a, 'rows')
+            + f'    return {_rows_literal(products)}\n')
+
+
+def _transpose_source(size: int) -> str:
+    a = _names('a', size)
+    return (f'def transpose{size}(rows):\n'
+            + _unpack(a, 'rows')
+            + f'    return {_rows_literal([list(col) for col in zip(*a)])}\n')
+
+
+def _det_source(size: int, flat: bool = False) -> str:
+    a = _names('a', size)
+    header = f'def det{size}_flat(flat):\n' + _unpack_flat(a, 'flat') if flat \
+        else f'def det{size}(rows):\n' + _unpack(a, 'rows')
+    return header + f'    return {_det_expression(a, range(size), list(range(size)))}\n'
+
+
+def _adjugate_source(size: int, flat: bool = False) -> str:
+    a, c = _names('a', size), _names('c', size)
+    lines = [f'    {c[row][col]} = {_cofactor_expression(a, row, col)}\n'
+             for row in range(size) for col in range(size)]
+    det = ' + '.join(f'{a[0][col]} * {c[0][col]}' for col in range(size))
+    adjugate = [list(col) for col in zip(*c)]
+    if flat:
+        return (f'def adjugate{size}_flat(flat):\n'
+                + _unpack_flat(a, 'flat') + ''.join(lines)
+                + f'    return {det}, {_flat_literal(adjugate)}\n')
+    return (f'def adjugate{size}(rows):\n'
+            + _unpack(a, 'rows') + ''.join(lines)
+            + f'    return {det}, {_rows_literal(adjugate)}\n')
+
+
+def _compile(name: str, source: str) -> Callable:
+    namespace = {}
+    exec(compile(source, f'<{__name__}.{name}>', 'exec'), namespace)
+    SOURCES[name] = source
+    return namespace[name]
+
+
+for _size in SIZES:
+    MATMUL[_size] = _compile(f'matmul{_size}', _matmul_source(_size))
+    SQUARE[_size] = _compile(f'square{_size}', _square_source(_size))
+    TRANSPOSE[_size] = _compile(f'transpose{_size}', _transpose_source(_size))
+    DET[_size] = _compile(f'det{_size}', _det_source(_size))
+    ADJUGATE[_size] = _compile(f'adjugate{_size}', _adjugate_source(_size))
+    FLAT_MATMUL[_size] = _compile(f'matmul{_size}_flat', _matmul_source(_size, flat=True))
+    FLAT_DET[_size] = _compile(f'det{_size}_flat', _det_source(_size, flat=True))
+    FLAT_ADJUGATE[_size] = _compile(f'adjugate{_size}_flat', _adjugate_source(_size, flat=True))
+
+
+if __name__ == '__main__':
+
+    print(SOURCES['matmul2'])
+    print(SOURCES['adjugate3'])
+    print(DET[3]([[1, 2, 3], [0, 4, 5], [1, 0, 6]]), ADJUGATE[2]([[1, 2], [3, 4]]))
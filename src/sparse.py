@@ -0,0 +1,395 @@
+"""
+sparse matrices, interoperable with src.matrix.Matrix
+
+COOMatrix is a builder: (row, col, value) triplets are appended in any order.
+SparseMatrix stores the compressed sparse rows (CSR) of a matrix:
+    indptr:  the entries of row r are at positions indptr[r] to indptr[r + 1]
+    indices: the column of each entry, increasing along each row
+    values:  the value of each entry
+Memory and the cost of every operation scale with the number of non-zero
+entries; zeros are never stored, and entries that cancel out are dropped.
+
+"""
+
+import math
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple, Union
+
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix, MatrixIndexError, Number, Shape
+from numeric.src.vector import Vector, Vector2D, Vector3D
+
+
+def _check_shape(shape: Union[Shape, tuple]) -> Shape:
+    rows, cols = shape
+    assert rows > 0 and cols > 0, 'a SparseMatrix must have at least one row and one column'
+    return Shape(rows=rows, cols=cols)
+
+
+class COOMatrix:
+    """
+    coordinate format builder of a SparseMatrix, duplicates are summed by to_csr()
+    """
+
+    def __init__(self, shape: Union[Shape, tuple]) -> None:
+        self._shape = _check_shape(shape)
+        self._row_indices = array('q')
+        self._col_indices = array('q')
+        self._values = []
+
+    @property
+    def shape(self) -> Shape:
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        """
+        :return: int, the number of triplets appended, duplicates included
+        """
+        return len(self._values)
+
+    def add(self, row: int, col: int, value: Number) -> None:
+        """appends the triplet (row, col, value)
+
+        :param row: int, 0 <= row < shape.rows
+        :param col: int, 0 <= col < shape.cols
+        :param value: Number, added to the previous values at (row, col) if any
+        """
+        if not (0 <= row < self._shape.rows and 0 <= col < self._shape.cols):
+            raise MatrixIndexError('COOMatrix indices row or col out of range')
+        self._row_indices.append(row)
+        self._col_indices.append(col)
+        self._values.append(value)
+
+    def extend(self, triplets: Iterable[Tuple[int, int, Number]]) -> None:
+        """appends each (row, col, value) of triplets
+        """
+        for row, col, value in triplets:
+            self.add(row, col, value)
+
+    def to_csr(self) -> 'SparseMatrix':
+        """
+        :return: the SparseMatrix of the triplets, duplicates summed
+        """
+        row_entries = [{} for _ in range(self._shape.rows)]
+        for row, col, value in zip(self._row_indices, self._col_indices, self._values):
+            entries = row_entries[row]
+            entries[col] = entries.get(col, 0) + value
+        return SparseMatrix._from_row_entries(self._shape, row_entries)
+
+
+class SparseMatrix:
+    """
+    a matrix in compressed sparse row format
+    """
+
+    def __init__(self, shape: Union[Shape, tuple], indptr: Iterable[int],
+                 indices: Iterable[int], values: Iterable[Number]) -> None:
+        """
+        :param shape: the (rows, cols) of the matrix
+        :param indptr: rows + 1 increasing positions in indices and values, from 0 to nnz
+        :param indices: the column of each entry, increasing along each row
+        :param values: the value of each entry
+        """
+        self._shape = _check_shape(shape)
+        self._indptr = array('q', indptr)
+        self._indices = array('q', indices)
+        self._values = list(values)
+        assert len(self._indptr) == self._shape.rows + 1, 'indptr must have rows + 1 positions'
+        assert self._indptr[0] == 0 and self._indptr[-1] == len(self._indices) == len(self._values), \
+            'indptr must run from 0 to the number of entries'
+
+    @classmethod
+    def _from_row_entries(cls, shape: Shape, row_entries: Iterable[Dict[int, Number]]) -> 'SparseMatrix':
+        """
+        :param row_entries: for each row, a dict of {col: value}; zero values are dropped
+        """
+        indptr, indices, values = array('q', [0]), array('q'), []
+        for entries in row_entries:
+            for col in sorted(entries):
+                value = entries[col]
+                if value:
+                    indices.append(col)
+                    values.append(value)
+            indptr.append(len(indices))
+        matrix = object.__new__(cls)
+        matrix._shape, matrix._indptr, matrix._indices, matrix._values = shape, indptr, indices, values
+        return matrix
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> 'SparseMatrix':
+        """
+        :param matrix: a dense Matrix
+        :return: the SparseMatrix of the non-zero elements of matrix
+        """
+        return cls._from_row_entries(matrix.shape, (dict(enumerate(row)) for row in matrix._row_lists()))
+
+    @classmethod
+    def zeros(cls, shape: Union[Shape, tuple]) -> 'SparseMatrix':
+        shape = _check_shape(shape)
+        return cls(shape, [0] * (shape.rows + 1), [], [])
+
+    @classmethod
+    def identity(cls, shape: Union[Shape, tuple]) -> 'SparseMatrix':
+        shape = _check_shape(shape)
+        if shape.rows != shape.cols:
+            raise IncompatibleMatrixShapes('Identity Matrix must be square')
+        return cls(shape, range(shape.rows + 1), range(shape.rows), [1] * shape.rows)
+
+    def to_matrix(self) -> Matrix:
+        """
+        :return: a new dense Matrix, with the zeros filled in
+        """
+        return Matrix._from_rows([self._dense_row(row) for row in range(self.rows)])
+
+    @property
+    def rows(self) -> int:
+        return self._shape.rows
+
+    @property
+    def cols(self) -> int:
+        return self._shape.cols
+
+    @property
+    def shape(self) -> Shape:
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        """
+        :return: int, the number of entries stored
+        """
+        return len(self._values)
+
+    def _row_entries(self, row: int) -> Dict[int, Number]:
+        """
+        :return: a new dict of {col: value} of the entries in the row
+        """
+        start, stop = self._indptr[row], self._indptr[row + 1]
+        return dict(zip(self._indices[start: stop], self._values[start: stop]))
+
+    def _dense_row(self, row: int) -> List[Number]:
+        result = [0] * self.cols
+        for col, value in self._row_entries(row).items():
+            result[col] = value
+        return result
+
+    def __getitem__(self, row_col: Tuple[int, int]) -> Number:
+        """
+        :return: the value at (row, col), 0 when no entry is stored there
+        """
+        row, col = row_col
+        if not (-self.rows <= row < self.rows and -self.cols <= col < self.cols):
+            raise MatrixIndexError('Matrix indices row or col out of range')
+        row, col = row % self.rows, col % self.cols
+        start, stop = self._indptr[row], self._indptr[row + 1]
+        pos = bisect_left(self._indices, col, start, stop)
+        if pos < stop and self._indices[pos] == col:
+            return self._values[pos]
+        return 0
+
+    def __eq__(self, other: Union['SparseMatrix', Matrix]) -> bool:
+        """test for equality, based on shape, and element to element equality
+
+        :param other: a SparseMatrix, or a dense Matrix, of identical Shape as self
+        """
+        if isinstance(other, Matrix):
+            return self.to_matrix() == other
+        if not isinstance(other, SparseMatrix):
+            raise TypeError('a SparseMatrix must be compared to a SparseMatrix or a Matrix')
+        if self.shape != other.shape:
+            raise IncompatibleMatrixShapes('Matrices must have identical shapes to be compared')
+        for row in range(self.rows):
+            self_entries, other_entries = self._row_entries(row), other._row_entries(row)
+            for col in self_entries.keys() | other_entries.keys():
+                if not math.isclose(self_entries.get(col, 0), other_entries.get(col, 0)):
+                    return False
+        return True
+
+    def transpose(self) -> 'SparseMatrix':
+        """
+        :return: a new SparseMatrix, transpose of self
+        """
+        rows, cols = self.shape
+        indptr = array('q', [0]) * (cols + 1)
+        for col in self._indices:
+            indptr[col + 1] += 1
+        for col in range(cols):
+            indptr[col + 1] += indptr[col]
+        next_pos = indptr[:-1]
+        indices, values = array('q', [0]) * self.nnz, [0] * self.nnz
+        for row in range(rows):
+            for pos in range(self._indptr[row], self._indptr[row + 1]):
+                col = self._indices[pos]
+                dest = next_pos[col]
+                indices[dest] = row
+                values[dest] = self._values[pos]
+                next_pos[col] = dest + 1
+        return SparseMatrix(Shape(rows=cols, cols=rows), indptr, indices, values)
+    T = transpose
+
+    def __mul__(self, scalar: Number) -> 'SparseMatrix':
+        """
+        :return: a new SparseMatrix, with each entry multiplied by scalar
+        """
+        if not scalar:
+            return SparseMatrix.zeros(self.shape)
+        return SparseMatrix(self.shape, self._indptr, self._indices, [value * scalar for value in self._values])
+    __rmul__ = __mul__
+
+    def _combine(self, other: 'SparseMatrix', sign: int) -> 'SparseMatrix':
+        """
+        :return: a new SparseMatrix, self + sign * other
+        """
+        if self.shape != other.shape:
+            raise IncompatibleMatrixShapes('Matrices must have identical shapes to be added or subtracted')
+        row_entries = []
+        for row in range(self.rows):
+            entries = self._row_entries(row)
+            start, stop = other._indptr[row], other._indptr[row + 1]
+            for col, value in zip(other._indices[start: stop], other._values[start: stop]):
+                entries[col] = entries.get(col, 0) + sign * value
+            row_entries.append(entries)
+        return SparseMatrix._from_row_entries(self.shape, row_entries)
+
+    def __add__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """
+        :param other: a SparseMatrix or a Matrix of Shape identical to self
+        :return: a new SparseMatrix if other is sparse, a new Matrix otherwise
+        """
+        if isinstance(other, SparseMatrix):
+            return self._combine(other, 1)
+        if isinstance(other, Matrix):
+            return self._add_to_dense(other, 1)
+        return NotImplemented
+
+    def __radd__(self, other: Matrix) -> Matrix:
+        if isinstance(other, Matrix):
+            return self._add_to_dense(other, 1)
+        return NotImplemented
+
+    def __sub__(self, other: Union['SparseMatrix', Matrix]) -> Union['SparseMatrix', Matrix]:
+        """
+        :param other: a SparseMatrix or a Matrix of Shape identical to self
+        :return: a new SparseMatrix if other is sparse, a new Matrix otherwise
+        """
+        if isinstance(other, SparseMatrix):
+            return self._combine(other, -1)
+        if isinstance(other, Matrix):
+            return self._add_to_dense(other, -1) * -1
+        return NotImplemented
+
+    def __rsub__(self, other: Matrix) -> Matrix:
+        """
+        :return: a new Matrix, other - self
+        """
+        if isinstance(other, Matrix):
+            return self._add_to_dense(other, -1)
+        return NotImplemented
+
+    def _add_to_dense(self, dense: Matrix, sign: int) -> Matrix:
+        """
+        :return: a new Matrix, dense + sign * self
+        """
+        if self.shape != dense.shape:
+            raise IncompatibleMatrixShapes('Matrices must have identical shapes to be added or subtracted')
+        rows = dense._row_lists()
+        for row_idx, row in enumerate(rows):
+            for pos in range(self._indptr[row_idx], self._indptr[row_idx + 1]):
+                row[self._indices[pos]] += sign * self._values[pos]
+        return Matrix._from_rows(rows)
+
+    def __matmul__(self, other: Union['SparseMatrix', Matrix, Vector]) -> Union['SparseMatrix', Matrix, Vector]:
+        """
+        :param other: a SparseMatrix or a Matrix with self.cols rows,
+                      or a Vector of self.cols coordinates
+        :return: a new SparseMatrix if other is sparse, a new Matrix if other
+                 is a Matrix, a new Vector if other is a Vector
+        """
+        if isinstance(other, SparseMatrix):
+            return self._matmul_sparse(other)
+        if isinstance(other, Matrix):
+            return self._matmul_dense(other)
+        if isinstance(other, Vector):
+            return self._matmul_vector(other)
+        return NotImplemented
+
+    def __rmatmul__(self, other: Matrix) -> Matrix:
+        """
+        :return: a new Matrix, other @ self, for a dense Matrix other
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if other.cols != self.rows:
+            raise IncompatibleMatrixShapes('Matrix A number of columns must equal Matrix B number of rows')
+        result = []
+        for dense_row in other._row_lists():
+            row = [0] * self.cols
+            for ndx, dense_value in enumerate(dense_row):
+                if dense_value:
+                    for pos in range(self._indptr[ndx], self._indptr[ndx + 1]):
+                        row[self._indices[pos]] += dense_value * self._values[pos]
+            result.append(row)
+        return Matrix._from_rows(result)
+
+    def _check_matmul(self, other_rows: int) -> None:
+        if self.cols != other_rows:
+            raise IncompatibleMatrixShapes('Matrix A number of columns must equal Matrix B number of rows')
+
+    def _matmul_sparse(self, other: 'SparseMatrix') -> 'SparseMatrix':
+        """Gustavson's row by row product: each entry of a row of self scales
+        the matching row of other, accumulated in a dict
+        """
+        self._check_matmul(other.rows)
+        indptr, indices, values = other._indptr, other._indices, other._values
+        row_entries = []
+        for row in range(self.rows):
+            entries = {}
+            for pos in range(self._indptr[row], self._indptr[row + 1]):
+                ndx, value = self._indices[pos], self._values[pos]
+                for other_pos in range(indptr[ndx], indptr[ndx + 1]):
+                    col = indices[other_pos]
+                    entries[col] = entries.get(col, 0) + value * values[other_pos]
+            row_entries.append(entries)
+        return SparseMatrix._from_row_entries(Shape(rows=self.rows, cols=other.cols), row_entries)
+
+    def _matmul_dense(self, other: Matrix) -> Matrix:
+        self._check_matmul(other.rows)
+        other_rows = other._row_lists()
+        result = []
+        for row in range(self.rows):
+            acc = [0] * other.cols
+            for pos in range(self._indptr[row], self._indptr[row + 1]):
+                value = self._values[pos]
+                acc = [elt + value * other_elt for elt, other_elt in zip(acc, other_rows[self._indices[pos]])]
+            result.append(acc)
+        return Matrix._from_rows(result)
+
+    def _matmul_vector(self, vector: Vector) -> Vector:
+        self._check_matmul(len(vector))
+        coords = list(vector)
+        indptr, indices, values = self._indptr, self._indices, self._values
+        result = [sum(values[pos] * coords[indices[pos]] for pos in range(indptr[row], indptr[row + 1]))
+                  for row in range(self.rows)]
+        tpe = {2: Vector2D, 3: Vector3D}.get(len(result), Vector)
+        return tpe(*result)
+
+    def __str__(self) -> str:
+        return '\n'.join(f'({row}, {col}) {value}' for row in range(self.rows)
+                         for col, value in self._row_entries(row).items())
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(shape={tuple(self.shape)}, nnz={self.nnz})'
+
+
+if __name__ == '__main__':
+
+    builder = COOMatrix((3, 3))
+    builder.extend([(0, 0, 2), (1, 2, 1), (2, 1, -1), (1, 2, 3)])
+    s = builder.to_csr()
+    print(repr(s))
+    print(s)
+    print(s @ Vector3D(1, 2, 3))
+    print(s.T().to_matrix())
+    print(s @ Matrix.identity((3, 3)) + s)
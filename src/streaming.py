@@ -0,0 +1,187 @@
+"""
+generator stages for unbounded streams of points and vectors
+
+A stream is an iterator of chunks, each chunk a flat array('d') of
+coordinates x0, y0, x1, y1, ... (x0, y0, z0, ... for dim=3), as used by
+PointArray and Hmat33.apply_many. Each stage consumes a stream and
+yields a new one, working on whole chunks with strided slices and
+map(operator...) instead of one Point object per event; stateful stages
+(differences, smooth, decimate) carry their state across chunk boundaries,
+so the result does not depend on the chunking.
+Streams are pulled by the consumer: memory stays bounded by the chunk size
+and the source is only read as fast as the chunks are consumed.
+
+    directions = pipe(chunked(events), partial(differences, lag=3), normalize)
+
+"""
+
+import math
+import operator
+
+from array import array
+from itertools import accumulate, chain, islice, repeat
+from typing import Callable, Iterable, Iterator, Type
+
+from numeric.src.hommat import AbstractHmat
+from numeric.src.vector import AbstractPointVector, Point2D
+
+
+CHUNK_SIZE = 4096
+
+Stream = Iterator[array]
+Stage = Callable[[Iterable[array]], Stream]
+
+
+def chunked(points: Iterable[Iterable[float]], size: int = CHUNK_SIZE) -> Stream:
+    """groups a stream of points, Point2D or tuples of coordinates, into chunks
+
+    :param points: iterable of points, possibly unbounded
+    :param size: int, the maximum number of points per chunk
+    :return: a stream of array('d') chunks
+    """
+    if size < 1:
+        raise ValueError('a chunk holds at least one point')
+    points = iter(points)
+    while True:
+        chunk = array('d', chain.from_iterable(islice(points, size)))
+        if not chunk:
+            return
+        yield chunk
+
+
+def rechunk(chunks: Iterable[array], size: int = CHUNK_SIZE, dim: int = 2) -> Stream:
+    """regroups a stream into chunks of exactly size points, except the last one
+
+    :param size: int, the number of points per chunk
+    """
+    if size < 1:
+        raise ValueError('a chunk holds at least one point')
+    width = size * dim
+    pending = array('d')
+    for chunk in chunks:
+        pending.extend(chunk)
+        while len(pending) >= width:
+            yield pending[:width]
+            del pending[:width]
+    if pending:
+        yield pending
+
+
+def pipe(chunks: Iterable[array], *stages: Stage) -> Stream:
+    """composes the stages, the first one applied first
+
+    stages with parameters are given with functools.partial
+    """
+    chunks = iter(chunks)
+    for stage in stages:
+        chunks = stage(chunks)
+    return chunks
+
+
+def transform(chunks: Iterable[array], hmat: AbstractHmat, vectors: bool = False) -> Stream:
+    """applies hmat to each chunk, see Hmat33.apply_many
+
+    :param vectors: bool, True to transform vectors, ignoring the translation
+    """
+    for chunk in chunks:
+        yield hmat.apply_many(chunk, vectors=vectors)
+
+
+def differences(chunks: Iterable[array], lag: int = 1, dim: int = 2) -> Stream:
+    """the direction vectors p[i] - p[i - lag] of a stream of points
+
+    the first lag points only start the stream; the smoothing of
+    direction_vector_GUI.direction, skipping 2 points, is lag=3
+    """
+    if lag < 1:
+        raise ValueError('the lag is at least one point')
+    shift = lag * dim
+    sub = operator.sub
+    carry = array('d')
+    for chunk in chunks:
+        joined = carry + chunk
+        carry = joined[-shift:]
+        if len(joined) > shift:
+            yield array('d', map(sub, joined[shift:], joined[:-shift]))
+
+
+def normalize(chunks: Iterable[array], dim: int = 2) -> Stream:
+    """scales each vector of a stream to unit length
+
+    null vectors, from a point repeated in the stream, stay null
+    """
+    truediv = operator.truediv
+    for chunk in chunks:
+        columns = [chunk[col::dim] for col in range(dim)]
+        norms = [norm or 1.0 for norm in map(math.hypot, *columns)]
+        result = array('d', bytes(8 * len(chunk)))
+        for col, column in enumerate(columns):
+            result[col::dim] = array('d', map(truediv, column, norms))
+        yield result
+
+
+def smooth(chunks: Iterable[array], window: int, dim: int = 2) -> Stream:
+    """the moving average of the last window points, or vectors, of a stream
+
+    the first window - 1 elements only fill the window; the running sums
+    restart from each chunk, so rounding errors do not build up along the stream
+    """
+    if window < 1:
+        raise ValueError('the window holds at least one point')
+    shift = (window - 1) * dim
+    sub, truediv = operator.sub, operator.truediv
+    carry = array('d')
+    for chunk in chunks:
+        joined = carry + chunk
+        carry = joined[-shift:] if shift else array('d')
+        count = len(joined) // dim - window + 1
+        if count <= 0:
+            continue
+        result = array('d', bytes(8 * count * dim))
+        for col in range(dim):
+            sums = list(accumulate(joined[col::dim], initial=0.0))
+            result[col::dim] = array('d', map(truediv, map(sub, sums[window:], sums), repeat(window)))
+        yield result
+
+
+def decimate(chunks: Iterable[array], step: int, dim: int = 2) -> Stream:
+    """keeps one element out of step of a stream, starting with the first one
+    """
+    if step < 1:
+        raise ValueError('the step is at least one point')
+    offset = 0
+    for chunk in chunks:
+        count = len(chunk) // dim
+        kept = len(range(offset, count, step))
+        if kept:
+            result = array('d', bytes(8 * kept * dim))
+            for col in range(dim):
+                result[col::dim] = chunk[offset * dim + col::step * dim]
+            yield result
+        offset = (offset - count) % step
+
+
+def elements(chunks: Iterable[array], factory: Type[AbstractPointVector] = Point2D,
+             dim: int = 2) -> Iterator[AbstractPointVector]:
+    """unpacks a stream into one element per point, for the consumers that need them
+
+    :param factory: the class of the elements, Point2D, Vector2D, ...
+    """
+    for chunk in chunks:
+        columns = [chunk[col::dim] for col in range(dim)]
+        yield from map(factory, *columns)
+
+
+if __name__ == '__main__':
+
+    from functools import partial
+
+    from numeric.src.hommat import Hmat33
+    from numeric.src.vector import Vector2D
+
+    events = ((t, t * t % 7) for t in range(20))
+    to_canvas = Hmat33.translation(250, 250) @ Hmat33.scaling(1, -1)
+    stream = pipe(chunked(events, size=6), partial(transform, hmat=to_canvas),
+                  partial(differences, lag=3), normalize, partial(decimate, step=4))
+    for direction in elements(stream, Vector2D):
+        print(direction)
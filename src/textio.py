@@ -0,0 +1,300 @@
+"""
+fast reading and writing of numbers as delimited text: CSV, whitespace
+separated point clouds, matrix dumps
+
+The files are read in chunks of lines (file.readlines with a size hint);
+each chunk is split into its fields with one str.join and one str.split,
+and each column is converted with map(int / float / Fraction, ...) on a
+strided slice of the fields, so that no python loop runs per field.
+The readers are generators: only one chunk is held in memory at a time,
+for files larger than the memory.
+
+Only numbers are read: quoted fields are not supported.
+
+column typing (dtype):
+    None:       inferred per column: int, float if a field is not an int, Fraction
+                if a field is not a float ('1/3'); a column is only widened, so
+                the rows read before a wider field keep their narrower type
+    a callable: int, float, Fraction, or any str -> number, for all the columns
+    a sequence: one callable per column read
+
+"""
+
+import time
+
+from array import array
+from contextlib import nullcontext
+from fractions import Fraction
+from itertools import islice, repeat
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, Union
+
+
+CHUNK_CHARS = 1 << 20       # size hint of the chunks of lines read
+CHUNK_ROWS = 4096           # rows formatted per write
+INFERRED = (int, float, Fraction)
+
+Converter = Callable[[str], object]
+DType = Union[Converter, Sequence[Converter], None]
+
+
+class ReadStats:
+    """
+    the counts of a read, updated as the chunks are parsed; seconds counts
+    the time spent reading and parsing, not the time of the consumer of a stream
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.chars = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f'{self.rows} rows, {self.chars / 1e6:.2f} M chars in {self.seconds:.3f} s: '
+                f'{self.rows_per_second:,.0f} rows/s, {self.chars_per_second / 1e6:.2f} M chars/s')
+
+
+def _open(source, mode: str):
+    """
+    :return: a context manager of the file of source, a path, opened and closed,
+             or a file object, left open
+    """
+    if hasattr(source, 'read' if mode == 'r' else 'write'):
+        return nullcontext(source)
+    return open(source, mode, newline='')
+
+
+class _ChunkParser:
+    """
+    splits chunks of lines into their fields, and converts the columns selected,
+    keeping the number of fields per line and the inferred types across chunks
+    """
+
+    def __init__(self, delimiter: Union[str, None], dtype: DType,
+                 columns: Union[Sequence[int], None]) -> None:
+        self.delimiter = delimiter
+        self.dtype = dtype
+        self.columns = columns
+        self.cols = 0           # the number of fields per line, set by the first line
+        self.converters = []    # per column read, a callable, or None to infer
+        self.inferred = []      # per column read, the index in INFERRED of its widest type
+        self.rows = 0           # the rows parsed, for the error messages
+        self.whole = False
+
+    def _split(self, line: str) -> List[str]:
+        return line.split(self.delimiter)
+
+    def _setup(self, first_line: str) -> None:
+        self.cols = len(self._split(first_line))
+        if self.columns is None:
+            self.columns = range(self.cols)
+        if not self.columns or not all(-self.cols <= col < self.cols for col in self.columns):
+            raise ValueError(f'columns {list(self.columns)} not in the {self.cols} fields of a row')
+        self.columns = [col % self.cols for col in self.columns]
+        if self.dtype is None or callable(self.dtype):
+            self.converters = [self.dtype] * len(self.columns)
+        else:
+            self.converters = list(self.dtype)
+            if len(self.converters) != len(self.columns):
+                raise ValueError(f'{len(self.converters)} dtypes for {len(self.columns)} columns')
+        self.inferred = [0] * len(self.columns)
+        # all the fields, in order, through one converter: converted in one pass
+        self.whole = self.columns == list(range(self.cols)) and callable(self.dtype)
+
+    def _fields(self, lines: List[str]) -> List[str]:
+        """
+        :return: the fields of lines, checked to be cols per line
+        """
+        if self.delimiter is None:
+            fields = ' '.join(lines).split()
+        else:
+            fields = self.delimiter.join(lines).split(self.delimiter)
+        if len(fields) != len(lines) * self.cols:
+            for row, line in enumerate(lines, self.rows + 1):
+                if len(self._split(line)) != self.cols:
+                    raise ValueError(f'row {row}: {len(self._split(line))} fields, expected {self.cols}')
+        return fields
+
+    def _convert(self, index: int, fields: List[str]) -> list:
+        """
+        :param index: int, the position of the column in the columns read
+        :return: the values of fields, converted with the converter of the column
+        """
+        converter = self.converters[index]
+        if converter is not None:
+            try:
+                return list(map(converter, fields))
+            except (ValueError, TypeError, ArithmeticError):
+                pass
+        else:
+            for kind in range(self.inferred[index], len(INFERRED)):
+                try:
+                    values = list(map(INFERRED[kind], fields))
+                except (ValueError, ZeroDivisionError):
+                    continue
+                self.inferred[index] = kind
+                return values
+        raise ValueError(f'column {self.columns[index]} of rows {self.rows + 1} to '
+                         f'{self.rows + len(fields)}: a field is not a number')
+
+    def parse(self, lines: List[str]) -> Tuple[list, int]:
+        """
+        :param lines: lines of text, the blank lines are skipped
+        :return: the values of the columns read, in row-major order, and the number of rows
+        """
+        lines = list(filter(None, map(str.strip, lines)))
+        if not lines:
+            return [], 0
+        if not self.cols:
+            self._setup(lines[0])
+        fields = self._fields(lines)
+        cols, width = self.cols, len(self.columns)
+        if width == cols and self.whole:
+            flat = self._convert(0, fields)
+        elif width == 1:
+            flat = self._convert(0, fields[self.columns[0]::cols])
+        else:
+            flat = [None] * (len(lines) * width)
+            for index, col in enumerate(self.columns):
+                flat[index::width] = self._convert(index, fields[col::cols])
+        self.rows += len(lines)
+        return flat, len(lines)
+
+
+def iter_chunks(source, delimiter: Union[str, None] = ',', dtype: DType = None,
+                columns: Union[Sequence[int], None] = None, skip: int = 0,
+                stats: Union[ReadStats, None] = None,
+                chunk_chars: int = CHUNK_CHARS) -> Iterator[Tuple[list, int, int]]:
+    """reads a delimited text file in chunks of lines
+
+    :param source: a path, or a text file object
+    :param delimiter: str, the separator of the fields, None for runs of whitespace
+    :param dtype: the types of the columns, see the module docstring
+    :param columns: the indices of the fields read in each line, None for all
+    :param skip: int, the number of lines skipped at the start, a header
+    :param stats: a ReadStats updated with the counts of the read, or None
+    :param chunk_chars: int, the approximate size in characters of the chunks
+    :return: a stream of the chunks: the values in row-major order, the number of rows
+             and the number of columns
+    """
+    parser = _ChunkParser(delimiter, dtype, columns)
+    with _open(source, 'r') as file:
+        for _ in islice(file, skip):
+            pass
+        while True:
+            start = time.perf_counter()
+            lines = file.readlines(chunk_chars)
+            if not lines:
+                return
+            flat, rows = parser.parse(lines)
+            if stats is not None:
+                stats.rows += rows
+                stats.chars += sum(map(len, lines))
+                stats.seconds += time.perf_counter() - start
+            if rows:
+                yield flat, rows, len(parser.columns)
+
+
+def iter_rows(source, delimiter: Union[str, None] = ',', dtype: DType = None,
+              columns: Union[Sequence[int], None] = None, skip: int = 0,
+              stats: Union[ReadStats, None] = None, chunk_chars: int = CHUNK_CHARS) -> Iterator[list]:
+    """reads the rows of a delimited text file lazily, one chunk of lines at a time
+
+    see iter_chunks for the parameters
+    :return: a stream of the rows, each a list of numbers
+    """
+    for flat, rows, cols in iter_chunks(source, delimiter, dtype, columns, skip, stats, chunk_chars):
+        for start in range(0, rows * cols, cols):
+            yield flat[start: start + cols]
+
+
+def read_flat(source, delimiter: Union[str, None] = ',', dtype: DType = None,
+              columns: Union[Sequence[int], None] = None, skip: int = 0,
+              stats: Union[ReadStats, None] = None, chunk_chars: int = CHUNK_CHARS) -> Tuple[list, int, int]:
+    """reads a whole delimited text file
+
+    see iter_chunks for the parameters
+    :return: the values of the file in row-major order, the number of rows and the number of columns
+    :raises ValueError: if the file holds no rows
+    """
+    flat, total, width = [], 0, 0
+    for values, rows, width in iter_chunks(source, delimiter, dtype, columns, skip, stats, chunk_chars):
+        flat += values
+        total += rows
+    if not total:
+        raise ValueError('no rows to read')
+    return flat, total, width
+
+
+def coord_columns(dim: Union[int, None], columns: Union[Sequence[int], None]) -> Union[Sequence[int], None]:
+    """
+    :return: the columns of the coordinates of points of dimension dim: columns,
+             the first dim fields if columns is None, None for all the fields if dim is None too
+    :raises ValueError: if dim does not match the number of columns
+    """
+    if columns is None:
+        return None if dim is None else range(dim)
+    if dim is not None and len(columns) != dim:
+        raise ValueError(f'{len(columns)} columns for points of dimension {dim}')
+    return columns
+
+
+def iter_coords(source, dim: Union[int, None] = None, delimiter: Union[str, None] = ',',
+                columns: Union[Sequence[int], None] = None, skip: int = 0,
+                stats: Union[ReadStats, None] = None, chunk_chars: int = CHUNK_CHARS) -> Iterator[array]:
+    """reads a point cloud lazily, as a stream of array('d') chunks of coordinates
+    x0, y0, x1, y1, ..., the streams of src.streaming
+
+    :param dim: int, the dimension of the points; the first dim fields of each line
+                are read if columns is None, all the fields if dim is None too
+    :param columns: the indices of the coordinates in each line, None for the first dim fields
+    see iter_chunks for the other parameters
+    :raises ValueError: if dim does not match the number of columns
+    """
+    columns = coord_columns(dim, columns)
+    for flat, _, _ in iter_chunks(source, delimiter, float, columns, skip, stats, chunk_chars):
+        yield array('d', flat)
+
+
+def format_rows(rows: Iterable[Iterable], delimiter: str = ',', fmt: Union[str, None] = None) -> Iterator[str]:
+    """formats rows of numbers as lines of text, each element with one call to str, or to format
+
+    :param fmt: str, a format spec for each element, '.6g'..., None for str, that keeps
+                the exact value of ints, floats and Fractions
+    :return: a stream of lines, each ending with a newline
+    """
+    if fmt is None:
+        for row in rows:
+            yield delimiter.join(map(str, row)) + '\n'
+    else:
+        for row in rows:
+            yield delimiter.join(map(format, row, repeat(fmt))) + '\n'
+
+
+def write_rows(target, rows: Iterable[Iterable], delimiter: str = ',', fmt: Union[str, None] = None,
+               header: Union[str, None] = None, chunk_rows: int = CHUNK_ROWS) -> int:
+    """writes rows of numbers as delimited text, chunk_rows lines per write
+
+    :param target: a path, or a text file object
+    :param header: str, a first line, or None
+    see format_rows for the other parameters
+    :return: int, the number of rows written
+    """
+    lines = format_rows(rows, delimiter, fmt)
+    count = 0
+    with _open(target, 'w') as file:
+        if header is not None:
+            file.write(header.rstrip('\n') + '\n')
+        while True:
+            chunk = list(islice(lines, chunk_rows))
+            if not chunk:
+                return count
+            file.write(''.join(chunk))
+            count += len(chunk)
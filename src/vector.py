@@ -7,15 +7,20 @@ classes to represent Point and Vector
 import math
 
 from abc import ABC
-from typing import Iterator, Union
+from typing import Iterator, List, Union
 
 
 Scalar = Union[int, float]
 
 
 class AbstractPointVector(ABC):
-    """Abstract Base Class for Vector2D and Point2D
+    """Abstract Base Class for Vector and Point
+
+    the coordinates are held by the concrete classes: in the `_coords` slot
+    of the n-dimensional Vector and Point, in the x, y (and z) slots of the
+    fixed dimension classes
     """
+    __slots__ = ()
     EPSILON = 1e-14
 
     def __init__(self, *coords: Scalar) -> None:
@@ -90,8 +95,7 @@ class AbstractPointVector(ABC):
             # Point += Point does not make sense
             # Vector += Point does not make sense
             raise TypeError("Can only mutate a Point or Vector via addition with a Vector")
-        for idx, coord in enumerate(other):
-            self._coords[idx] += coord
+        self._coords = [self_c + other_c for self_c, other_c in zip(self._coords, other)]
         return self
 
     def __isub__(self, other: 'Vector') -> Union['Point', 'Vector']:
@@ -106,12 +110,155 @@ class AbstractPointVector(ABC):
             # Vector -= Point does not make sense
             # Point -= Point does not make sense
             raise TypeError("Can only mutate a Vector or a Point by subtracting a Vector")
-        for idx, coord in enumerate(other):
-            self._coords[idx] -= coord
+        self._coords = [self_c - other_c for self_c, other_c in zip(self._coords, other)]
         return self
 
 
-class Vector(AbstractPointVector):
+class AbstractPointVector2D(AbstractPointVector):
+    """Abstract Base Class for the fixed dimension Vector2D and Point2D
+
+    the coordinates are held in the x and y slots of the concrete classes,
+    and the arithmetic is unrolled; `_coords` is kept as a property so
+    the generic methods of the base classes still apply.
+    """
+    __slots__ = ()
+
+    def __init__(self, x: Scalar = 0.0, y: Scalar = 0.0) -> None:
+        self.x = x
+        self.y = y
+
+    @property
+    def _coords(self) -> List[Scalar]:
+        return [self.x, self.y]
+
+    @_coords.setter
+    def _coords(self, coords: List[Scalar]) -> None:
+        self.x, self.y = coords
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self) -> Iterator:
+        return iter((self.x, self.y))
+
+    def __eq__(self, other: 'AbstractPointVector') -> bool:
+        """tests for equality between self and other
+
+        :return: bool, True if self and other are equal, False otherwise
+        """
+        assert other is not None
+        if not isinstance(other, type(self)):
+            return False
+        return math.isclose(self.x, other.x, abs_tol=self.EPSILON) \
+            and math.isclose(self.y, other.y, abs_tol=self.EPSILON)
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __bool__(self) -> bool:
+        return not (math.isclose(self.x, 0, abs_tol=self.EPSILON)
+                    and math.isclose(self.y, 0, abs_tol=self.EPSILON))
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(x={self.x :.2f}, y={self.y :.2f})'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(x={self.x}, y={self.y})'
+
+    def clone(self) -> 'AbstractPointVector2D':
+        return self.__class__(self.x, self.y)
+
+    def __iadd__(self, other: 'Vector') -> 'AbstractPointVector2D':
+        if isinstance(other, Vector2D):
+            self.x += other.x
+            self.y += other.y
+            return self
+        return super().__iadd__(other)
+
+    def __isub__(self, other: 'Vector') -> 'AbstractPointVector2D':
+        if isinstance(other, Vector2D):
+            self.x -= other.x
+            self.y -= other.y
+            return self
+        return super().__isub__(other)
+
+
+class AbstractPointVector3D(AbstractPointVector):
+    """Abstract Base Class for the fixed dimension Vector3D and Point3D
+
+    the coordinates are held in the x, y and z slots of the concrete classes
+    """
+    __slots__ = ()
+
+    def __init__(self, x: Scalar = 0.0, y: Scalar = 0.0, z: Scalar = 0.0) -> None:
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @property
+    def _coords(self) -> List[Scalar]:
+        return [self.x, self.y, self.z]
+
+    @_coords.setter
+    def _coords(self, coords: List[Scalar]) -> None:
+        self.x, self.y, self.z = coords
+
+    def __len__(self) -> int:
+        return 3
+
+    def __iter__(self) -> Iterator:
+        return iter((self.x, self.y, self.z))
+
+    def __eq__(self, other: 'AbstractPointVector') -> bool:
+        """tests for equality between self and other
+
+        :return: bool, True if self and other are equal, False otherwise
+        """
+        assert other is not None
+        if not isinstance(other, type(self)):
+            return False
+        return math.isclose(self.x, other.x, abs_tol=self.EPSILON) \
+            and math.isclose(self.y, other.y, abs_tol=self.EPSILON) \
+            and math.isclose(self.z, other.z, abs_tol=self.EPSILON)
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.z))
+
+    def __bool__(self) -> bool:
+        return not (math.isclose(self.x, 0, abs_tol=self.EPSILON)
+                    and math.isclose(self.y, 0, abs_tol=self.EPSILON)
+                    and math.isclose(self.z, 0, abs_tol=self.EPSILON))
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(x={self.x :.2f}, y={self.y :.2f}, z={self.z :.2f})'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(x={self.x}, y={self.y}, z={self.z})'
+
+    def clone(self) -> 'AbstractPointVector3D':
+        return self.__class__(self.x, self.y, self.z)
+
+    def __iadd__(self, other: 'Vector') -> 'AbstractPointVector3D':
+        if isinstance(other, Vector3D):
+            self.x += other.x
+            self.y += other.y
+            self.z += other.z
+            return self
+        return super().__iadd__(other)
+
+    def __isub__(self, other: 'Vector') -> 'AbstractPointVector3D':
+        if isinstance(other, Vector3D):
+            self.x -= other.x
+            self.y -= other.y
+            self.z -= other.z
+            return self
+        return super().__isub__(other)
+
+
+class AbstractVector(AbstractPointVector):
+    """the operations of the vectors, of any dimension
+    """
+    __slots__ = ()
 
     def __abs__(self) -> Scalar:
         """calculates and returns the magnitude of self
@@ -236,32 +383,76 @@ class Vector(AbstractPointVector):
         return sum(c0 * c1 for c0, c1 in zip(self, other))
 
 
-class Vector2D(Vector):
+class Vector(AbstractVector):
+    """a vector of any dimension, its coordinates in a list
 
-    def __init__(self, x: Scalar = 0.0, y: Scalar = 0.0) -> None:
-        super().__init__(x, y)
+    Vector2D and Vector3D are registered as virtual subclasses: they are
+    instances of Vector, without carrying its `_coords` slot
+    """
+    __slots__ = ('_coords',)
 
-    @property
-    def x(self) -> Scalar:
-        return self._coords[0]
 
-    @property
-    def y(self) -> Scalar:
-        return self._coords[1]
+class Vector2D(AbstractPointVector2D, AbstractVector):
+    __slots__ = ('x', 'y')
 
-    @x.setter
-    def x(self, val: Scalar) -> None:
-        self._coords[0] = val
+    def __abs__(self) -> Scalar:
+        return math.hypot(self.x, self.y)
+    mag = __abs__
 
-    @y.setter
-    def y(self, val: Scalar) -> None:
-        self._coords[1] = val
+    def __add__(self, other: 'AbstractPointVector') -> 'AbstractPointVector':
+        if isinstance(other, Vector2D):
+            return self.__class__(self.x + other.x, self.y + other.y)
+        return super().__add__(other)
 
-    def __str__(self):
-        return f'{self.__class__.__name__}(x={self.x :.2f}, y={self.y :.2f})'
+    def __sub__(self, other: 'Vector') -> 'Vector':
+        if isinstance(other, Vector2D):
+            return self.__class__(self.x - other.x, self.y - other.y)
+        return super().__sub__(other)
 
-    def __repr__(self):
-        return f'{self.__class__.__name__}(x={self.x}, y={self.y})'
+    def __neg__(self) -> 'Vector2D':
+        return self.__class__(-self.x, -self.y)
+
+    def __mul__(self, scalar: Scalar) -> 'Vector2D':
+        return self.__class__(self.x * scalar, self.y * scalar)
+    __rmul__ = __mul__
+
+    def __imul__(self, factor: Scalar) -> 'Vector2D':
+        self.x *= factor
+        self.y *= factor
+        return self
+
+    def __truediv__(self, divisor: Scalar) -> 'Vector2D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        return self.__class__(self.x / divisor, self.y / divisor)
+
+    def __itruediv__(self, divisor: Scalar) -> 'Vector2D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        self.x /= divisor
+        self.y /= divisor
+        return self
+
+    def __floordiv__(self, divisor: Scalar) -> 'Vector2D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        return self.__class__(self.x // divisor, self.y // divisor)
+
+    def __ifloordiv__(self, divisor: Scalar) -> 'Vector2D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        self.x //= divisor
+        self.y //= divisor
+        return self
+
+    def unit_vector(self) -> 'Vector2D':
+        magnitude = math.hypot(self.x, self.y)
+        return self.__class__(self.x / magnitude, self.y / magnitude)
+
+    def dot(self, other: 'Vector') -> Scalar:
+        if isinstance(other, Vector2D):
+            return self.x * other.x + self.y * other.y
+        return super().dot(other)
 
     def perp(self) -> 'Vector2D':
         """2D Perp Operator
@@ -271,14 +462,6 @@ class Vector2D(Vector):
         :return: a new Vector2D normal to self, pointing to the left (ccw)
         """
         return self.__class__(-self.y, self.x)
-    #
-    # def dot(self, other: 'Vector2D') -> Scalar:
-    #     """calculates and returns the dot product of self and other
-    #
-    #     :param other: Vector2D
-    #     :return: Scalar
-    #     """
-    #     return sum(c0 * c1 for c0, c1 in zip(self, other))
 
     def perp_product(self, other) -> Scalar:
         """2D exterior product, or outer product: ad-bc
@@ -294,7 +477,89 @@ class Vector2D(Vector):
         return not bool(self)
 
 
-class Point(AbstractPointVector):
+class Vector3D(AbstractPointVector3D, AbstractVector):
+    __slots__ = ('x', 'y', 'z')
+
+    def __abs__(self) -> Scalar:
+        return math.hypot(self.x, self.y, self.z)
+    mag = __abs__
+
+    def __add__(self, other: 'AbstractPointVector') -> 'AbstractPointVector':
+        if isinstance(other, Vector3D):
+            return self.__class__(self.x + other.x, self.y + other.y, self.z + other.z)
+        return super().__add__(other)
+
+    def __sub__(self, other: 'Vector') -> 'Vector':
+        if isinstance(other, Vector3D):
+            return self.__class__(self.x - other.x, self.y - other.y, self.z - other.z)
+        return super().__sub__(other)
+
+    def __neg__(self) -> 'Vector3D':
+        return self.__class__(-self.x, -self.y, -self.z)
+
+    def __mul__(self, scalar: Scalar) -> 'Vector3D':
+        return self.__class__(self.x * scalar, self.y * scalar, self.z * scalar)
+    __rmul__ = __mul__
+
+    def __imul__(self, factor: Scalar) -> 'Vector3D':
+        self.x *= factor
+        self.y *= factor
+        self.z *= factor
+        return self
+
+    def __truediv__(self, divisor: Scalar) -> 'Vector3D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        return self.__class__(self.x / divisor, self.y / divisor, self.z / divisor)
+
+    def __itruediv__(self, divisor: Scalar) -> 'Vector3D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        self.x /= divisor
+        self.y /= divisor
+        self.z /= divisor
+        return self
+
+    def __floordiv__(self, divisor: Scalar) -> 'Vector3D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        return self.__class__(self.x // divisor, self.y // divisor, self.z // divisor)
+
+    def __ifloordiv__(self, divisor: Scalar) -> 'Vector3D':
+        if divisor == 0:
+            raise ZeroDivisionError("cannot divide a Vector by zero")
+        self.x //= divisor
+        self.y //= divisor
+        self.z //= divisor
+        return self
+
+    def unit_vector(self) -> 'Vector3D':
+        magnitude = math.hypot(self.x, self.y, self.z)
+        return self.__class__(self.x / magnitude, self.y / magnitude, self.z / magnitude)
+
+    def dot(self, other: 'Vector') -> Scalar:
+        if isinstance(other, Vector3D):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        return super().dot(other)
+
+    def cross(self, other: 'Vector3D') -> 'Vector3D':
+        """calculates and returns the cross product of self and other
+
+        :param other: Vector3D
+        :return: a new Vector3D normal to self and other
+        """
+        return self.__class__(self.y * other.z - self.z * other.y,
+                              self.z * other.x - self.x * other.z,
+                              self.x * other.y - self.y * other.x)
+
+    def isnull(self) -> bool:
+        return not bool(self)
+
+
+class AbstractPoint(AbstractPointVector):
+    """the operations of the points, of any dimension
+    """
+    __slots__ = ()
 
     def __add__(self, other: 'AbstractPointVector') -> 'AbstractPointVector':
         """returns a new Vector2D sum of self and other
@@ -330,32 +595,29 @@ class Point(AbstractPointVector):
         raise TypeError("Can only subtract a Point or a Vector from a Point")
 
 
-class Point2D(Point):
-
-    def __init__(self, x: Scalar = 0.0, y: Scalar = 0.0) -> None:
-        super().__init__(x, y)
-
-    @property
-    def x(self) -> Scalar:
-        return self._coords[0]
+class Point(AbstractPoint):
+    """a point of any dimension, its coordinates in a list
 
-    @property
-    def y(self) -> Scalar:
-        return self._coords[1]
+    Point2D and Point3D are registered as virtual subclasses: they are
+    instances of Point, without carrying its `_coords` slot
+    """
+    __slots__ = ('_coords',)
 
-    @x.setter
-    def x(self, val: Scalar) -> None:
-        self._coords[0] = val
 
-    @y.setter
-    def y(self, val: Scalar) -> None:
-        self._coords[1] = val
+class Point2D(AbstractPointVector2D, AbstractPoint):
+    __slots__ = ('x', 'y')
 
-    def __str__(self):
-        return f'{self.__class__.__name__}(x={self.x :.2f}, y={self.y :.2f})'
+    def __add__(self, other: 'AbstractPointVector') -> 'AbstractPointVector':
+        if isinstance(other, Vector2D):
+            return self.__class__(self.x + other.x, self.y + other.y)
+        return super().__add__(other)
 
-    def __repr__(self):
-        return f'{self.__class__.__name__}(x={self.x}, y={self.y})'
+    def __sub__(self, other: Union['Point', 'Vector']) -> Union['Point', 'Vector']:
+        if isinstance(other, Vector2D):
+            return self.__class__(self.x - other.x, self.y - other.y)
+        if isinstance(other, Point2D):
+            return Vector2D(self.x - other.x, self.y - other.y)
+        return super().__sub__(other)
 
     # POINT
     #
@@ -370,6 +632,28 @@ class Point2D(Point):
     #     return self.__class__(*((selfv + otherv) / 2 for selfv, otherv in zip(self, other)))
 
 
+class Point3D(AbstractPointVector3D, AbstractPoint):
+    __slots__ = ('x', 'y', 'z')
+
+    def __add__(self, other: 'AbstractPointVector') -> 'AbstractPointVector':
+        if isinstance(other, Vector3D):
+            return self.__class__(self.x + other.x, self.y + other.y, self.z + other.z)
+        return super().__add__(other)
+
+    def __sub__(self, other: Union['Point', 'Vector']) -> Union['Point', 'Vector']:
+        if isinstance(other, Vector3D):
+            return self.__class__(self.x - other.x, self.y - other.y, self.z - other.z)
+        if isinstance(other, Point3D):
+            return Vector3D(self.x - other.x, self.y - other.y, self.z - other.z)
+        return super().__sub__(other)
+
+
+for _fixed in (Vector2D, Vector3D):
+    Vector.register(_fixed)
+for _fixed in (Point2D, Point3D):
+    Point.register(_fixed)
+
+
 if __name__ == '__main__':
 
     # a = Vector2D(2.12345, 3.9991)
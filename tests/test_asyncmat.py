@@ -0,0 +1,155 @@
+"""
+Tests Suite for amatmul, asolve and asolve_many
+
+"""
+
+import asyncio
+import random
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from unittest.mock import patch
+
+from numeric.src import bareiss
+from numeric.src.asyncmat import amatmul, asolve, asolve_many
+from numeric.src.backends import register
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix
+from numeric.tests.test_backends import ListBackend
+
+
+def random_matrix(rows, cols):
+    return Matrix([[random.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)])
+
+
+class TestAmatmul(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.a = random_matrix(70, 50)
+        self.b = random_matrix(50, 30)
+
+    async def test_identical_to_matmul(self):
+        product = await amatmul(self.a, self.b, chunk_rows=16)
+        self.assertEqual((self.a @ self.b)._row_lists(), product._row_lists())
+
+    async def test_identical_strategies(self):
+        for strategy in ('naive', 'transposed', 'blocked'):
+            product = await amatmul(self.a, self.b, chunk_rows=9, strategy=strategy)
+            self.assertEqual(self.a.matmul(self.b, strategy)._row_lists(), product._row_lists())
+
+    async def test_small(self):
+        a = Matrix([[1, 2], [3, 4]])
+        self.assertEqual(Matrix([[7, 10], [15, 22]]), await amatmul(a, a))
+
+    async def test_exact(self):
+        a = Matrix([[Fraction(1, 3), 2, 5], [1, 0, Fraction(-1, 2)]])
+        b = Matrix([[1, 2], [3, 4], [5, 6]])
+        self.assertEqual((a @ b)._row_lists(), (await amatmul(a, b, chunk_rows=1))._row_lists())
+
+    async def test_backend(self):
+        lists = ListBackend()
+        register(lists)
+        a = Matrix([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], backend='lists')
+        product = await amatmul(a, a.transpose(), chunk_rows=1)
+        self.assertEqual(['to_array', 'to_array', 'matmul'], lists.calls)
+        self.assertEqual((a @ a.transpose())._row_lists(), product._row_lists())
+
+    async def test_views(self):
+        product = await amatmul(self.b.transpose(), self.a[10:60, :], chunk_rows=8)
+        self.assertEqual((self.b.transpose() @ self.a[10:60, :])._row_lists(), product._row_lists())
+
+    async def test_executor_concurrency(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            product = await amatmul(self.a, self.b, chunk_rows=5, executor=executor, concurrency=4)
+        self.assertEqual((self.a @ self.b)._row_lists(), product._row_lists())
+
+    async def test_incompatible(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            await amatmul(self.a, self.a)
+
+    async def test_not_matrix(self):
+        with self.assertRaises(TypeError):
+            await amatmul(self.a, [[1]])
+
+    async def test_chunk_rows(self):
+        with self.assertRaises(ValueError):
+            await amatmul(self.a, self.b, chunk_rows=0)
+
+    async def test_event_loop_runs(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+        await amatmul(self.a, self.b, chunk_rows=1)
+        task.cancel()
+        self.assertGreater(len(ticks), 1)
+
+    async def test_cancel(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            task = asyncio.ensure_future(amatmul(self.a, self.b, chunk_rows=1, executor=executor))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        self.assertTrue(task.cancelled())
+
+
+class TestAsolve(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.a = random_matrix(12, 12)
+        self.rhss = random_matrix(12, 10)
+        self.exact = Matrix([[2, 1, 1], [4, -6, 0], [-2, 7, 2]])
+
+    async def test_asolve(self):
+        rhs = [random.random() for _ in range(12)]
+        self.assertEqual(self.a.solve(rhs), await asolve(self.a, rhs))
+
+    async def test_asolve_exact(self):
+        self.assertEqual([1, 1, 2], await asolve(self.exact, [5, -2, 9]))
+
+    async def test_asolve_many(self):
+        solutions = await asolve_many(self.a, self.rhss, chunk_cols=3)
+        self.assertEqual(self.a.solve_many(self.rhss)._row_lists(), solutions._row_lists())
+
+    async def test_asolve_many_exact(self):
+        rhss = Matrix([[5, 1], [-2, 0], [9, Fraction(1, 2)]])
+        solutions = await asolve_many(self.exact, rhss, chunk_cols=1)
+        self.assertEqual(self.exact.solve_many(rhss)._row_lists(), solutions._row_lists())
+        self.assertIsInstance(solutions[2, 1], Fraction)
+
+    async def test_asolve_many_exact_eliminates_once(self):
+        rhss = Matrix([[random.randint(-9, 9) for _ in range(7)] for _ in range(3)])
+        with patch.object(bareiss, '_eliminate', wraps=bareiss._eliminate) as eliminate, \
+                patch.object(bareiss, 'inverse_numerators', wraps=bareiss.inverse_numerators) as invert:
+            solutions = await asolve_many(self.exact, rhss, chunk_cols=2)
+        self.assertEqual(1, eliminate.call_count)
+        self.assertEqual(1, invert.call_count)
+        self.assertEqual(self.exact.solve_many(rhss)._row_lists(), solutions._row_lists())
+
+    async def test_asolve_many_exact_narrow_solves_directly(self):
+        for rhss, chunk_cols in ((Matrix([[5, 1], [-2, 0], [9, 3]]), 1), (Matrix([[5, 1, 2, 7]] * 3), 4)):
+            with patch.object(bareiss, 'inverse_numerators', wraps=bareiss.inverse_numerators) as invert:
+                solutions = await asolve_many(self.exact, rhss, chunk_cols=chunk_cols)
+            self.assertEqual(0, invert.call_count)
+            self.assertEqual(self.exact.solve_many(rhss)._row_lists(), solutions._row_lists())
+
+    async def test_asolve_many_mode_resolved_once(self):
+        rhss = Matrix([[5, 1.5], [-2, 0], [9, 1]])
+        solutions = await asolve_many(self.exact, rhss, chunk_cols=1)
+        self.assertEqual(self.exact.solve_many(rhss)._row_lists(), solutions._row_lists())
+        self.assertIsInstance(solutions[0, 0], float)
+
+    async def test_asolve_many_shapes(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            await asolve_many(self.a, self.exact)
+
+
+if __name__ == '__main__':
+    unittest.main()
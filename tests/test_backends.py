@@ -0,0 +1,284 @@
+"""
+Tests Suite for the backends of src.matrix.Matrix
+
+"""
+
+import math
+import unittest
+
+from fractions import Fraction
+
+from numeric.src import backends
+from numeric.src.backends import Backend, get_backend, numpy, register, set_default_backend
+from numeric.src.matmul import matmul
+from numeric.src.matrix import Matrix
+
+
+class ListBackend(Backend):
+    """a backend of float matrices as tuples of rows, recording its operations"""
+    name = 'lists'
+
+    def __init__(self):
+        self.calls = []
+
+    def available(self):
+        return True
+
+    def to_array(self, flat, rows, cols):
+        self.calls.append('to_array')
+        if not all(type(elt) is float for elt in flat):
+            return None
+        return tuple(tuple(flat[row * cols: (row + 1) * cols]) for row in range(rows))
+
+    def to_rows(self, array):
+        self.calls.append('to_rows')
+        return [list(row) for row in array]
+
+    def accepts_scalar(self, scalar):
+        return type(scalar) is float
+
+    def matmul(self, a, b):
+        self.calls.append('matmul')
+        return tuple(map(tuple, matmul(a, b)))
+
+    def add(self, a, b):
+        self.calls.append('add')
+        return tuple(tuple(x + y for x, y in zip(row_a, row_b)) for row_a, row_b in zip(a, b))
+
+    def sub(self, a, b):
+        self.calls.append('sub')
+        return tuple(tuple(x - y for x, y in zip(row_a, row_b)) for row_a, row_b in zip(a, b))
+
+    def scale(self, a, scalar):
+        self.calls.append('scale')
+        return tuple(tuple(x * scalar for x in row) for row in a)
+
+    def isclose(self, a, b):
+        self.calls.append('isclose')
+        return all(math.isclose(x, y) for row_a, row_b in zip(a, b) for x, y in zip(row_a, row_b))
+
+
+class TestBackendSelection(unittest.TestCase):
+
+    def test_default(self):
+        self.assertEqual('python', Matrix([[1]]).backend)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            Matrix([[1]], backend='fortran')
+
+    @unittest.skipIf(numpy is not None, 'numpy is installed')
+    def test_numpy_missing(self):
+        with self.assertRaises(ImportError):
+            set_default_backend('numpy')
+        with self.assertRaises(ImportError):
+            Matrix([[1.0]]).to_numpy()
+
+    def test_incomplete_backend(self):
+        class Incomplete(Backend):
+            name = 'incomplete'
+
+            def available(self):
+                return True
+
+        with self.assertRaises(TypeError):
+            register(Incomplete())
+
+    def test_python_backend_arrays(self):
+        python = get_backend('python')
+        a = python.to_array([1, 2, 3, 4, 5, 6], 2, 3)
+        self.assertEqual([[1, 2, 3], [4, 5, 6]], a)
+        self.assertEqual([[14, 32], [32, 77]], python.matmul(a, [list(col) for col in zip(*a)]))
+        self.assertEqual([[0, 0, 0], [0, 0, 0]], python.sub(python.add(a, a), python.scale(a, 2)))
+        self.assertTrue(python.isclose(a, python.to_rows(a)))
+        self.assertEqual([1, 2, 3, 4, 5, 6], python.to_flat(a))
+
+    def test_set_default_backend(self):
+        register(ListBackend())
+        previous = set_default_backend('lists')
+        try:
+            self.assertEqual('python', previous)
+            self.assertEqual('lists', Matrix([[1]]).backend)
+        finally:
+            set_default_backend(previous)
+        self.assertEqual('python', Matrix([[1]]).backend)
+
+    def test_python_units(self):
+        self.assertIsInstance(Matrix.zeros((2, 2))[0, 0], int)
+        self.assertIsInstance(Matrix.identity((2, 2))[1, 1], int)
+
+
+class TestBackendDispatch(unittest.TestCase):
+
+    def setUp(self):
+        self.lists = ListBackend()
+        register(self.lists)
+        self.a = Matrix([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], backend='lists')
+        self.b = Matrix([[0.5, -1.0, 2.0], [1.5, 0.0, -2.0]])
+        self.c = Matrix([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0]])
+
+    def test_matmul(self):
+        product = self.a @ self.b
+        self.assertIn('matmul', self.lists.calls)
+        self.assertEqual(Matrix(self.a._row_lists()) @ self.b, product)
+
+    def test_result_keeps_backend(self):
+        self.assertEqual('lists', (self.b @ self.a).backend)
+        self.assertEqual('lists', (self.a + self.c).backend)
+
+    def test_result_keeps_array(self):
+        total = self.a + self.c
+        del self.lists.calls[:]
+        _ = total - self.c
+        self.assertEqual(['sub'], self.lists.calls)
+
+    def test_result_materialized_lazily(self):
+        total = (self.a + self.c) * 2.0 - self.c
+        copied = total.copy()
+        self.assertNotIn('to_rows', self.lists.calls)
+        self.assertEqual(15.0, total[2, 1])
+        self.assertEqual(1, self.lists.calls.count('to_rows'))
+        self.assertEqual([[3.0, 5.0], [8.0, 10.0], [13.0, 15.0]], total._row_lists())
+        self.assertEqual(1, self.lists.calls.count('to_rows'))
+        self.assertEqual(total._row_lists(), copied._row_lists())
+
+    def test_materialized_result_mutation(self):
+        total = self.a + self.c
+        total.transpose()[0, 1] = 0.0
+        self.assertEqual(Matrix([[2.0, 3.0], [0.0, 6.0], [8.0, 9.0]]), total)
+        self.assertEqual(-2.0, (total - self.c)[1, 0])
+
+    def test_add_sub(self):
+        self.assertEqual(Matrix([[2, 3], [5, 6], [8, 9]]), self.a + self.c)
+        self.assertEqual(Matrix([[0, 1], [1, 2], [2, 3]]), self.a - self.c)
+        self.assertIn('add', self.lists.calls)
+        self.assertIn('sub', self.lists.calls)
+
+    def test_scale(self):
+        self.assertEqual(Matrix([[2, 4], [6, 8], [10, 12]]), self.a * 2.0)
+        self.assertIn('scale', self.lists.calls)
+
+    def test_scale_declined_scalar(self):
+        self.assertEqual(Matrix([[0.5, 1], [1.5, 2], [2.5, 3]]), self.a * Fraction(1, 2))
+        self.assertNotIn('scale', self.lists.calls)
+
+    def test_eq(self):
+        self.assertTrue(self.a == Matrix([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]))
+        self.assertIn('isclose', self.lists.calls)
+
+    def test_declined_stays_exact(self):
+        exact = Matrix([[Fraction(1, 3), 2], [1, 0]], backend='lists')
+        product = exact @ exact
+        self.assertNotIn('matmul', self.lists.calls)
+        self.assertEqual(Fraction(19, 9), product[0, 0])
+
+    def test_array_cached(self):
+        _ = self.a + self.c
+        _ = self.a - self.c
+        self.assertEqual(2, self.lists.calls.count('to_array'))
+
+    def test_mutation_invalidates_array(self):
+        _ = self.a + self.c
+        self.a[0, 0] = 10.0
+        self.assertEqual(11.0, (self.a + self.c)[0, 0])
+
+    def test_view_mutation_invalidates_array(self):
+        _ = self.a + self.c
+        self.a.transpose()[1, 2] = 0.0
+        self.assertEqual(3.0, (self.a + self.c)[2, 1])
+
+    def test_views_keep_backend(self):
+        self.assertEqual('lists', self.a.transpose().backend)
+        self.assertEqual('lists', self.a.get_row(1).backend)
+        self.assertEqual('lists', self.a.get_col(1).backend)
+        self.assertEqual('lists', self.a.clone().backend)
+
+    def test_view_operands(self):
+        pure = Matrix(self.a._row_lists())
+        self.assertEqual(pure.transpose() @ self.c, self.a.transpose() @ self.c)
+        self.assertIn('matmul', self.lists.calls)
+
+    def test_explicit_strategy_is_pure(self):
+        self.a.matmul(self.b, 'naive')
+        self.assertNotIn('matmul', self.lists.calls)
+
+    def test_python_selected_wins(self):
+        python = Matrix(self.b._row_lists(), backend='python')
+        python @ self.a
+        self.assertNotIn('matmul', self.lists.calls)
+
+    def test_set_backend(self):
+        self.a.backend = None
+        self.assertEqual('python', self.a.backend)
+        self.a @ self.b
+        self.assertNotIn('matmul', self.lists.calls)
+
+    def test_units(self):
+        self.assertIsInstance(Matrix.zeros((2, 3), backend='lists')[1, 2], float)
+        self.assertEqual('lists', Matrix.identity((2, 2), backend=self.lists).backend)
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumpyBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Matrix([[1.5, 2.0, -1.0], [3.0, 4.25, 0.0]], backend='numpy')
+        self.b = Matrix([[0.5, -1.0], [1.5, 0.0], [2.0, -2.0]])
+
+    def test_matmul(self):
+        expected = Matrix(self.a._row_lists()) @ self.b
+        self.assertEqual(expected, self.a @ self.b)
+
+    def test_add_sub_scale(self):
+        pure = Matrix(self.a._row_lists())
+        self.assertEqual(pure + pure, self.a + self.a)
+        self.assertEqual(pure - pure * 0.5, self.a - self.a * 0.5)
+
+    def test_results_are_python_floats(self):
+        self.assertIs(float, type((self.a @ self.b)[0, 0]))
+
+    def test_result_keeps_array_as_storage(self):
+        product = self.a @ self.b
+        self.assertIsInstance(product._array, numpy.ndarray)
+        self.assertEqual([[1.0, -3.5], [7.875, -3.0]], product.to_numpy().tolist())
+        self.assertEqual([1.0, -3.5, 7.875, -3.0], product._flat())
+
+    def test_complex(self):
+        a = Matrix([[1j, 2.0], [0.5, 1 - 1j]], backend='numpy')
+        self.assertEqual(Matrix([[1j, 2.0], [0.5, 1 - 1j]]) @ a, a @ a)
+
+    def test_exact_stays_pure(self):
+        exact = Matrix([[Fraction(1, 3), 2], [1, 0]], backend='numpy')
+        self.assertEqual(Fraction(19, 9), (exact @ exact)[0, 0])
+        ints = Matrix([[2 ** 62, 1], [1, 1]], backend='numpy')
+        self.assertEqual(2 ** 124 + 1, (ints @ ints)[0, 0])
+
+    def test_round_trip_float(self):
+        array = self.a.to_numpy()
+        self.assertEqual(numpy.float64, array.dtype)
+        self.assertEqual(self.a._row_lists(), Matrix.from_numpy(array)._row_lists())
+
+    def test_round_trip_exact(self):
+        exact = Matrix([[Fraction(1, 3), 2 ** 70]])
+        array = exact.to_numpy()
+        self.assertEqual(object, array.dtype)
+        self.assertEqual(exact._row_lists(), Matrix.from_numpy(array)._row_lists())
+
+    def test_round_trip_int(self):
+        self.assertEqual(numpy.int64, Matrix([[1, 2], [3, 4]]).to_numpy().dtype)
+
+    def test_from_numpy_dimensions(self):
+        with self.assertRaises(ValueError):
+            Matrix.from_numpy(numpy.zeros(3))
+
+    def test_default_backend(self):
+        previous = set_default_backend('numpy')
+        try:
+            self.assertIs(get_backend('numpy'), backends.default_backend())
+            self.assertIsInstance(Matrix.zeros((2, 2))[0, 0], float)
+        finally:
+            set_default_backend(previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Tests Suite for the exact Bareiss elimination, and the exact mode of Matrix
+
+"""
+
+import random
+import unittest
+
+from fractions import Fraction
+
+from numeric.src import bareiss
+from numeric.src.lu import LUDecomposition, SingularMatrixError
+from numeric.src.matrix import Matrix
+
+
+def random_rational_rows(num_rows: int, num_cols: int) -> list:
+    return [[Fraction(random.randint(-20, 20), random.randint(1, 12)) for _ in range(num_cols)]
+            for _ in range(num_rows)]
+
+
+class TestBareiss(unittest.TestCase):
+
+    def setUp(self):
+        self.ints = [[2, 1, 1], [4, -6, 0], [-2, 7, 2]]
+        self.fractions = [[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), Fraction(1, 5)]]
+
+    def test_is_exact(self):
+        self.assertTrue(bareiss.is_exact(self.fractions))
+
+    def test_is_not_exact(self):
+        self.assertFalse(bareiss.is_exact([[1, 2.0]]))
+
+    def test_det_ints(self):
+        actual = bareiss.det(self.ints)
+        self.assertEqual(-16, actual)
+        self.assertIsInstance(actual, int)
+
+    def test_det_fractions(self):
+        self.assertEqual(Fraction(1, 60), bareiss.det(self.fractions))
+
+    def test_det_needs_pivoting(self):
+        self.assertEqual(-1, bareiss.det([[0, 1], [1, 0]]))
+
+    def test_det_singular(self):
+        self.assertEqual(0, bareiss.det([[1, 2, 3], [4, 5, 6], [7, 8, 9]]))
+
+    def test_det_matches_fraction_lu(self):
+        rows = random_rational_rows(8, 8)
+        self.assertEqual(LUDecomposition(rows).det(), bareiss.det(rows))
+
+    def test_rank_full(self):
+        self.assertEqual(3, bareiss.rank(self.ints))
+
+    def test_rank_deficient(self):
+        self.assertEqual(2, bareiss.rank([[1, 2, 3], [4, 5, 6], [7, 8, 9]]))
+
+    def test_rank_skips_columns(self):
+        self.assertEqual(2, bareiss.rank([[0, 1, 2, 3], [0, 2, 4, 7], [0, 3, 6, 10]]))
+
+    def test_rank_wide(self):
+        self.assertEqual(1, bareiss.rank([[Fraction(1, 2), 1, Fraction(3, 2)], [1, 2, 3]]))
+
+    def test_rank_random_product(self):
+        left, right = random_rational_rows(7, 3), random_rational_rows(3, 6)
+        product = [[sum(l * r for l, r in zip(row, col)) for col in zip(*right)] for row in left]
+        self.assertEqual(3, bareiss.rank(product))
+
+    def test_solve(self):
+        actual = bareiss.solve(self.ints, [5, -2, 9])
+        self.assertEqual([1, 1, 2], actual)
+        self.assertIsInstance(actual[0], Fraction)
+
+    def test_solve_matches_fraction_lu(self):
+        rows, rhs = random_rational_rows(9, 9), random_rational_rows(1, 9)[0]
+        self.assertEqual(LUDecomposition(rows).solve(rhs), bareiss.solve(rows, rhs))
+
+    def test_solve_singular(self):
+        with self.assertRaises(SingularMatrixError):
+            bareiss.solve([[1, 2], [2, 4]], [1, 1])
+
+    def test_solve_wrong_size(self):
+        with self.assertRaises(ValueError):
+            bareiss.solve(self.ints, [1, 1])
+
+    def test_inverse(self):
+        self.assertEqual([[12, -20], [-15, 30]], bareiss.inverse(self.fractions))
+
+    def test_inverse_matches_fraction_lu(self):
+        rows = random_rational_rows(6, 6)
+        self.assertEqual(LUDecomposition(rows).inverse(), bareiss.inverse(rows))
+
+    def test_inverse_numerators(self):
+        numerators, divisor = bareiss.inverse_numerators(self.fractions)
+        self.assertTrue(all(isinstance(elt, int) for row in numerators for elt in row))
+        self.assertEqual(bareiss.inverse(self.fractions),
+                         [[Fraction(elt, divisor) for elt in row] for row in numerators])
+
+    def test_solve_inverted_matches_solve_many(self):
+        rows, rhss = random_rational_rows(7, 7), random_rational_rows(4, 7) + [[1, -2, 0, 3, 5, 1, 1]]
+        numerators, divisor = bareiss.inverse_numerators(rows)
+        self.assertEqual(bareiss.solve_many(rows, rhss), bareiss.solve_inverted(numerators, divisor, rhss))
+
+    def test_solve_inverted_wrong_size(self):
+        numerators, divisor = bareiss.inverse_numerators(self.ints)
+        with self.assertRaises(ValueError):
+            bareiss.solve_inverted(numerators, divisor, [[1, 1]])
+
+
+class TestMatrixExactMode(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Matrix([[2, 1, 1], [4, -6, 0], [-2, 7, 2]])
+
+    def test_det_auto_exact(self):
+        self.assertIsInstance(self.a.det(), int)
+
+    def test_det_forced_lu(self):
+        self.assertIsInstance(self.a.det(exact=False), float)
+
+    def test_det_floats_not_exact(self):
+        self.assertIsInstance(Matrix([[1.5, 0], [0, 2]]).det(), float)
+
+    def test_det_floats_forced_exact(self):
+        self.assertEqual(3, Matrix([[1.5, 0], [0, 2]]).det(exact=True))
+
+    def test_inverse_exact(self):
+        inverse = self.a.inverse()
+        self.assertEqual(Fraction(3, 4), inverse[0, 0])
+        self.assertEqual(Matrix.identity((3, 3)), self.a @ inverse)
+
+    def test_inverse_exact_singular(self):
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2], [2, 4]]).inverse()
+
+    def test_solve_exact(self):
+        self.assertEqual([1, 1, 2], self.a.solve([5, -2, 9]))
+
+    def test_solve_float_rhs_uses_lu(self):
+        self.assertIsInstance(self.a.solve([5.0, -2, 9])[0], float)
+
+    def test_solve_many_exact(self):
+        rhss = Matrix([[5, 4], [-2, -2], [9, 5]])
+        actual = self.a.solve_many(rhss)
+        self.assertIsInstance(actual[0, 0], Fraction)
+        self.assertEqual(rhss, self.a @ actual)
+
+    def test_rank(self):
+        self.assertEqual(3, self.a.rank())
+
+    def test_rank_non_square(self):
+        self.assertEqual(1, Matrix([[1, 2, 3], [2, 4, 6]]).rank())
+
+    def test_rank_floats(self):
+        self.assertEqual(2, Matrix([[0.5, 0.25], [0.25, 0.5]]).rank())
+
+
+if __name__ == '__main__':
+    unittest.main()
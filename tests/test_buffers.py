@@ -0,0 +1,147 @@
+"""
+Tests Suite for the buffer import and export of Matrix, PointArray and VectorArray
+
+"""
+
+import struct
+import unittest
+
+from array import array
+
+from numeric.src.buffers import flat_view, to_array, to_list
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix
+from numeric.src.pointarray import PointArray, VectorArray
+from numeric.src.vector import Point3D
+
+
+class TestBuffers(unittest.TestCase):
+
+    def test_to_list(self):
+        self.assertEqual(([1, 2, 3], (3,)), to_list(array('q', [1, 2, 3])))
+
+    def test_to_list_2d(self):
+        view = memoryview(array('d', [1, 2, 3, 4, 5, 6])).cast('B').cast('d', (2, 3))
+        self.assertEqual(([1, 2, 3, 4, 5, 6], (2, 3)), to_list(view))
+
+    def test_bytes(self):
+        self.assertEqual([1.5, -2.0], to_list(memoryview(struct.pack('2d', 1.5, -2.0)).cast('d'))[0])
+
+    def test_non_contiguous(self):
+        view = memoryview(array('d', [0, 1, 2, 3, 4, 5]))[::2]
+        self.assertEqual(([0, 2, 4], (3,)), to_list(view))
+
+    def test_to_array_converts(self):
+        coords, shape = to_array(array('f', [0.5, 1.5]))
+        self.assertEqual(array('d', [0.5, 1.5]), coords)
+
+    def test_to_array_copies(self):
+        source = array('d', [1, 2])
+        coords, _ = to_array(source)
+        source[0] = 42
+        self.assertEqual(1, coords[0])
+
+    def test_shares_contiguous(self):
+        source = array('d', [1, 2])
+        view, _ = flat_view(source)
+        source[0] = 42
+        self.assertEqual(42, view[0])
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            flat_view(memoryview(b'ab').cast('c'))
+
+
+class TestMatrixBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self._2x3 = Matrix([[1.0, 2.0, 3.0], [4.0, 5.0, 6.5]])
+
+    def test_as_buffer(self):
+        view = self._2x3.as_buffer()
+        self.assertEqual('d', view.format)
+        self.assertEqual((2, 3), view.shape)
+        self.assertEqual([[1, 2, 3], [4, 5, 6.5]], view.tolist())
+
+    def test_as_buffer_int(self):
+        view = Matrix([[1, 2], [3, 4]]).as_buffer('q')
+        self.assertEqual(b''.join(struct.pack('q', elt) for elt in (1, 2, 3, 4)), view.tobytes())
+
+    def test_as_buffer_view(self):
+        self.assertEqual([[1, 4], [2, 5], [3, 6.5]], self._2x3.transpose().as_buffer().tolist())
+
+    def test_round_trip(self):
+        self.assertEqual(self._2x3._row_lists(), Matrix.frombuffer(self._2x3.as_buffer())._row_lists())
+
+    def test_frombuffer_shape(self):
+        matrix = Matrix.frombuffer(array('q', range(6)), shape=(3, 2))
+        self.assertEqual([[0, 1], [2, 3], [4, 5]], matrix._row_lists())
+        self.assertIsInstance(matrix[0, 1], int)
+
+    def test_frombuffer_bytes(self):
+        matrix = Matrix.frombuffer(memoryview(struct.pack('4d', 1, 2, 3, 4)).cast('d'), shape=(2, 2))
+        self.assertEqual(Matrix([[1, 2], [3, 4]]), matrix)
+
+    def test_frombuffer_owns_storage(self):
+        source = array('d', [1, 2, 3, 4])
+        matrix = Matrix.frombuffer(source, shape=(2, 2))
+        source[0] = 42
+        matrix[1, 1] = 0
+        self.assertEqual([[1, 2], [3, 0]], matrix._row_lists())
+        self.assertEqual([1, 2, 3, 0], matrix._data)
+
+    def test_frombuffer_needs_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix.frombuffer(array('d', [1, 2]))
+
+    def test_frombuffer_wrong_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix.frombuffer(array('d', [1, 2, 3]), shape=(2, 2))
+
+    def test_frombuffer_operations(self):
+        matrix = Matrix.frombuffer(array('d', [1, 2, 3, 4]), shape=(2, 2))
+        self.assertEqual(Matrix([[7, 10], [15, 22]]), matrix @ matrix)
+
+
+class TestPointArrayBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.points = PointArray([1, 2, 3, 4, 5, 6])
+
+    def test_as_buffer(self):
+        view = self.points.as_buffer()
+        self.assertEqual((3, 2), view.shape)
+        self.assertEqual([[1, 2], [3, 4], [5, 6]], view.tolist())
+
+    def test_as_buffer_shares(self):
+        view = self.points.as_buffer()
+        self.points[1].x = 42
+        self.assertEqual(42, view[1, 0])
+
+    def test_as_buffer_empty(self):
+        self.assertEqual((0,), PointArray(dim=3).as_buffer().shape)
+
+    def test_frombuffer_2d(self):
+        points = PointArray.frombuffer(self.points.as_buffer())
+        self.assertEqual(self.points, points)
+        self.assertIsNot(self.points.coords, points.coords)
+
+    def test_frombuffer_dim(self):
+        points = PointArray.frombuffer(array('d', [1, 2, 3, 4, 5, 6]), dim=3)
+        self.assertEqual([Point3D(1, 2, 3), Point3D(4, 5, 6)], points.to_list())
+
+    def test_frombuffer_ints(self):
+        vectors = VectorArray.frombuffer(array('i', [1, 2, 3, 4]))
+        self.assertEqual(array('d', [1, 2, 3, 4]), vectors.coords)
+        self.assertIsInstance(vectors, VectorArray)
+
+    def test_frombuffer_mismatched_dim(self):
+        with self.assertRaises(ValueError):
+            PointArray.frombuffer(self.points.as_buffer(), dim=3)
+
+    def test_frombuffer_not_multiple(self):
+        with self.assertRaises(ValueError):
+            PointArray.frombuffer(array('d', [1, 2, 3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
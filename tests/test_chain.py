@@ -0,0 +1,137 @@
+"""
+Tests Suite for the matrix chain ordering of src.chain
+
+"""
+
+import operator
+import unittest
+
+from functools import reduce
+
+from numeric.src import chain
+from numeric.src.chain import dims_of, multi_dot, multiply, naive_cost, parenthesize, plan
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix
+from numeric.src.matrix import multi_dot as matrix_multi_dot
+
+
+def grouping(split, first, last):
+    """the parenthesization of the matrices first to last, as nested tuples of their indices"""
+    if first == last:
+        return first
+    mid = split[first][last]
+    return grouping(split, first, mid), grouping(split, mid + 1, last)
+
+
+class TestParenthesize(unittest.TestCase):
+
+    def test_single(self):
+        self.assertEqual(0, parenthesize((3, 4))[0])
+
+    def test_pair(self):
+        self.assertEqual(3 * 4 * 5, parenthesize((3, 4, 5))[0])
+
+    def test_right_to_left(self):
+        cost, split = parenthesize((10, 1000, 1000, 1))
+        self.assertEqual(1000 * 1000 + 10 * 1000, cost)
+        self.assertEqual((0, (1, 2)), grouping(split, 0, 2))
+
+    def test_textbook(self):
+        cost, split = parenthesize((30, 35, 15, 5, 10, 20, 25))
+        self.assertEqual(15125, cost)
+        self.assertEqual(((0, (1, 2)), ((3, 4), 5)), grouping(split, 0, 5))
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            parenthesize((3,))
+
+
+class TestMultiply(unittest.TestCase):
+
+    def test_order(self):
+        _, split = parenthesize((10, 1000, 1000, 1))
+        trace = multiply('abc', split, lambda left, right: f'({left}{right})')
+        self.assertEqual('(a(bc))', trace)
+
+    def test_single(self):
+        self.assertEqual('a', multiply('a', parenthesize((2, 2))[1]))
+
+
+class TestPlan(unittest.TestCase):
+
+    def test_naive_cost(self):
+        self.assertEqual(10 * 1000 * 1000 + 10 * 1000 * 1, naive_cost((10, 1000, 1000, 1)))
+
+    def test_plan(self):
+        chain_plan = plan((10, 1000, 1000, 1))
+        self.assertEqual(1010000, chain_plan.cost)
+        self.assertEqual(2020000, chain_plan.flops)
+        self.assertEqual(20020000, chain_plan.naive_flops)
+        self.assertAlmostEqual(10010000 / 1010000, chain_plan.speedup)
+        self.assertEqual('(A0 (A1 A2))', chain_plan.order())
+        self.assertIn('2,020,000 flops', str(chain_plan))
+
+    def test_single(self):
+        self.assertEqual('A0', plan((2, 3)).order())
+        self.assertEqual(1.0, plan((2, 3)).speedup)
+
+    def test_cached_by_dims(self):
+        chain.plan.cache_clear()
+        first = plan((4, 5, 6, 7))
+        self.assertIs(first, plan((4, 5, 6, 7)))
+        self.assertEqual(1, chain.plan.cache_info().hits)
+
+    def test_dims_of(self):
+        self.assertEqual((2, 3, 1), dims_of([Matrix([[1] * 3] * 2), Matrix([[1]] * 3)]))
+        with self.assertRaises(ValueError):
+            dims_of([Matrix([[1] * 3] * 2), Matrix([[1] * 3] * 2)])
+
+    def test_multi_dot_generic(self):
+        class Shaped:
+            def __init__(self, name, shape):
+                self.name, self.shape = name, shape
+
+            def __matmul__(self, other):
+                return Shaped(f'({self.name}{other.name})', (self.shape[0], other.shape[1]))
+
+        result = multi_dot([Shaped('a', (10, 1000)), Shaped('b', (1000, 1000)), Shaped('c', (1000, 1))])
+        self.assertEqual('(a(bc))', result.name)
+
+
+class TestMatrixChain(unittest.TestCase):
+
+    def setUp(self):
+        self.chain = [Matrix([[row + col for col in range(cols)] for row in range(rows)])
+                      for rows, cols in ((3, 5), (5, 2), (2, 6), (6, 1), (1, 4))]
+
+    def test_same_value_as_reduce(self):
+        expected = reduce(operator.matmul, self.chain)
+        self.assertEqual(expected._row_lists(), Matrix.chain_multiply(*self.chain)._row_lists())
+
+    def test_multi_dot(self):
+        self.assertEqual(Matrix.chain_multiply(*self.chain), matrix_multi_dot(self.chain))
+
+    def test_chain_plan(self):
+        chain_plan = Matrix.chain_plan(*self.chain)
+        self.assertEqual((3, 5, 2, 6, 1, 4), chain_plan.dims)
+        self.assertLessEqual(chain_plan.cost, chain_plan.naive_cost)
+
+    def test_single_is_copied(self):
+        single = Matrix.chain_multiply(self.chain[0])
+        self.assertIsNot(self.chain[0], single)
+        self.assertEqual(self.chain[0], single)
+
+    def test_mismatched_shapes(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix.chain_multiply(self.chain[0], self.chain[0])
+
+    def test_empty(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix.chain_multiply()
+
+    def test_not_matrices(self):
+        with self.assertRaises(TypeError):
+            Matrix.chain_multiply(self.chain[0], [[1], [2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
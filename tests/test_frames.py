@@ -0,0 +1,129 @@
+"""
+Tests Suite for CoordinateSystem and convert
+
+"""
+
+import unittest
+
+from array import array
+
+from numeric.src.frames import CoordinateSystem, convert
+from numeric.src.hommat import Hmat33
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point2D, Vector2D
+
+
+class TestCoordinateSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.world = CoordinateSystem(name='world')
+        self.canvas = CoordinateSystem(Vector2D(1, 0), Vector2D(0, -1), Point2D(250, 250),
+                                       parent=self.world, name='canvas')
+        self.model = CoordinateSystem(Vector2D(2, 0), Vector2D(0, 2), Point2D(10, 0),
+                                      parent=self.world, name='model')
+        self.part = CoordinateSystem(Vector2D(0, 1), Vector2D(-1, 0), Point2D(1, 1),
+                                     parent=self.model, name='part')
+
+    def test_children(self):
+        self.assertEqual([self.canvas, self.model], self.world.children)
+
+    def test_root(self):
+        self.assertIs(self.world, self.part.root)
+
+    def test_local(self):
+        self.assertEqual(Hmat33([[2, 0, 10], [0, 2, 0], [0, 0, 1]]), self.model.local)
+
+    def test_to_root(self):
+        self.assertEqual((12, 4, 1), self.part.to_root * (1, 0, 1))
+
+    def test_from_root(self):
+        self.assertEqual((1, 0, 1), self.part.from_root * (12, 4, 1))
+
+    def test_to_root_cached(self):
+        self.assertIs(self.part.to_root, self.part.to_root)
+
+    def test_ancestors_cached(self):
+        _ = self.part.to_root
+        self.assertIsNotNone(self.model._to_root)
+
+    def test_move_invalidates_subtree(self):
+        _ = self.part.to_root
+        self.model.move(origin=Point2D(0, 0))
+        self.assertIsNone(self.part._to_root)
+        self.assertEqual((2, 4, 1), self.part.to_root * (1, 0, 1))
+
+    def test_move_keeps_siblings(self):
+        canvas_to_root = self.canvas.to_root
+        _ = self.part.to_root
+        self.model.move(e1=Vector2D(1, 0))
+        self.assertIs(canvas_to_root, self.canvas.to_root)
+
+    def test_move_keeps_ancestors(self):
+        _ = self.part.to_root
+        model_to_root = self.model.to_root
+        self.part.move(origin=Point2D(0, 0))
+        self.assertIs(model_to_root, self.model.to_root)
+
+    def test_reparent(self):
+        _ = self.part.to_root
+        self.part.parent = self.canvas
+        self.assertEqual([self.canvas], [frame for frame in self.world.children if self.part in frame.children])
+        self.assertEqual((251, 249, 1), self.part.to_root * (0, 0, 1))
+
+    def test_reparent_cycle(self):
+        with self.assertRaises(ValueError):
+            self.model.parent = self.part
+
+    def test_transform_to(self):
+        self.assertEqual((-238, 246, 1), self.part.transform_to(self.canvas) * (1, 0, 1))
+
+    def test_transform_to_self(self):
+        self.assertEqual(Hmat33.identity(), self.part.transform_to(self.part))
+
+    def test_transform_to_other_tree(self):
+        with self.assertRaises(ValueError):
+            self.part.transform_to(CoordinateSystem())
+
+    def test_deep_hierarchy(self):
+        frame = self.world
+        for _ in range(5000):
+            frame = CoordinateSystem(origin=Point2D(1, 0), parent=frame)
+        self.assertEqual((5000, 0, 1), frame.to_root * (0, 0, 1))
+
+
+class TestConvert(unittest.TestCase):
+
+    def setUp(self):
+        self.world = CoordinateSystem(name='world')
+        self.canvas = CoordinateSystem(Vector2D(1, 0), Vector2D(0, -1), Point2D(250, 250),
+                                       parent=self.world, name='canvas')
+        self.model = CoordinateSystem(Vector2D(2, 0), Vector2D(0, 2), Point2D(10, 0),
+                                      parent=self.world, name='model')
+
+    def test_flat_buffer(self):
+        self.assertEqual([-240, 250, -238, 246], list(convert(array('d', [0, 0, 1, 2]), self.model, self.canvas)))
+
+    def test_flat_list_out(self):
+        out = [0] * 4
+        self.assertIs(out, convert([0, 0, 1, 2], self.model, self.canvas, out=out))
+        self.assertEqual([-240, 250, -238, 246], out)
+
+    def test_points(self):
+        result = convert([Point2D(0, 0), Point2D(1, 2)], self.model, self.canvas)
+        self.assertEqual(PointArray([-240, 250, -238, 246]), result)
+
+    def test_point_array(self):
+        result = convert(PointArray([0, 0, 1, 2]), self.model, self.canvas)
+        self.assertEqual(PointArray([-240, 250, -238, 246]), result)
+
+    def test_round_trip(self):
+        coords = array('d', [3, -4, 0.5, 7])
+        back = convert(convert(coords, self.model, self.canvas), self.canvas, self.model)
+        self.assertEqual(list(coords), list(back))
+
+    def test_vectors(self):
+        self.assertEqual([2, -4], list(convert(array('d', [1, 2]), self.model, self.canvas, vectors=True)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests Suite for AffineGrid
+
+"""
+
+import unittest
+
+from array import array
+
+from numeric.src.grid import AffineGrid
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point2D, Vector2D
+
+
+class TestAffineGrid(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = AffineGrid(Vector2D(2, 1), Vector2D(-1, 3), origin=Point2D(10, 20),
+                               rows=range(-1, 2), cols=range(0, 3))
+
+    def expected(self, grid):
+        return [coord for row in grid.rows for col in grid.cols for coord in grid.position(row, col)]
+
+    def test_len(self):
+        self.assertEqual(9, len(self.grid))
+
+    def test_position(self):
+        self.assertEqual((15, 19), self.grid.position(-1, 2))
+
+    def test_empty_range(self):
+        with self.assertRaises(ValueError):
+            AffineGrid(Vector2D(1, 0), Vector2D(0, 1), rows=range(0))
+
+    def test_iter_rows(self):
+        rows = list(self.grid.iter_rows())
+        self.assertEqual(3, len(rows))
+        self.assertEqual(array('d', [11, 17, 13, 18, 15, 19]), rows[0])
+
+    def test_lattice(self):
+        self.assertEqual(self.expected(self.grid), list(self.grid.lattice()))
+
+    def test_lattice_steps(self):
+        grid = AffineGrid((0.5, 0.25), (0.1, 1.5), origin=(3, -2), rows=range(10, -10, -3), cols=range(-7, 8, 2))
+        for coord, expected in zip(grid.lattice(), self.expected(grid)):
+            self.assertAlmostEqual(expected, coord)
+
+    def test_lattice_single_node(self):
+        grid = AffineGrid((1, 0), (0, 1), origin=(4, 5), rows=range(1), cols=range(1))
+        self.assertEqual(array('d', [4, 5]), grid.lattice())
+
+    def test_lattice_out(self):
+        out = [0] * 18
+        self.assertIs(out, self.grid.lattice(out=out))
+        self.assertEqual(self.expected(self.grid), out)
+
+    def test_lattice_out_wrong_size(self):
+        with self.assertRaises(ValueError):
+            self.grid.lattice(out=array('d', bytes(8)))
+
+    def test_points(self):
+        self.assertEqual(PointArray(self.expected(self.grid)), self.grid.points())
+
+    def test_lines(self):
+        lines = list(self.grid.lines())
+        self.assertEqual(6, len(lines))
+        self.assertEqual((11, 17, 15, 19), lines[0])
+        self.assertEqual((9, 23, 13, 25), lines[2])
+        self.assertEqual((11, 17, 9, 23), lines[3])
+        self.assertEqual((15, 19, 13, 25), lines[5])
+
+    def test_lines_lazy(self):
+        grid = AffineGrid((1, 0), (0, 1), rows=range(10 ** 9), cols=range(10 ** 9))
+        self.assertEqual((0, 0, 10 ** 9 - 1, 0), next(grid.lines()))
+
+
+if __name__ == '__main__':
+    unittest.main()
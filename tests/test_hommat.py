@@ -0,0 +1,252 @@
+"""
+Tests Suite for Hmat33 and Hmat44
+
+"""
+
+import math
+import unittest
+
+from array import array
+
+from numeric.src.hommat import AbstractHmat, Hmat33, Hmat44
+from numeric.src.lu import SingularMatrixError
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point2D, Point3D, Vector2D
+
+
+class TestHmat33(unittest.TestCase):
+
+    def setUp(self):
+        self.transform = Hmat33([[10, 0, 200],
+                                 [0, -10, 200],
+                                 [0, 0, 1]])
+        self.coords = array('d', [10, 20, 0, 0, -50, 50])
+
+    def test_apply_many(self):
+        expected = [300, 0, 200, 200, -300, -300]
+        self.assertEqual(expected, list(self.transform.apply_many(self.coords)))
+
+    def test_apply_many_matches_mul(self):
+        result = self.transform.apply_many(self.coords)
+        for idx in range(0, len(self.coords), 2):
+            x, y, _ = self.transform * (self.coords[idx], self.coords[idx + 1], 1)
+            self.assertEqual((x, y), (result[idx], result[idx + 1]))
+
+    def test_apply_many_new_buffer(self):
+        self.assertIsNot(self.coords, self.transform.apply_many(self.coords))
+
+    def test_apply_many_out(self):
+        out = array('d', [0] * 6)
+        self.assertIs(out, self.transform.apply_many(self.coords, out=out))
+        self.assertEqual([300, 0, 200, 200, -300, -300], list(out))
+
+    def test_apply_many_list(self):
+        out = [0] * 6
+        self.transform.apply_many([10, 20, 0, 0, -50, 50], out=out)
+        self.assertEqual([300, 0, 200, 200, -300, -300], out)
+
+    def test_apply_many_memoryview(self):
+        out = memoryview(array('d', [0] * 6))
+        self.transform.apply_many(memoryview(self.coords), out=out)
+        self.assertEqual([300, 0, 200, 200, -300, -300], out.tolist())
+
+    def test_apply_in_place(self):
+        self.assertIs(self.coords, self.transform.apply_in_place(self.coords))
+        self.assertEqual([300, 0, 200, 200, -300, -300], list(self.coords))
+
+    def test_apply_many_vectors(self):
+        self.assertEqual([100, -200, 0, 0, -500, -500], list(self.transform.apply_many(self.coords, vectors=True)))
+
+    def test_apply_many_projective(self):
+        projective = Hmat33([[1, 0, 0], [0, 1, 0], [0, 0, 2]])
+        self.assertEqual([5, 10, 0, 0, -25, 25], list(projective.apply_many(self.coords)))
+
+    def test_apply_many_odd_length(self):
+        with self.assertRaises(ValueError):
+            self.transform.apply_many([1, 2, 3])
+
+    def test_apply_many_wrong_out_length(self):
+        with self.assertRaises(ValueError):
+            self.transform.apply_many(self.coords, out=array('d', [0] * 4))
+
+    def test_transform_points_sequence(self):
+        result = self.transform.transform_points([Point2D(10, 20), Point2D(0, 0)])
+        self.assertEqual(PointArray([300, 0, 200, 200]), result)
+
+    def test_transform_points_point_array(self):
+        points = PointArray(self.coords)
+        result = self.transform.transform_points(points)
+        self.assertEqual([Point2D(300, 0), Point2D(200, 200), Point2D(-300, -300)], result.to_list())
+
+    def test_transform_points_wrong_dim(self):
+        with self.assertRaises(ValueError):
+            self.transform.transform_points(PointArray([1, 2, 3], dim=3))
+
+    def test_power(self):
+        self.assertEqual(Hmat33.translation(3000, -40), Hmat33.translation(3, -0.04) ** 1000)
+
+    def test_power_matches_products(self):
+        expected = self.transform @ self.transform @ self.transform
+        self.assertEqual(expected, self.transform ** 3)
+
+    def test_power_zero_and_negative(self):
+        self.assertEqual(Hmat33.identity(), self.transform ** 0)
+        self.assertEqual(self.transform.inverse() @ self.transform.inverse(), self.transform ** -2)
+
+    def test_power_singular(self):
+        with self.assertRaises(SingularMatrixError):
+            Hmat33([[1, 2, 0], [2, 4, 0], [0, 0, 1]]) ** -1
+
+    def test_power_not_int(self):
+        with self.assertRaises(TypeError):
+            self.transform ** 0.5
+
+
+class TestAbstractHmat(unittest.TestCase):
+
+    def test_apply_many_is_abstract(self):
+        class NoApplyMany(AbstractHmat):
+            DIM = 2
+
+        with self.assertRaises(TypeError):
+            NoApplyMany([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+
+class TestHmat33Factories(unittest.TestCase):
+
+    def setUp(self):
+        self.coords = array('d', [1, 0, 2, 3])
+
+    def test_identity(self):
+        self.assertEqual([1, 0, 2, 3], list(Hmat33.identity().apply_many(self.coords)))
+
+    def test_translation(self):
+        self.assertEqual([11, -5, 12, -2], list(Hmat33.translation(10, -5).apply_many(self.coords)))
+
+    def test_scaling(self):
+        self.assertEqual([2, 0, 4, 6], list(Hmat33.scaling(2).apply_many(self.coords)))
+
+    def test_scaling_anisotropic(self):
+        self.assertEqual([2, 0, 4, -3], list(Hmat33.scaling(2, -1).apply_many(self.coords)))
+
+    def test_rotation(self):
+        x, y, _ = Hmat33.rotation(math.pi / 2) * (1, 0, 1)
+        self.assertTrue(math.isclose(0, x, abs_tol=1e-15))
+        self.assertTrue(math.isclose(1, y))
+
+    def test_from_basis(self):
+        transform = Hmat33.from_basis(Vector2D(20, 5), Vector2D(3, 15), Point2D(250, 250))
+        self.assertEqual((273, 270, 1), transform * (1, 1, 1))
+
+    def test_composition_order(self):
+        transform = Hmat33.translation(10, 0) @ Hmat33.scaling(2)
+        self.assertEqual((12, 0, 1), transform * (1, 0, 1))
+
+    def test_inverse(self):
+        transform = Hmat33.from_basis((20, 5), (3, 15), (250, 250))
+        self.assertEqual(PointArray(self.coords), (transform.inverse() @ transform).transform_points(PointArray(self.coords)))
+
+    def test_inverse_type(self):
+        self.assertIsInstance(Hmat33.scaling(2).inverse(), Hmat33)
+
+    def test_inverse_singular(self):
+        with self.assertRaises(SingularMatrixError):
+            Hmat33.scaling(0, 1).inverse()
+
+
+class TestHmat44Factories(unittest.TestCase):
+
+    def setUp(self):
+        self.coords = array('d', [1, 0, 2, 3, 4, 5])
+
+    def test_identity(self):
+        self.assertEqual([1, 0, 2, 3, 4, 5], list(Hmat44.identity().apply_many(self.coords)))
+
+    def test_translation(self):
+        self.assertEqual([11, -5, 3, 13, -1, 6], list(Hmat44.translation(10, -5, 1).apply_many(self.coords)))
+
+    def test_scaling(self):
+        self.assertEqual([2, 0, 4, 6, 8, 10], list(Hmat44.scaling(2).apply_many(self.coords)))
+
+    def test_scaling_anisotropic(self):
+        self.assertEqual([2, 0, 6, 6, -4, 15], list(Hmat44.scaling(2, -1, 3).apply_many(self.coords)))
+
+    def test_rotation_about_z(self):
+        x, y, z, _ = Hmat44.rotation(math.pi / 2) * (1, 0, 0, 1)
+        self.assertTrue(math.isclose(0, x, abs_tol=1e-15))
+        self.assertTrue(math.isclose(1, y))
+        self.assertEqual(0, z)
+
+    def test_rotation_about_axis(self):
+        rotation = Hmat44.rotation(2 * math.pi / 3, (1, 1, 1))
+        x, y, z, _ = rotation * (1, 0, 0, 1)
+        self.assertTrue(math.isclose(0, x, abs_tol=1e-15))
+        self.assertTrue(math.isclose(1, y))
+        self.assertTrue(math.isclose(0, z, abs_tol=1e-15))
+
+    def test_rotation_null_axis(self):
+        with self.assertRaises(ValueError):
+            Hmat44.rotation(1, (0, 0, 0))
+
+    def test_composition_order(self):
+        transform = Hmat44.translation(10, 0, 0) @ Hmat44.scaling(2)
+        self.assertEqual((12, 0, 0, 1), transform * (1, 0, 0, 1))
+
+
+class TestHmatEquality(unittest.TestCase):
+
+    def test_different_dimensions(self):
+        self.assertNotEqual(Hmat33.identity(), Hmat44.identity())
+        self.assertNotEqual(Hmat44.identity(), Hmat33.identity())
+
+    def test_other_objects(self):
+        self.assertNotEqual(Hmat33.identity(), [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        self.assertFalse(Hmat44.identity() == 1)
+
+
+class TestHmat44(unittest.TestCase):
+
+    def setUp(self):
+        self.transform = Hmat44([[0, -1, 0, 1],
+                                 [1, 0, 0, 2],
+                                 [0, 0, 2, 3],
+                                 [0, 0, 0, 1]])
+        self.coords = array('d', [1, 0, 0, 0, 1, 1])
+
+    def test_matmul(self):
+        identity = Hmat44([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+        self.assertEqual(self.transform, self.transform @ identity)
+
+    def test_matmul_composes(self):
+        composed = (self.transform @ self.transform).apply_many(self.coords)
+        twice = self.transform.apply_many(self.transform.apply_many(self.coords))
+        self.assertEqual(list(twice), list(composed))
+
+    def test_mul(self):
+        self.assertEqual((1, 3, 3, 1), self.transform * (1, 0, 0, 1))
+
+    def test_inverse(self):
+        identity = Hmat44([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+        self.assertEqual(identity, self.transform.inverse() @ self.transform)
+
+    def test_apply_many(self):
+        self.assertEqual([1, 3, 3, 0, 2, 5], list(self.transform.apply_many(self.coords)))
+
+    def test_apply_many_vectors(self):
+        self.assertEqual([0, 1, 0, -1, 0, 2], list(self.transform.apply_many(self.coords, vectors=True)))
+
+    def test_apply_many_projective(self):
+        projective = Hmat44([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 1, 1]])
+        self.assertEqual([1, 0, 0, 0, 0.5, 0.5], list(projective.apply_many(self.coords)))
+
+    def test_apply_in_place(self):
+        self.transform.apply_in_place(self.coords)
+        self.assertEqual([1, 3, 3, 0, 2, 5], list(self.coords))
+
+    def test_transform_points(self):
+        result = self.transform.transform_points([Point3D(1, 0, 0), Point3D(0, 1, 1)])
+        self.assertEqual([Point3D(1, 3, 3), Point3D(0, 2, 5)], result.to_list())
+
+
+if __name__ == '__main__':
+    unittest.main()
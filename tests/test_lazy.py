@@ -0,0 +1,183 @@
+"""
+Tests Suite for the lazy Matrix expressions of src.lazy
+
+"""
+
+import unittest
+
+from fractions import Fraction
+from unittest.mock import patch
+
+from numeric.src import lazy as lazy_module
+from numeric.src.backends import register
+from numeric.src.lazy import Expr, MatMul, lazy
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix
+from numeric.tests.test_backends import ListBackend
+
+
+class TestLazy(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Matrix([[1.5, 2.0], [3.0, -4.0]])
+        self.b = Matrix([[0.5, 1.0], [1.0, 0.25]])
+        self.c = Matrix([[2.0, 1.0], [0.0, 3.0]])
+        self.d = Matrix([[1.0, 1.0], [1.0, 1.0]])
+
+    def test_builds_expression(self):
+        expression = lazy(self.a) @ self.b + self.c * 2 - self.d
+        self.assertIsInstance(expression, Expr)
+        self.assertEqual((2, 2), expression.shape)
+
+    def test_same_values_as_eager(self):
+        expression = lazy(self.a) @ self.b + self.c * 2 - self.d
+        eager = self.a @ self.b + self.c * 2 - self.d
+        self.assertEqual(eager._row_lists(), expression.eval()._row_lists())
+
+    def test_operators(self):
+        expression = -(2 * lazy(self.a)) / 4 + self.b - self.c @ lazy(self.d)
+        eager = (self.a * 2).__neg__() / 4 + self.b - self.c @ self.d
+        self.assertEqual(eager._row_lists(), expression.eval()._row_lists())
+
+    def test_matrix_on_the_left(self):
+        self.assertEqual((self.a - self.b)._row_lists(), (self.a - lazy(self.b)).eval()._row_lists())
+        self.assertEqual((self.a @ self.b)._row_lists(), (self.a @ lazy(self.b)).eval()._row_lists())
+
+    def test_element_access(self):
+        expression = lazy(self.a) + self.b
+        self.assertEqual(2.0, expression[0, 0])
+        self.assertEqual(Matrix([[4.0, -3.75]]), expression[1, :])
+
+    def test_operands_not_mutated(self):
+        (-lazy(self.a)).eval()
+        self.assertEqual(1.5, self.a[0, 0])
+
+    def test_cached(self):
+        expression = lazy(self.a) + self.b
+        expression.eval()
+        cached = expression._value
+        expression.eval()
+        self.assertIs(cached, expression._value)
+
+    def test_eval_returns_a_copy(self):
+        expression = lazy(self.a) + self.b
+        result = expression.eval()
+        result[0, 0] = 99.0
+        result += self.b
+        self.assertEqual(2.0, expression.eval()[0, 0])
+        self.assertEqual(2.0, expression[0, 0])
+
+    def test_mutated_view_of_cache_reevaluates(self):
+        expression = lazy(self.a) + self.b
+        view = expression[0:1, :]
+        view[0, 0] = 99.0
+        self.assertEqual(2.0, expression[0, 0])
+
+    def test_mutation_reevaluates(self):
+        expression = lazy(self.a) + self.b
+        self.assertEqual(2.0, expression[0, 0])
+        self.a.transpose()[0, 0] = 0.0
+        self.assertEqual(0.5, expression[0, 0])
+
+    def test_repeated_operand(self):
+        self.assertEqual([[3.0, 4.0], [6.0, -8.0]], (lazy(self.a) + self.a).eval()._row_lists())
+
+    def test_views(self):
+        expression = lazy(self.a.transpose()) + self.a[:, :]
+        self.assertEqual([[3.0, 5.0], [5.0, -8.0]], expression.eval()._row_lists())
+
+    def test_exact(self):
+        f = Matrix([[Fraction(1, 3), 1], [2, Fraction(1, 2)]])
+        result = (lazy(f) * 3 - f / 3).eval()
+        self.assertEqual(Fraction(8, 9), result[0, 0])
+        self.assertEqual(Fraction(4, 3), result[1, 1])
+
+    def test_shapes_checked(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            lazy(self.a) + Matrix([[1.0, 2.0]])
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix([[1.0, 2.0]]).transpose() @ lazy(self.a)
+
+    def test_zero_divisor(self):
+        with self.assertRaises(ZeroDivisionError):
+            lazy(self.a) / 0
+
+    def test_leaf_eval_copies(self):
+        copied = lazy(self.a).eval()
+        copied[0, 0] = 0.0
+        self.assertEqual(1.5, self.a[0, 0])
+
+    def test_shared_product_evaluated_once(self):
+        product = lazy(self.a) @ self.b
+        with patch.object(Matrix, '__matmul__', autospec=True, side_effect=Matrix.__matmul__) as matmul:
+            result = (product + product * 2).eval()
+            _ = (product - self.c)[0, 0]
+        self.assertEqual(1, matmul.call_count)
+        self.assertEqual((self.a @ self.b) * 3, result)
+
+    def test_leaves_collected_once(self):
+        expression = lazy(self.a) @ self.b + self.a
+        self.assertIs(expression._leaf_matrices(), expression._leaf_matrices())
+        self.assertEqual([self.a, self.b], expression.leaves())
+
+    def test_abstract_nodes(self):
+        with self.assertRaises(TypeError):
+            Expr(self.a.shape)
+        with self.assertRaises(TypeError):
+            lazy_module.Elementwise(self.a.shape)
+
+    def test_compiled_once(self):
+        lazy_module._compile.cache_clear()
+        for scalar in (2, 3, 4):
+            (lazy(self.a) * scalar + self.b).eval()
+        self.assertEqual(1, lazy_module._compile.cache_info().misses)
+
+
+class TestLazyChain(unittest.TestCase):
+
+    def setUp(self):
+        self.row = Matrix([[1, 2, 3]])
+        self.square = Matrix([[1, 0, 2], [0, 1, 1], [1, 1, 0]])
+        self.col = Matrix([[1], [-1], [2]])
+
+    def test_factors(self):
+        expression = lazy(self.row) @ self.square @ self.square @ self.col
+        self.assertIsInstance(expression, MatMul)
+        self.assertEqual(4, len(expression.factors()))
+
+    def test_chain_value(self):
+        expression = lazy(self.row) @ self.square @ self.square @ self.col
+        self.assertEqual(self.row @ self.square @ self.square @ self.col, expression.eval())
+
+    def test_chain_order(self):
+        products = []
+        original = Matrix.__matmul__
+
+        def recording(left, right):
+            products.append((left.shape, right.shape))
+            return original(left, right)
+
+        Matrix.__matmul__ = recording
+        try:
+            (lazy(self.square) @ self.square @ self.col).eval()
+        finally:
+            Matrix.__matmul__ = original
+        self.assertEqual([((3, 3), (3, 1)), ((3, 3), (3, 1))], products)
+
+    def test_chain_of_sums(self):
+        expression = (lazy(self.square) + self.square) @ (lazy(self.col) * 2)
+        self.assertEqual((self.square + self.square) @ (self.col * 2), expression.eval())
+
+
+class TestLazyBackend(unittest.TestCase):
+
+    def test_backend_stays_eager(self):
+        lists = ListBackend()
+        register(lists)
+        a = Matrix([[1.0, 2.0], [3.0, 4.0]], backend='lists')
+        result = (lazy(a) + a * 2.0).eval()
+        self.assertEqual(['to_array', 'scale', 'add'], lists.calls)
+        self.assertEqual([[3.0, 6.0], [9.0, 12.0]], result._row_lists())
+
+
+if __name__ == '__main__':
+    unittest.main()
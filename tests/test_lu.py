@@ -0,0 +1,139 @@
+"""
+Tests Suite for the LU decomposition, and Matrix solve / inverse / det
+
+"""
+
+import math
+import unittest
+
+from fractions import Fraction
+
+from numeric.src.lu import LUDecomposition, SingularMatrixError
+from numeric.src.matmul import matmul
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix
+
+
+class TestLUDecomposition(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [[2, 1, 1], [4, -6, 0], [-2, 7, 2]]
+        self.lu = LUDecomposition(self.rows)
+
+    def test_size(self):
+        self.assertEqual(3, self.lu.size)
+
+    def test_rows_not_mutated(self):
+        self.assertEqual([[2, 1, 1], [4, -6, 0], [-2, 7, 2]], self.rows)
+
+    def test_pa_equals_lu(self):
+        permuted = [self.rows[row] for row in self.lu.permutation]
+        self.assertEqual(Matrix(permuted), Matrix(matmul(self.lu.lower, self.lu.upper)))
+
+    def test_lower_unit_diagonal(self):
+        self.assertEqual([1, 1, 1], [row[idx] for idx, row in enumerate(self.lu.lower)])
+
+    def test_partial_pivoting(self):
+        self.assertEqual(1, self.lu.permutation[0])
+
+    def test_det(self):
+        self.assertTrue(math.isclose(-16, self.lu.det()))
+
+    def test_solve(self):
+        for expected, actual in zip([1, 1, 2], self.lu.solve([5, -2, 9])):
+            self.assertTrue(math.isclose(expected, actual))
+
+    def test_solve_wrong_size(self):
+        with self.assertRaises(ValueError):
+            self.lu.solve([1, 2])
+
+    def test_singular(self):
+        lu = LUDecomposition([[1, 2], [2, 4]])
+        self.assertTrue(lu.singular)
+        self.assertEqual(0, lu.det())
+
+    def test_singular_solve(self):
+        with self.assertRaises(SingularMatrixError):
+            LUDecomposition([[1, 2], [2, 4]]).solve([1, 1])
+
+    def test_fractions_stay_exact(self):
+        lu = LUDecomposition([[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), Fraction(1, 5)]])
+        self.assertEqual(Fraction(1, 60), lu.det())
+        self.assertEqual([[12, -20], [-15, 30]], lu.inverse())
+
+
+class TestMatrixSolve(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Matrix([[2, 1, 1], [4, -6, 0], [-2, 7, 2]])
+
+    def test_det(self):
+        self.assertTrue(math.isclose(-16, self.a.det()))
+
+    def test_det_identity(self):
+        self.assertEqual(1, Matrix.identity((4, 4)).det())
+
+    def test_solve_list(self):
+        actual = self.a.solve([5, -2, 9])
+        self.assertIsInstance(actual, list)
+        self.assertEqual(Matrix([[1, 1, 2]]), Matrix([actual]))
+
+    def test_solve_column(self):
+        actual = self.a.solve(Matrix([[5], [-2], [9]]))
+        self.assertEqual(Matrix([[1], [1], [2]]), actual)
+
+    def test_solve_wrong_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            self.a.solve(Matrix([[5, -2, 9]]))
+
+    def test_solve_many(self):
+        rhss = Matrix([[5, 4], [-2, -2], [9, 5]])
+        self.assertEqual(rhss, self.a @ self.a.solve_many(rhss))
+
+    def test_solve_many_shape(self):
+        rhss = Matrix([[5, 4], [-2, -2], [9, 5]])
+        self.assertEqual((3, 2), self.a.solve_many(rhss).shape)
+
+    def test_inverse(self):
+        self.assertEqual(Matrix.identity((3, 3)), self.a @ self.a.inverse())
+
+    def test_inverse_singular(self):
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2], [2, 4]]).inverse()
+
+    def test_not_square(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix([[1, 2, 3], [4, 5, 6]]).det()
+
+    # ------ CACHED FACTORS --------------------------------------------
+
+    def test_lu_cached(self):
+        self.assertIs(self.a.lu(), self.a.lu())
+
+    def test_lu_invalidated_by_setitem(self):
+        prior = self.a.lu()
+        self.a[0, 0] = 3
+        self.assertIsNot(prior, self.a.lu())
+        self.assertTrue(math.isclose(-28, self.a.det()))
+
+    def test_lu_invalidated_by_iadd(self):
+        prior = self.a.lu()
+        self.a += Matrix.identity((3, 3))
+        self.assertIsNot(prior, self.a.lu())
+
+    def test_lu_invalidated_by_imul(self):
+        self.a.det()
+        self.a *= 2
+        self.assertTrue(math.isclose(-128, self.a.det()))
+
+    def test_lu_invalidated_by_neg(self):
+        self.a.det()
+        _ = -self.a
+        self.assertTrue(math.isclose(16, self.a.det()))
+
+    def test_lu_not_shared_with_clone(self):
+        self.a.lu()
+        self.assertIsNot(self.a.lu(), self.a.clone().lu())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Tests Suite for the binary matrix files of src.matfile, and Matrix.save / Matrix.load
+
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+
+from fractions import Fraction
+
+from numeric.src import matfile
+from numeric.src.matfile import HEADER, MappedStorage, read_header
+from numeric.src.matrix import Matrix
+
+
+class MatrixFileCase(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'matrix.bin')
+        self.floats = Matrix([[1.5, 2.0, -3.0], [4.0, 5.25, 6.0]])
+        self.ints = Matrix([[1, -2], [2 ** 62, 4]])
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+
+class TestFormat(MatrixFileCase):
+
+    def test_header(self):
+        self.floats.save(self.path)
+        self.assertEqual(('d', 'C', 2, 3), read_header(self.path))
+        self.assertEqual(HEADER.size + 6 * 8, os.path.getsize(self.path))
+
+    def test_payload_little_endian(self):
+        Matrix([[1, 258]]).save(self.path)
+        with open(self.path, 'rb') as file:
+            file.seek(HEADER.size)
+            self.assertEqual(struct.pack('<2q', 1, 258), file.read())
+
+    def test_dtype_int64(self):
+        self.ints.save(self.path)
+        self.assertEqual('q', read_header(self.path).dtype)
+
+    def test_dtype_mixed(self):
+        Matrix([[1, 2.5]]).save(self.path)
+        self.assertEqual('d', read_header(self.path).dtype)
+
+    def test_lossy_refused(self):
+        for matrix in (Matrix([[Fraction(1, 3)]]), Matrix([[2 ** 63]]), Matrix([[2 ** 60, 0.5]])):
+            with self.assertRaises(ValueError):
+                matrix.save(self.path)
+
+    def test_lossy_explicit(self):
+        Matrix([[Fraction(1, 4), 2]]).save(self.path, dtype='d')
+        self.assertEqual([[0.25, 2.0]], Matrix.load(self.path)._row_lists())
+
+    def test_not_a_matrix_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'x' * 64)
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path)
+
+    def test_truncated(self):
+        self.floats.save(self.path)
+        with open(self.path, 'r+b') as file:
+            file.truncate(HEADER.size + 8)
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path, mmap=True)
+
+    def test_bad_layout(self):
+        with self.assertRaises(ValueError):
+            self.floats.save(self.path, layout='X')
+
+
+class TestLoad(MatrixFileCase):
+
+    def test_round_trip(self):
+        for matrix in (self.floats, self.ints):
+            matrix.save(self.path)
+            loaded = Matrix.load(self.path)
+            self.assertEqual(matrix._row_lists(), loaded._row_lists())
+            self.assertIsInstance(loaded._data, list)
+
+    def test_round_trip_types(self):
+        self.ints.save(self.path)
+        self.assertIsInstance(Matrix.load(self.path)[1, 0], int)
+
+    def test_layout_f(self):
+        self.floats.save(self.path, layout='F')
+        self.assertEqual('F', read_header(self.path).layout)
+        for mmap in (False, True):
+            self.assertEqual(self.floats._row_lists(), Matrix.load(self.path, mmap=mmap)._row_lists())
+
+    def test_save_view(self):
+        self.floats[:, 1:].transpose().save(self.path)
+        self.assertEqual([[2.0, 5.25], [-3.0, 6.0]], Matrix.load(self.path)._row_lists())
+
+    def test_backend(self):
+        self.floats.save(self.path)
+        self.assertEqual('python', Matrix.load(self.path, backend='python').backend)
+
+
+@unittest.skipUnless(matfile.MAPPABLE, 'matrix files are mapped on little-endian hosts only')
+class TestMappedLoad(MatrixFileCase):
+
+    def test_storage(self):
+        self.floats.save(self.path)
+        loaded = Matrix.load(self.path, mmap=True)
+        self.assertIsInstance(loaded._data, MappedStorage)
+        self.assertEqual(self.floats._row_lists(), loaded._row_lists())
+        self.assertEqual(-3.0, loaded[0, 2])
+
+    def test_operations(self):
+        self.floats.save(self.path)
+        loaded = Matrix.load(self.path, mmap=True)
+        self.assertEqual(self.floats @ self.floats.transpose(), loaded @ loaded.transpose())
+        self.assertEqual(self.floats + self.floats, loaded + loaded)
+        self.assertEqual(self.floats.get_col(1), loaded.get_col(1))
+
+    def test_read_only(self):
+        self.floats.save(self.path)
+        loaded = Matrix.load(self.path, mmap=True)
+        with self.assertRaises(TypeError):
+            loaded[0, 0] = 1.0
+
+    def test_write_through(self):
+        self.ints.save(self.path)
+        loaded = Matrix.load(self.path, mmap=True, mode='r+')
+        loaded[0, 0] = 10
+        loaded[1, :] = 0
+        loaded._data.flush()
+        loaded._data.close()
+        self.assertEqual([[10, -2], [0, 0]], Matrix.load(self.path)._row_lists())
+
+    def test_int_map_only_stores_ints(self):
+        self.ints.save(self.path)
+        loaded = Matrix.load(self.path, mmap=True, mode='c')
+        with self.assertRaisesRegex(TypeError, 'int64 matrix file only stores ints'):
+            loaded[0, 0] = 1.5
+        with self.assertRaisesRegex(TypeError, 'int64 matrix file only stores ints'):
+            loaded[0, :] = Matrix([[1, 2.5]])
+        with self.assertRaisesRegex(TypeError, 'int64 matrix file only stores ints'):
+            loaded *= 2.5
+        self.assertEqual(self.ints._row_lists(), loaded._row_lists())
+        loaded += Matrix([[1, 1], [1, 1]])
+        self.assertEqual([[2, -1], [2 ** 62 + 1, 5]], loaded._row_lists())
+
+    def test_copy_on_write(self):
+        self.floats.save(self.path)
+        loaded = Matrix.load(self.path, mmap=True, mode='c')
+        loaded[0, 0] = 0.0
+        self.assertEqual(0.0, loaded[0, 0])
+        loaded._data.close()
+        self.assertEqual(1.5, Matrix.load(self.path)[0, 0])
+
+    def test_mutation_invalidates_lu(self):
+        Matrix([[2.0, 1.0], [1.0, 3.0]]).save(self.path)
+        loaded = Matrix.load(self.path, mmap=True, mode='c')
+        self.assertAlmostEqual(5.0, loaded.det())
+        loaded[1, 1] = 1.0
+        self.assertAlmostEqual(1.0, loaded.det())
+
+    def test_copy_detaches(self):
+        self.floats.save(self.path)
+        copied = Matrix.load(self.path, mmap=True).copy()
+        self.assertIsInstance(copied._data, list)
+
+    def test_unknown_mode(self):
+        self.floats.save(self.path)
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path, mmap=True, mode='w')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests Suite for the matmul kernels
+
+"""
+
+import random
+import unittest
+
+from fractions import Fraction
+
+from numeric.src.matmul import (STRATEGIES, choose_strategy, matmul, matmul_blocked,
+                                matmul_naive, matmul_rows, matmul_transposed, power)
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix
+
+
+class TestMatmulKernels(unittest.TestCase):
+
+    def setUp(self):
+        self.a = [[1, 2, 3], [4, 5, 6]]
+        self.b = [[7, 8], [9, 10], [11, 12]]
+        self.expected = [[58, 64], [139, 154]]
+
+    def test_naive(self):
+        self.assertEqual(self.expected, matmul_naive(self.a, self.b))
+
+    def test_transposed(self):
+        self.assertEqual(self.expected, matmul_transposed(self.a, self.b))
+
+    def test_blocked(self):
+        self.assertEqual(self.expected, matmul_blocked(self.a, self.b))
+
+    def test_blocked_small_blocks(self):
+        self.assertEqual(self.expected, matmul_blocked(self.a, self.b, block_size=1))
+
+    def test_blocked_uneven_tiles(self):
+        a = [[random.randint(-9, 9) for _ in range(7)] for _ in range(11)]
+        b = [[random.randint(-9, 9) for _ in range(5)] for _ in range(7)]
+        self.assertEqual(matmul_naive(a, b), matmul_blocked(a, b, block_size=3))
+
+    def test_fractions_stay_exact(self):
+        a = [[Fraction(1, 3), Fraction(2, 3)]]
+        b = [[Fraction(3, 4)], [Fraction(1, 4)]]
+        for kernel in STRATEGIES.values():
+            self.assertEqual([[Fraction(5, 12)]], kernel(a, b))
+
+    def test_auto(self):
+        self.assertEqual(self.expected, matmul(self.a, self.b))
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            matmul(self.a, self.b, 'strassen')
+
+    def test_matmul_rows(self):
+        self.assertEqual(self.expected, list(matmul_rows(iter(self.a), self.b)))
+
+    def test_choose_strategy_small(self):
+        self.assertEqual('transposed', choose_strategy(4, 4, 4))
+
+    def test_choose_strategy_large(self):
+        self.assertEqual('blocked', choose_strategy(512, 512, 512))
+
+
+class TestPower(unittest.TestCase):
+
+    def test_integers(self):
+        for exponent in range(1, 40):
+            self.assertEqual(3 ** exponent, power(3, exponent, lambda a, b: a * b))
+
+    def test_number_of_products(self):
+        products = []
+
+        def multiply(a, b):
+            products.append((a, b))
+            return a + b
+
+        self.assertEqual(1000, power(1, 1000, multiply))
+        self.assertEqual(9 + 5, len(products))
+
+    def test_square(self):
+        squares = []
+
+        def square(a):
+            squares.append(a)
+            return a * a
+
+        self.assertEqual(2 ** 20, power(2, 20, lambda a, b: a * b, square))
+        self.assertEqual(4, len(squares))
+
+    def test_rows(self):
+        fibonacci = [[1, 1], [1, 0]]
+        self.assertEqual([[89, 55], [55, 34]], power(fibonacci, 10, matmul))
+
+    def test_first_power_is_base(self):
+        base = [[1, 2], [3, 4]]
+        self.assertIs(base, power(base, 1, matmul))
+
+    def test_not_positive(self):
+        with self.assertRaises(ValueError):
+            power([[1]], 0, matmul)
+
+
+class TestMatrixMatmulStrategies(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Matrix([[random.random() for _ in range(9)] for _ in range(13)])
+        self.b = Matrix([[random.random() for _ in range(6)] for _ in range(9)])
+
+    def test_strategies_agree(self):
+        expected = self.a.matmul(self.b, 'naive')
+        for strategy in STRATEGIES:
+            self.assertEqual(expected, self.a.matmul(self.b, strategy))
+
+    def test_matmul_operator(self):
+        self.assertEqual(self.a.matmul(self.b, 'naive'), self.a @ self.b)
+
+    def test_matmul_shape(self):
+        self.assertEqual((13, 6), self.a.matmul(self.b).shape)
+
+    def test_matmul_incompatible_shapes(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            self.b.matmul(self.b)
+
+    def test_matmul_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            self.a.matmul(self.b, 'strassen')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Tests Suite for the flat storage of src.matrix.Matrix, its views, and slice indexing
+
+"""
+
+import unittest
+
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix, MatrixIndexError, Shape
+
+
+class TestFlatStorage(unittest.TestCase):
+
+    def setUp(self):
+        self._2x3 = Matrix([[1, 2, 3], [4, 5, 6]])
+
+    def test_storage_is_flat(self):
+        self.assertEqual([1, 2, 3, 4, 5, 6], self._2x3._data)
+
+    def test_strides(self):
+        self.assertEqual((3, 1), self._2x3._strides)
+
+    def test_getitem(self):
+        self.assertEqual(6, self._2x3[1, 2])
+
+    def test_getitem_negative(self):
+        self.assertEqual(4, self._2x3[-1, -3])
+
+    def test_in_place_keeps_storage(self):
+        storage = self._2x3._data
+        self._2x3 *= 2
+        self.assertIs(storage, self._2x3._data)
+        self.assertEqual([2, 4, 6, 8, 10, 12], storage)
+
+    def test_clone_is_contiguous(self):
+        clone = self._2x3.T().clone()
+        self.assertEqual([1, 4, 2, 5, 3, 6], clone._data)
+
+
+class TestTransposeView(unittest.TestCase):
+
+    def setUp(self):
+        self._2x3 = Matrix([[1, 2, 3], [4, 5, 6]])
+        self.transposed = self._2x3.transpose()
+
+    def test_shares_storage(self):
+        self.assertIs(self._2x3._data, self.transposed._data)
+
+    def test_strides_swapped(self):
+        self.assertEqual((1, 3), self.transposed._strides)
+
+    def test_values(self):
+        self.assertEqual(Matrix([[1, 4], [2, 5], [3, 6]]), self.transposed)
+
+    def test_write_through(self):
+        self.transposed[2, 0] = 42
+        self.assertEqual(42, self._2x3[0, 2])
+
+    def test_parent_write_seen(self):
+        self._2x3[1, 0] = 42
+        self.assertEqual(42, self.transposed[0, 1])
+
+    def test_in_place_op_on_view(self):
+        self.transposed += Matrix([[1, 1], [1, 1], [1, 1]])
+        self.assertEqual(Matrix([[2, 3, 4], [5, 6, 7]]), self._2x3)
+
+    def test_neg_on_view(self):
+        _ = -self.transposed
+        self.assertEqual(Matrix([[-1, -2, -3], [-4, -5, -6]]), self._2x3)
+
+    def test_go_and_back_strides(self):
+        self.assertEqual((3, 1), self.transposed.T()._strides)
+
+    def test_matmul_with_view(self):
+        self.assertEqual(Matrix([[14, 32], [32, 77]]), self._2x3 @ self.transposed)
+
+    def test_lu_invalidated_by_view_write(self):
+        a = Matrix([[4, 3], [6, 3]])
+        self.assertEqual(-6, a.det(exact=False))
+        a.T()[1, 0] = 0
+        self.assertEqual(12, a.det(exact=False))
+
+
+class TestRowColViews(unittest.TestCase):
+
+    def setUp(self):
+        self._3x3 = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+
+    def test_get_row_shares_storage(self):
+        self.assertIs(self._3x3._data, self._3x3.get_row(1)._data)
+
+    def test_get_row_write_through(self):
+        self._3x3.get_row(1)[0, 2] = 42
+        self.assertEqual(42, self._3x3[1, 2])
+
+    def test_get_col_shares_storage(self):
+        self.assertIs(self._3x3._data, self._3x3.get_col(1)._data)
+
+    def test_get_col_write_through(self):
+        self._3x3.get_col(-1)[0, 1] = 42
+        self.assertEqual(42, self._3x3[1, 2])
+
+    def test_get_col_of_transposed(self):
+        self.assertEqual(Matrix([[4, 5, 6]]), self._3x3.T().get_col(1))
+
+    def test_get_row_of_transposed(self):
+        self.assertEqual(Matrix([[2, 5, 8]]), self._3x3.T().get_row(1))
+
+    def test_get_col_scaled_in_place(self):
+        col = self._3x3.get_col(0)
+        col *= 10
+        self.assertEqual(Matrix([[10, 2, 3], [40, 5, 6], [70, 8, 9]]), self._3x3)
+
+    def test_view_index_out_of_range(self):
+        with self.assertRaises(MatrixIndexError):
+            _ = self._3x3.get_row(0)[1, 0]
+
+
+class TestSliceViews(unittest.TestCase):
+
+    def setUp(self):
+        self._3x4 = Matrix([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])
+
+    def test_rows_slice(self):
+        self.assertEqual(Matrix([[5, 6, 7, 8], [9, 10, 11, 12]]), self._3x4[1:3, :])
+
+    def test_col_slice_shape(self):
+        self.assertEqual(Shape(rows=3, cols=1), self._3x4[:, 2].shape)
+
+    def test_col_slice(self):
+        self.assertEqual(Matrix([[3], [7], [11]]), self._3x4[:, 2])
+
+    def test_row_slice_shape(self):
+        self.assertEqual(Shape(rows=1, cols=4), self._3x4[1, :].shape)
+
+    def test_block(self):
+        self.assertEqual(Matrix([[6, 7], [10, 11]]), self._3x4[1:, 1:3])
+
+    def test_steps(self):
+        self.assertEqual(Matrix([[1, 3], [9, 11]]), self._3x4[::2, ::2])
+
+    def test_negative_steps(self):
+        self.assertEqual(Matrix([[12, 11, 10, 9], [4, 3, 2, 1]]), self._3x4[::-2, ::-1])
+
+    def test_negative_step_write_through(self):
+        self._3x4[::-1, ::-1][0, 0] = 42
+        self.assertEqual(42, self._3x4[2, 3])
+
+    def test_shares_storage(self):
+        self.assertIs(self._3x4._data, self._3x4[1:3, 1:3]._data)
+
+    def test_view_of_view(self):
+        self.assertEqual(Matrix([[10]]), self._3x4[1:, 1:][1:, :1])
+
+    def test_view_of_transposed(self):
+        self.assertEqual(Matrix([[2, 6], [3, 7]]), self._3x4.T()[1:3, :2])
+
+    def test_write_through(self):
+        self._3x4[1:, 2:][0, 1] = 42
+        self.assertEqual(42, self._3x4[1, 3])
+
+    def test_row_operation_in_place(self):
+        row = self._3x4[1, :]
+        row -= self._3x4[0, :] * 5
+        self.assertEqual(Matrix([[0, -4, -8, -12]]), self._3x4[1, :])
+
+    def test_empty_selection(self):
+        with self.assertRaises(MatrixIndexError):
+            _ = self._3x4[2:1, :]
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(MatrixIndexError):
+            _ = self._3x4[3, :]
+
+    def test_setitem_block(self):
+        self._3x4[:2, 2:] = Matrix([[0, 0], [0, 0]])
+        self.assertEqual(Matrix([[1, 2, 0, 0], [5, 6, 0, 0], [9, 10, 11, 12]]), self._3x4)
+
+    def test_setitem_scalar(self):
+        self._3x4[:, 0] = 0
+        self.assertEqual(Matrix([[0], [0], [0]]), self._3x4[:, 0])
+
+    def test_setitem_overlapping(self):
+        self._3x4[1:, :] = self._3x4[:2, :]
+        self.assertEqual(Matrix([[1, 2, 3, 4], [1, 2, 3, 4], [5, 6, 7, 8]]), self._3x4)
+
+    def test_setitem_wrong_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            self._3x4[:2, :2] = Matrix([[1, 2, 3]])
+
+    def test_setitem_invalidates_lu(self):
+        a = Matrix([[4, 3], [6, 3]])
+        self.assertEqual(-6, a.det(exact=False))
+        a[1, :] = Matrix([[0, 3]])
+        self.assertEqual(12, a.det(exact=False))
+
+    def test_copy_detaches(self):
+        block = self._3x4[:2, :2].copy()
+        block[0, 0] = 42
+        self.assertEqual(1, self._3x4[0, 0])
+
+    def test_copy_owns_contiguous_storage(self):
+        self.assertEqual([2, 4, 10, 12], self._3x4[::2, 1::2].copy()._data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Tests Suite for ParallelBackend
+
+"""
+
+import random
+import unittest
+
+from fractions import Fraction
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import patch
+
+from numeric.src.backends import Backend, get_backend
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix
+from numeric.src import parallel
+from numeric.src.parallel import ParallelBackend
+
+
+def random_matrix(rows, cols):
+    return Matrix([[random.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)])
+
+
+class TestParallelBackend(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.backend = ParallelBackend(workers=2, matmul_threshold=0, elementwise_threshold=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.backend.close()
+
+    def setUp(self):
+        random.seed(3)
+        self.a = random_matrix(13, 7)
+        self.b = random_matrix(7, 5)
+        self.c = random_matrix(13, 7)
+
+    def parallel(self, matrix):
+        copy = matrix.clone()
+        copy.backend = self.backend
+        return copy
+
+    def test_is_a_backend(self):
+        self.assertIsInstance(self.backend, Backend)
+        self.assertIsInstance(get_backend('parallel'), ParallelBackend)
+
+    def test_matmul(self):
+        product = self.parallel(self.a) @ self.b
+        self.assertEqual((self.a @ self.b)._row_lists(), product._row_lists())
+        self.assertIsNotNone(self.backend._executor)
+
+    def test_matmul_views(self):
+        a, b = self.c.transpose(), self.a[:, ::2]
+        a.backend = self.backend
+        self.assertEqual((self.c.transpose() @ b)._row_lists(), (a @ b)._row_lists())
+
+    def test_matmul_single_row(self):
+        a = self.parallel(self.a[3:4, :])
+        self.assertEqual((self.a[3:4, :] @ self.b)._row_lists(), (a @ self.b)._row_lists())
+
+    def test_chained_operations_stay_on_backend(self):
+        result = (self.parallel(self.a) + self.c) @ self.b
+        self.assertIs(self.backend, result._array_backend)
+        self.assertEqual(((self.a + self.c) @ self.b)._row_lists(), result._row_lists())
+
+    def test_add(self):
+        self.assertEqual((self.a + self.c)._row_lists(), (self.parallel(self.a) + self.c)._row_lists())
+
+    def test_sub(self):
+        self.assertEqual((self.a - self.c)._row_lists(), (self.parallel(self.a) - self.c)._row_lists())
+
+    def test_mul(self):
+        self.assertEqual((self.a * 2.5)._row_lists(), (self.parallel(self.a) * 2.5)._row_lists())
+
+    def test_eq(self):
+        self.assertEqual(self.a, self.parallel(self.a))
+        self.assertNotEqual(self.c, self.parallel(self.a))
+
+    def test_add_incompatible(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            self.parallel(self.a) + self.b
+
+    def test_exact_stays_serial(self):
+        a = Matrix([[1, Fraction(1, 3)], [2, 5]], backend=self.backend)
+        result = a @ a
+        self.assertEqual((a.clone() @ a.clone())._row_lists(), result._row_lists())
+        self.assertIsInstance(result[0, 1], Fraction)
+        self.assertIsInstance((a + a)[1, 1], int)
+
+    def test_mul_exact_scalar_stays_serial(self):
+        self.assertIsInstance((self.parallel(self.a) * Fraction(1, 2))[0, 0], float)
+
+    def test_threshold(self):
+        backend = ParallelBackend(workers=2)
+        a = self.a.clone()
+        a.backend = backend
+        self.assertEqual((self.a @ self.b)._row_lists(), (a @ self.b)._row_lists())
+        self.assertEqual((self.a + self.c)._row_lists(), (a + self.c)._row_lists())
+        self.assertIsNone(backend._executor)
+
+    def test_failed_share_releases_blocks(self):
+        created = []
+
+        def second_fails(*args, **kwargs):
+            if created:
+                raise OSError('no space left on /dev/shm')
+            created.append(SharedMemory(*args, **kwargs))
+            return created[-1]
+
+        with patch.object(parallel, 'SharedMemory', side_effect=second_fails):
+            with self.assertRaises(OSError):
+                self.parallel(self.a) @ self.b
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=created[0].name)
+
+    def test_ranges(self):
+        self.assertEqual([(0, 2), (2, 5)], self.backend._ranges(5))
+        self.assertEqual([(0, 1)], self.backend._ranges(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests Suite for TransformPipeline
+
+"""
+
+import unittest
+
+from array import array
+
+from numeric.src.hommat import Hmat33
+from numeric.src.pipeline import TransformPipeline
+from numeric.src.pointarray import PointArray
+from numeric.src.vector import Point2D
+
+
+class TestTransformPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = TransformPipeline()
+        self.pipeline.append(Hmat33.scaling(2), name='model')
+        self.pipeline.append(Hmat33.translation(10, 0), name='world')
+        self.pipeline.append(Hmat33.scaling(1, -1), name='canvas')
+        self.coords = array('d', [1, 1, 0, 2])
+
+    def test_len(self):
+        self.assertEqual(3, len(self.pipeline))
+
+    def test_empty_is_identity(self):
+        self.assertEqual(Hmat33.identity(), TransformPipeline().fused)
+
+    def test_stages_applied_in_order(self):
+        self.assertEqual([12, -2, 10, -4], list(self.pipeline.apply_many(self.coords)))
+
+    def test_matches_stage_by_stage(self):
+        coords = self.coords
+        for idx in range(len(self.pipeline)):
+            coords = self.pipeline[idx].apply_many(coords)
+        self.assertEqual(list(coords), list(self.pipeline.apply_many(self.coords)))
+
+    def test_fused_cached(self):
+        self.assertIs(self.pipeline.fused, self.pipeline.fused)
+
+    def test_setitem_by_name_invalidates(self):
+        prior = self.pipeline.fused
+        self.pipeline['model'] = Hmat33.identity()
+        self.assertIsNot(prior, self.pipeline.fused)
+        self.assertEqual([11, -1, 10, -2], list(self.pipeline.apply_many(self.coords)))
+
+    def test_setitem_by_index(self):
+        self.pipeline[-1] = Hmat33.identity()
+        self.assertEqual([12, 2, 10, 4], list(self.pipeline.apply_many(self.coords)))
+
+    def test_append_invalidates(self):
+        self.pipeline.fused
+        self.pipeline.append(Hmat33.translation(0, 1))
+        self.assertEqual([12, -1, 10, -3], list(self.pipeline.apply_many(self.coords)))
+
+    def test_delitem_invalidates(self):
+        self.pipeline.fused
+        del self.pipeline['world']
+        self.assertEqual([2, -2, 0, -4], list(self.pipeline.apply_many(self.coords)))
+
+    def test_getitem_unknown_name(self):
+        with self.assertRaises(KeyError):
+            _ = self.pipeline['screen']
+
+    def test_getitem_out_of_range(self):
+        with self.assertRaises(IndexError):
+            _ = self.pipeline[3]
+
+    def test_duplicate_name(self):
+        with self.assertRaises(ValueError):
+            self.pipeline.append(Hmat33.identity(), name='model')
+
+    def test_stage_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self.pipeline.append([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+    def test_apply_in_place(self):
+        self.pipeline.apply_in_place(self.coords)
+        self.assertEqual([12, -2, 10, -4], list(self.coords))
+
+    def test_transform_points(self):
+        result = self.pipeline.transform_points([Point2D(1, 1), Point2D(0, 2)])
+        self.assertEqual(PointArray([12, -2, 10, -4]), result)
+
+    def test_str(self):
+        self.assertEqual('model -> world -> canvas', str(self.pipeline))
+
+
+if __name__ == '__main__':
+    unittest.main()
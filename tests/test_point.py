@@ -9,7 +9,7 @@ import unittest
 from contextlib import redirect_stdout
 from io import StringIO
 
-from numeric.src.vector import Point, Point2D, Vector, Vector2D
+from numeric.src.vector import Point, Point2D, Point3D, Vector, Vector2D, Vector3D
 
 
 class TestPoint(unittest.TestCase):
@@ -597,5 +597,58 @@ class TestPoint2DVector2DInteraction(unittest.TestCase):
         self.assertEqual(expected, str(e.exception))
 
 
+class TestPoint3DVector3DInteraction(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(Point3D(1, 2, 3), '__dict__'))
+
+    def test_no_coords_slot(self):
+        self.assertEqual(object.__basicsize__ + 3 * 8, Point3D.__basicsize__)
+        self.assertIsInstance(Point3D(1, 2, 3), Point)
+
+    def test_is_point(self):
+        self.assertIsInstance(Point3D(1, 2, 3), Point)
+
+    def test_sub_Point3D_from_Point3D(self):
+        actual = Point3D(1, 2, 3) - Point3D(1, 1, 1)
+        self.assertEqual(Vector3D(0, 1, 2), actual)
+        self.assertIsInstance(actual, Vector3D)
+
+    def test_sub_Vector3D_from_Point3D(self):
+        actual = Point3D(1, 2, 3) - Vector3D(1, 1, 1)
+        self.assertEqual(Point3D(0, 1, 2), actual)
+        self.assertIsInstance(actual, Point3D)
+
+    def test_add_Point3D_w_Vector3D(self):
+        self.assertEqual(Point3D(2, 3, 4), Point3D(1, 2, 3) + Vector3D(1, 1, 1))
+
+    def test_add_Vector3D_w_Point3D(self):
+        actual = Vector3D(1, 1, 1) + Point3D(1, 2, 3)
+        self.assertEqual(Point3D(2, 3, 4), actual)
+        self.assertIsInstance(actual, Point3D)
+
+    def test_add_Point3D_w_Point3D(self):
+        with self.assertRaises(TypeError) as e:
+            _ = Point3D(1, 2, 3) + Point3D(1, 2, 3)
+        self.assertEqual("cannot add two Point", str(e.exception))
+
+    def test_iadd_Point3D_w_Vector3D_same_instance(self):
+        actual = Point3D(1, 2, 3)
+        prior = actual
+        actual += Vector3D(1, 1, 1)
+        self.assertIs(prior, actual)
+        self.assertEqual(Point3D(2, 3, 4), actual)
+
+    def test_isub_Point3D_from_Point3D(self):
+        p0 = Point3D(1, 2, 3)
+        with self.assertRaises(TypeError) as e:
+            p0 -= Point3D(1, 2, 3)
+        self.assertEqual("Can only mutate a Vector or a Point by subtracting a Vector", str(e.exception))
+
+    def test_sub_Vector3D_from_Point2D(self):
+        with self.assertRaises(ValueError):
+            _ = Point2D(1, 2) - Vector3D(1, 2, 3)
+
+
 if __name__ == '__main__':
     unittest.main()
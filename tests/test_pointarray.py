@@ -0,0 +1,226 @@
+"""
+Tests Suite for PointArray and VectorArray
+
+"""
+
+import math
+import unittest
+
+from numeric.src.pointarray import PointArray, PointView, VectorArray, VectorView
+from numeric.src.vector import Point, Point2D, Point3D, Vector, Vector2D
+
+
+class TestPointArray(unittest.TestCase):
+
+    def setUp(self):
+        self.points = PointArray([1, 2, 3, 4, -5, 6])
+        self.others = PointArray([0, 0, 1, 1, 2, 2])
+
+    def test_instance(self):
+        self.assertIsInstance(self.points, PointArray)
+
+    def test_len(self):
+        self.assertEqual(len(self.points), 3)
+
+    def test_dim(self):
+        self.assertEqual(PointArray([1, 2, 3, 4, 5, 6], dim=3).dim, 3)
+
+    def test_coords_not_multiple_of_dim(self):
+        with self.assertRaises(ValueError):
+            PointArray([1, 2, 3], dim=2)
+
+    def test_copy_of_seq_passed(self):
+        seq = [1.0, 2.0]
+        points = PointArray(seq)
+        seq[0] = 42
+        self.assertEqual(points[0].x, 1.0)
+
+    def test_from_elements(self):
+        expected = PointArray([1, 2, 3, 4])
+        actual = PointArray.from_elements([Point2D(1, 2), Point2D(3, 4)])
+        self.assertEqual(expected, actual)
+
+    def test_from_elements_mismatched_sizes(self):
+        with self.assertRaises(ValueError):
+            PointArray.from_elements([Point2D(1, 2), Point(3, 4, 5)])
+
+    def test_zeros(self):
+        self.assertEqual(PointArray.zeros(2, dim=3), PointArray([0, 0, 0, 0, 0, 0], dim=3))
+
+    def test_getitem_view(self):
+        self.assertIsInstance(self.points[0], PointView)
+
+    def test_getitem_values(self):
+        view = self.points[1]
+        self.assertEqual((view.x, view.y), (3, 4))
+
+    def test_getitem_negative(self):
+        self.assertEqual(self.points[-1].clone(), Point2D(-5, 6))
+
+    def test_getitem_out_of_range(self):
+        with self.assertRaises(IndexError):
+            _ = self.points[3]
+
+    def test_view_writes_through(self):
+        self.points[2].y = 42
+        self.assertEqual(self.points.coords[5], 42)
+
+    def test_view_clone_type_2d(self):
+        self.assertIsInstance(self.points[0].clone(), Point2D)
+
+    def test_view_clone_type_3d(self):
+        self.assertIsInstance(PointArray([1, 2, 3], dim=3)[0].clone(), Point3D)
+
+    def test_view_clone_type_nd(self):
+        self.assertIsInstance(PointArray([1, 2, 3, 4], dim=4)[0].clone(), Point)
+
+    def test_iter(self):
+        expected = [Point2D(1, 2), Point2D(3, 4), Point2D(-5, 6)]
+        self.assertEqual(expected, [view.clone() for view in self.points])
+
+    def test_to_list(self):
+        expected = [Point2D(1, 2), Point2D(3, 4), Point2D(-5, 6)]
+        self.assertEqual(expected, self.points.to_list())
+
+    def test_clone_not_same_buffer(self):
+        clone = self.points.clone()
+        clone[0].x = 42
+        self.assertEqual(self.points[0].x, 1)
+
+    def test_sub_point_array(self):
+        expected = VectorArray([1, 2, 2, 3, -7, 4])
+        self.assertEqual(expected, self.points - self.others)
+
+    def test_sub_point_array_instance(self):
+        self.assertIsInstance(self.points - self.others, VectorArray)
+
+    def test_sub_vector_array(self):
+        expected = PointArray([0, 1, 2, 3, -6, 5])
+        self.assertEqual(expected, self.points - VectorArray([1, 1, 1, 1, 1, 1]))
+
+    def test_sub_single_point(self):
+        expected = VectorArray([0, 0, 2, 2, -6, 4])
+        self.assertEqual(expected, self.points - Point2D(1, 2))
+
+    def test_sub_wrong_type(self):
+        with self.assertRaises(TypeError):
+            _ = self.points - 3
+
+    def test_add_vector_array(self):
+        expected = PointArray([2, 3, 4, 5, -4, 7])
+        self.assertEqual(expected, self.points + VectorArray([1, 1, 1, 1, 1, 1]))
+
+    def test_add_single_vector(self):
+        expected = PointArray([11, 12, 13, 14, 5, 16])
+        self.assertEqual(expected, self.points + Vector2D(10, 10))
+
+    def test_add_point_array(self):
+        with self.assertRaises(TypeError):
+            _ = self.points + self.others
+
+    def test_add_mismatched_sizes(self):
+        with self.assertRaises(ValueError):
+            _ = self.points + VectorArray([1, 1])
+
+    def test_iadd_same_instance(self):
+        prior = self.points
+        self.points += Vector2D(1, 1)
+        self.assertIs(prior, self.points)
+        self.assertEqual(PointArray([2, 3, 4, 5, -4, 7]), self.points)
+
+    def test_isub_point_array(self):
+        with self.assertRaises(TypeError):
+            self.points -= self.others
+
+
+class TestVectorArray(unittest.TestCase):
+
+    def setUp(self):
+        self.vectors = VectorArray([3, 4, 0, 2, -1, 0])
+
+    def test_view(self):
+        self.assertIsInstance(self.vectors[0], VectorView)
+
+    def test_view_clone_type(self):
+        self.assertIsInstance(self.vectors[0].clone(), Vector2D)
+
+    def test_add_vector_array(self):
+        expected = VectorArray([6, 8, 0, 4, -2, 0])
+        self.assertEqual(expected, self.vectors + self.vectors)
+
+    def test_add_point_array(self):
+        actual = self.vectors + PointArray([1, 1, 1, 1, 1, 1])
+        self.assertIsInstance(actual, PointArray)
+        self.assertEqual(PointArray([4, 5, 1, 3, 0, 1]), actual)
+
+    def test_add_single_point(self):
+        actual = self.vectors + Point2D(1, -1)
+        self.assertIsInstance(actual, PointArray)
+        self.assertEqual(PointArray([4, 3, 1, 1, 0, -1]), actual)
+
+    def test_add_point_mismatched_sizes(self):
+        with self.assertRaises(ValueError):
+            _ = self.vectors + Point3D(1, 1, 1)
+
+    def test_sub_point_array(self):
+        with self.assertRaises(TypeError):
+            _ = self.vectors - PointArray([1, 1, 1, 1, 1, 1])
+
+    def test_neg(self):
+        self.assertEqual(VectorArray([-3, -4, 0, -2, 1, 0]), -self.vectors)
+
+    def test_mul(self):
+        self.assertEqual(VectorArray([6, 8, 0, 4, -2, 0]), self.vectors * 2)
+
+    def test_rmul(self):
+        self.assertEqual(VectorArray([6, 8, 0, 4, -2, 0]), 2 * self.vectors)
+
+    def test_imul_same_instance(self):
+        prior = self.vectors
+        self.vectors *= 2
+        self.assertIs(prior, self.vectors)
+        self.assertEqual(VectorArray([6, 8, 0, 4, -2, 0]), self.vectors)
+
+    def test_truediv(self):
+        self.assertEqual(VectorArray([1.5, 2, 0, 1, -0.5, 0]), self.vectors / 2)
+
+    def test_truediv_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            _ = self.vectors / 0
+
+    def test_itruediv(self):
+        self.vectors /= 2
+        self.assertEqual(VectorArray([1.5, 2, 0, 1, -0.5, 0]), self.vectors)
+
+    def test_dot(self):
+        other = VectorArray([1, 1, 2, 3, 4, 5])
+        self.assertEqual([7, 6, -4], other.dot(self.vectors).tolist())
+
+    def test_dot_single_vector(self):
+        self.assertEqual([3, 0, -1], self.vectors.dot(Vector2D(1, 0)).tolist())
+
+    def test_dot_3d(self):
+        vectors = VectorArray([1, 2, 3, -1, 0, 1], dim=3)
+        self.assertEqual([4, 0], vectors.dot(Vector(1, 0, 1)).tolist())
+
+    def test_mag(self):
+        self.assertEqual([5, 2, 1], self.vectors.mag().tolist())
+
+    def test_abs(self):
+        self.assertEqual([5, 2, 1], abs(self.vectors).tolist())
+
+    def test_mag_matches_vector(self):
+        vectors = VectorArray([1, 2, 3, 4, 5, 6, 7, 8], dim=4)
+        self.assertEqual(Vector(1, 2, 3, 4).mag(), vectors.mag()[0])
+
+    def test_unit_vector(self):
+        expected = VectorArray([0.6, 0.8, 0, 1, -1, 0])
+        self.assertEqual(expected, self.vectors.unit_vector())
+
+    def test_unit_vector_mags(self):
+        for mag in self.vectors.unit_vector().mag():
+            self.assertTrue(math.isclose(mag, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Tests Suite for the unrolled small matrix kernels, and their dispatch from Matrix
+
+"""
+
+import random
+import unittest
+
+from fractions import Fraction
+
+from numeric.src import smallmat
+from numeric.src.lu import LUDecomposition, SingularMatrixError
+from numeric.src.matmul import matmul_naive
+from numeric.src.matrix import Matrix
+
+
+def random_rows(size: int) -> list:
+    return [[Fraction(random.randint(-9, 9)) for _ in range(size)] for _ in range(size)]
+
+
+class TestSmallKernels(unittest.TestCase):
+
+    def test_sizes(self):
+        for kernels in (smallmat.MATMUL, smallmat.SQUARE, smallmat.TRANSPOSE, smallmat.DET, smallmat.ADJUGATE,
+                        smallmat.FLAT_MATMUL, smallmat.FLAT_DET, smallmat.FLAT_ADJUGATE):
+            self.assertEqual(set(smallmat.SIZES), set(kernels))
+
+    def test_sources_kept(self):
+        self.assertIn('def adjugate4(rows):', smallmat.SOURCES['adjugate4'])
+
+    def test_matmul(self):
+        for size in smallmat.SIZES:
+            a, b = random_rows(size), random_rows(size)
+            self.assertEqual(matmul_naive(a, b), smallmat.MATMUL[size](a, b))
+
+    def test_square(self):
+        for size in smallmat.SIZES:
+            rows = random_rows(size)
+            self.assertEqual(matmul_naive(rows, rows), smallmat.SQUARE[size](rows))
+
+    def test_transpose(self):
+        for size in smallmat.SIZES:
+            rows = random_rows(size)
+            self.assertEqual([list(col) for col in zip(*rows)], smallmat.TRANSPOSE[size](rows))
+
+    def test_det(self):
+        for size in smallmat.SIZES:
+            rows = random_rows(size)
+            self.assertEqual(LUDecomposition(rows).det(), smallmat.DET[size](rows))
+
+    def test_det_2x2(self):
+        self.assertEqual(-2, smallmat.DET[2]([[1, 2], [3, 4]]))
+
+    def test_adjugate_2x2(self):
+        self.assertEqual((-2, [[4, -2], [-3, 1]]), smallmat.ADJUGATE[2]([[1, 2], [3, 4]]))
+
+    def test_adjugate_is_det_times_inverse(self):
+        for size in smallmat.SIZES:
+            rows = random_rows(size)
+            det, adjugate = smallmat.ADJUGATE[size](rows)
+            if det:
+                expected = LUDecomposition(rows).inverse()
+                self.assertEqual(expected, [[elt / det for elt in row] for row in adjugate])
+
+    def test_kernels_accept_tuples(self):
+        self.assertEqual([[1, 3], [2, 4]], smallmat.TRANSPOSE[2](((1, 2), (3, 4))))
+
+    def test_flat_kernels_match_rows_kernels(self):
+        for size in smallmat.SIZES:
+            a, b = random_rows(size), random_rows(size)
+            a_flat, b_flat = sum(a, []), sum(b, [])
+            self.assertEqual(sum(smallmat.MATMUL[size](a, b), []), smallmat.FLAT_MATMUL[size](a_flat, b_flat))
+            self.assertEqual(smallmat.DET[size](a), smallmat.FLAT_DET[size](a_flat))
+            det, adjugate = smallmat.ADJUGATE[size](a)
+            self.assertEqual((det, sum(adjugate, [])), smallmat.FLAT_ADJUGATE[size](a_flat))
+
+    def test_flat_adjugate_2x2(self):
+        self.assertEqual((-2, [4, -2, -3, 1]), smallmat.FLAT_ADJUGATE[2]([1, 2, 3, 4]))
+
+
+class TestMatrixDispatch(unittest.TestCase):
+
+    def setUp(self):
+        self._3x3 = Matrix([[1, 2, 3], [0, 4, 5], [1, 0, 6]])
+        self._4x4 = Matrix([[2, 0, 0, 1], [0, 3, 0, 0], [0, 0, 4, 0], [1, 0, 0, 5]])
+
+    def test_matmul_matches_generic(self):
+        self.assertEqual(self._4x4.matmul(self._4x4, 'naive'), self._4x4 @ self._4x4)
+
+    def test_matmul_of_views(self):
+        a = Matrix([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]]).transpose()
+        self.assertEqual(a.copy().matmul(self._4x4, 'naive'), a @ self._4x4)
+        self.assertEqual(a.copy().det(exact=True), a.det())
+
+    def test_matmul_out(self):
+        out = Matrix.zeros((3, 3))
+        self.assertIs(out, self._3x3.matmul(self._3x3, out=out))
+        self.assertEqual(self._3x3.matmul(self._3x3, 'naive'), out)
+
+    def test_transpose(self):
+        self.assertEqual(Matrix([[1, 0, 1], [2, 4, 0], [3, 5, 6]]), self._3x3.transpose())
+
+    def test_det_3x3(self):
+        self.assertEqual(22, self._3x3.det())
+
+    def test_det_4x4(self):
+        self.assertEqual(108, self._4x4.det())
+
+    def test_det_int_stays_int(self):
+        self.assertIsInstance(self._4x4.det(), int)
+
+    def test_inverse_exact(self):
+        inverse = self._3x3.inverse()
+        self.assertEqual(Fraction(12, 11), inverse[0, 0])
+        self.assertEqual(Matrix.identity((3, 3)), self._3x3 @ inverse)
+
+    def test_inverse_floats(self):
+        a = Matrix([[1.0, 2.0], [3.0, 4.0]])
+        self.assertEqual(Matrix([[-2, 1], [1.5, -0.5]]), a.inverse())
+
+    def test_inverse_matches_lu(self):
+        a = Matrix([[random.random() for _ in range(4)] for _ in range(4)])
+        self.assertEqual(a.inverse(exact=False), a.inverse())
+
+    def test_inverse_singular(self):
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]]).inverse()
+
+    def test_5x5_uses_generic_path(self):
+        a = Matrix([[1 if row == col else 0 for col in range(5)] for row in range(5)]) * 2
+        self.assertEqual(32, a.det())
+
+
+if __name__ == '__main__':
+    unittest.main()
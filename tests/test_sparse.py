@@ -0,0 +1,160 @@
+"""
+Tests Suite for COOMatrix and SparseMatrix
+
+"""
+
+import unittest
+
+from fractions import Fraction
+
+from numeric.src.matrix import IncompatibleMatrixShapes, Matrix, MatrixIndexError, Shape
+from numeric.src.sparse import COOMatrix, SparseMatrix
+from numeric.src.vector import Vector, Vector3D
+
+
+class TestCOOMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.builder = COOMatrix((2, 3))
+
+    def test_nnz_counts_duplicates(self):
+        self.builder.extend([(0, 1, 1), (0, 1, 2)])
+        self.assertEqual(2, self.builder.nnz)
+
+    def test_duplicates_summed(self):
+        self.builder.extend([(0, 1, 1), (0, 1, 2)])
+        self.assertEqual(3, self.builder.to_csr()[0, 1])
+
+    def test_any_order(self):
+        self.builder.extend([(1, 2, 6), (0, 0, 1), (1, 0, 4)])
+        self.assertEqual(Matrix([[1, 0, 0], [4, 0, 6]]), self.builder.to_csr().to_matrix())
+
+    def test_cancelled_entries_dropped(self):
+        self.builder.extend([(0, 1, 1), (0, 1, -1)])
+        self.assertEqual(0, self.builder.to_csr().nnz)
+
+    def test_out_of_range(self):
+        with self.assertRaises(MatrixIndexError):
+            self.builder.add(2, 0, 1)
+
+
+class TestSparseMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.dense = Matrix([[1, 0, 0, 2], [0, 0, 3, 0], [0, 4, 0, 5]])
+        self.sparse = SparseMatrix.from_matrix(self.dense)
+
+    def test_csr_arrays(self):
+        self.assertEqual([0, 2, 3, 5], list(self.sparse._indptr))
+        self.assertEqual([0, 3, 2, 1, 3], list(self.sparse._indices))
+
+    def test_nnz(self):
+        self.assertEqual(5, self.sparse.nnz)
+
+    def test_shape(self):
+        self.assertEqual(Shape(rows=3, cols=4), self.sparse.shape)
+
+    def test_getitem(self):
+        self.assertEqual(5, self.sparse[2, 3])
+
+    def test_getitem_zero(self):
+        self.assertEqual(0, self.sparse[1, 1])
+
+    def test_getitem_negative(self):
+        self.assertEqual(4, self.sparse[-1, -3])
+
+    def test_getitem_out_of_range(self):
+        with self.assertRaises(MatrixIndexError):
+            _ = self.sparse[3, 0]
+
+    def test_round_trip(self):
+        self.assertEqual(self.dense, self.sparse.to_matrix())
+
+    def test_eq_dense(self):
+        self.assertEqual(self.sparse, self.dense)
+
+    def test_dense_eq_sparse(self):
+        self.assertTrue(self.dense == self.sparse)
+        self.assertFalse(self.dense != self.sparse)
+
+    def test_eq_wrong_type(self):
+        with self.assertRaises(TypeError):
+            _ = self.sparse == [[1]]
+
+    def test_identity(self):
+        self.assertEqual(Matrix.identity((3, 3)), SparseMatrix.identity((3, 3)).to_matrix())
+
+    def test_zeros(self):
+        self.assertEqual(0, SparseMatrix.zeros((3, 3)).nnz)
+
+    def test_transpose(self):
+        self.assertEqual(self.dense.transpose(), self.sparse.transpose().to_matrix())
+
+    def test_transpose_sorted_indices(self):
+        self.assertEqual([0, 2, 1, 0, 2], list(self.sparse.T()._indices))
+
+    def test_mul_scalar(self):
+        self.assertEqual(self.dense * 3, (3 * self.sparse).to_matrix())
+
+    def test_add_sparse(self):
+        total = self.sparse + SparseMatrix.from_matrix(Matrix([[1, 1, 0, 0], [0, 0, -3, 0], [0, 0, 0, 0]]))
+        self.assertIsInstance(total, SparseMatrix)
+        self.assertEqual(Matrix([[2, 1, 0, 2], [0, 0, 0, 0], [0, 4, 0, 5]]), total.to_matrix())
+        self.assertEqual(5, total.nnz)
+
+    def test_sub_sparse(self):
+        self.assertEqual(0, (self.sparse - self.sparse).nnz)
+
+    def test_add_dense(self):
+        ones = Matrix([[1] * 4] * 3)
+        self.assertEqual(self.dense + ones, self.sparse + ones)
+
+    def test_radd_dense(self):
+        ones = Matrix([[1] * 4] * 3)
+        self.assertIsInstance(ones + self.sparse, Matrix)
+        self.assertEqual(self.dense + ones, ones + self.sparse)
+
+    def test_sub_dense(self):
+        ones = Matrix([[1] * 4] * 3)
+        self.assertEqual(Matrix([[0, -1, -1, 1], [-1, -1, 2, -1], [-1, 3, -1, 4]]), self.sparse - ones)
+
+    def test_rsub_dense(self):
+        ones = Matrix([[1] * 4] * 3)
+        self.assertEqual(Matrix([[0, 1, 1, -1], [1, 1, -2, 1], [1, -3, 1, -4]]), ones - self.sparse)
+
+    def test_add_wrong_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            _ = self.sparse + SparseMatrix.identity((3, 3))
+
+    def test_matmul_sparse(self):
+        product = self.sparse @ self.sparse.T()
+        self.assertIsInstance(product, SparseMatrix)
+        self.assertEqual(self.dense @ self.dense.T(), product.to_matrix())
+
+    def test_matmul_dense(self):
+        other = Matrix([[1, 2], [3, 4], [5, 6], [7, 8]])
+        self.assertEqual(self.dense @ other, self.sparse @ other)
+
+    def test_rmatmul_dense(self):
+        other = Matrix([[1, 2, 3], [4, 5, 6]])
+        self.assertIsInstance(other @ self.sparse, Matrix)
+        self.assertEqual(other @ self.dense, other @ self.sparse)
+
+    def test_matmul_vector(self):
+        self.assertEqual(Vector3D(9, 9, 28), self.sparse @ Vector(1, 2, 3, 4))
+
+    def test_matmul_wrong_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            _ = self.sparse @ self.sparse
+
+    def test_matmul_wrong_type(self):
+        with self.assertRaises(TypeError):
+            _ = self.sparse @ [1, 2, 3, 4]
+
+    def test_fractions(self):
+        sparse = SparseMatrix.from_matrix(Matrix([[Fraction(1, 3), 0], [0, Fraction(1, 2)]]))
+        self.assertEqual(Fraction(1, 4), (sparse @ sparse)[1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Tests Suite for the streaming stages
+
+"""
+
+import unittest
+
+from array import array
+from functools import partial
+
+from numeric.src.hommat import Hmat33
+from numeric.src.streaming import (chunked, decimate, differences, elements, normalize, pipe, rechunk,
+                                   smooth, transform)
+from numeric.src.vector import Point2D, Vector2D
+
+
+def flat(chunks):
+    return [coord for chunk in chunks for coord in chunk]
+
+
+class TestChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.points = [(idx, 10 * idx) for idx in range(7)]
+
+    def test_chunked(self):
+        chunks = list(chunked(self.points, size=3))
+        self.assertEqual([6, 6, 2], [len(chunk) for chunk in chunks])
+        self.assertEqual(array('d', [0, 0, 1, 10, 2, 20]), chunks[0])
+
+    def test_chunked_points(self):
+        self.assertEqual([[1, 2, 3, 4]], [list(chunk) for chunk in chunked([Point2D(1, 2), Point2D(3, 4)])])
+
+    def test_chunked_unbounded(self):
+        def events():
+            idx = 0
+            while True:
+                yield idx, idx
+                idx += 1
+        self.assertEqual(array('d', [0, 0, 1, 1]), next(chunked(events(), size=2)))
+
+    def test_chunked_size(self):
+        with self.assertRaises(ValueError):
+            next(chunked(self.points, size=0))
+
+    def test_rechunk(self):
+        chunks = list(rechunk(chunked(self.points, size=2), size=3))
+        self.assertEqual([6, 6, 2], [len(chunk) for chunk in chunks])
+        self.assertEqual(flat(chunked(self.points)), flat(chunks))
+
+    def test_elements(self):
+        result = list(elements(chunked(self.points[:2]), Vector2D))
+        self.assertEqual([Vector2D(0, 0), Vector2D(1, 10)], result)
+
+
+class TestStages(unittest.TestCase):
+
+    def setUp(self):
+        self.points = [(idx, idx * idx % 11) for idx in range(23)]
+
+    def chunkings(self, stage):
+        """the result of stage for several chunk sizes, which must all agree"""
+        results = [flat(stage(chunked(self.points, size=size))) for size in (1, 2, 5, 23)]
+        for result in results[1:]:
+            self.assertEqual(results[0], result)
+        return results[0]
+
+    def test_transform(self):
+        hmat = Hmat33.translation(1, 2)
+        result = flat(transform(chunked(self.points), hmat))
+        self.assertEqual([4, 11], result[6:8])
+
+    def test_transform_vectors(self):
+        hmat = Hmat33.translation(1, 2)
+        self.assertEqual([3, 9], flat(transform(chunked(self.points[3:4]), hmat, vectors=True)))
+
+    def test_differences(self):
+        result = self.chunkings(differences)
+        self.assertEqual(44, len(result))
+        self.assertEqual([1, 1, 1, 3], result[:4])
+
+    def test_differences_lag(self):
+        result = self.chunkings(partial(differences, lag=3))
+        expected = [coord for p0, p1 in zip(self.points, self.points[3:]) for coord in (p1[0] - p0[0], p1[1] - p0[1])]
+        self.assertEqual(expected, result)
+
+    def test_normalize(self):
+        result = flat(normalize(chunked([(3, 4), (0, -2)])))
+        self.assertEqual([0.6, 0.8, 0, -1], result)
+
+    def test_normalize_null(self):
+        self.assertEqual([0, 0], flat(normalize(chunked([(0, 0)]))))
+
+    def test_smooth(self):
+        result = self.chunkings(partial(smooth, window=4))
+        self.assertEqual(40, len(result))
+        self.assertEqual([1.5, 3.5], result[:2])
+
+    def test_smooth_window_one(self):
+        self.assertEqual(flat(chunked(self.points)), self.chunkings(partial(smooth, window=1)))
+
+    def test_decimate(self):
+        result = self.chunkings(partial(decimate, step=4))
+        self.assertEqual([coord for point in self.points[::4] for coord in point], result)
+
+    def test_invalid_parameters(self):
+        for stage in (partial(differences, lag=0), partial(smooth, window=0), partial(decimate, step=0)):
+            with self.assertRaises(ValueError):
+                next(stage(chunked(self.points)))
+
+    def test_pipe(self):
+        stream = pipe(chunked(self.points, size=4), partial(differences, lag=3), normalize)
+        directions = list(elements(stream, Vector2D))
+        p0, p1 = Point2D(*self.points[0]), Point2D(*self.points[3])
+        self.assertEqual((p1 - p0).unit_vector(), directions[0])
+        self.assertEqual(20, len(directions))
+
+    def test_pipe_3d(self):
+        points = [(idx, 2 * idx, 3 * idx) for idx in range(5)]
+        stream = pipe(chunked(points, size=2), partial(differences, dim=3), partial(decimate, step=2, dim=3))
+        self.assertEqual([1, 2, 3, 1, 2, 3], flat(stream))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Tests Suite for the delimited text readers and writers of src.textio
+
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+from array import array
+from fractions import Fraction
+
+from numeric.src import textio
+from numeric.src.matrix import Matrix
+from numeric.src.pointarray import PointArray, VectorArray
+from numeric.src.vector import Point3D
+
+
+class TestReadRows(unittest.TestCase):
+
+    def rows(self, text, **kwargs):
+        return list(textio.iter_rows(io.StringIO(text), **kwargs))
+
+    def test_inferred_types(self):
+        rows = self.rows('1,2.5,1/3\n4,-5,7\n')
+        self.assertEqual([[1, 2.5, Fraction(1, 3)], [4, -5.0, Fraction(7)]], rows)
+        self.assertEqual([int, float, Fraction], [type(elt) for elt in rows[1]])
+
+    def test_widened_column(self):
+        rows = self.rows('1\n2\n3.5\n', chunk_chars=1)
+        self.assertEqual([int, int, float], [type(row[0]) for row in rows])
+
+    def test_dtype(self):
+        self.assertEqual([[1.0, 2.0]], self.rows('1,2\n', dtype=float))
+        self.assertEqual([[Fraction(1, 10), 2]], self.rows('0.1,2\n', dtype=[Fraction, int]))
+
+    def test_dtype_count(self):
+        with self.assertRaises(ValueError):
+            self.rows('1,2\n', dtype=[int])
+
+    def test_whitespace(self):
+        self.assertEqual([[1, 2], [3, 4]], self.rows('  1   2\n3\t4\r\n', delimiter=None))
+
+    def test_spaces_around_fields(self):
+        self.assertEqual([[1, 2.5]], self.rows(' 1 , 2.5 \r\n'))
+
+    def test_skip_and_blank_lines(self):
+        self.assertEqual([[1, 2], [3, 4]], self.rows('x,y\n1,2\n\n3,4\n\n', skip=1))
+
+    def test_columns(self):
+        self.assertEqual([[3, 1], [6, 4]], self.rows('1,2,3\n4,5,6\n', columns=[-1, 0]))
+
+    def test_bad_columns(self):
+        with self.assertRaises(ValueError):
+            self.rows('1,2\n', columns=[2])
+
+    def test_ragged(self):
+        with self.assertRaisesRegex(ValueError, 'row 3'):
+            self.rows('1,2\n3,4\n5\n')
+
+    def test_ragged_across_chunks(self):
+        with self.assertRaisesRegex(ValueError, 'row 2'):
+            self.rows('1,2\n3,4,5\n', chunk_chars=1)
+
+    def test_not_a_number(self):
+        with self.assertRaisesRegex(ValueError, 'column 1'):
+            self.rows('1,2\n3,x\n')
+        with self.assertRaises(ValueError):
+            self.rows('1,2.5\n', dtype=int)
+
+    def test_chunking(self):
+        text = ''.join(f'{row},{row * 0.5},{-row}\n' for row in range(100))
+        expected = self.rows(text)
+        for chunk_chars in (1, 7, 64, 1000):
+            self.assertEqual(expected, self.rows(text, chunk_chars=chunk_chars))
+
+    def test_lazy(self):
+        source = io.StringIO('1,2\n' * 1000)
+        rows = textio.iter_rows(source, chunk_chars=100)
+        next(rows)
+        self.assertLess(source.tell(), 200)
+
+    def test_stats(self):
+        stats = textio.ReadStats()
+        self.rows('1,2\n3,4\n5,6\n', stats=stats)
+        self.assertEqual(3, stats.rows)
+        self.assertEqual(12, stats.chars)
+        self.assertGreater(stats.seconds, 0)
+        self.assertIn('rows/s', str(stats))
+
+
+class TestWriteRows(unittest.TestCase):
+
+    def test_format(self):
+        lines = list(textio.format_rows([[1, 0.5, Fraction(1, 3)], [2, 3, 4]]))
+        self.assertEqual(['1,0.5,1/3\n', '2,3,4\n'], lines)
+
+    def test_fmt(self):
+        self.assertEqual(['3.14 2\n'], list(textio.format_rows([[3.14159, 2]], ' ', '.3g')))
+
+    def test_write(self):
+        target = io.StringIO()
+        count = textio.write_rows(target, ([row, row] for row in range(10)), header='a,b', chunk_rows=3)
+        self.assertEqual(10, count)
+        self.assertEqual('a,b\n0,0\n1,1\n', target.getvalue()[:12])
+
+
+class TestMatrixCsv(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'matrix.csv')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_round_trip_exact(self):
+        matrix = Matrix([[1, 0.1, Fraction(1, 3)], [2 ** 70, -2.5e-300, Fraction(-7, 2)]])
+        matrix.to_csv(self.path)
+        loaded = Matrix.from_csv(self.path)
+        self.assertEqual(matrix._row_lists(), loaded._row_lists())
+
+    def test_round_trip_view(self):
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        matrix.transpose().to_csv(self.path, delimiter=';', header='a;b')
+        self.assertEqual([[1, 4], [2, 5], [3, 6]], Matrix.from_csv(self.path, delimiter=';', skip=1)._row_lists())
+
+    def test_dtype(self):
+        Matrix([[1, 2], [3, 4]]).to_csv(self.path)
+        self.assertIsInstance(Matrix.from_csv(self.path, dtype=float)[0, 0], float)
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            Matrix.from_csv(io.StringIO('header\n'), skip=1)
+
+    def test_backend(self):
+        self.assertEqual('python', Matrix.from_csv(io.StringIO('1\n'), backend='python').backend)
+
+
+class TestPointCsv(unittest.TestCase):
+
+    def test_dim_from_fields(self):
+        points = PointArray.from_csv(io.StringIO('1,2,3\n4,5,6\n'))
+        self.assertEqual([Point3D(1, 2, 3), Point3D(4, 5, 6)], points.to_list())
+
+    def test_first_dim_fields(self):
+        points = PointArray.from_csv(io.StringIO('1 2 3 255\n4 5 6 0\n'), dim=2, delimiter=None)
+        self.assertEqual(array('d', [1, 2, 4, 5]), points.coords)
+
+    def test_columns(self):
+        vectors = VectorArray.from_csv(io.StringIO('0,1,2\n0,3,4\n'), columns=[2, 1])
+        self.assertIsInstance(vectors, VectorArray)
+        self.assertEqual(array('d', [2, 1, 4, 3]), vectors.coords)
+
+    def test_dim_mismatch(self):
+        with self.assertRaises(ValueError):
+            PointArray.from_csv(io.StringIO('1,2,3\n'), dim=2, columns=[0, 1, 2])
+
+    def test_empty(self):
+        self.assertEqual(0, len(PointArray.from_csv(io.StringIO(''))))
+
+    def test_round_trip(self):
+        points = PointArray([0.1, 2, -3.5, 4e10], dim=2)
+        target = io.StringIO()
+        points.to_csv(target)
+        self.assertEqual(points, PointArray.from_csv(io.StringIO(target.getvalue())))
+
+    def test_iter_coords(self):
+        chunks = list(textio.iter_coords(io.StringIO('1,2,9\n3,4,9\n5,6,9\n'), dim=2, chunk_chars=6))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(array('d', [1, 2, 3, 4, 5, 6]), sum(chunks, array('d')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ import unittest
 from contextlib import redirect_stdout
 from io import StringIO
 
-from numeric.src.vector import Vector, Vector2D
+from numeric.src.vector import Vector, Vector2D, Vector3D
 
 
 class TestVector(unittest.TestCase):
@@ -824,5 +824,134 @@ class TestVector2D(unittest.TestCase):
         self.assertFalse(Vector2D(1, 1).isnull())
 
 
+class TestVector2DSlots(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(Vector2D(1, 2), '__dict__'))
+
+    def test_is_vector(self):
+        self.assertIsInstance(Vector2D(1, 2), Vector)
+
+    def test_no_coords_slot(self):
+        for cls in (Vector2D, Vector3D):
+            self.assertFalse(any('_coords' in vars(base).get('__slots__', ()) for base in cls.__mro__))
+        self.assertEqual(object.__basicsize__ + 2 * 8, Vector2D.__basicsize__)
+
+    def test_generic_vector_has_no_dict(self):
+        self.assertFalse(hasattr(Vector(1, 2, 3, 4), '__dict__'))
+
+    def test_coords_property(self):
+        self.assertEqual([1, 2], Vector2D(1, 2)._coords)
+
+    def test_iadd_generic_vector(self):
+        actual = Vector2D(1, 2)
+        actual += Vector(3, 4)
+        self.assertEqual(Vector2D(4, 6), actual)
+
+    def test_isub_generic_vector(self):
+        actual = Vector2D(1, 2)
+        actual -= Vector(3, 4)
+        self.assertEqual(Vector2D(-2, -2), actual)
+
+    def test_dot_generic_vector(self):
+        self.assertEqual(11, Vector2D(1, 2).dot(Vector(3, 4)))
+
+    def test_add_mismatched_sizes(self):
+        with self.assertRaises(ValueError):
+            Vector2D(1, 2) - Vector(1, 2, 3)
+
+
+class TestVector3D(unittest.TestCase):
+
+    def test_instance(self):
+        self.assertIsInstance(Vector3D(1, 2, 3), Vector)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(Vector3D(1, 2, 3), '__dict__'))
+
+    def test_default(self):
+        self.assertEqual(Vector3D(0, 0, 0), Vector3D())
+
+    def test_len(self):
+        self.assertEqual(len(Vector3D(1, 2, 3)), 3)
+
+    def test_iter(self):
+        x, y, z = Vector3D(1, 2, 3)
+        self.assertEqual((1, 2, 3), (x, y, z))
+
+    def test_hash(self):
+        self.assertEqual(hash((1, 2, 3)), hash(Vector3D(1, 2, 3)))
+
+    def test_bool(self):
+        self.assertFalse(Vector3D())
+        self.assertTrue(Vector3D(0, 0, 1))
+
+    def test_str(self):
+        self.assertEqual('Vector3D(x=1.00, y=2.00, z=3.00)', str(Vector3D(1, 2, 3)))
+
+    def test_repr(self):
+        self.assertEqual('Vector3D(x=1, y=2, z=3)', repr(Vector3D(1, 2, 3)))
+
+    def test_clone(self):
+        original = Vector3D(1, 2, 3)
+        clone = original.clone()
+        clone.z = 42
+        self.assertEqual(Vector3D(1, 2, 3), original)
+
+    def test_add(self):
+        actual = Vector3D(1, 2, 3) + Vector3D(1, 1, 1)
+        self.assertEqual(Vector3D(2, 3, 4), actual)
+        self.assertIsInstance(actual, Vector3D)
+
+    def test_sub(self):
+        self.assertEqual(Vector3D(0, 1, 2), Vector3D(1, 2, 3) - Vector3D(1, 1, 1))
+
+    def test_iadd_same_instance(self):
+        actual = Vector3D(1, 2, 3)
+        prior = actual
+        actual += Vector3D(1, 1, 1)
+        self.assertIs(prior, actual)
+        self.assertEqual(Vector3D(2, 3, 4), actual)
+
+    def test_neg(self):
+        self.assertEqual(Vector3D(-1, -2, -3), -Vector3D(1, 2, 3))
+
+    def test_mul(self):
+        self.assertEqual(Vector3D(2, 4, 6), Vector3D(1, 2, 3) * 2)
+
+    def test_rmul(self):
+        self.assertEqual(Vector3D(2, 4, 6), 2 * Vector3D(1, 2, 3))
+
+    def test_imul(self):
+        actual = Vector3D(1, 2, 3)
+        actual *= 2
+        self.assertEqual(Vector3D(2, 4, 6), actual)
+
+    def test_truediv(self):
+        self.assertEqual(Vector3D(0.5, 1, 1.5), Vector3D(1, 2, 3) / 2)
+
+    def test_truediv_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            _ = Vector3D(1, 2, 3) / 0
+
+    def test_floordiv(self):
+        self.assertEqual(Vector3D(0, 1, 1), Vector3D(1, 2, 3) // 2)
+
+    def test_mag(self):
+        self.assertEqual(7, Vector3D(2, 3, 6).mag())
+
+    def test_unit_vector(self):
+        self.assertEqual(Vector3D(2 / 7, 3 / 7, 6 / 7), Vector3D(2, 3, 6).unit_vector())
+
+    def test_dot(self):
+        self.assertEqual(20, Vector3D(2, 3, 6).dot(Vector3D(1, 2, 2)))
+
+    def test_cross(self):
+        self.assertEqual(Vector3D(0, 0, 1), Vector3D(1, 0, 0).cross(Vector3D(0, 1, 0)))
+
+    def test_cross_anticommutative(self):
+        self.assertEqual(Vector3D(0, 0, -1), Vector3D(0, 1, 0).cross(Vector3D(1, 0, 0)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,6 +7,7 @@ import unittest
 
 from fractions import Fraction
 
+from numeric.src.lu import SingularMatrixError
 from numeric.src.matrix import Matrix, Shape, IncompatibleMatrixShapes, MatrixIndexError
 
 
@@ -110,6 +111,47 @@ class TestMatrix(unittest.TestCase):
         with self.assertRaises(AssertionError):
             Matrix([[1, 2, 3], [4, 5, 6], []])
 
+    def test_flat_with_shape(self):
+        matrix = Matrix([1, 2, 3, 4, 5, 6], shape=(2, 3))
+        self.assertEqual([[1, 2, 3], [4, 5, 6]], matrix._row_lists())
+
+    def test_flat_copied(self):
+        flat = [1, 2, 3, 4]
+        matrix = Matrix(flat, shape=(2, 2))
+        flat[0] = 42
+        self.assertEqual(1, matrix[0, 0])
+
+    def test_flat_adopted(self):
+        flat = [1, 2, 3, 4]
+        self.assertIs(flat, Matrix(flat, shape=(2, 2), copy=False)._data)
+
+    def test_flat_tuple_not_adopted(self):
+        self.assertEqual([1, 2, 3, 4], Matrix((1, 2, 3, 4), shape=(2, 2), copy=False)._data)
+
+    def test_flat_wrong_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix([1, 2, 3], shape=(2, 2))
+
+    def test_not_validated(self):
+        self.assertEqual((2, 2), Matrix([[1, 2], [3]], validate=False).shape)
+
+    def test_from_owned(self):
+        flat = [1.0, 2.0]
+        matrix = Matrix._from_owned(flat, 2, 1)
+        self.assertIs(flat, matrix._data)
+        self.assertEqual((2, 1), matrix.shape)
+
+    def test_from_rows(self):
+        self.assertEqual([1, 2, 3, 4], Matrix._from_rows([[1, 2], [3, 4]])._data)
+
+    def test_results_own_new_storage(self):
+        a = Matrix([[1, 2], [3, 4]])
+        for result in (a + a, a - a, a * 2, a / 2, a @ a, a.clone(), a.inverse()):
+            self.assertIsNot(a._data, result._data)
+        doubled = a * 1
+        doubled[0, 0] = 0
+        self.assertEqual(1, a[0, 0])
+
     # ------ ROWs COLs -------------------------------------------------
 
     def test_row_col_1x1(self):
@@ -207,10 +249,8 @@ class TestMatrix(unittest.TestCase):
             self.assertEqual(expected_msg, str(e))
 
     def test__eq__wrong_types(self):
-        with self.assertRaises(TypeError) as e:
-            self.assertEqual(self._2x2, [[1, 2], [3, 4]])
-            expected_msg = 'a Matrix must be compared to a Matrix'
-            self.assertEqual(expected_msg, str(e))
+        self.assertIs(NotImplemented, self._2x2.__eq__([[1, 2], [3, 4]]))
+        self.assertNotEqual(self._2x2, [[1, 2], [3, 4]])
 
     # ------ SETITEM ---------------------------------------------------
 
@@ -1308,5 +1348,187 @@ class TestMatrix(unittest.TestCase):
         self.assertIsNot(original, actual)
 
 
+class TestInPlace(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Matrix([[1, 2, 3], [4, 5, 6]])
+        self.b = Matrix([[10, 20, 30], [40, 50, 60]])
+
+    def test_iadd_keeps_storage(self):
+        storage = self.a._data
+        self.a += self.b
+        self.assertIs(storage, self.a._data)
+        self.assertEqual([[11, 22, 33], [44, 55, 66]], self.a._row_lists())
+
+    def test_iadd_view(self):
+        view = self.a[:, 1:]
+        view += Matrix([[1, 1], [1, 1]])
+        self.assertEqual([[1, 3, 4], [4, 6, 7]], self.a._row_lists())
+
+    def test_isub_imul_itruediv(self):
+        storage = self.b._data
+        self.b -= self.a
+        self.b *= 2
+        self.b /= 9
+        self.assertIs(storage, self.b._data)
+        self.assertEqual([[2, 4, 6], [8, 10, 12]], self.b._row_lists())
+
+    def test_iadd_not_matrix_falls_back(self):
+        class Reflected:
+            def __radd__(self, other):
+                return 'radd'
+
+            def __rsub__(self, other):
+                return 'rsub'
+
+        a = self.a
+        a += Reflected()
+        self.assertEqual('radd', a)
+        b = self.b
+        b -= Reflected()
+        self.assertEqual('rsub', b)
+
+    def test_itruediv_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.a /= 0
+
+    def test_add_sub_out(self):
+        out = Matrix.zeros(Shape(2, 3))
+        self.assertIs(out, self.a.add(self.b, out=out))
+        self.assertEqual(self.a + self.b, out)
+        self.assertIs(out, self.b.sub(self.a, out=out))
+        self.assertEqual(self.b - self.a, out)
+
+    def test_add_without_out(self):
+        self.assertEqual(self.a + self.b, self.a.add(self.b))
+        self.assertEqual(self.b - self.a, self.b.sub(self.a))
+        self.assertEqual(self.a * 3, self.a.scale(3))
+
+    def test_scale_out(self):
+        out = Matrix.zeros(Shape(2, 3))
+        self.a.scale(Fraction(1, 2), out=out)
+        self.assertEqual([[Fraction(1, 2), 1, Fraction(3, 2)], [2, Fraction(5, 2), 3]], out._row_lists())
+
+    def test_out_of_wrong_shape(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            self.a.add(self.b, out=Matrix.zeros(Shape(3, 2)))
+        with self.assertRaises(IncompatibleMatrixShapes):
+            self.a.matmul(self.b.T(), out=self.a)
+        with self.assertRaises(TypeError):
+            self.a.scale(2, out=[[0, 0, 0], [0, 0, 0]])
+
+    def test_out_aliasing_operand(self):
+        m = Matrix([[1, 2], [3, 4]])
+        m.add(m.T(), out=m)
+        self.assertEqual([[2, 5], [5, 8]], m._row_lists())
+
+    def test_transpose_out(self):
+        out = Matrix.zeros(Shape(3, 2))
+        self.assertIs(out, self.a.transpose(out=out))
+        self.assertEqual([[1, 4], [2, 5], [3, 6]], out._row_lists())
+
+    def test_transpose_in_place_small(self):
+        for size in (2, 3, 4):
+            m = Matrix([[row * size + col for col in range(size)] for row in range(size)])
+            expected = m.transpose().copy()
+            self.assertIs(m, m.transpose(out=m))
+            self.assertEqual(expected._row_lists(), m._row_lists())
+
+    def test_transpose_in_place(self):
+        m = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        storage = m._data
+        m.transpose(out=m)
+        self.assertIs(storage, m._data)
+        self.assertEqual([[1, 4, 7], [2, 5, 8], [3, 6, 9]], m._row_lists())
+
+    def test_matmul_out(self):
+        out = Matrix.zeros(Shape(2, 2))
+        for strategy in ('auto', 'naive', 'transposed', 'blocked'):
+            self.assertIs(out, self.a.matmul(self.b.T(), strategy, out=out))
+            self.assertEqual([[140, 320], [320, 770]], out._row_lists())
+
+    def test_matmul_out_small(self):
+        m = Matrix([[1, 1], [1, 0]])
+        m.matmul(m, out=m)
+        self.assertEqual([[2, 1], [1, 1]], m._row_lists())
+
+    def test_matmul_out_aliasing(self):
+        m = Matrix([[1, 2, 0], [0, 1, 0], [0, 0, 2]])
+        m.matmul(Matrix([[1, 0, 0], [1, 1, 0], [0, 0, 1]]), 'transposed', out=m)
+        self.assertEqual([[3, 2, 0], [1, 1, 0], [0, 0, 2]], m._row_lists())
+
+    def test_matmul_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            self.a.matmul(self.b.T(), 'fast', out=Matrix.zeros(Shape(2, 2)))
+
+    def test_long_column(self):
+        column = Matrix([[row] for row in range(10000)])
+        column += column
+        self.assertEqual(2 * 9999, column[9999, 0])
+
+    def test_views_see_writes(self):
+        row = self.a[0, :]
+        self.a *= 2
+        self.assertEqual([[2, 4, 6]], row._row_lists())
+
+
+class TestPower(unittest.TestCase):
+
+    def setUp(self):
+        self.fibonacci = Matrix([[1, 1], [1, 0]])
+
+    def test_fibonacci(self):
+        self.assertEqual([[89, 55], [55, 34]], (self.fibonacci ** 10)._row_lists())
+
+    def test_exact_large_exponent(self):
+        power = self.fibonacci ** 300
+        self.assertEqual(222232244629420445529739893461909967206666939096499764990979600, power[0, 1])
+        self.assertIsInstance(power[0, 1], int)
+
+    def test_matches_repeated_products(self):
+        for size in (2, 3, 4, 5, 7):
+            m = Matrix([[(row * 3 + col * 5) % 7 - 3 for col in range(size)] for row in range(size)])
+            expected = m
+            for exponent in range(2, 12):
+                expected = expected @ m
+                self.assertEqual(expected._row_lists(), (m ** exponent)._row_lists())
+
+    def test_first_power_is_a_copy(self):
+        power = self.fibonacci ** 1
+        self.assertIsNot(self.fibonacci._data, power._data)
+        self.assertEqual(self.fibonacci, power)
+
+    def test_zero(self):
+        m = Matrix([[Fraction(1, 2)] * 5] * 5)
+        self.assertEqual(Matrix.identity(Shape(5, 5)), m ** 0)
+
+    def test_negative_exact(self):
+        inverse = self.fibonacci ** -5
+        self.assertEqual([[Fraction(-3), Fraction(5)], [Fraction(5), Fraction(-8)]], inverse._row_lists())
+        self.assertEqual(Matrix.identity(Shape(2, 2)), inverse @ self.fibonacci ** 5)
+
+    def test_negative_generic_size(self):
+        m = Matrix([[2, 1, 0, 0, 0], [0, 2, 0, 0, 0], [0, 0, 1, 0, 0], [0, 0, 0, 1, 0], [0, 0, 0, 0, 1]])
+        self.assertEqual([Fraction(1, 8), Fraction(-3, 16), 0, 0, 0], (m ** -3)._row_lists()[0])
+
+    def test_floats(self):
+        m = Matrix([[0.5, 0.25, 0.25], [0.5, 0.0, 0.5], [0.25, 0.25, 0.5]])
+        self.assertEqual(m @ m @ m @ m @ m, m ** 5)
+
+    def test_singular(self):
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2], [2, 4]]) ** -1
+
+    def test_not_square(self):
+        with self.assertRaises(IncompatibleMatrixShapes):
+            Matrix([[1, 2, 3], [4, 5, 6]]) ** 2
+
+    def test_not_int(self):
+        with self.assertRaises(TypeError):
+            self.fibonacci ** 0.5
+        with self.assertRaises(TypeError):
+            self.fibonacci ** True
+
+
 if __name__ == '__main__':
     unittest.main()